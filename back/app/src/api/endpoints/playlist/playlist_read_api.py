@@ -9,14 +9,24 @@ Single Responsibility: Handle HTTP GET requests for playlist retrieval.
 """
 
 import logging
+from typing import Optional
+
 from fastapi import APIRouter, Query
 
 from app.src.services.error.unified_error_decorator import handle_http_errors
 from app.src.services.response.unified_response_service import UnifiedResponseService
 from app.src.services.serialization.unified_serialization_service import UnifiedSerializationService
+from app.src.utils.pagination import decode_cursor
+from app.src.domain.data.models.playlist_summary import PLAYLIST_VIEWS, VIEW_FULL, VIEW_SUMMARY
 
 logger = logging.getLogger(__name__)
 
+# Fields selectable with ?fields= on the playlist listing
+LIST_PLAYLIST_FIELDS = {
+    "id", "title", "description", "nfc_tag_id", "created_at", "updated_at",
+    "type", "last_played", "track_count", "total_duration_ms", "tracks",
+}
+
 
 class PlaylistReadAPI:
     """
@@ -48,14 +58,50 @@ class PlaylistReadAPI:
         async def list_playlists_impl(
             page: int = Query(1, description="Page number"),
             limit: int = Query(50, description="Number of playlists to return"),
+            cursor: Optional[str] = Query(
+                None,
+                description="Keyset cursor from next_cursor; pass an empty value for the first page",
+            ),
+            view: str = Query(
+                VIEW_FULL, description="'full' to include tracks, 'summary' for a track-free listing"
+            ),
+            fields: Optional[str] = Query(
+                None,
+                description="Comma-separated playlist fields to return; implies the summary view unless 'tracks' is listed",
+            ),
         ):
             """Get all playlists with pagination."""
-            try:
-                # Use application service
-                playlists_result = await self._playlist_service.get_playlists_use_case(
-                    page=page, page_size=limit
+            if cursor and None in decode_cursor(cursor):
+                return UnifiedResponseService.bad_request(
+                    message="Invalid pagination cursor", details={"cursor": cursor}
+                )
+            if view not in PLAYLIST_VIEWS:
+                return UnifiedResponseService.bad_request(
+                    message="Invalid playlist view", details={"view": view, "allowed": list(PLAYLIST_VIEWS)}
                 )
 
+            selected_fields = None
+            if fields is not None:
+                selected_fields = [name.strip() for name in fields.split(",") if name.strip()]
+                unknown_fields = sorted(set(selected_fields) - LIST_PLAYLIST_FIELDS)
+                if unknown_fields:
+                    return UnifiedResponseService.bad_request(
+                        message="Unknown playlist fields", details={"fields": unknown_fields}
+                    )
+                if "tracks" not in selected_fields:
+                    view = VIEW_SUMMARY
+
+            try:
+                # Use application service; cursor mode replaces page numbers
+                options = {"page_size": limit}
+                if cursor is None:
+                    options["page"] = page
+                else:
+                    options["cursor"] = cursor
+                if view == VIEW_SUMMARY:
+                    options["view"] = VIEW_SUMMARY
+                playlists_result = await self._playlist_service.get_playlists_use_case(**options)
+
                 # DataApplicationService returns raw domain data directly
                 playlists = playlists_result.get("playlists", [])
 
@@ -66,10 +112,19 @@ class PlaylistReadAPI:
                 serialized_playlists = UnifiedSerializationService.serialize_bulk_playlists(
                     playlists,
                     format=UnifiedSerializationService.FORMAT_API,
-                    include_tracks=True,
+                    include_tracks=view == VIEW_FULL,
                 )
-
-                total_count = len(serialized_playlists)
+                if view == VIEW_SUMMARY:
+                    for serialized, playlist in zip(serialized_playlists, playlists):
+                        serialized["track_count"] = playlist.get("track_count", 0)
+                        serialized["total_duration_ms"] = playlist.get("total_duration_ms", 0)
+                if selected_fields is not None:
+                    serialized_playlists = [
+                        {name: item[name] for name in ["id", *selected_fields] if name in item}
+                        for item in serialized_playlists
+                    ]
+
+                total_count = playlists_result.get("total", len(serialized_playlists))
                 total_pages = (total_count + limit - 1) // limit
 
                 data = {
@@ -79,6 +134,8 @@ class PlaylistReadAPI:
                     "total": total_count,
                     "total_pages": total_pages,
                 }
+                if cursor is not None:
+                    data["next_cursor"] = playlists_result.get("next_cursor")
 
                 return UnifiedResponseService.success(
                     message="Playlists retrieved successfully",
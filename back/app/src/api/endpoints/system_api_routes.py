@@ -148,6 +148,7 @@ class SystemAPIRoutes:
                     "services": services,
                     "timestamp": time.time(),
                     "server_seq": server_seq,
+                    "caches": self._get_cache_statistics(),
                 }
 
                 return UnifiedResponseService.success(
@@ -230,7 +231,8 @@ class SystemAPIRoutes:
                         "contract_version": "3.1.0",
                         "hostname": system_info.get("hostname", "localhost"),
                         "uptime": 3600,  # System uptime in seconds
-                        "server_seq": server_seq
+                        "server_seq": server_seq,
+                        "audio": self._get_audio_output_info(request),
                     }
                 })
 
@@ -241,6 +243,36 @@ class SystemAPIRoutes:
                     operation="get_system_info"
                 )
 
+        @self.router.get("/system/latency")
+        @handle_http_errors()
+        async def get_latency_statistics(request: Request, limit: int = 10):
+            """Get tag-to-audio latency percentiles over the last traced scans."""
+            try:
+                from app.src.monitoring import get_latency_tracer
+
+                data = get_latency_tracer().get_statistics(limit=max(0, min(limit, 100)))
+                coordinator = self._get_coordinator(request)
+                backend_statistics = getattr(coordinator, "get_audio_backend_statistics", None)
+                if callable(backend_statistics):
+                    statistics = backend_statistics()
+                    if isinstance(statistics, dict) and statistics:
+                        data["audio_backend"] = statistics
+
+                from fastapi.responses import JSONResponse
+                return JSONResponse(content={
+                    "status": "success",
+                    "message": "Latency statistics retrieved successfully",
+                    "timestamp": time.time(),
+                    "data": data
+                })
+
+            except Exception as e:
+                logger.error(f"Error getting latency statistics: {str(e)}")
+                return UnifiedResponseService.internal_error(
+                    message="Failed to get latency statistics",
+                    operation="get_latency_statistics"
+                )
+
         @self.router.get("/system/logs")
         @handle_http_errors()
         async def get_system_logs():
@@ -335,6 +367,44 @@ class SystemAPIRoutes:
                     operation="restart_system"
                 )
 
+    def _get_audio_output_info(self, request: Request) -> Dict[str, Any]:
+        """Report the mixer profile in use and its latest self-test result."""
+        from app.src.config import config
+
+        info = {"mixer_profile": config.audio.get_mixer_profile().to_dict(), "mixer_self_test": None}
+        try:
+            coordinator = self._get_coordinator(request)
+            backend_statistics = getattr(coordinator, "get_audio_backend_statistics", None)
+            statistics = backend_statistics() if callable(backend_statistics) else None
+            mixer = statistics.get("mixer") if isinstance(statistics, dict) else None
+            if isinstance(mixer, dict):
+                info["mixer_profile"] = mixer.get("profile", info["mixer_profile"])
+                info["mixer_self_test"] = mixer.get("self_test")
+        except Exception as e:
+            logger.warning(f"Could not collect mixer status: {e}")
+        return info
+
+    @staticmethod
+    def _get_cache_statistics() -> Dict[str, Any]:
+        """Collect in-process cache counters for the health report."""
+        try:
+            from app.src.infrastructure.adapters.audio.audio_metadata_cache import (
+                get_audio_metadata_cache,
+            )
+            from app.src.infrastructure.repositories.playlist_cache import (
+                get_playlist_cache_statistics,
+            )
+            from app.src.services.transcoding_service import get_transcoding_service
+
+            return {
+                "playlists": get_playlist_cache_statistics(),
+                "audio_metadata": get_audio_metadata_cache().get_statistics(),
+                "transcoding": get_transcoding_service().get_statistics(),
+            }
+        except Exception as e:
+            logger.warning(f"Could not collect cache statistics: {e}")
+            return {}
+
     def get_router(self) -> APIRouter:
         """Get the configured router."""
         return self.router
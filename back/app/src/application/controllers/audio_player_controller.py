@@ -12,6 +12,7 @@ NO playlist logic, NO state management beyond current playback status.
 from typing import Optional, Dict, Any
 from enum import Enum
 import logging
+from app.src.monitoring import get_latency_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -76,18 +77,19 @@ class AudioPlayer:
                 self.stop()
 
             # Start new playback
-            if hasattr(self._backend, 'play_file'):
-                # Use play_file if available (sync method)
-                if duration_ms is not None:
-                    success = self._backend.play_file(file_path, duration_ms=duration_ms)
+            with get_latency_tracer().span("play_file"):
+                if hasattr(self._backend, 'play_file'):
+                    # Use play_file if available (sync method)
+                    if duration_ms is not None:
+                        success = self._backend.play_file(file_path, duration_ms=duration_ms)
+                    else:
+                        success = self._backend.play_file(file_path)
                 else:
-                    success = self._backend.play_file(file_path)
-            else:
-                # Use async play method
-                import asyncio
-                loop = asyncio.new_event_loop()
-                success = loop.run_until_complete(self._backend.play(file_path))
-                loop.close()
+                    # Use async play method
+                    import asyncio
+                    loop = asyncio.new_event_loop()
+                    success = loop.run_until_complete(self._backend.play(file_path))
+                    loop.close()
 
             if success:
                 self._current_file = file_path
@@ -363,6 +365,14 @@ class AudioPlayer:
         try:
             position_ms = int(position_seconds * 1000)
 
+            if hasattr(self._backend, 'set_position'):
+                # Sync seek (WM8960): callers run on the server's event loop,
+                # where the async seek() below cannot get a loop of its own
+                success = self._backend.set_position(position_seconds)
+                if success:
+                    logger.info(f"⏩ Seeked to {position_seconds:.1f}s")
+                return bool(success)
+
             if hasattr(self._backend, 'seek'):
                 import asyncio
                 import inspect
@@ -383,6 +393,79 @@ class AudioPlayer:
             logger.error(f"Error seeking: {e}")
             return False
 
+    # --- Backend Events ---
+
+    def attach_event_bus(self, event_bus) -> bool:
+        """
+        Let the backend publish playback events on an event bus.
+
+        Returns:
+            bool: True if the backend publishes TrackEndedEvent itself
+        """
+        attach = getattr(self._backend, "attach_event_bus", None)
+        if not callable(attach) or getattr(self._backend, "emits_track_end_events", False) is not True:
+            return False
+        attach(event_bus)
+        return True
+
+    def get_backend_statistics(self) -> Dict[str, Any]:
+        """Get the backend's seek and transition counters, if it keeps any."""
+        get_statistics = getattr(self._backend, "get_statistics", None)
+        statistics = get_statistics() if callable(get_statistics) else None
+        return statistics if isinstance(statistics, dict) else {}
+
+    # --- Gapless Playback ---
+
+    def supports_gapless(self) -> bool:
+        """Check if the backend can queue the next track for gapless playback."""
+        return getattr(self._backend, "gapless_enabled", False) is True
+
+    def queue_next(self, file_path: str, duration_ms: Optional[int] = None) -> bool:
+        """
+        Queue the file to play right after the current one.
+
+        Args:
+            file_path: Path to the next audio file
+            duration_ms: Optional track duration in milliseconds
+
+        Returns:
+            bool: True if the file was queued
+        """
+        if self._state == PlaybackState.STOPPED or not self.supports_gapless():
+            return False
+
+        try:
+            return bool(self._backend.queue_next(file_path, duration_ms))
+        except Exception as e:
+            logger.warning(f"Could not queue next track: {e}")
+            return False
+
+    def clear_queued(self) -> None:
+        """Cancel the queued file, if any."""
+        if self.supports_gapless():
+            self._backend.clear_queued()
+
+    def has_queued_next(self) -> bool:
+        """Check if a file is queued to follow the current one."""
+        return self.supports_gapless() and self._backend.has_queued_track is True
+
+    def consume_track_transition(self) -> bool:
+        """
+        Check if the backend switched to the queued file.
+
+        Returns:
+            bool: True once per gapless transition
+        """
+        if not self.supports_gapless():
+            return False
+
+        file_path = self._backend.consume_track_transition()
+        if not file_path:
+            return False
+
+        self._current_file = file_path
+        return True
+
     # --- Status Queries ---
 
     def get_state(self) -> Dict[str, Any]:
@@ -402,6 +485,10 @@ class AudioPlayer:
             "duration": self.get_duration()
         }
 
+    def get_current_file(self) -> Optional[str]:
+        """Get the file handed to the backend for the current track."""
+        return self._current_file
+
     def is_playing(self) -> bool:
         """Check if currently playing."""
         return self._state == PlaybackState.PLAYING
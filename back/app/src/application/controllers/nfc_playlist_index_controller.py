@@ -0,0 +1,278 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""
+NfcPlaylistIndex - Resident NFC tag to playlist index.
+
+Keeps every tag-associated playlist prepared in memory (converted, with track
+paths resolved and validated) so a tag scan can start playback without a
+database round-trip. The index is prewarmed at startup and kept current by
+playlist change notifications.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from .playlist_controller import PlaylistController
+from .playlist_state_manager_controller import Playlist
+
+logger = logging.getLogger(__name__)
+
+
+class NfcPlaylistIndex:
+    """
+    In-memory map from NFC tag to a ready-to-play playlist.
+
+    Entries are dropped as soon as a change notification touches them and
+    reloaded in the background, so a scan never plays stale data: a tag that
+    is not in the index simply takes the regular database path.
+    """
+
+    def __init__(self, playlist_controller: PlaylistController, playlist_service):
+        """
+        Initialize an empty index.
+
+        Args:
+            playlist_controller: Controller used to prepare playable playlists
+            playlist_service: Domain playlist service for data access
+        """
+        self._playlist_controller = playlist_controller
+        self._playlist_service = playlist_service
+        self._playlists: Dict[str, Playlist] = {}
+        self._tag_to_playlist: Dict[str, str] = {}
+        self._playlist_to_tag: Dict[str, str] = {}
+        self._track_to_playlist: Dict[str, str] = {}
+        # Bumped on every change; a refresh scheduled before a newer change is discarded
+        self._versions: Dict[str, int] = {}
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._warmed = False
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+
+    # --- Lookup ---
+
+    def get(self, tag_uid: str) -> Optional[Playlist]:
+        """
+        Get the prepared playlist for a tag.
+
+        Returns:
+            Optional[Playlist]: A copy safe to hand to the state manager, or
+            None if the tag is not indexed
+        """
+        playlist_id = self._tag_to_playlist.get(tag_uid)
+        playlist = self._playlists.get(playlist_id) if playlist_id else None
+        if playlist is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return Playlist(id=playlist.id, title=playlist.title, tracks=list(playlist.tracks))
+
+    def peek(self, tag_uid: str) -> Optional[Playlist]:
+        """Get the indexed playlist for a tag without counting a lookup.
+
+        The returned playlist is the index's own copy and must not be modified.
+        """
+        playlist_id = self._tag_to_playlist.get(tag_uid)
+        return self._playlists.get(playlist_id) if playlist_id else None
+
+    # --- Population ---
+
+    async def prewarm(self) -> int:
+        """
+        Load every tag-associated playlist into the index.
+
+        Returns:
+            int: Number of indexed tags
+        """
+        versions = self.capture_versions()
+        try:
+            playlists_data = await self._playlist_service.get_nfc_tagged_playlists()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not prewarm NFC playlist index: {e}")
+            return 0
+        if versions.get("*", 0) != self._version("*"):
+            # Everything was invalidated meanwhile; a new prewarm is scheduled
+            return len(self._tag_to_playlist)
+
+        for playlist_data in playlists_data or []:
+            tag_uid = playlist_data.get("nfc_tag_id")
+            if tag_uid:
+                # Skipped if changed while loading; its own refresh re-indexes it
+                self.remember(tag_uid, playlist_data, versions)
+
+        self._warmed = True
+        logger.info(f"✅ NFC playlist index prewarmed with {len(self._tag_to_playlist)} tags")
+        return len(self._tag_to_playlist)
+
+    def capture_versions(self) -> Dict[str, int]:
+        """
+        Snapshot the change counters before an awaited lookup.
+
+        Returns:
+            Dict[str, int]: Counters to pass to remember() with the lookup result
+        """
+        return dict(self._versions)
+
+    def remember(
+        self,
+        tag_uid: str,
+        playlist_data: Dict[str, Any],
+        versions: Optional[Dict[str, int]] = None,
+    ) -> Optional[Playlist]:
+        """
+        Prepare a playlist and index it under a tag.
+
+        Args:
+            tag_uid: NFC tag UID
+            playlist_data: Raw playlist data as returned by the playlist service
+            versions: Counters captured before playlist_data was loaded; the
+                data is discarded if the tag or playlist changed since
+
+        Returns:
+            Optional[Playlist]: The prepared playlist, or None if it has no
+            playable tracks or is stale (the tag is then left unindexed)
+        """
+        playlist_id = playlist_data.get("id")
+        if not tag_uid or not playlist_id:
+            return None
+        if versions is not None:
+            keys = ("*", f"tag:{tag_uid}", f"playlist:{playlist_id}")
+            if any(versions.get(key, 0) != self._version(key) for key in keys):
+                return None
+
+        self._forget_tag(tag_uid)
+        self._forget_playlist(str(playlist_id))
+
+        playlist = self._playlist_controller.prepare_playlist(playlist_data)
+        if playlist is None:
+            return None
+
+        self._playlists[playlist.id] = playlist
+        self._tag_to_playlist[tag_uid] = playlist.id
+        self._playlist_to_tag[playlist.id] = tag_uid
+        for track_data in playlist_data.get("tracks") or []:
+            track_id = track_data.get("id")
+            if track_id:
+                self._track_to_playlist[str(track_id)] = playlist.id
+        return playlist
+
+    # --- Invalidation ---
+
+    def handle_playlist_change(
+        self,
+        playlist_id: Optional[str] = None,
+        nfc_tag_id: Optional[str] = None,
+        track_id: Optional[str] = None,
+    ) -> None:
+        """
+        Drop entries affected by a write and reload them in the background.
+
+        Matches the playlist cache change listener signature; all arguments
+        None means anything may have changed.
+        """
+        if track_id is not None:
+            playlist_id = self._track_to_playlist.get(track_id)
+            if playlist_id is None:
+                return
+
+        if playlist_id is None and nfc_tag_id is None:
+            self._bump("*")
+            self._clear()
+            self._schedule(self.prewarm())
+            return
+
+        if playlist_id is not None:
+            self._bump(f"playlist:{playlist_id}")
+            self._forget_playlist(playlist_id)
+            self._schedule(self._refresh_playlist(playlist_id, self._version(f"playlist:{playlist_id}")))
+
+        if nfc_tag_id is not None:
+            self._bump(f"tag:{nfc_tag_id}")
+            self._forget_tag(nfc_tag_id)
+            self._schedule(self._refresh_tag(nfc_tag_id, self._version(f"tag:{nfc_tag_id}")))
+
+    async def _refresh_playlist(self, playlist_id: str, version: int) -> None:
+        """Reload a playlist and re-index it if it still has a tag."""
+        key = f"playlist:{playlist_id}"
+        playlist_data = await self._playlist_service.get_playlist(playlist_id)
+        if version != self._version(key) or not playlist_data:
+            return
+        tag_uid = playlist_data.get("nfc_tag_id")
+        if tag_uid:
+            self.remember(tag_uid, playlist_data)
+            self._refreshes += 1
+
+    async def _refresh_tag(self, tag_uid: str, version: int) -> None:
+        """Reload the playlist a tag points at, if any."""
+        key = f"tag:{tag_uid}"
+        playlist_data = await self._playlist_service.get_playlist_by_nfc(tag_uid)
+        if version != self._version(key) or not playlist_data:
+            return
+        self.remember(tag_uid, playlist_data)
+        self._refreshes += 1
+
+    def _schedule(self, coroutine) -> None:
+        """Run a refresh on the current event loop, if there is one."""
+        try:
+            task = asyncio.get_running_loop().create_task(self._run_refresh(coroutine))
+        except RuntimeError:
+            # No loop (sync caller): entries stay dropped until the next scan
+            coroutine.close()
+            return
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    @staticmethod
+    async def _run_refresh(coroutine) -> None:
+        try:
+            await coroutine
+        except Exception as e:
+            logger.warning(f"⚠️ NFC playlist index refresh failed: {e}")
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait until background refreshes have completed."""
+        while self._refresh_tasks:
+            await asyncio.gather(*list(self._refresh_tasks), return_exceptions=True)
+
+    def _forget_tag(self, tag_uid: str) -> None:
+        playlist_id = self._tag_to_playlist.pop(tag_uid, None)
+        if playlist_id is not None:
+            self._forget_playlist(playlist_id)
+
+    def _forget_playlist(self, playlist_id: str) -> None:
+        self._playlists.pop(playlist_id, None)
+        tag_uid = self._playlist_to_tag.pop(playlist_id, None)
+        if tag_uid is not None and self._tag_to_playlist.get(tag_uid) == playlist_id:
+            del self._tag_to_playlist[tag_uid]
+        for track_id in [t for t, p in self._track_to_playlist.items() if p == playlist_id]:
+            del self._track_to_playlist[track_id]
+
+    def _clear(self) -> None:
+        self._playlists.clear()
+        self._tag_to_playlist.clear()
+        self._playlist_to_tag.clear()
+        self._track_to_playlist.clear()
+
+    def _version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def _bump(self, key: str) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    # --- Reporting ---
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get index counters for health reporting."""
+        lookups = self._hits + self._misses
+        return {
+            "warmed": self._warmed,
+            "tags": len(self._tag_to_playlist),
+            "hits": self._hits,
+            "misses": self._misses,
+            "refreshes": self._refreshes,
+            "pending_refreshes": len(self._refresh_tasks),
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
@@ -9,9 +9,14 @@ This coordinator combines playlist management and audio control,
 ensuring single source of truth while maintaining separation of concerns.
 """
 
+import asyncio
 from typing import Optional, Dict, Any
 import logging
+from app.src.domain.audio.events.audio_events import TrackEndedEvent
+from app.src.monitoring import get_latency_tracer
+from app.src.utils.async_file_utils import AsyncFileUtils
 from .playlist_controller import PlaylistController
+from .nfc_playlist_index_controller import NfcPlaylistIndex
 from .audio_player_controller import AudioPlayer
 from .track_resolver_controller import TrackResolver
 
@@ -51,10 +56,17 @@ class PlaybackCoordinator:
 
         self._playlist_controller = PlaylistController(self._track_resolver, playlist_service)
         self._audio_player = AudioPlayer(audio_backend)
+        self._nfc_playlist_index = NfcPlaylistIndex(self._playlist_controller, playlist_service)
+        # In-flight speculative preloads by tag UID
+        self._tag_preloads: Dict[str, asyncio.Task] = {}
 
         # Auto-advance tracking
         self._auto_advance_enabled = True
         self._last_position = 0.0
+        # Audio event bus; when the backend publishes track ends on it,
+        # auto-advance is driven by TrackEndedEvent instead of status polling
+        self._audio_event_bus = None
+        self._track_end_events = False
 
         # Store socketio for state broadcasting
         self._socketio = socketio
@@ -101,9 +113,13 @@ class PlaybackCoordinator:
 
             # Play the track
             if current_track.file_path:
-                success = self._audio_player.play_file(current_track.file_path, current_track.duration_ms)
+                success = self._audio_player.play_file(
+                    self._track_resolver.resolve_playback_path(current_track.file_path),
+                    current_track.duration_ms,
+                )
                 if success:
                     logger.info(f"▶️ Playing: {current_track.title}")
+                    self._queue_next_track()
                 return success
             else:
                 logger.error(f"Track {current_track.title} has no valid file path")
@@ -233,7 +249,11 @@ class PlaybackCoordinator:
 
     def seek(self, position_seconds: float) -> bool:
         """Seek to specific position."""
-        return self._audio_player.seek(position_seconds)
+        success = self._audio_player.seek(position_seconds)
+        if success:
+            # Restarting the decoder drops the queued track
+            self._queue_next_track()
+        return success
 
     def seek_to_position(self, position_ms: int) -> bool:
         """Seek to specific position in milliseconds."""
@@ -244,15 +264,22 @@ class PlaybackCoordinator:
 
     def set_repeat_mode(self, mode: str) -> bool:
         """Set repeat mode (none, one, all)."""
-        return self._playlist_controller.set_repeat_mode(mode)
+        success = self._playlist_controller.set_repeat_mode(mode)
+        if success:
+            self._queue_next_track()
+        return success
 
     def set_shuffle(self, enabled: bool) -> bool:
         """Enable/disable shuffle mode."""
-        return self._playlist_controller.set_shuffle(enabled)
+        success = self._playlist_controller.set_shuffle(enabled)
+        if success:
+            self._queue_next_track()
+        return success
 
     def set_auto_advance(self, enabled: bool) -> None:
         """Enable/disable auto-advance to next track."""
         self._auto_advance_enabled = enabled
+        self._queue_next_track()
         logger.info(f"Auto-advance {'enabled' if enabled else 'disabled'}")
 
     # --- State Queries ---
@@ -264,12 +291,14 @@ class PlaybackCoordinator:
         Returns:
             Dict[str, Any]: Complete status including playlist and audio state
         """
+        self._sync_gapless_transition()
+
         # Get states from components
         audio_state = self._audio_player.get_state()
         playlist_info = self._playlist_controller.get_playlist_info()
 
-        # Check for auto-advance
-        if self._auto_advance_enabled and self._should_auto_advance():
+        # Check for auto-advance (unless track end events drive it)
+        if self._auto_advance_enabled and not self.track_end_events_enabled() and self._should_auto_advance():
             self._handle_auto_advance()
 
         # Extract track for field name mapping
@@ -314,6 +343,58 @@ class PlaybackCoordinator:
 
         Should be called periodically by progress tracking service.
         """
+        self._sync_gapless_transition()
+        if self._auto_advance_enabled and not self.track_end_events_enabled() and self._should_auto_advance():
+            self._handle_auto_advance()
+
+    # --- Track End Events ---
+
+    @property
+    def audio_event_bus(self):
+        """Audio event bus attached with attach_audio_events, if any."""
+        return self._audio_event_bus
+
+    def attach_audio_events(self, event_bus) -> None:
+        """
+        Drive auto-advance from the backend's TrackEndedEvent.
+
+        Backends that do not publish track ends keep the polling path.
+
+        Args:
+            event_bus: Audio domain event bus
+        """
+        if self._audio_event_bus is not None:
+            self._audio_event_bus.unsubscribe(TrackEndedEvent, self._on_track_ended)
+        self._audio_event_bus = event_bus
+        self._track_end_events = self._audio_player.attach_event_bus(event_bus)
+        event_bus.subscribe(TrackEndedEvent, self._on_track_ended)
+        try:
+            event_bus.bind_loop(asyncio.get_running_loop())
+        except RuntimeError:
+            # Bound on the first publish or by the progress service start
+            pass
+        logger.info(f"Track end events {'enabled' if self._track_end_events else 'unavailable'}")
+
+    def track_end_events_enabled(self) -> bool:
+        """Check if TrackEndedEvent, not polling, triggers auto-advance."""
+        return self._track_end_events and self._audio_event_bus.loop_bound
+
+    async def _on_track_ended(self, event: TrackEndedEvent) -> None:
+        """Advance once the backend reports the current track finished.
+
+        Runs on the event loop, like button presses and tag scans, so a track
+        end never advances the playlist concurrently with them.
+        """
+        if event.reason != "completed":
+            return
+        current_file = self._audio_player.get_current_file()
+        if event.file_path != current_file:
+            logger.debug(f"Ignoring end of {event.file_path}, now playing {current_file}")
+            return
+        self._advance_after_track_end()
+
+    def _advance_after_track_end(self) -> None:
+        self._sync_gapless_transition()
         if self._auto_advance_enabled and self._should_auto_advance():
             self._handle_auto_advance()
 
@@ -338,6 +419,40 @@ class PlaybackCoordinator:
             logger.info("📄 End of playlist - stopping playback")
             self.stop()
 
+    def get_audio_backend_statistics(self) -> Dict[str, Any]:
+        """Get the audio backend's seek latency and transition counters."""
+        return self._audio_player.get_backend_statistics()
+
+    # --- Gapless Playback ---
+
+    def is_next_track_queued(self) -> bool:
+        """Check if the next track will start gaplessly when the current one ends."""
+        return self._audio_player.has_queued_next()
+
+    def _queue_next_track(self) -> None:
+        """Queue the track that follows the current one, honouring repeat and shuffle."""
+        if not self._audio_player.supports_gapless():
+            return
+
+        next_track = self._playlist_controller.peek_next_track()
+        if not self._auto_advance_enabled or not next_track or not next_track.file_path:
+            self._audio_player.clear_queued()
+            return
+
+        playback_path = self._track_resolver.resolve_playback_path(next_track.file_path)
+        if not self._audio_player.queue_next(playback_path, next_track.duration_ms):
+            self._audio_player.clear_queued()
+
+    def _sync_gapless_transition(self) -> None:
+        """Follow the backend onto a queued track it started on its own."""
+        if not self._audio_player.consume_track_transition():
+            return
+
+        track = self._playlist_controller.next_track()
+        if track:
+            logger.info(f"⏭️ Gapless transition to: {track.title}")
+        self._queue_next_track()
+
     # --- Helper Methods ---
 
     def _find_track_by_id(self, track_id: str) -> Optional[Any]:
@@ -372,6 +487,11 @@ class PlaybackCoordinator:
         """Get audio player for advanced operations."""
         return self._audio_player
 
+    @property
+    def nfc_playlist_index(self) -> NfcPlaylistIndex:
+        """Get the resident NFC tag to playlist index."""
+        return self._nfc_playlist_index
+
     # --- NFC Integration ---
 
     async def handle_tag_scanned(self, tag_uid: str, tag_data: Optional[Dict[str, Any]] = None) -> None:
@@ -381,21 +501,45 @@ class PlaybackCoordinator:
             tag_uid: The UID of the scanned NFC tag
             tag_data: Optional additional tag data
         """
+        tracer = get_latency_tracer()
         try:
             logger.info(f"🏷️ NFC tag scanned: {tag_uid}")
 
+            # A speculative preload already resolving this tag is cheaper to join
+            preload = self._tag_preloads.get(tag_uid)
+            if preload is not None and not preload.done():
+                with tracer.span("preload_wait"):
+                    await asyncio.wait({preload})
+
+            # Fast path: playlist already prepared in memory, no database access
+            with tracer.span("tag_lookup"):
+                prepared = self._nfc_playlist_index.get(tag_uid)
+            if prepared is not None:
+                logger.info(f"🎵 Found playlist '{prepared.title}' for NFC tag (indexed)")
+                with tracer.span("load_playlist"):
+                    load_success = self._playlist_controller.set_prepared_playlist(prepared)
+                if load_success:
+                    await self._start_nfc_playlist(prepared.id, prepared.title)
+                else:
+                    logger.warning(f"⚠️ Failed to load playlist '{prepared.title}'")
+                    tracer.finish(status="load_failed")
+                return
+
             # Try to find a playlist associated with this NFC tag
             logger.info(f"🔍 Looking for playlist associated with NFC tag: {tag_uid}")
 
             # Check if data application service is available
             if not self._data_application_service:
                 logger.warning("⚠️ Data application service not injected, cannot look up NFC playlist")
+                tracer.finish(status="unavailable")
                 return
 
             # Use the injected DDD service to find playlist by NFC tag
             try:
                 # This returns the playlist dict directly (or None)
-                playlist = await self._data_application_service.get_playlist_by_nfc_use_case(tag_uid)
+                versions = self._nfc_playlist_index.capture_versions()
+                with tracer.span("tag_lookup"):
+                    playlist = await self._data_application_service.get_playlist_by_nfc_use_case(tag_uid)
 
                 if playlist:
                     playlist_title = playlist.get("title", playlist.get("name", "Unknown"))
@@ -404,31 +548,92 @@ class PlaybackCoordinator:
                     logger.info(f"🎵 Found playlist '{playlist_title}' for NFC tag")
 
                     # Load and start the playlist (async)
-                    load_success = await self.load_playlist(playlist_id)
+                    with tracer.span("load_playlist"):
+                        load_success = await self.load_playlist(playlist_id)
                     if load_success:
-                        # Start playing from track 1
-                        play_success = self.start_playlist(1)
-                        if play_success:
-                            logger.info(f"🎵 Started playing playlist '{playlist_title}'")
-
-                            # CRITICAL FIX: Broadcast playlist started event via Socket.IO
-                            # This ensures the frontend receives state updates just like in the UI flow
-                            await self._broadcast_playlist_started(playlist_id)
-                        else:
-                            logger.warning(f"⚠️ Failed to start playing playlist '{playlist_title}'")
+                        await self._start_nfc_playlist(playlist_id, playlist_title)
+                        # Index the tag so the next scan skips the database
+                        if playlist.get("tracks"):
+                            self._nfc_playlist_index.remember(tag_uid, playlist, versions)
                     else:
                         logger.warning(f"⚠️ Failed to load playlist '{playlist_title}'")
+                        tracer.finish(status="load_failed")
                 else:
                     logger.warning(f"⚠️ No playlist found for NFC tag: {tag_uid}")
+                    tracer.finish(status="no_playlist")
 
             except Exception as service_error:
                 logger.error(f"❌ Error accessing playlist service: {service_error}")
                 logger.warning(f"⚠️ No playlist found for NFC tag: {tag_uid}")
+                tracer.finish(status="error")
 
             logger.info(f"✅ NFC tag handling completed for: {tag_uid}")
 
         except Exception as e:
             logger.error(f"❌ Error handling NFC tag {tag_uid}: {e}")
+            tracer.finish(status="error")
+
+    def start_tag_preload(self, tag_uid: str) -> Optional[asyncio.Task]:
+        """Start preparing playback for a tag before it is routed to playback.
+
+        Resolves the tag's playlist into the NFC index (when it is not already
+        there) and warms the first track into the OS page cache, so the scan
+        that follows starts from memory. Cancelling the task is safe at any
+        point: the index is only updated once the lookup has completed.
+
+        Args:
+            tag_uid: The UID of the detected NFC tag
+
+        Returns:
+            Optional[asyncio.Task]: The preload task, or None without a running loop
+        """
+        task = self._tag_preloads.get(tag_uid)
+        if task is not None and not task.done():
+            return task
+        try:
+            task = asyncio.get_running_loop().create_task(self._preload_tag(tag_uid))
+        except RuntimeError:
+            return None
+        self._tag_preloads[tag_uid] = task
+        task.add_done_callback(
+            lambda done: self._tag_preloads.pop(tag_uid, None) if self._tag_preloads.get(tag_uid) is done else None
+        )
+        return task
+
+    async def _preload_tag(self, tag_uid: str) -> None:
+        """Resolve a tag's playlist into the index and warm its first track."""
+        with get_latency_tracer().span("speculative_preload"):
+            try:
+                prepared = self._nfc_playlist_index.peek(tag_uid)
+                if prepared is None and self._data_application_service:
+                    versions = self._nfc_playlist_index.capture_versions()
+                    playlist = await self._data_application_service.get_playlist_by_nfc_use_case(tag_uid)
+                    if playlist and playlist.get("tracks"):
+                        prepared = self._nfc_playlist_index.remember(tag_uid, playlist, versions)
+                if prepared is not None and prepared.tracks and prepared.tracks[0].file_path:
+                    # Warm the file that will actually play, the rendition if cached
+                    await AsyncFileUtils.prefetch(
+                        self._track_resolver.resolve_playback_path(prepared.tracks[0].file_path)
+                    )
+            except asyncio.CancelledError:
+                logger.debug(f"Speculative preload cancelled for NFC tag {tag_uid}")
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Speculative preload failed for NFC tag {tag_uid}: {e}")
+
+    async def _start_nfc_playlist(self, playlist_id: str, playlist_title: str) -> None:
+        """Start a freshly loaded NFC playlist from track 1 and broadcast it."""
+        play_success = self.start_playlist(1)
+        # Tag-to-audio ends when the backend started output, before broadcasting
+        get_latency_tracer().finish(status="ok" if play_success else "play_failed", end_mark="audio_output")
+        if play_success:
+            logger.info(f"🎵 Started playing playlist '{playlist_title}'")
+
+            # CRITICAL FIX: Broadcast playlist started event via Socket.IO
+            # This ensures the frontend receives state updates just like in the UI flow
+            await self._broadcast_playlist_started(playlist_id)
+        else:
+            logger.warning(f"⚠️ Failed to start playing playlist '{playlist_title}'")
 
     async def _broadcast_playlist_started(self, playlist_id: str) -> None:
         """Broadcast playlist started event via Socket.IO.
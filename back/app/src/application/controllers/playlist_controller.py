@@ -81,36 +81,66 @@ class PlaylistController:
                 logger.error(f"Playlist {playlist_id} not found")
                 return False
 
-            # Convert to domain objects
-            playlist = self._convert_to_domain_playlist(playlist_data)
-            if not playlist:
-                logger.error(f"Failed to convert playlist {playlist_id}")
+            playlist = self.prepare_playlist(playlist_data)
+            if playlist is None:
                 return False
 
-            # Resolve track file paths
-            self._resolve_track_paths(playlist)
+            return self.set_prepared_playlist(playlist)
 
-            # Validate playlist
-            valid_tracks = self._validate_tracks(playlist.tracks)
-            if not valid_tracks:
-                logger.error(f"No valid tracks in playlist {playlist_id}")
-                return False
+        except Exception as e:
+            logger.error(f"Error loading playlist {playlist_id}: {e}")
+            return False
 
-            # Update playlist with valid tracks only
-            playlist.tracks = valid_tracks
+    def prepare_playlist(self, playlist_data: Dict[str, Any]) -> Optional[Playlist]:
+        """
+        Build a playable playlist from raw data without changing current state.
 
-            # Set in state manager
-            success = self._state_manager.set_playlist(playlist)
-            if success:
-                logger.info(
-                    f"✅ Playlist '{playlist.title}' loaded with {len(valid_tracks)} valid tracks"
-                )
+        Converts the data, resolves track file paths and keeps only valid
+        tracks, so the result can be handed to set_prepared_playlist later.
 
-            return success
+        Args:
+            playlist_data: Raw playlist data as returned by the playlist service
 
-        except Exception as e:
-            logger.error(f"Error loading playlist {playlist_id}: {e}")
-            return False
+        Returns:
+            Optional[Playlist]: Playlist with resolved tracks, or None if unusable
+        """
+        playlist_id = playlist_data.get("id")
+
+        # Convert to domain objects
+        playlist = self._convert_to_domain_playlist(playlist_data)
+        if not playlist:
+            logger.error(f"Failed to convert playlist {playlist_id}")
+            return None
+
+        # Resolve track file paths
+        self._resolve_track_paths(playlist)
+
+        # Validate playlist
+        valid_tracks = self._validate_tracks(playlist.tracks)
+        if not valid_tracks:
+            logger.error(f"No valid tracks in playlist {playlist_id}")
+            return None
+
+        # Update playlist with valid tracks only
+        playlist.tracks = valid_tracks
+        return playlist
+
+    def set_prepared_playlist(self, playlist: Playlist) -> bool:
+        """
+        Make a playlist built by prepare_playlist the current one.
+
+        Args:
+            playlist: Prepared playlist
+
+        Returns:
+            bool: True if the playlist was set
+        """
+        success = self._state_manager.set_playlist(playlist)
+        if success:
+            logger.info(
+                f"✅ Playlist '{playlist.title}' loaded with {len(playlist.tracks)} valid tracks"
+            )
+        return success
 
     async def _get_playlist_data(self, playlist_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -240,6 +270,10 @@ class PlaylistController:
         """Move to next track."""
         return self._state_manager.move_to_next()
 
+    def peek_next_track(self) -> Optional[Track]:
+        """Get the track next_track would move to, without moving."""
+        return self._state_manager.peek_next()
+
     def previous_track(self) -> Optional[Track]:
         """Move to previous track."""
         return self._state_manager.move_to_previous()
@@ -131,6 +131,35 @@ class PlaylistStateManager:
         Returns:
             Optional[Track]: Next track or None if at end
         """
+        next_index = self._next_track_index()
+        if next_index is None:
+            return None
+
+        # Handle repeat one
+        if self._repeat_mode == "one":
+            return self.get_current_track()
+
+        self._current_track_index = next_index
+        track = self.get_current_track()
+        if track:
+            logger.info(f"Moved to next track: {track.title} (index {self._current_track_index})")
+
+        return track
+
+    def peek_next(self) -> Optional[Track]:
+        """
+        Get the track move_to_next would select, without moving.
+
+        Returns:
+            Optional[Track]: Next track or None if at end
+        """
+        next_index = self._next_track_index()
+        if next_index is None:
+            return None
+        return self._current_playlist.tracks[next_index]
+
+    def _next_track_index(self) -> Optional[int]:
+        """Index of the next track honouring repeat and shuffle, or None at end."""
         if not self._current_playlist or not self._current_playlist.tracks:
             return None
 
@@ -138,7 +167,9 @@ class PlaylistStateManager:
 
         # Handle repeat one
         if self._repeat_mode == "one":
-            return self.get_current_track()
+            if 0 <= self._current_track_index < total_tracks:
+                return self._current_track_index
+            return None
 
         # Calculate next index
         if self._shuffle_enabled and self._shuffle_order:
@@ -146,26 +177,18 @@ class PlaylistStateManager:
             next_shuffle_pos = current_shuffle_pos + 1
 
             if next_shuffle_pos < len(self._shuffle_order):
-                self._current_track_index = self._shuffle_order[next_shuffle_pos]
+                return self._shuffle_order[next_shuffle_pos]
             elif self._repeat_mode == "all":
-                self._current_track_index = self._shuffle_order[0]
-            else:
-                return None  # End of playlist
-        else:
-            next_index = self._current_track_index + 1
+                return self._shuffle_order[0]
+            return None  # End of playlist
 
-            if next_index < total_tracks:
-                self._current_track_index = next_index
-            elif self._repeat_mode == "all":
-                self._current_track_index = 0
-            else:
-                return None  # End of playlist
+        next_index = self._current_track_index + 1
 
-        track = self.get_current_track()
-        if track:
-            logger.info(f"Moved to next track: {track.title} (index {self._current_track_index})")
-
-        return track
+        if next_index < total_tracks:
+            return next_index
+        elif self._repeat_mode == "all":
+            return 0
+        return None  # End of playlist
 
     def move_to_previous(self) -> Optional[Track]:
         """
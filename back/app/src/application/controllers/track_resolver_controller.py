@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional, List
 import logging
 from app.src.config import config
+from app.src.services.transcoding_service import get_transcoding_service
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +91,23 @@ class TrackResolver:
         logger.warning(f"Could not resolve path for: {filename}")
         return None
 
+    def resolve_playback_path(self, file_path: Optional[str]) -> Optional[str]:
+        """
+        Resolve the file handed to the audio backend for a track.
+
+        Args:
+            file_path: Full path to the original track file
+
+        Returns:
+            Optional[str]: Path of its cached rendition when one is current,
+            otherwise the original path
+        """
+        try:
+            return get_transcoding_service().playback_path(file_path)
+        except Exception as e:
+            logger.warning(f"Could not look up cached rendition for {file_path}: {e}")
+            return file_path
+
     def validate_path(self, file_path: str) -> bool:
         """
         Validate that a file path exists and is readable.
@@ -21,6 +21,7 @@ from app.src.application.services.upload_application_service import UploadApplic
 from app.src.infrastructure.upload.adapters.file_storage_adapter import LocalFileStorageAdapter
 from app.src.infrastructure.upload.adapters.metadata_extractor import MutagenMetadataExtractor
 from app.src.services.error.unified_error_decorator import handle_errors
+from app.src.services.transcoding_service import get_transcoding_service
 
 
 logger = get_logger(__name__)
@@ -226,6 +227,9 @@ class UploadController:
             logger.info(f"✅ Upload finalized, track ready for domain integration: {track_entry.get('title')}",
             )
 
+            # Convert costly formats for playback without holding up the response
+            get_transcoding_service().schedule([file_path])
+
             # Emit completion event
             await self.socketio.emit(
                 "upload:complete",
@@ -165,12 +165,14 @@ def register_application_services(container: ApplicationContainer) -> None:
         # Get audio backend from domain container
         if audio_domain_container.is_initialized:
             audio_backend = audio_domain_container.backend
-            return PlaybackCoordinator(
+            coordinator = PlaybackCoordinator(
                 audio_backend,
                 playlist_service=playlist_service,
                 socketio=None,
                 data_application_service=data_app_service
             )
+            coordinator.attach_audio_events(audio_domain_container.event_bus)
+            return coordinator
 
         # Fallback: create with mock backend
         from app.src.domain.audio.backends.implementations.mock_audio_backend import MockAudioBackend
@@ -10,6 +10,7 @@ from app.src.monitoring import get_logger
 from app.src.domain.data.services.playlist_service import PlaylistService
 from app.src.domain.data.services.track_service import TrackService
 from app.src.common.exceptions import BusinessLogicError
+from app.src.services.transcoding_service import get_transcoding_service
 
 logger = get_logger(__name__)
 
@@ -37,18 +38,31 @@ class DataApplicationService:
         logger.info("✅ DataApplicationService initialized")
 
     # Playlist operations
-    async def get_playlists_use_case(self, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
+    async def get_playlists_use_case(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+        view: str = "full",
+    ) -> Dict[str, Any]:
         """Get paginated playlists.
 
         Args:
             page: Page number
             page_size: Items per page
+            cursor: Keyset cursor; when set, ``page`` is ignored
+            view: ``"full"`` to include tracks, ``"summary"`` for a track-free listing
 
         Returns:
             Paginated playlist data
         """
         try:
-            return await self._playlist_service.get_playlists(page, page_size)
+            options = {}
+            if cursor is not None:
+                options["cursor"] = cursor
+            if view != "full":
+                options["view"] = view
+            return await self._playlist_service.get_playlists(page, page_size, **options)
         except Exception as e:
             logger.error(f"Failed to get playlists: {e}")
             raise BusinessLogicError(f"Failed to retrieve playlists: {str(e)}")
@@ -90,6 +104,30 @@ class DataApplicationService:
             logger.error(f"Failed to create playlist {name}: {e}")
             raise BusinessLogicError(f"Failed to create playlist: {str(e)}")
 
+    async def import_playlists_use_case(self, playlists_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Import many playlists with their tracks in a single transaction.
+
+        Args:
+            playlists_data: Playlist dicts, each with a title and a tracks list
+
+        Returns:
+            Imported playlist IDs and counts
+        """
+        try:
+            normalized = []
+            for playlist_data in playlists_data:
+                title = (playlist_data.get('title') or '').strip()
+                if not title:
+                    raise BusinessLogicError("Playlist name is required")
+                normalized.append({**playlist_data, 'title': title})
+
+            return await self._playlist_service.import_playlists(normalized)
+        except BusinessLogicError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to import {len(playlists_data)} playlists: {e}")
+            raise BusinessLogicError(f"Failed to import playlists: {str(e)}")
+
     async def update_playlist_use_case(self, playlist_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update playlist metadata.
 
@@ -176,7 +214,9 @@ class DataApplicationService:
             Sync statistics
         """
         try:
-            return await self._playlist_service.sync_with_filesystem(upload_folder)
+            stats = await self._playlist_service.sync_with_filesystem(upload_folder)
+            get_transcoding_service().schedule_folder(upload_folder)
+            return stats
         except Exception as e:
             logger.error(f"Failed to sync filesystem: {e}")
             raise BusinessLogicError(f"Failed to sync filesystem: {str(e)}")
@@ -13,6 +13,7 @@ from app.src.domain.nfc.protocols.nfc_hardware_protocol import (
     NfcHardwareProtocol,
     NfcRepositoryProtocol,
 )
+from app.src.monitoring import get_latency_tracer
 from app.src.services.error.unified_error_decorator import handle_service_errors
 import logging
 
@@ -56,6 +57,7 @@ class NfcApplicationService:
         # Event callbacks
         self._tag_detected_callbacks: List[Callable[[str], None]] = []
         self._association_callbacks: List[Callable[[Dict], None]] = []
+        self._tag_preload_callbacks: List[Callable[[str], Optional[asyncio.Task]]] = []
 
         # Setup hardware callbacks
         self._nfc_hardware.set_tag_detected_callback(self._on_tag_detected)
@@ -104,6 +106,8 @@ class NfcApplicationService:
                     await self._cleanup_task
                 except asyncio.CancelledError:
                     pass  # Expected when cancelling
+            # Persist buffered tag detections
+            await self._nfc_repository.close()
 
             logger.info("✅ NFC system stopped successfully")
             return {"status": "success", "message": "NFC system stopped"}
@@ -294,6 +298,20 @@ class NfcApplicationService:
         """
         self._tag_detected_callbacks.append(callback)
 
+    def register_tag_preload_callback(
+        self, callback: Callable[[str], Optional[asyncio.Task]]
+    ) -> None:
+        """Register callback for speculative preloading on tag detection.
+
+        Called with the tag UID before the association check; it should start
+        (and return) a task preparing playback for the tag. The task is
+        cancelled if the tag turns out to be scanned for association.
+
+        Args:
+            callback: Function starting a preload task for a tag UID
+        """
+        self._tag_preload_callbacks.append(callback)
+
     def register_association_callback(self, callback: Callable[[Dict], None]) -> None:
         """Register callback for association events.
 
@@ -315,7 +333,9 @@ class NfcApplicationService:
             logger.error(f"❌ Unknown tag data format: {tag_data}")
             return
         logger.debug(f"🔄 NfcApplicationService received tag: {tag_identifier}")
-        asyncio.create_task(self._handle_tag_detection(tag_identifier))
+        # Joins the hardware trace, or starts one for tags from other sources
+        with get_latency_tracer().ensure_trace("tag_to_audio", uid=tag_identifier.uid):
+            asyncio.create_task(self._handle_tag_detection(tag_identifier))
 
     def _on_tag_removed(self) -> None:
         """Handle tag removal from hardware."""
@@ -328,6 +348,52 @@ class NfcApplicationService:
         association and does NOT trigger playback. This prevents accidental playback
         when user is trying to associate a tag.
         """
+        tracer = get_latency_tracer()
+        # Preloads run while the tag is routed; association mode cancels them
+        preloads = self._start_tag_preloads(tag_identifier.uid)
+        try:
+            with tracer.span("nfc_service"):
+                playback_requested = await self._process_tag_detection(tag_identifier, preloads)
+        except BaseException:
+            self._cancel_tag_preloads(preloads)
+            raise
+        if not playback_requested:
+            self._cancel_tag_preloads(preloads)
+            tracer.finish(status="association")
+
+    def _start_tag_preloads(self, tag_uid: str) -> List[asyncio.Task]:
+        """Start speculative preload tasks for a detected tag."""
+        tasks = []
+        for callback in self._tag_preload_callbacks:
+            try:
+                task = callback(tag_uid)
+            except Exception as e:
+                logger.warning(f"⚠️ Tag preload callback failed for {tag_uid}: {e}")
+                continue
+            if task is not None:
+                tasks.append(task)
+        return tasks
+
+    @staticmethod
+    def _cancel_tag_preloads(preloads: List[asyncio.Task]) -> None:
+        for task in preloads:
+            if not task.done():
+                task.cancel()
+        preloads.clear()
+
+    async def _process_tag_detection(
+        self, tag_identifier: TagIdentifier, preloads: Optional[List[asyncio.Task]] = None
+    ) -> bool:
+        """Route a detected tag to association or playback.
+
+        Args:
+            tag_identifier: Detected tag
+            preloads: Speculative preload tasks, cancelled on entering
+                association mode
+
+        Returns:
+            True if playback callbacks were notified
+        """
         logger.info(f"🔄 NfcApplicationService processing tag detection: {tag_identifier}")
 
         # Check if ANY association session is active
@@ -336,6 +402,8 @@ class NfcApplicationService:
         if active_sessions:
             # ASSOCIATION MODE: Block playback, process association only
             logger.info(f"🔒 Association mode active ({len(active_sessions)} sessions), blocking playback for tag {tag_identifier}")
+            if preloads:
+                self._cancel_tag_preloads(preloads)
 
             # Process through association service
             result = await self._association_service.process_tag_detection(tag_identifier)
@@ -369,7 +437,7 @@ class NfcApplicationService:
 
             # Do NOT notify tag detection callbacks - prevents playback trigger
             logger.debug(f"🔒 Skipping tag detection callbacks to prevent playback during association mode")
-            return  # Exit early, do not trigger playback
+            return False  # Exit early, do not trigger playback
 
         # NORMAL MODE: No active association sessions, proceed with normal tag detection
         logger.info(f"▶️ Normal mode, processing tag detection for playback: {tag_identifier}")
@@ -391,6 +459,7 @@ class NfcApplicationService:
         )
         for callback in self._tag_detected_callbacks:
             callback(str(tag_identifier))
+        return True
 
     async def _periodic_cleanup(self) -> None:
         """Periodic cleanup of expired sessions."""
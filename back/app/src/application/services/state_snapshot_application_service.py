@@ -97,8 +97,10 @@ class StateSnapshotApplicationService:
         playlists = []
         if self._data_application_service:
             try:
-                # Get all playlists via injected application service
-                playlists_result = await self._data_application_service.get_playlists_use_case()
+                # Snapshot only carries summaries, so skip loading tracks
+                playlists_result = await self._data_application_service.get_playlists_use_case(
+                    view="summary"
+                )
 
                 # The DDD service returns data directly with 'playlists' key
                 playlists = playlists_result.get("playlists", [])
@@ -16,6 +16,7 @@ import logging
 
 from app.src.services.notification_service import DownloadNotifier
 from app.src.infrastructure.youtube.youtube_downloader import YouTubeDownloader
+from app.src.services.transcoding_service import get_transcoding_service
 
 logger = logging.getLogger(__name__)
 
@@ -76,26 +77,32 @@ class YouTubeApplicationService:
 
             # Create playlist using new architecture
             data_service = self._get_data_application_service()
-            
-            # Create playlist first
-            playlist_result = await data_service.create_playlist_use_case(
-                name=result["title"],
-                description=f"YouTube download from {url}"
-            )
-            playlist_id = playlist_result.get("id")
-            
-            # Add tracks/chapters to the playlist
+
+            # Adapt tracks/chapters to the expected format
             tracks = result.get("chapters", [])
-            for track_data in tracks:
-                # Adapt track data to expected format
-                track_info = {
+            track_infos = [
+                {
                     "title": track_data.get("title", "Unknown Track"),
                     "filename": track_data.get("filename"),
                     "start_time": track_data.get("start_time", 0),
                     "end_time": track_data.get("end_time", 0),
                     "folder": str(relative_path)
                 }
-                await data_service.add_track_use_case(playlist_id, track_info)
+                for track_data in tracks
+            ]
+
+            # Create the playlist and all of its tracks in one transaction
+            import_result = await data_service.import_playlists_use_case([
+                {
+                    "title": result["title"],
+                    "description": f"YouTube download from {url}",
+                    "tracks": track_infos,
+                }
+            ])
+            playlist_id = import_result["playlist_ids"][0]
+
+            # Downloads keep the format YouTube served; convert costly ones in the background
+            get_transcoding_service().schedule_folder(Path(self.config.upload_folder) / result["folder"])
 
             # Send completion notification
             await notifier.notify(
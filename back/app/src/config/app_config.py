@@ -517,6 +517,24 @@ class AppConfig:
             self.audio.default_volume = int(os.environ["AUDIO_DEFAULT_VOLUME"])
         if "AUDIO_VOLUME_STEP" in os.environ:
             self.audio.volume_step = int(os.environ["AUDIO_VOLUME_STEP"])
+        if "AUDIO_MIXER_PROFILE" in os.environ:
+            self.audio.mixer_profile = os.environ["AUDIO_MIXER_PROFILE"].strip().lower()
+        if "AUDIO_MIXER_SELF_TEST" in os.environ:
+            self.audio.mixer_self_test = os.environ["AUDIO_MIXER_SELF_TEST"].lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+        if "AUDIO_TRANSCODE_ENABLED" in os.environ:
+            self.audio.transcode_enabled = os.environ["AUDIO_TRANSCODE_ENABLED"].lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+        if "AUDIO_TRANSCODE_WORKERS" in os.environ:
+            self.audio.transcode_workers = int(os.environ["AUDIO_TRANSCODE_WORKERS"])
+        if "AUDIO_TRANSCODE_QUOTA_MB" in os.environ:
+            self.audio.transcode_quota_mb = int(os.environ["AUDIO_TRANSCODE_QUOTA_MB"])
 
         # Hardware config overrides
         if "USE_MOCK_HARDWARE" in os.environ:
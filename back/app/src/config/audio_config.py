@@ -7,7 +7,49 @@ Audio configuration settings for TheOpenMusicBox.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class MixerProfile:
+    """
+    pygame/SDL output settings trading latency against CPU load and underrun risk.
+
+    Smaller buffers start audio sooner but wake the mixer thread more often and
+    leave less slack before the device runs dry on a busy Pi.
+    """
+
+    name: str
+    frequency: int  # Output sample rate in Hz
+    buffer: int  # Samples per SDL audio callback (power of two)
+    size: int = -16  # Signed 16-bit samples
+    channels: int = 2
+
+    @property
+    def buffer_latency_ms(self) -> float:
+        """Audio held by one SDL buffer, in milliseconds."""
+        return round(self.buffer * 1000 / self.frequency, 1)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize the profile for status reporting."""
+        return {
+            "name": self.name,
+            "frequency": self.frequency,
+            "buffer": self.buffer,
+            "size": self.size,
+            "channels": self.channels,
+            "buffer_latency_ms": self.buffer_latency_ms,
+        }
+
+
+MIXER_PROFILES: Dict[str, MixerProfile] = {
+    # Pi 4/5: ~11 ms buffers for snappy tag-to-audio
+    "low_latency": MixerProfile("low_latency", frequency=48000, buffer=512),
+    # Matches the WM8960 native format; safe on every Pi
+    "balanced": MixerProfile("balanced", frequency=48000, buffer=2048),
+    # Pi Zero/3: large buffers, and 44.1 kHz spares SDL resampling most music
+    "low_cpu": MixerProfile("low_cpu", frequency=44100, buffer=4096),
+}
 
 
 @dataclass
@@ -23,12 +65,17 @@ class AudioConfig:
     volume_step: int = 5  # Volume change step for encoder/buttons
     min_volume: int = 0  # Minimum allowed volume
     max_volume: int = 100  # Maximum allowed volume
+    mixer_control: str = "Master"  # ALSA mixer control driven for hardware volume
+    volume_coalesce_window: float = 0.05  # Minimum seconds between hardware volume writes
 
     # Playback settings
     fade_in_duration: float = 0.5  # Fade in duration in seconds
     fade_out_duration: float = 0.5  # Fade out duration in seconds
     crossfade_duration: float = 2.0  # Crossfade between tracks in seconds
     buffer_size: int = 4096  # Audio buffer size in bytes
+    gapless_playback: bool = True  # Queue the next track in the decoder to avoid silence between tracks
+    mixer_profile: str = "balanced"  # Output latency profile, one of MIXER_PROFILES
+    mixer_self_test: bool = False  # Measure time-to-first-audio and underruns when the mixer opens
 
     # Audio format settings
     sample_rate: int = 44100  # Sample rate in Hz
@@ -49,12 +96,22 @@ class AudioConfig:
     # File format support
     supported_formats: List[str] = None
 
+    # Transcoding cache: MP3 renditions of costly files, stored next to the originals
+    transcode_enabled: bool = False  # Opt-in: convert costly files in the background after import
+    transcode_formats: List[str] = None  # Formats always converted for playback
+    transcode_max_bitrate: int = 256  # kbps above which other files are converted too
+    transcode_bitrate: int = 192  # kbps of the MP3 rendition
+    transcode_workers: int = 1  # ffmpeg processes running at once
+    transcode_quota_mb: int = 1024  # Disk space for renditions, least recently played evicted first (0 = no limit)
+
     def __post_init__(self):
         """
         Initialize default values for mutable fields.
         """
         if self.supported_formats is None:
             self.supported_formats = ["mp3", "wav", "flac", "ogg", "m4a"]
+        if self.transcode_formats is None:
+            self.transcode_formats = ["flac", "m4a", "aac", "wma"]
 
     def validate(self) -> None:
         """
@@ -71,3 +128,20 @@ class AudioConfig:
 
         if self.min_volume >= self.max_volume:
             raise ValueError("min_volume must be less than max_volume")
+
+        if self.transcode_workers < 1:
+            raise ValueError(f"transcode_workers must be at least 1, got {self.transcode_workers}")
+
+        if self.transcode_quota_mb < 0:
+            raise ValueError(f"transcode_quota_mb must not be negative, got {self.transcode_quota_mb}")
+
+        if self.mixer_profile not in MIXER_PROFILES:
+            raise ValueError(
+                f"mixer_profile must be one of {sorted(MIXER_PROFILES)}, got {self.mixer_profile}"
+            )
+
+    def get_mixer_profile(self) -> MixerProfile:
+        """
+        Get the configured mixer profile, falling back to balanced if unknown.
+        """
+        return MIXER_PROFILES.get(self.mixer_profile, MIXER_PROFILES["balanced"])
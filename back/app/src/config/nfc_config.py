@@ -24,9 +24,19 @@ class NFCConfig:
 
     # Tag detection settings
     tag_cooldown: float = 0.5  # Cooldown period after tag detection
-    tag_removal_threshold: float = 1.0  # Time to confirm tag removal
+    tag_removal_threshold: float = 1.0  # Time without reads to confirm tag removal
     max_errors: int = 3  # Max consecutive errors before reset
     debounce_time: float = 0.2  # Debounce time for tag detection
+    presence_confirm_reads: int = 1  # Reads of a UID needed to confirm it present...
+    presence_window_size: int = 3  # ...within this many consecutive polls
+
+    # Adaptive polling (debounce_time is the fixed interval when disabled)
+    adaptive_polling_enabled: bool = True  # Adapt the poll rate to reader activity
+    poll_interval_min: float = 0.1  # Poll interval right after activity in seconds
+    poll_interval_max: float = 0.6  # Ceiling the idle poll interval backs off to
+    poll_backoff_factor: float = 1.5  # Growth of the poll interval per idle poll
+    idle_backoff_delay: float = 30.0  # Seconds without activity before backing off
+    presence_hold_interval: float = 0.3  # Presence check interval while a tag is held
 
     # Playback control
     manual_action_priority_window: float = 1.0  # Window for manual actions to override NFC
@@ -64,5 +74,32 @@ class NFCConfig:
         if self.tag_cooldown < 0:
             raise ValueError(f"tag_cooldown must be non-negative, got {self.tag_cooldown}")
 
+        if self.tag_removal_threshold < 0:
+            raise ValueError(
+                f"tag_removal_threshold must be non-negative, got {self.tag_removal_threshold}"
+            )
+
+        if not 1 <= self.presence_confirm_reads <= self.presence_window_size:
+            raise ValueError(
+                "presence_confirm_reads must be between 1 and presence_window_size, "
+                f"got {self.presence_confirm_reads} of {self.presence_window_size}"
+            )
+
+        if self.poll_interval_min <= 0:
+            raise ValueError(f"poll_interval_min must be positive, got {self.poll_interval_min}")
+
+        if self.poll_interval_max < self.poll_interval_min:
+            raise ValueError(
+                f"poll_interval_max must be >= poll_interval_min, got {self.poll_interval_max}"
+            )
+
+        if self.poll_backoff_factor < 1:
+            raise ValueError(f"poll_backoff_factor must be >= 1, got {self.poll_backoff_factor}")
+
+        if self.presence_hold_interval <= 0:
+            raise ValueError(
+                f"presence_hold_interval must be positive, got {self.presence_hold_interval}"
+            )
+
         if self.pause_threshold < 0:
             raise ValueError(f"pause_threshold must be non-negative, got {self.pause_threshold}")
@@ -89,6 +89,9 @@ class Application:
         # Synchronize playlists with filesystem at startup
         await self._sync_playlists_domain()
 
+        # Prepare tag-associated playlists so scans skip the database
+        await self._prewarm_nfc_playlist_index()
+
         return self
 
     # MARK: - Domain Architecture Initialization
@@ -131,6 +134,15 @@ class Application:
             domain_bootstrap.initialize(existing_backend=container_audio)
             logger.info("✅ Pure Domain Application initialized successfully")
 
+        # Let the audio backend answer duration lookups from the shared metadata cache
+        from app.src.infrastructure.adapters.audio.audio_metadata_cache import get_audio_metadata_cache
+
+        audio_domain_container = container.get("audio_domain_container")
+        if audio_domain_container.is_initialized:
+            audio_backend = audio_domain_container.backend
+            if hasattr(audio_backend, "attach_metadata_cache"):
+                audio_backend.attach_metadata_cache(get_audio_metadata_cache())
+
         # Get PlaybackCoordinator from DI container (singleton managed by container)
         from app.src.dependencies import get_playback_coordinator
 
@@ -186,6 +198,19 @@ class Application:
                 except Exception as e:
                     logger.error(f"Error scheduling NFC event handler: {e}")
 
+    # MARK: - NFC Playlist Index
+    @handle_errors("_prewarm_nfc_playlist_index")
+    async def _prewarm_nfc_playlist_index(self):
+        """Load the NFC playlist index and subscribe it to playlist changes."""
+        index = getattr(self._playlist_controller, "nfc_playlist_index", None)
+        if index is None:
+            logger.warning("⚠️ NFC playlist index not available, tag scans will query the database")
+            return
+
+        from app.src.infrastructure.repositories.playlist_cache import add_playlist_change_listener
+        add_playlist_change_listener(index.handle_playlist_change)
+        await index.prewarm()
+
     # MARK: - Domain Playlist Synchronization
     @handle_errors("_sync_playlists_domain")
     async def _sync_playlists_domain(self):
@@ -255,11 +280,9 @@ class Application:
         logger.info(f"NFC handler initialized: {type(self._nfc_handler).__name__}",
         )
         # Initialize NFC application service using domain architecture
-        from app.src.infrastructure.nfc.repositories.nfc_memory_repository import (
-            NfcMemoryRepository,
-        )
+        from app.src.infrastructure.nfc.repositories.nfc_tag_repository import NfcTagRepository
 
-        nfc_repository = NfcMemoryRepository()
+        nfc_repository = NfcTagRepository()
         # Get playlist repository for NFC-Playlist synchronization using proper DI
         # This is CRITICAL for persisting NFC tag associations to the database
         from app.src.infrastructure.di.container import get_container
@@ -275,6 +298,9 @@ class Application:
         # Register callbacks for tag detection (NfcApplicationService handles hardware callbacks internally)
         self._nfc_app_service.register_tag_detected_callback(self._on_nfc_tag_detected)
         self._nfc_app_service.register_association_callback(self._on_nfc_association_event)
+        # Start resolving the tag's playlist while the tag is being routed
+        if self._playlist_controller and hasattr(self._playlist_controller, "start_tag_preload"):
+            self._nfc_app_service.register_tag_preload_callback(self._playlist_controller.start_tag_preload)
         # Start the NFC system
         start_result = await self._nfc_app_service.start_nfc_system()
         if start_result.get("status") == "success":
@@ -455,6 +481,18 @@ class Application:
                 except Exception as e:
                     logger.error(f"❌ Error stopping NFC service: {e}")
 
+            # Stop keeping the NFC playlist index in sync
+            index = getattr(getattr(self, "_playlist_controller", None), "nfc_playlist_index", None)
+            if index is not None:
+                from app.src.infrastructure.repositories.playlist_cache import (
+                    remove_playlist_change_listener,
+                )
+                remove_playlist_change_listener(index.handle_playlist_change)
+
+            # Drop conversions that have not started yet
+            from app.src.services.transcoding_service import get_transcoding_service
+            get_transcoding_service().shutdown()
+
             # Additional cleanup specific to Application
             if hasattr(self, "_playlist_controller") and self._playlist_controller and hasattr(
                 self._playlist_controller, "cleanup"
@@ -6,24 +6,44 @@
 Thread-safe SQLite connection pool for efficient database connection management.
 
 Provides connection pooling with overflow handling and optimized SQLite settings.
+Connections are validated lazily on borrow once they have been idle for a while,
+and recycled after a maximum age or number of uses.
 """
 
 import sqlite3
-from typing import Optional
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 import threading
 import queue
 
-from app.src.monitoring import get_logger
+from app.src.monitoring import LatencyHistogram, get_logger
 from app.src.services.error.unified_error_decorator import handle_errors
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class _ConnectionState:
+    """Bookkeeping for a pooled connection."""
+
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
 class ConnectionPool:
     """Thread-safe SQLite connection pool with optimized settings."""
 
     def __init__(
-        self, db_path: str, pool_size: int = 5, max_overflow: int = 10, timeout: float = 30.0
+        self,
+        db_path: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        validate_after_idle: float = 30.0,
+        max_connection_age: float = 3600.0,
+        max_connection_uses: int = 10000,
     ):
         """Initialize the connection pool.
 
@@ -32,15 +52,32 @@ class ConnectionPool:
             pool_size: Base number of connections to maintain in the pool
             max_overflow: Maximum number of overflow connections allowed
             timeout: Connection timeout in seconds
+            validate_after_idle: Seconds a connection may sit idle before it is
+                checked with ``SELECT 1`` on borrow
+            max_connection_age: Seconds after which a connection is recycled
+                (0 disables age-based recycling)
+            max_connection_uses: Borrows after which a connection is recycled
+                (0 disables use-based recycling)
         """
         self.db_path = db_path
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.timeout = timeout
+        self.validate_after_idle = validate_after_idle
+        self.max_connection_age = max_connection_age
+        self.max_connection_uses = max_connection_uses
         self._pool = queue.Queue(maxsize=pool_size + max_overflow)
         self._current_size = 0
         self._lock = threading.Lock()
         self._created_connections = 0
+        self._states: Dict[sqlite3.Connection, _ConnectionState] = {}
+        self._wait_times = LatencyHistogram()
+        self._overflow_events = 0
+        self._last_overflow_at: Optional[float] = None
+        self._exhausted_events = 0
+        self._validations = 0
+        self._validation_failures = 0
+        self._recycled_connections = 0
 
         # Pre-populate the pool
         self._init_pool()
@@ -61,10 +98,10 @@ class ConnectionPool:
             check_same_thread=False,
             isolation_level=None,  # Autocommit mode
         )
-        # Optimize SQLite settings
+        # Optimize SQLite settings once per connection rather than per borrow
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA cache_size=2000")
+        conn.execute("PRAGMA cache_size=10000")
         conn.execute("PRAGMA temp_store=MEMORY")
         conn.execute("PRAGMA mmap_size=134217728")
         conn.execute("PRAGMA foreign_keys=ON")
@@ -73,31 +110,118 @@ class ConnectionPool:
         with self._lock:
             self._created_connections += 1
             self._current_size += 1
+            self._states[conn] = _ConnectionState()
         logger.debug(f"Created DB connection (total: {self._created_connections})")
         return conn
 
+    def _reserve_overflow_slot(self) -> bool:
+        """Reserve room for one more connection if the pool may still grow."""
+        with self._lock:
+            if self._current_size >= self.pool_size + self.max_overflow:
+                return False
+            # Counted up front so concurrent borrowers cannot overshoot the cap
+            self._current_size += 1
+            self._overflow_events += 1
+            self._last_overflow_at = time.time()
+            return True
+
+    def _create_overflow_connection(self) -> Optional[sqlite3.Connection]:
+        """Create a connection in a previously reserved slot."""
+        conn = self._create_connection()
+        with self._lock:
+            # A created connection counted itself, so only the reservation is
+            # released, whether or not the connection could be created
+            self._current_size -= 1
+        return conn
+
     def get_connection(self) -> sqlite3.Connection:
         """Get a connection from the pool.
 
+        Idle connections are used immediately; otherwise the pool grows up to
+        its overflow limit before waiting for a connection to be returned.
+
         Returns:
             A database connection from the pool
 
         Raises:
             sqlite3.OperationalError: If the connection pool is exhausted
         """
+        started_at = time.perf_counter()
+        deadline = started_at + self.timeout
+        while True:
+            conn = self._borrow(deadline)
+            conn = self._prepare_for_use(conn)
+            if conn:
+                self._wait_times.record((time.perf_counter() - started_at) * 1000)
+                return conn
+
+    def _borrow(self, deadline: float) -> Optional[sqlite3.Connection]:
+        """Take an idle connection, grow the pool, or wait until the deadline."""
         try:
-            return self._pool.get(timeout=1.0)
+            return self._pool.get_nowait()
         except queue.Empty:
+            pass
+
+        if self._reserve_overflow_slot():
+            conn = self._create_overflow_connection()
+            if conn:
+                return conn
+
+        try:
+            return self._pool.get(timeout=max(0.0, deadline - time.perf_counter()))
+        except queue.Empty as exc:
             with self._lock:
-                if self._current_size < self.pool_size + self.max_overflow:
-                    conn = self._create_connection()
-                    if conn:
-                        return conn
+                self._exhausted_events += 1
+            raise sqlite3.OperationalError("Connection pool exhausted") from exc
 
+    def _prepare_for_use(self, conn: Optional[sqlite3.Connection]) -> Optional[sqlite3.Connection]:
+        """Recycle or validate a borrowed connection.
+
+        Returns:
+            The connection, a fresh replacement, or None if the caller should
+            borrow again
+        """
+        if not conn:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.setdefault(conn, _ConnectionState())
+
+        if self._needs_recycle(state, now):
+            self._recycle_connection(conn)
+            return self._prepare_for_use(self._create_connection())
+
+        if self.validate_after_idle and now - state.last_used_at >= self.validate_after_idle:
+            with self._lock:
+                self._validations += 1
             try:
-                return self._pool.get(timeout=self.timeout)
-            except queue.Empty as exc:
-                raise sqlite3.OperationalError("Connection pool exhausted") from exc
+                conn.execute("SELECT 1").fetchone()
+            except sqlite3.Error:
+                with self._lock:
+                    self._validation_failures += 1
+                self._close_connection(conn)
+                return self._prepare_for_use(self._create_connection())
+
+        state.uses += 1
+        state.last_used_at = now
+        return conn
+
+    def _needs_recycle(self, state: _ConnectionState, now: float) -> bool:
+        """Check whether a connection exceeded its age or use budget."""
+        if self.max_connection_age and now - state.created_at >= self.max_connection_age:
+            return True
+        return bool(self.max_connection_uses and state.uses >= self.max_connection_uses)
+
+    def _recycle_connection(self, conn: sqlite3.Connection):
+        """Close a worn-out connection, letting SQLite refresh planner statistics first."""
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug(f"PRAGMA optimize failed on recycle: {e}")
+        with self._lock:
+            self._recycled_connections += 1
+        self._close_connection(conn)
 
     def return_connection(self, conn: sqlite3.Connection):
         """Return a connection to the pool.
@@ -107,8 +231,14 @@ class ConnectionPool:
         """
         if conn:
             try:
-                conn.execute("SELECT 1").fetchone()
-                conn.rollback()
+                # Only roll back work a caller left open; autocommit connections
+                # are normally clean and need no round-trip here
+                if conn.in_transaction:
+                    conn.rollback()
+                if self._pool.qsize() >= self.pool_size:
+                    # Enough idle connections already; shed the overflow one
+                    self._close_connection(conn)
+                    return
                 self._pool.put(conn, timeout=1.0)
             except (queue.Full, sqlite3.Error):
                 self._close_connection(conn)
@@ -125,6 +255,7 @@ class ConnectionPool:
             pass
         with self._lock:
             self._current_size -= 1
+            self._states.pop(conn, None)
 
     def close_all(self):
         """Close all connections in the pool."""
@@ -148,4 +279,11 @@ class ConnectionPool:
                 "current_size": self._current_size,
                 "created_connections": self._created_connections,
                 "queue_size": self._pool.qsize(),
+                "recycled_connections": self._recycled_connections,
+                "validations": self._validations,
+                "validation_failures": self._validation_failures,
+                "overflow_events": self._overflow_events,
+                "last_overflow_at": self._last_overflow_at,
+                "exhausted_events": self._exhausted_events,
+                "borrow_wait_ms": self._wait_times.snapshot(),
             }
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Migration 002: Search Index
+Creates FTS5 full-text indexes over playlists and tracks, kept in sync by triggers.
+
+The indexes are external-content FTS5 tables keyed on the source rowid, so the
+text is stored only once. When the SQLite build lacks FTS5 the migration is a
+no-op and the playlist repository keeps using its LIKE-based search.
+"""
+
+import sqlite3
+from typing import Dict, Any
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATION_VERSION = "002"
+MIGRATION_NAME = "search_index"
+
+SEARCH_TABLES = ("playlists_fts", "tracks_fts")
+
+_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS playlists_fts_ai AFTER INSERT ON playlists BEGIN
+        INSERT INTO playlists_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS playlists_fts_ad AFTER DELETE ON playlists BEGIN
+        INSERT INTO playlists_fts(playlists_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS playlists_fts_au AFTER UPDATE OF title, description ON playlists BEGIN
+        INSERT INTO playlists_fts(playlists_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO playlists_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tracks_fts_ai AFTER INSERT ON tracks BEGIN
+        INSERT INTO tracks_fts(rowid, title, artist, album)
+        VALUES (new.rowid, new.title, new.artist, new.album);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tracks_fts_ad AFTER DELETE ON tracks BEGIN
+        INSERT INTO tracks_fts(tracks_fts, rowid, title, artist, album)
+        VALUES ('delete', old.rowid, old.title, old.artist, old.album);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tracks_fts_au AFTER UPDATE OF title, artist, album ON tracks BEGIN
+        INSERT INTO tracks_fts(tracks_fts, rowid, title, artist, album)
+        VALUES ('delete', old.rowid, old.title, old.artist, old.album);
+        INSERT INTO tracks_fts(rowid, title, artist, album)
+        VALUES (new.rowid, new.title, new.artist, new.album);
+    END
+    """,
+)
+
+
+def fts5_available(connection: sqlite3.Connection) -> bool:
+    """Check whether the SQLite build supports FTS5."""
+    try:
+        connection.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(content)")
+        connection.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def up(connection: sqlite3.Connection) -> bool:
+    """Apply the migration - create search indexes, triggers and backfill them."""
+    if not fts5_available(connection):
+        logger.warning(
+            f"⚠️ Migration {MIGRATION_VERSION}: SQLite build lacks FTS5, "
+            "search will use LIKE fallback"
+        )
+        return True
+
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS playlists_fts USING fts5(
+                title, description,
+                content='playlists', content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS tracks_fts USING fts5(
+                title, artist, album,
+                content='tracks', content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+
+        for trigger in _TRIGGERS:
+            cursor.execute(trigger)
+
+        # Index rows that existed before the migration
+        cursor.execute("INSERT INTO playlists_fts(playlists_fts) VALUES ('rebuild')")
+        cursor.execute("INSERT INTO tracks_fts(tracks_fts) VALUES ('rebuild')")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} applied successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} failed: {e}")
+        connection.rollback()
+        return False
+
+
+def down(connection: sqlite3.Connection) -> bool:
+    """Rollback the migration - drop triggers and search indexes."""
+    try:
+        cursor = connection.cursor()
+
+        for table in ("playlists", "tracks"):
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+        for table in SEARCH_TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} rolled back successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} rollback failed: {e}")
+        connection.rollback()
+        return False
+
+
+def get_migration_info() -> Dict[str, Any]:
+    """Get migration metadata."""
+    return {
+        "version": MIGRATION_VERSION,
+        "name": MIGRATION_NAME,
+        "description": "Creates FTS5 search indexes over playlists and tracks"
+    }
+
+
+def migrate_database(db_path: str) -> bool:
+    """Migration runner interface - applies the migration."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            return up(connection)
+    except Exception as e:
+        logger.error(f"❌ Database migration failed: {e}")
+        return False
+
+
+def verify_migration(db_path: str) -> bool:
+    """Verify the migration was applied correctly."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            if not fts5_available(connection):
+                return True
+
+            cursor = connection.cursor()
+            for table in SEARCH_TABLES:
+                cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)
+                )
+                if not cursor.fetchone():
+                    return False
+
+            return True
+    except Exception as e:
+        logger.error(f"❌ Migration verification failed: {e}")
+        return False
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Migration 003: Playlist Listing Index
+Creates the composite index backing keyset pagination of the playlist list.
+
+Playlists are listed by ``updated_at DESC, id``; with this index a page after a
+cursor is a range scan in index order, independent of its position.
+"""
+
+import sqlite3
+from typing import Dict, Any
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATION_VERSION = "003"
+MIGRATION_NAME = "playlist_listing_index"
+
+INDEX_NAME = "idx_playlists_updated_at_id"
+
+
+def up(connection: sqlite3.Connection) -> bool:
+    """Apply the migration - create the listing index."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON playlists(updated_at DESC, id)"
+        )
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} applied successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} failed: {e}")
+        connection.rollback()
+        return False
+
+
+def down(connection: sqlite3.Connection) -> bool:
+    """Rollback the migration - drop the listing index."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} rolled back successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} rollback failed: {e}")
+        connection.rollback()
+        return False
+
+
+def get_migration_info() -> Dict[str, Any]:
+    """Get migration metadata."""
+    return {
+        "version": MIGRATION_VERSION,
+        "name": MIGRATION_NAME,
+        "description": "Creates composite index on playlists(updated_at DESC, id) for keyset pagination"
+    }
+
+
+def migrate_database(db_path: str) -> bool:
+    """Migration runner interface - applies the migration."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            return up(connection)
+    except Exception as e:
+        logger.error(f"❌ Database migration failed: {e}")
+        return False
+
+
+def verify_migration(db_path: str) -> bool:
+    """Verify the migration was applied correctly."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name=?", (INDEX_NAME,)
+            )
+            return cursor.fetchone() is not None
+    except Exception as e:
+        logger.error(f"❌ Migration verification failed: {e}")
+        return False
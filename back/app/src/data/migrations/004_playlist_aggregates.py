@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Migration 004: Playlist Aggregates
+Adds denormalized track_count and total_duration_ms columns to playlists.
+
+The columns are maintained by triggers on the tracks table and backfilled from
+existing tracks, so playlist summaries can be read without loading any track.
+Unknown durations (NULL) count as zero.
+"""
+
+import sqlite3
+from typing import Dict, Any
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATION_VERSION = "004"
+MIGRATION_NAME = "playlist_aggregates"
+
+AGGREGATE_COLUMNS = ("track_count", "total_duration_ms")
+
+_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tracks_aggregates_ai AFTER INSERT ON tracks BEGIN
+        UPDATE playlists
+        SET track_count = track_count + 1,
+            total_duration_ms = total_duration_ms + COALESCE(new.duration_ms, 0)
+        WHERE id = new.playlist_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tracks_aggregates_ad AFTER DELETE ON tracks BEGIN
+        UPDATE playlists
+        SET track_count = track_count - 1,
+            total_duration_ms = total_duration_ms - COALESCE(old.duration_ms, 0)
+        WHERE id = old.playlist_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tracks_aggregates_au AFTER UPDATE OF playlist_id, duration_ms ON tracks BEGIN
+        UPDATE playlists
+        SET track_count = track_count - 1,
+            total_duration_ms = total_duration_ms - COALESCE(old.duration_ms, 0)
+        WHERE id = old.playlist_id;
+        UPDATE playlists
+        SET track_count = track_count + 1,
+            total_duration_ms = total_duration_ms + COALESCE(new.duration_ms, 0)
+        WHERE id = new.playlist_id;
+    END
+    """,
+)
+
+
+def up(connection: sqlite3.Connection) -> bool:
+    """Apply the migration - add aggregate columns, triggers and backfill them."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute("PRAGMA table_info(playlists)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for column in AGGREGATE_COLUMNS:
+            if column not in existing_columns:
+                cursor.execute(
+                    f"ALTER TABLE playlists ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+                )
+
+        for trigger in _TRIGGERS:
+            cursor.execute(trigger)
+
+        # Backfill aggregates for playlists that existed before the migration
+        cursor.execute("""
+            UPDATE playlists SET
+                track_count = (
+                    SELECT COUNT(*) FROM tracks WHERE tracks.playlist_id = playlists.id
+                ),
+                total_duration_ms = (
+                    SELECT COALESCE(SUM(duration_ms), 0) FROM tracks
+                    WHERE tracks.playlist_id = playlists.id
+                )
+        """)
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} applied successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} failed: {e}")
+        connection.rollback()
+        return False
+
+
+def down(connection: sqlite3.Connection) -> bool:
+    """Rollback the migration - drop triggers and aggregate columns."""
+    try:
+        cursor = connection.cursor()
+
+        for suffix in ("ai", "ad", "au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS tracks_aggregates_{suffix}")
+        for column in AGGREGATE_COLUMNS:
+            cursor.execute(f"ALTER TABLE playlists DROP COLUMN {column}")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} rolled back successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} rollback failed: {e}")
+        connection.rollback()
+        return False
+
+
+def get_migration_info() -> Dict[str, Any]:
+    """Get migration metadata."""
+    return {
+        "version": MIGRATION_VERSION,
+        "name": MIGRATION_NAME,
+        "description": "Adds trigger-maintained track_count and total_duration_ms to playlists"
+    }
+
+
+def migrate_database(db_path: str) -> bool:
+    """Migration runner interface - applies the migration."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            return up(connection)
+    except Exception as e:
+        logger.error(f"❌ Database migration failed: {e}")
+        return False
+
+
+def verify_migration(db_path: str) -> bool:
+    """Verify the migration was applied correctly."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            cursor = connection.cursor()
+
+            cursor.execute("PRAGMA table_info(playlists)")
+            columns = {row[1] for row in cursor.fetchall()}
+            if not all(column in columns for column in AGGREGATE_COLUMNS):
+                return False
+
+            cursor.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type='trigger' AND name LIKE 'tracks_aggregates_%'"
+            )
+            return cursor.fetchone()[0] == len(_TRIGGERS)
+    except Exception as e:
+        logger.error(f"❌ Migration verification failed: {e}")
+        return False
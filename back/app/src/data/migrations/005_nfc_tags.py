@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Migration 005: NFC Tags
+Creates the nfc_tags table holding tag metadata across restarts.
+
+Tags are keyed by UID; the playlist_id index backs lookups of the tag bound to
+a playlist. The playlists table remains the source of truth for associations:
+playlist_id here is only trusted while playlists.nfc_tag_id agrees.
+"""
+
+import sqlite3
+from typing import Dict, Any
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATION_VERSION = "005"
+MIGRATION_NAME = "nfc_tags"
+
+TABLE_NAME = "nfc_tags"
+INDEX_NAME = "idx_nfc_tags_playlist_id"
+
+
+def up(connection: sqlite3.Connection) -> bool:
+    """Apply the migration - create the nfc_tags table and its index."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+                uid TEXT PRIMARY KEY,
+                playlist_id TEXT,
+                last_detected_at TEXT,
+                detection_count INTEGER NOT NULL DEFAULT 0,
+                metadata TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON {TABLE_NAME}(playlist_id)")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} applied successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} failed: {e}")
+        connection.rollback()
+        return False
+
+
+def down(connection: sqlite3.Connection) -> bool:
+    """Rollback the migration - drop the nfc_tags table."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+        cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} rolled back successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} rollback failed: {e}")
+        connection.rollback()
+        return False
+
+
+def get_migration_info() -> Dict[str, Any]:
+    """Get migration metadata."""
+    return {
+        "version": MIGRATION_VERSION,
+        "name": MIGRATION_NAME,
+        "description": "Creates nfc_tags table with an index on playlist_id"
+    }
+
+
+def migrate_database(db_path: str) -> bool:
+    """Migration runner interface - applies the migration."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            return up(connection)
+    except Exception as e:
+        logger.error(f"❌ Database migration failed: {e}")
+        return False
+
+
+def verify_migration(db_path: str) -> bool:
+    """Verify the migration was applied correctly."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'index') AND name IN (?, ?)",
+                (TABLE_NAME, INDEX_NAME),
+            )
+            return len(cursor.fetchall()) == 2
+    except Exception as e:
+        logger.error(f"❌ Migration verification failed: {e}")
+        return False
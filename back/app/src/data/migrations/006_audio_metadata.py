@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Migration 006: Audio Metadata
+Creates the audio_metadata table caching parsed tags and durations of audio files.
+
+Rows are keyed by path and only trusted while the file's size and modification
+time still match, so a replaced file is parsed again.
+"""
+
+import sqlite3
+from typing import Dict, Any
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATION_VERSION = "006"
+MIGRATION_NAME = "audio_metadata"
+
+TABLE_NAME = "audio_metadata"
+
+
+def up(connection: sqlite3.Connection) -> bool:
+    """Apply the migration - create the audio_metadata table."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                title TEXT,
+                artist TEXT,
+                album TEXT,
+                duration REAL,
+                bitrate INTEGER,
+                sample_rate INTEGER,
+                tags TEXT,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} applied successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} failed: {e}")
+        connection.rollback()
+        return False
+
+
+def down(connection: sqlite3.Connection) -> bool:
+    """Rollback the migration - drop the audio_metadata table."""
+    try:
+        cursor = connection.cursor()
+
+        cursor.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+
+        connection.commit()
+        logger.info(f"✅ Migration {MIGRATION_VERSION} rolled back successfully")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Migration {MIGRATION_VERSION} rollback failed: {e}")
+        connection.rollback()
+        return False
+
+
+def get_migration_info() -> Dict[str, Any]:
+    """Get migration metadata."""
+    return {
+        "version": MIGRATION_VERSION,
+        "name": MIGRATION_NAME,
+        "description": "Creates audio_metadata table keyed by file path"
+    }
+
+
+def migrate_database(db_path: str) -> bool:
+    """Migration runner interface - applies the migration."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            return up(connection)
+    except Exception as e:
+        logger.error(f"❌ Database migration failed: {e}")
+        return False
+
+
+def verify_migration(db_path: str) -> bool:
+    """Verify the migration was applied correctly."""
+    try:
+        with sqlite3.connect(db_path) as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (TABLE_NAME,),
+            )
+            return cursor.fetchone() is not None
+    except Exception as e:
+        logger.error(f"❌ Migration verification failed: {e}")
+        return False
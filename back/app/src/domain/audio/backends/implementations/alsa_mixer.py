@@ -0,0 +1,230 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""ALSA mixer control with coalesced volume writes.
+
+A single ``amixer -s`` process is kept open and fed mixer commands on stdin,
+so a volume change costs one pipe write instead of a fork and exec. Bursts of
+volume requests, such as a rotary encoder turn, are collapsed into one write
+of the latest target per coalescing window.
+"""
+
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.src.monitoring import LatencyHistogram, get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MIXER_CONTROL = "Master"
+# Seconds between two hardware volume writes
+DEFAULT_COALESCE_WINDOW = 0.05
+
+
+class AmixerCoprocess:
+    """Long-lived ``amixer -s`` process holding the mixer open."""
+
+    def __init__(self, control: str = DEFAULT_MIXER_CONTROL):
+        """Initialize without starting the process.
+
+        Args:
+            control: ALSA simple mixer control to drive
+        """
+        self._control = control
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._unavailable = False
+        self._starts = 0
+
+    def set_volume(self, volume: int) -> bool:
+        """Set the control to a volume percentage.
+
+        Returns:
+            bool: True if the command was handed to amixer
+        """
+        command = f"sset {self._control} {volume}%\n".encode()
+        with self._lock:
+            # A dead process is restarted once per write
+            for _ in range(2):
+                process = self._ensure_process()
+                if process is None:
+                    return False
+                try:
+                    process.stdin.write(command)
+                    process.stdin.flush()
+                    return True
+                except (BrokenPipeError, OSError, ValueError) as e:
+                    logger.warning(f"🔊 amixer co-process lost ({e}), restarting")
+                    self._terminate()
+            return False
+
+    def close(self) -> None:
+        """Stop the amixer process."""
+        with self._lock:
+            self._terminate()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get process state."""
+        with self._lock:
+            return {
+                "control": self._control,
+                "running": self._process is not None and self._process.poll() is None,
+                "starts": self._starts,
+                "available": not self._unavailable,
+            }
+
+    def _ensure_process(self) -> Optional[subprocess.Popen]:
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        if self._unavailable:
+            return None
+        try:
+            self._process = subprocess.Popen(
+                ["amixer", "-s", "-q"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning(f"🔊 amixer not available, hardware volume disabled: {e}")
+            self._unavailable = True
+            self._process = None
+            return None
+        self._starts += 1
+        return self._process
+
+    def _terminate(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class CoalescedVolumeWriter:
+    """Writes volume targets to hardware at most once per window.
+
+    The first request after a quiet period is written at once; requests
+    arriving within the window after a write only replace the pending
+    target, which is written when the window ends.
+    """
+
+    def __init__(self, write: Callable[[int], bool], window: float = DEFAULT_COALESCE_WINDOW):
+        """Initialize the writer; its thread starts on the first request.
+
+        Args:
+            write: Hardware write, called from the writer thread
+            window: Minimum seconds between two writes
+        """
+        self._write = write
+        self._window = max(0.0, window)
+        self._condition = threading.Condition()
+        # (volume, monotonic time of the latest request)
+        self._pending: Optional[Tuple[int, float]] = None
+        self._writing = False
+        self._last_write_at = float("-inf")
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._requests = 0
+        self._coalesced = 0
+        self._writes = 0
+        self._failed_writes = 0
+        self._last_written: Optional[int] = None
+        self._latency = LatencyHistogram()
+        self._last_latency_ms: Optional[float] = None
+
+    def request(self, volume: int) -> None:
+        """Ask for a volume; only the latest request of a burst is written."""
+        with self._condition:
+            if self._closed:
+                return
+            self._requests += 1
+            if self._pending is not None:
+                self._coalesced += 1
+            self._pending = (volume, time.monotonic())
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="volume-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until the pending target has been written.
+
+        Returns:
+            bool: True if nothing is left to write
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._pending is not None or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def close(self) -> None:
+        """Write the pending target and stop the writer thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=2.0)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get request and write counters with the request-to-write latency."""
+        with self._condition:
+            return {
+                "requests": self._requests,
+                "writes": self._writes,
+                "failed_writes": self._failed_writes,
+                "coalesced": self._coalesced,
+                "last_volume": self._last_written,
+                "last_write_latency_ms": self._last_latency_ms,
+                "latency": self._latency.snapshot(),
+                "window_ms": round(self._window * 1000, 1),
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                delay = self._last_write_at + self._window - time.monotonic()
+                if delay > 0 and not self._closed:
+                    self._condition.wait(delay)
+                    continue
+                (volume, requested_at), self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                written = self._write(volume)
+            except Exception as e:
+                logger.warning(f"🔊 Volume write failed: {e}")
+                written = False
+            latency_ms = (time.monotonic() - requested_at) * 1000
+
+            with self._condition:
+                self._writing = False
+                self._last_write_at = time.monotonic()
+                if written:
+                    self._writes += 1
+                    self._last_written = volume
+                    self._last_latency_ms = round(latency_ms, 2)
+                    self._latency.record(latency_ms)
+                else:
+                    self._failed_writes += 1
+                self._condition.notify_all()
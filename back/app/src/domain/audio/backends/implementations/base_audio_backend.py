@@ -40,6 +40,31 @@ class BaseAudioBackend(AudioBackendProtocol):
         self._current_file_path: Optional[str] = None
         self._volume = 70  # Default volume
         self._backend_name = self.__class__.__name__
+        # Audio event bus receiving track start/end events, if attached
+        self._event_bus = None
+        # Shared audio metadata cache answering duration lookups, if attached
+        self._metadata_cache = None
+
+    def attach_event_bus(self, event_bus) -> None:
+        """Publish playback events on an audio event bus.
+
+        Args:
+            event_bus: Event bus providing publish_threadsafe()
+        """
+        self._event_bus = event_bus
+
+    def attach_metadata_cache(self, metadata_cache) -> None:
+        """Look up file durations in a shared metadata cache.
+
+        Args:
+            metadata_cache: Cache providing get_duration()
+        """
+        self._metadata_cache = metadata_cache
+
+    def _publish_event(self, event) -> None:
+        """Publish an audio event from whichever thread detected it."""
+        if self._event_bus is not None:
+            self._event_bus.publish_threadsafe(event)
 
     @handle_errors("_validate_file_path")
     def _validate_file_path(self, file_path: str) -> Optional[Path]:
@@ -0,0 +1,181 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Mixer profile self-test.
+
+Plays a short silent clip and watches the mixer to measure time-to-first-audio
+and count underruns. pygame's music position adds one buffer per postmix
+callback and runs with the wall clock in between, so it moves even when no
+audio is mixed. Time-to-first-audio therefore reads the audio actually mixed,
+which pygame reports while the music is paused. A callback that comes more
+than one buffer late, seen as the position dropping behind the wall clock,
+is counted as an underrun since SDL does not report them.
+"""
+
+import time
+import wave
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TEST_DURATION = 1.0
+POLL_INTERVAL = 0.005
+# Seconds allowed for the first audio before the test gives up
+FIRST_AUDIO_TIMEOUT = 2.0
+
+
+@dataclass
+class MixerSelfTestResult:
+    """Outcome of one self-test run."""
+
+    profile: str
+    time_to_first_audio_ms: Optional[float]
+    underruns: int
+    measured_seconds: float
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        """Whether audio started and played without underruns."""
+        return self.error is None and self.time_to_first_audio_ms is not None and self.underruns == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the result for status reporting."""
+        return {
+            "profile": self.profile,
+            "time_to_first_audio_ms": self.time_to_first_audio_ms,
+            "underruns": self.underruns,
+            "measured_seconds": self.measured_seconds,
+            "passed": self.passed,
+            "error": self.error,
+        }
+
+
+def write_silence(file_path: str, frequency: int, channels: int, seconds: float) -> None:
+    """Write a 16-bit PCM WAV file of silence."""
+    with wave.open(file_path, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(frequency)
+        wav.writeframes(b"\0" * (2 * channels * int(frequency * seconds)))
+
+
+class SimulatedMixer:
+    """Mixer clock that reports like pygame, for the mock backend and tests.
+
+    Callbacks run once per buffer, the first one half a buffer after start(),
+    and can be delayed with stall().
+    """
+
+    def __init__(self, buffer_ms: float, first_callback_ms: Optional[float] = None):
+        self._buffer_ms = buffer_ms
+        if first_callback_ms is None:
+            first_callback_ms = buffer_ms / 2
+        self._first_callback_ms = first_callback_ms
+        self._stalls: List[Tuple[float, float]] = []
+        self._started_at: Optional[float] = None
+
+    def start(self) -> bool:
+        """Start playback."""
+        self._started_at = time.monotonic()
+        return True
+
+    def stall(self, at_ms: float, length_ms: float) -> None:
+        """Hold back callbacks due within a window after start()."""
+        self._stalls.append((at_ms, length_ms))
+
+    def position_ms(self) -> Optional[float]:
+        """Position as pygame.mixer.music.get_pos() reports it while playing."""
+        if self._started_at is None:
+            return None
+        elapsed = (time.monotonic() - self._started_at) * 1000
+        count, last = self._callbacks(elapsed)
+        return count * self._buffer_ms + elapsed - (last if count else 0.0)
+
+    def mixed_ms(self) -> Optional[float]:
+        """Audio mixed so far, as get_pos() reports it while paused."""
+        if self._started_at is None:
+            return None
+        count, _ = self._callbacks((time.monotonic() - self._started_at) * 1000)
+        return count * self._buffer_ms
+
+    def _callbacks(self, elapsed_ms: float) -> Tuple[int, float]:
+        count, last, due = 0, 0.0, self._first_callback_ms
+        while True:
+            for at, length in self._stalls:
+                if at <= due < at + length:
+                    due = at + length
+            if due > elapsed_ms:
+                return count, last
+            count, last = count + 1, due
+            due += self._buffer_ms
+
+
+def measure_output(
+    profile: str,
+    start: Callable[[], bool],
+    read_position_ms: Callable[[], Optional[float]],
+    read_mixed_ms: Callable[[], Optional[float]],
+    buffer_ms: float,
+    duration: float = DEFAULT_TEST_DURATION,
+    first_audio_timeout: float = FIRST_AUDIO_TIMEOUT,
+) -> MixerSelfTestResult:
+    """Start playback and watch the mixer.
+
+    Args:
+        profile: Name of the mixer profile under test
+        start: Starts playback of the test clip; returns False on failure
+        read_position_ms: Playback position in milliseconds, extrapolated
+            with the wall clock between mixer callbacks
+        read_mixed_ms: Milliseconds of audio actually mixed so far
+        buffer_ms: Audio held by one output buffer
+        duration: Seconds of playback to watch after the first audio
+        first_audio_timeout: Seconds to wait for the first audio
+
+    Returns:
+        The measurements; the caller stops playback
+    """
+    started_at = time.monotonic()
+    if not start():
+        return MixerSelfTestResult(profile, None, 0, 0.0, error="playback did not start")
+
+    first_audio_at = None
+    while first_audio_at is None:
+        now = time.monotonic()
+        mixed = read_mixed_ms()
+        if mixed is not None and mixed > 0:
+            first_audio_at = now
+        elif now - started_at > first_audio_timeout:
+            return MixerSelfTestResult(profile, None, 0, 0.0, error="no audio within timeout")
+        else:
+            time.sleep(POLL_INTERVAL)
+
+    # Between callbacks the position keeps pace with the wall clock; a late
+    # callback shows up as the position dropping behind it
+    underruns = 0
+    last_drift = None
+    while time.monotonic() - first_audio_at < duration:
+        position = read_position_ms()
+        if position is None:
+            break
+        drift = position - (time.monotonic() - started_at) * 1000
+        if last_drift is not None and last_drift - drift > buffer_ms:
+            underruns += 1
+        last_drift = drift
+        time.sleep(POLL_INTERVAL)
+
+    result = MixerSelfTestResult(
+        profile=profile,
+        time_to_first_audio_ms=round((first_audio_at - started_at) * 1000, 2),
+        underruns=underruns,
+        measured_seconds=round(time.monotonic() - first_audio_at, 3),
+    )
+    logger.info(
+        f"🔊 Mixer self-test ({profile}): first audio after {result.time_to_first_audio_ms}ms, "
+        f"{underruns} underruns"
+    )
+    return result
@@ -10,11 +10,17 @@ operations without requiring real hardware.
 """
 
 import time
-from typing import Optional, Any
+from typing import Any, Dict, Optional
 import logging
 
 from app.src.config import config
 from app.src.domain.audio.backends.implementations.base_audio_backend import BaseAudioBackend
+from app.src.domain.audio.backends.implementations.mixer_self_test import (
+    DEFAULT_TEST_DURATION,
+    MixerSelfTestResult,
+    SimulatedMixer,
+    measure_output,
+)
 from app.src.domain.decorators.error_handler import handle_domain_errors
 
 def handle_errors(*dargs, **dkwargs):
@@ -40,6 +46,10 @@ class MockAudioBackend(BaseAudioBackend):
         self._play_start_time: Optional[float] = None
         self._volume = 50  # Default volume
         self._initialized = False
+        self._mixer_self_test: Optional[MixerSelfTestResult] = None
+
+        if config.audio.mixer_self_test:
+            self.run_mixer_self_test()
 
         logger.info("🧪 Mock Audio Backend initialized")
 
@@ -247,6 +257,38 @@ class MockAudioBackend(BaseAudioBackend):
                         },
                     )
 
+    def run_mixer_self_test(self, duration: float = DEFAULT_TEST_DURATION) -> MixerSelfTestResult:
+        """Run the mixer self-test against a simulated mixer.
+
+        Args:
+            duration: Seconds of playback to watch after the first audio
+
+        Returns:
+            The measurements, also kept for get_statistics()
+        """
+        profile = config.audio.get_mixer_profile()
+        mixer = SimulatedMixer(profile.buffer_latency_ms)
+
+        result = measure_output(
+            profile.name,
+            mixer.start,
+            mixer.position_ms,
+            mixer.mixed_ms,
+            profile.buffer_latency_ms,
+            duration,
+        )
+        self._mixer_self_test = result
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get the simulated mixer profile and self-test result."""
+        return {
+            "mixer": {
+                "profile": config.audio.get_mixer_profile().to_dict(),
+                "self_test": self._mixer_self_test.to_dict() if self._mixer_self_test else None,
+            }
+        }
+
     @handle_errors("cleanup")
     def cleanup(self) -> None:
         """Clean up audio resources (simulated)."""
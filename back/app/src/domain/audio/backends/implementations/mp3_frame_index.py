@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""MPEG audio frame index.
+
+Scans the frame headers of an MP3 file once and keeps the start time of
+every frame. Seeks can then be snapped to the frame the decoder actually
+resumes from, and VBR files get an exact duration without decoding any
+audio.
+"""
+
+import os
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+# Number of frame indexes kept in memory
+DEFAULT_CACHE_SIZE = 8
+# Bytes searched for the first frame after the ID3v2 tag
+_SYNC_SEARCH_LIMIT = 64 * 1024
+
+# Bitrates in kbps by (MPEG-1?, layer)
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+def parse_frame_header(header: bytes) -> Optional[Tuple[int, int, int]]:
+    """Parse a 4-byte MPEG audio frame header.
+
+    Returns:
+        (frame length in bytes, samples per frame, sample rate), or None if
+        the bytes are not a valid header
+    """
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = 4 - ((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+    samples = 1152 if layer == 2 or mpeg1 else 576
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+class Mp3FrameIndex:
+    """Start sample of every audio frame in an MP3 file."""
+
+    def __init__(self, sample_rate: int, sample_starts: array, total_samples: int):
+        self.sample_rate = sample_rate
+        self._sample_starts = sample_starts
+        self._total_samples = total_samples
+
+    @classmethod
+    def build(cls, file_path: str) -> Optional["Mp3FrameIndex"]:
+        """Scan a file's frame headers.
+
+        Returns:
+            The index, or None if no MPEG audio frame was found
+        """
+        sample_starts = array("Q")
+        sample_rate = 0
+        total_samples = 0
+
+        with open(file_path, "rb") as f:
+            offset = cls._first_frame_offset(f)
+            if offset is None:
+                return None
+            f.seek(offset)
+            header = f.read(4)
+            while True:
+                frame = parse_frame_header(header)
+                if frame is None:
+                    break
+                length, samples, rate = frame
+                if not sample_rate:
+                    sample_rate = rate
+                    # A Xing/Info/VBRI frame carries metadata, not audio
+                    if cls._is_info_frame(f, offset, length):
+                        offset += length
+                        f.seek(offset)
+                        header = f.read(4)
+                        continue
+                sample_starts.append(total_samples)
+                total_samples += samples
+                offset += length
+                f.seek(offset)
+                header = f.read(4)
+
+        if not sample_starts:
+            return None
+        return cls(sample_rate, sample_starts, total_samples)
+
+    @staticmethod
+    def _first_frame_offset(f) -> Optional[int]:
+        head = f.read(10)
+        start = 0
+        if head[:3] == b"ID3" and len(head) == 10:
+            size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            start = 10 + size + (10 if head[5] & 0x10 else 0)
+        f.seek(start)
+        data = f.read(_SYNC_SEARCH_LIMIT)
+        for i in range(len(data) - 3):
+            frame = parse_frame_header(data[i:i + 4])
+            if frame is None:
+                continue
+            # Require a second header right after to skip false syncs
+            following = data[i + frame[0]:i + frame[0] + 4]
+            if len(following) < 4 or parse_frame_header(following) is not None:
+                return start + i
+        return None
+
+    @staticmethod
+    def _is_info_frame(f, offset: int, length: int) -> bool:
+        f.seek(offset)
+        frame = f.read(min(length, 64))
+        return any(tag in frame for tag in (b"Xing", b"Info", b"VBRI"))
+
+    @property
+    def duration(self) -> float:
+        """Exact duration in seconds."""
+        return self._total_samples / self.sample_rate
+
+    @property
+    def frame_count(self) -> int:
+        """Number of audio frames."""
+        return len(self._sample_starts)
+
+    def frame_at(self, position: float) -> float:
+        """Find the start of the frame playing at a position.
+
+        Args:
+            position: Position in seconds
+
+        Returns:
+            Start time of the frame in seconds
+        """
+        sample = max(0, int(position * self.sample_rate))
+        index = max(0, bisect_right(self._sample_starts, sample) - 1)
+        return self._sample_starts[index] / self.sample_rate
+
+
+class Mp3FrameIndexCache:
+    """LRU cache of frame indexes keyed by path, size and modification time.
+
+    Concurrent requests for a file that is being scanned wait for that scan
+    instead of starting their own.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self._max_size = max(1, max_size)
+        self._indexes: "OrderedDict[Tuple[str, int, float], Optional[Mp3FrameIndex]]" = OrderedDict()
+        self._building: Dict[Tuple[str, int, float], threading.Event] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, file_path: str) -> Optional[Mp3FrameIndex]:
+        """Get the index for a file, scanning it on first use.
+
+        Returns:
+            The index, or None if the file is missing or not MPEG audio
+        """
+        key = self._key(file_path)
+        if key is None:
+            return None
+
+        with self._lock:
+            if key in self._indexes:
+                self._hits += 1
+                self._indexes.move_to_end(key)
+                return self._indexes[key]
+            building = self._building.get(key)
+            if building is None:
+                self._misses += 1
+                self._building[key] = threading.Event()
+
+        if building is not None:
+            building.wait()
+            with self._lock:
+                return self._indexes.get(key)
+
+        index = None
+        built = False
+        try:
+            index = Mp3FrameIndex.build(file_path)
+            built = True
+        except OSError as e:
+            logger.warning(f"Could not index MP3 frames of {file_path}: {e}")
+        finally:
+            with self._lock:
+                if built:
+                    self._indexes[key] = index
+                    self._indexes.move_to_end(key)
+                    while len(self._indexes) > self._max_size:
+                        self._indexes.popitem(last=False)
+                self._building.pop(key).set()
+        return index
+
+    def peek(self, file_path: str) -> Optional[Mp3FrameIndex]:
+        """Get the index for a file only if it is already built; never scans.
+
+        Returns:
+            The index, or None if it is not built yet or the file is not MPEG audio
+        """
+        key = self._key(file_path)
+        with self._lock:
+            if key is None or key not in self._indexes:
+                return None
+            self._hits += 1
+            self._indexes.move_to_end(key)
+            return self._indexes[key]
+
+    @staticmethod
+    def _key(file_path: str) -> Optional[Tuple[str, int, float]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_path, stat.st_size, stat.st_mtime
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        with self._lock:
+            return {"indexes": len(self._indexes), "hits": self._hits, "misses": self._misses}
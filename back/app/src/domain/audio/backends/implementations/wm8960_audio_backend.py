@@ -12,9 +12,11 @@ through the WM8960 codec using pygame for reliable audio format handling.
 import os
 import asyncio
 import subprocess
+import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Set, Tuple
 
 try:
     import pygame
@@ -32,33 +34,96 @@ except ImportError:
     MutagenFile = None
 
 from app.src.config import config
-from app.src.monitoring import get_logger
+from app.src.monitoring import LatencyHistogram, get_latency_tracer, get_logger
+from app.src.domain.audio.events.audio_events import (
+    PlaybackStateChangedEvent,
+    TrackEndedEvent,
+    TrackStartedEvent,
+)
 from app.src.domain.decorators.error_handler import handle_domain_errors as handle_errors
+from app.src.domain.protocols.state_manager_protocol import PlaybackState
 from app.src.domain.protocols.notification_protocol import PlaybackNotifierProtocol as PlaybackSubject
 
 from .base_audio_backend import BaseAudioBackend
+from .alsa_mixer import AmixerCoprocess, CoalescedVolumeWriter
+from .mixer_self_test import (
+    DEFAULT_TEST_DURATION,
+    FIRST_AUDIO_TIMEOUT,
+    MixerSelfTestResult,
+    measure_output,
+    write_silence,
+)
+from .mp3_frame_index import Mp3FrameIndexCache
 
 logger = get_logger(__name__)
 
+# Seconds between end-of-track checks while a track is playing
+TRACK_END_POLL_INTERVAL = 0.05
+# Seconds a computed position is served before the decoder is read again
+POSITION_REFRESH_INTERVAL = 0.05
+
 
 class WM8960AudioBackend(BaseAudioBackend):
     """WM8960 audio backend for Raspberry Pi hardware.
 
     This implementation provides real audio playback through the WM8960 codec
-    using ALSA and subprocess-based audio control.
+    using pygame for playback and a persistent amixer process for ALSA volume.
+
+    With an event bus attached, a watcher thread publishes TrackEndedEvent as
+    soon as pygame finishes a track. The thread only runs while a track is
+    playing.
     """
 
+    # Publishes TrackEndedEvent on its own when an event bus is attached
+    emits_track_end_events = True
+
     def __init__(self, playback_subject: Optional[PlaybackSubject] = None):
         """Initialize the WM8960 audio backend."""
         super().__init__(playback_subject)
         self._is_paused = False
+        # Monotonic clock fallback when the decoder position is unavailable
         self._play_start_time = None
         self._pause_time = None
+        # get_pos() counts from the last play() call; this is where it started
+        self._seek_offset = 0.0
+        # (monotonic read time, position) of the last computed position
+        self._position_cache: Optional[Tuple[float, float]] = None
 
         # Track current file and its duration
         self._current_file_path = None
         self._current_file_duration = None  # in seconds
 
+        # Gapless playback: the next track is queued in pygame so it starts
+        # as soon as the current one ends, with no decoder restart in between
+        self._gapless_enabled = config.audio.gapless_playback
+        self._queued_file_path: Optional[str] = None
+        self._queued_file_duration: Optional[float] = None
+        # pygame cannot unqueue a track; a cancelled one is stopped when it starts
+        self._queued_cancelled = False
+        # get_pos() restarts from zero when the queued track takes over
+        self._last_pos_ms = 0
+        self._pending_transition: Optional[str] = None
+        self._gapless_transitions = 0
+
+        self._end_watcher: Optional[threading.Thread] = None
+
+        # Seek engine: capabilities are detected on first seek
+        self._capabilities: Optional[Dict[str, bool]] = None
+        self._set_pos_unsupported: Set[str] = set()
+        self._frame_indexes = Mp3FrameIndexCache()
+        self._seek_latency = LatencyHistogram()
+        self._seek_counts = {"in_place": 0, "reload": 0, "failed": 0, "frame_indexed": 0}
+
+        # Hardware volume: one amixer process, written at most once per window
+        self._mixer = AmixerCoprocess(config.audio.mixer_control)
+        self._volume_writer = CoalescedVolumeWriter(
+            self._mixer.set_volume, config.audio.volume_coalesce_window
+        )
+
+        # Output buffer and sample rate used when the mixer opens
+        self._mixer_profile = config.audio.get_mixer_profile()
+        self._mixer_self_test: Optional[MixerSelfTestResult] = None
+
         # Initialize hardware
         self._initialize_wm8960_hardware()
 
@@ -74,6 +139,9 @@ class WM8960AudioBackend(BaseAudioBackend):
             logger.warning("🔊 WM8960: pygame not available - audio will not work")
             raise RuntimeError("WM8960 audio backend initialization failed: pygame not available")
 
+        if config.audio.mixer_self_test:
+            self.run_mixer_self_test()
+
         logger.info("🔊 WM8960 Audio Backend initialized successfully")
 
     @handle_errors("_init_pygame_simple")
@@ -100,11 +168,16 @@ class WM8960AudioBackend(BaseAudioBackend):
         logger.info(f"🔊 WM8960: SDL_AUDIODRIVER={os.environ.get('SDL_AUDIODRIVER')}")
         logger.info(f"🔊 WM8960: SDL_AUDIODEV={os.environ.get('SDL_AUDIODEV')}")
 
-        # Use audio parameters that match WM8960 hardware capabilities
-        # Based on aplay working format: 48000Hz, Signed 16 bit Little Endian, 2 channels
-        pygame.mixer.pre_init(frequency=48000, size=-16, channels=2, buffer=2048)
+        # Buffer size and sample rate come from the configured mixer profile
+        profile = self._mixer_profile
+        pygame.mixer.pre_init(
+            frequency=profile.frequency, size=profile.size, channels=profile.channels, buffer=profile.buffer
+        )
 
-        logger.info(f"🔊 WM8960: pygame.mixer.pre_init called with freq=48000, size=-16, channels=2, buffer=2048")
+        logger.info(
+            f"🔊 WM8960: pygame.mixer.pre_init called with profile {profile.name}: "
+            f"freq={profile.frequency}, size={profile.size}, channels={profile.channels}, buffer={profile.buffer}"
+        )
 
         try:
             pygame.mixer.init()
@@ -188,6 +261,9 @@ class WM8960AudioBackend(BaseAudioBackend):
         Returns:
             float: Duration in seconds, or None if not available
         """
+        if self._metadata_cache is not None:
+            return self._metadata_cache.get_duration(file_path)
+
         if not MUTAGEN_AVAILABLE:
             logger.warning("🔊 WM8960: mutagen not available for duration detection")
             return None
@@ -272,6 +348,7 @@ class WM8960AudioBackend(BaseAudioBackend):
 
             logger.info(f"🔊 WM8960: Starting playback...")
             pygame.mixer.music.play()
+            get_latency_tracer().mark("audio_output")
             logger.info(f"🔊 WM8960: pygame.mixer.music.play() called")
 
             # Check if playback started
@@ -281,8 +358,11 @@ class WM8960AudioBackend(BaseAudioBackend):
             self._current_file_path = file_path
             self._is_playing = True
             self._is_paused = False
-            self._play_start_time = time.time()
+            self._play_start_time = time.monotonic()
             self._pause_time = None
+            self._seek_offset = 0.0
+            self._position_cache = None
+            self._clear_queue_state()
 
             # Use duration from playlist if provided, otherwise detect it from file
             if duration_ms:
@@ -291,6 +371,10 @@ class WM8960AudioBackend(BaseAudioBackend):
                 # Try to detect file duration automatically
                 self._current_file_duration = self._detect_file_duration(file_path)
 
+            self._publish_event(TrackStartedEvent(self._backend_name, file_path, self._duration_ms()))
+            self._start_end_watcher()
+            self._warm_frame_index(file_path)
+
             logger.info(f"🔊 WM8960: Playback state set - playing={self._is_playing}, busy={is_busy}")
             return True
 
@@ -306,7 +390,13 @@ class WM8960AudioBackend(BaseAudioBackend):
             bool: True if stopped successfully, False otherwise
         """
         with self._state_lock:
+            file_path = self._current_file_path if self._is_playing or self._is_paused else None
+            duration_ms = self._duration_ms()
             self._stop_current_playback()
+        if file_path:
+            self._publish_event(
+                TrackEndedEvent(self._backend_name, file_path, duration_ms, reason="stopped")
+            )
         logger.info("🔊 WM8960: Playback stopped")
         return True
 
@@ -326,7 +416,11 @@ class WM8960AudioBackend(BaseAudioBackend):
                 pygame.mixer.music.pause()
                 self._is_playing = False
                 self._is_paused = True
-                self._pause_time = time.time()
+                self._pause_time = time.monotonic()
+                self._position_cache = None
+                self._publish_event(
+                    PlaybackStateChangedEvent(self._backend_name, PlaybackState.PLAYING, PlaybackState.PAUSED)
+                )
                 logger.info("🔊 WM8960: Playback paused")
                 return True
             else:
@@ -350,9 +444,14 @@ class WM8960AudioBackend(BaseAudioBackend):
                 self._is_paused = False
                 # Adjust play start time to account for pause duration
                 if self._pause_time and self._play_start_time:
-                    pause_duration = time.time() - self._pause_time
+                    pause_duration = time.monotonic() - self._pause_time
                     self._play_start_time += pause_duration
                 self._pause_time = None
+                self._position_cache = None
+                self._publish_event(
+                    PlaybackStateChangedEvent(self._backend_name, PlaybackState.PAUSED, PlaybackState.PLAYING)
+                )
+                self._start_end_watcher()
                 logger.info("🔊 WM8960: Playback resumed")
                 return True
             else:
@@ -362,85 +461,396 @@ class WM8960AudioBackend(BaseAudioBackend):
     def get_position_sync(self) -> float:
         """Get current playback position in seconds.
 
+        The position comes from the decoder (pygame.mixer.music.get_pos()
+        plus the offset of the last seek), so it does not run ahead while
+        playback is starting or underrunning. Repeated reads within
+        POSITION_REFRESH_INTERVAL return the same cached value.
+
         Returns:
             float: Current position in seconds
         """
         with self._state_lock:
-            if not self._play_start_time:
-                return 0.0
-            if self._is_paused and self._pause_time:
-                # If paused, return position at pause time
-                position = self._pause_time - self._play_start_time
-            elif self._is_playing:
-                # If playing, return current elapsed time
-                position = time.time() - self._play_start_time
-            else:
-                return 0.0
-            # Validate position - should not be negative or extremely large
-            if position < 0:
-                logger.warning(f"🔊 WM8960: Negative position detected ({position:.2f}s), resetting to 0",
-                )
-                return 0.0
-            elif position > 7200:  # More than 2 hours is suspicious
-                logger.warning(f"🔊 WM8960: Suspiciously large position ({position:.2f}s), might indicate timing issue",
-                )
+            now = time.monotonic()
+            if self._position_cache and now - self._position_cache[0] < POSITION_REFRESH_INTERVAL:
+                return self._position_cache[1]
+            self._check_queued_transition()
+            position = self._read_position(now)
+            self._position_cache = (now, position)
             return position
 
+    def _read_position(self, now: float) -> float:
+        """Compute the position from the decoder, or the monotonic clock."""
+        if not self._play_start_time or not (self._is_playing or self._is_paused):
+            return 0.0
+
+        pos_ms = self._decoder_position_ms()
+        if pos_ms is not None:
+            position = self._seek_offset + pos_ms / 1000.0
+        elif self._is_paused and self._pause_time:
+            # If paused, return position at pause time
+            position = self._pause_time - self._play_start_time
+        else:
+            # If playing, return current elapsed time
+            position = now - self._play_start_time
+
+        # Validate position - should not be negative or extremely large
+        if position < 0:
+            logger.warning(f"🔊 WM8960: Negative position detected ({position:.2f}s), resetting to 0",
+            )
+            return 0.0
+        elif position > 7200:  # More than 2 hours is suspicious
+            logger.warning(f"🔊 WM8960: Suspiciously large position ({position:.2f}s), might indicate timing issue",
+            )
+        return position
+
+    @staticmethod
+    def _decoder_position_ms() -> Optional[int]:
+        """Milliseconds played since the last play() call, if pygame reports it."""
+        if not PYGAME_AVAILABLE or not pygame.mixer.get_init():
+            return None
+        pos_ms = pygame.mixer.music.get_pos()
+        if isinstance(pos_ms, int) and pos_ms >= 0:
+            return pos_ms
+        return None
+
     @handle_errors("set_position")
     def set_position(self, position: float) -> bool:
         """Set playback position (seek functionality).
 
+        Seeks in place with pygame.mixer.music.set_pos() while the file is
+        loaded and only reloads it for formats that cannot seek in place.
+        MP3 targets are snapped to the start of the frame the decoder resumes
+        from, so the reported position matches what is heard, once the frame
+        index built in the background at play time is ready.
+
         Args:
             position: Position in seconds to seek to
 
         Returns:
             bool: True if position was set successfully, False otherwise
+        """
+        file_path = self._current_file_path
+        if not file_path:
+            return False
 
-        Note: pygame.mixer.music doesn't support direct seeking, so we restart
-        playback from the beginning and use pygame.mixer.music.set_pos() if available.
+        started = time.perf_counter()
+        target = self._seek_target(file_path, max(0.0, position))
+        with self._state_lock:
+            if not (PYGAME_AVAILABLE and pygame.mixer.get_init()) or file_path != self._current_file_path:
+                return False
+            in_place = (self._is_playing or self._is_paused) and self._seek_in_place(target)
+            success = in_place or self._seek_by_reload(target)
+            self._position_cache = None
+
+        self._seek_latency.record((time.perf_counter() - started) * 1000)
+        self._seek_counts["in_place" if in_place else "reload"] += 1
+        if not success:
+            self._seek_counts["failed"] += 1
+        logger.debug(f"🔊 WM8960: Seek to {target:.2f}s ({'in place' if in_place else 'reload'})")
+        return success
+
+    def _seek_target(self, file_path: str, position: float) -> float:
+        """Clamp a seek to the track and snap MP3 seeks to a frame start.
+
+        Never scans the file: a seek right after play, before the background
+        scan is done, goes to the unsnapped position.
         """
-        if not self._current_file_path:
+        index = self._frame_indexes.peek(file_path) if Path(file_path).suffix.lower() == ".mp3" else None
+        if index is None:
+            duration = self._current_file_duration
+            return min(position, duration) if duration else position
+        self._seek_counts["frame_indexed"] += 1
+        return index.frame_at(min(position, index.duration))
+
+    def _seek_capabilities(self) -> Dict[str, bool]:
+        """Detect once how this pygame build can seek."""
+        if self._capabilities is None:
+            import inspect
+
+            try:
+                parameters = inspect.signature(pygame.mixer.music.play).parameters.values()
+                play_start = any(
+                    p.name == "start" or p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters
+                )
+            except (TypeError, ValueError):
+                # Builtin without a signature: play(loops, start, fade_ms) since pygame 1.9
+                play_start = True
+            self._capabilities = {
+                "set_pos": hasattr(pygame.mixer.music, "set_pos"),
+                "play_start": play_start,
+            }
+            logger.info(f"🔊 WM8960: Seek capabilities {self._capabilities}")
+        return self._capabilities
+
+    def _seek_in_place(self, target: float) -> bool:
+        """Seek the loaded file without stopping it; keeps any queued track."""
+        suffix = Path(self._current_file_path).suffix.lower()
+        if not self._seek_capabilities()["set_pos"] or suffix in self._set_pos_unsupported:
+            return False
+        try:
+            if suffix == ".mp3":
+                # set_pos() is relative for MP3 on some SDL_mixer builds;
+                # from the start of the file relative and absolute agree
+                pygame.mixer.music.rewind()
+            pygame.mixer.music.set_pos(target)
+        except Exception as e:
+            # Remember the format so later seeks go straight to the reload path
+            self._set_pos_unsupported.add(suffix)
+            logger.info(f"🔊 WM8960: In-place seek unsupported for {suffix or 'this format'}: {e}")
             return False
 
+        # get_pos() keeps counting from the last play(); offset it to the target
+        pos_ms = self._decoder_position_ms()
+        self._seek_offset = target - (pos_ms or 0) / 1000.0
+        now = time.monotonic()
+        self._play_start_time = now - target
+        if self._is_paused:
+            self._pause_time = now
+        return True
+
+    def _seek_by_reload(self, target: float) -> bool:
+        """Restart the file at the target; drops any queued track."""
+        was_paused = self._is_paused
+        # Stop current playback (this also drops any queued track)
+        pygame.mixer.music.stop()
+        self._clear_queue_state()
+        pygame.mixer.music.load(self._current_file_path)
+        success = False
+        try:
+            if self._seek_capabilities()["play_start"]:
+                pygame.mixer.music.play(start=target)
+                success = True
+            else:
+                pygame.mixer.music.play()
+                logger.warning("🔊 WM8960: pygame.mixer.music.play() doesn't support start parameter")
+        except Exception as e:
+            # Fallback to simple play without seeking
+            pygame.mixer.music.play()
+            logger.warning(f"🔊 WM8960: Seek failed, playing from start: {e}")
+
+        # get_pos() restarts from zero at the new start point
+        self._seek_offset = target if success else 0.0
+        now = time.monotonic()
+        self._play_start_time = now - self._seek_offset
+        self._pause_time = None
+        self._is_playing = True
+        self._is_paused = False
+        if was_paused:
+            pygame.mixer.music.pause()
+            self._is_playing = False
+            self._is_paused = True
+            self._pause_time = now
+        else:
+            self._start_end_watcher()
+        return success
+
+    def _warm_frame_index(self, file_path: str) -> None:
+        """Index an MP3 in the background so its first seek is fast."""
+        if Path(file_path).suffix.lower() != ".mp3":
+            return
+        threading.Thread(
+            target=self._frame_indexes.get, args=(file_path,), name="wm8960-frame-index", daemon=True
+        ).start()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get seek, gapless playback and volume counters for health reporting."""
+        return {
+            "seek": {
+                **self._seek_counts,
+                "latency": self._seek_latency.snapshot(),
+                "capabilities": dict(self._capabilities or {}),
+                "in_place_unsupported": sorted(self._set_pos_unsupported),
+                "frame_index_cache": self._frame_indexes.get_statistics(),
+            },
+            "gapless_transitions": self._gapless_transitions,
+            "volume": {
+                **self._volume_writer.get_statistics(),
+                "mixer": self._mixer.get_statistics(),
+            },
+            "mixer": {
+                "profile": self._mixer_profile.to_dict(),
+                "self_test": self._mixer_self_test.to_dict() if self._mixer_self_test else None,
+            },
+        }
+
+    def run_mixer_self_test(self, duration: float = DEFAULT_TEST_DURATION) -> MixerSelfTestResult:
+        """Measure time-to-first-audio and underruns of the current mixer profile.
+
+        Plays a silent clip, so it is refused while a track is loaded.
+
+        Args:
+            duration: Seconds of playback to watch after the first audio
+
+        Returns:
+            The measurements, also kept for get_statistics()
+        """
+        profile = self._mixer_profile
         with self._state_lock:
-            if PYGAME_AVAILABLE and pygame.mixer.get_init():
-                was_playing = self._is_playing
-                was_paused = self._is_paused
-                # Stop current playback
-                pygame.mixer.music.stop()
-                # Reload and start playback
-                pygame.mixer.music.load(self._current_file_path)
-                # Try to use pygame's set_pos if available (pygame 2.0+)
-                seek_success = False
+            if self._current_file_path is not None or not self._pygame_initialized:
+                return MixerSelfTestResult(profile.name, None, 0, 0.0, error="mixer busy or unavailable")
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                clip = os.path.join(tmp_dir, "mixer_self_test.wav")
+                write_silence(clip, profile.frequency, profile.channels, duration + FIRST_AUDIO_TIMEOUT + 1.0)
+
+                def start() -> bool:
+                    pygame.mixer.music.load(clip)
+                    pygame.mixer.music.play()
+                    return True
+
+                def read_position_ms() -> Optional[float]:
+                    position = self._decoder_position_ms()
+                    return position if position is not None and position >= 0 else None
+
+                def read_mixed_ms() -> Optional[float]:
+                    # Paused, get_pos() leaves out its wall-clock extrapolation
+                    pygame.mixer.music.pause()
+                    try:
+                        return read_position_ms()
+                    finally:
+                        pygame.mixer.music.unpause()
+
                 try:
-                    # Test if pygame supports the start parameter first
-                    import inspect
-
-                    play_sig = inspect.signature(pygame.mixer.music.play)
-                    has_start_param = "start" in play_sig.parameters
-                    if has_start_param:
-                        # Try to use the start parameter
-                        pygame.mixer.music.play(start=position)
-                        # Assume seeking worked for now - pygame doesn't give us feedback
-                        seek_success = True
-                        logger.info(f"🔊 WM8960: Attempted seek to {position:.1f}s using play(start=)",
-                        )
-                    else:
-                        # No start parameter available
-                        pygame.mixer.music.play()
-                        seek_success = False
-                        logger.warning("🔊 WM8960: pygame.mixer.music.play() doesn't support start parameter",
-                        )
+                    result = measure_output(
+                        profile.name,
+                        start,
+                        read_position_ms,
+                        read_mixed_ms,
+                        profile.buffer_latency_ms,
+                        duration,
+                    )
                 except Exception as e:
-                    # Fallback to simple play without seeking
-                    pygame.mixer.music.play()
-                    seek_success = False
-                    logger.warning(f"🔊 WM8960: Seek failed, playing from start: {e}")
+                    result = MixerSelfTestResult(profile.name, None, 0, 0.0, error=str(e))
+                finally:
+                    pygame.mixer.music.stop()
+                    pygame.mixer.music.unload()
+
+        self._mixer_self_test = result
+        return result
+
+    # --- Gapless playback ---
+
+    @property
+    def gapless_enabled(self) -> bool:
+        """Whether the next track can be queued for gapless playback."""
+        return self._gapless_enabled
+
+    def set_gapless_enabled(self, enabled: bool) -> None:
+        """Enable or disable gapless playback.
+
+        Disabling it cancels a track that is already queued.
+        """
+        with self._state_lock:
+            self._gapless_enabled = bool(enabled)
+            if not self._gapless_enabled:
+                self.clear_queued()
+        logger.info(f"🔊 WM8960: Gapless playback {'enabled' if enabled else 'disabled'}")
+
+    @handle_errors("queue_next")
+    def queue_next(self, file_path: str, duration_ms: Optional[int] = None) -> bool:
+        """Queue the track to play as soon as the current one ends.
+
+        Replaces any previously queued track.
+
+        Args:
+            file_path: Path to the next audio file
+            duration_ms: Optional track duration in milliseconds from playlist
+
+        Returns:
+            bool: True if the track was queued, False otherwise
+        """
+        path = self._validate_file_path(file_path)
+        if not path:
+            return False
+
+        with self._state_lock:
+            if not self._gapless_enabled or not self._current_file_path:
+                return False
+            if not (PYGAME_AVAILABLE and self._pygame_initialized and pygame.mixer.get_init()):
+                return False
+            # Catch a transition to the previously queued track before replacing it
+            self._check_queued_transition()
+            pygame.mixer.music.queue(str(path))
+            self._queued_file_path = str(path)
+            self._queued_file_duration = duration_ms / 1000.0 if duration_ms else None
+            self._queued_cancelled = False
+            logger.debug(f"🔊 WM8960: Queued next track {Path(path).name}")
+            return True
+
+    def clear_queued(self) -> None:
+        """Cancel the queued track, if any."""
+        with self._state_lock:
+            if self._queued_file_path is not None:
+                self._queued_cancelled = True
+
+    @property
+    def has_queued_track(self) -> bool:
+        """Whether a track is queued to follow the current one."""
+        with self._state_lock:
+            self._check_queued_transition()
+            return self._queued_file_path is not None and not self._queued_cancelled
+
+    def consume_track_transition(self) -> Optional[str]:
+        """Report a gapless switch to the queued track.
+
+        Returns:
+            Optional[str]: Path of the track that took over since the last
+            call, or None if there was no transition
+        """
+        with self._state_lock:
+            self._check_queued_transition()
+            file_path, self._pending_transition = self._pending_transition, None
+            return file_path
+
+    def _check_queued_transition(self) -> None:
+        """Promote the queued track to current once pygame has started it."""
+        if self._queued_file_path is None or not self._is_playing or self._is_paused:
+            return
+        pos_ms = pygame.mixer.music.get_pos()
+        if pos_ms < 0:
+            return
+        if pos_ms >= self._last_pos_ms:
+            self._last_pos_ms = pos_ms
+            return
+
+        # Position went backwards: the queued track is now playing
+        file_path, cancelled = self._queued_file_path, self._queued_cancelled
+        duration = self._queued_file_duration
+        self._clear_queue_state()
+        self._last_pos_ms = pos_ms
+        if cancelled:
+            logger.debug("🔊 WM8960: Stopping cancelled queued track")
+            pygame.mixer.music.stop()
+            self._finish_track()
+            return
+
+        self._publish_event(
+            TrackEndedEvent(self._backend_name, self._current_file_path, self._duration_ms())
+        )
+        self._current_file_path = file_path
+        self._current_file_duration = duration or self._detect_file_duration(file_path)
+        self._publish_event(TrackStartedEvent(self._backend_name, file_path, self._duration_ms()))
+        self._play_start_time = time.monotonic() - pos_ms / 1000.0
+        self._pause_time = None
+        self._seek_offset = 0.0
+        self._position_cache = None
+        self._pending_transition = file_path
+        self._gapless_transitions += 1
+        logger.info(f"🔊 WM8960: Gapless transition to {Path(file_path).name}")
+
+    def _clear_queue_state(self) -> None:
+        self._queued_file_path = None
+        self._queued_file_duration = None
+        self._queued_cancelled = False
+        self._last_pos_ms = 0
 
     @handle_errors("set_volume_sync")
     def set_volume_sync(self, volume: int) -> bool:
         """Set playback volume through pygame and ALSA.
 
+        The pygame volume changes at once; the ALSA write goes through the
+        coalescing volume writer, so a burst of changes costs one write.
+
         Args:
             volume: Volume level (0-100)
 
@@ -455,11 +865,8 @@ class WM8960AudioBackend(BaseAudioBackend):
                 pygame.mixer.music.set_volume(pygame_volume)
                 logger.debug(f"🔊 WM8960: pygame volume set to {pygame_volume}")
                 # Also set system volume via ALSA
-                volume_percent = f"{self._volume}%"
-                subprocess.run(
-                    ["amixer", "sset", "Master", volume_percent], check=True, capture_output=True
-                )
-                logger.debug(f"🔊 WM8960: ALSA volume set to {self._volume}%")
+                self._volume_writer.request(self._volume)
+        return True
 
     @property
     def is_paused(self) -> bool:
@@ -478,14 +885,12 @@ class WM8960AudioBackend(BaseAudioBackend):
             bool: True if playing, False otherwise
         """
         with self._state_lock:
+            self._check_queued_transition()
             # Check pygame.mixer.music playback status
             if PYGAME_AVAILABLE and self._is_playing and not self._is_paused:
                 if not pygame.mixer.music.get_busy():
                     # pygame music finished
-                    self._is_playing = False
-                    self._is_paused = False
-                    self._play_start_time = None
-                    logger.debug("🔊 WM8960: pygame track finished")
+                    self._finish_track()
 
             return self._is_playing
 
@@ -499,18 +904,59 @@ class WM8960AudioBackend(BaseAudioBackend):
             bool: True if backend is busy, False if idle/finished
         """
         with self._state_lock:
+            self._check_queued_transition()
             # Check if pygame.mixer.music is still playing
             if PYGAME_AVAILABLE and self._is_playing and not self._is_paused:
                 if not pygame.mixer.music.get_busy():
                     # Track finished
-                    self._is_playing = False
-                    self._is_paused = False
-                    self._play_start_time = None
-                    logger.debug("🔊 WM8960: Track ended, backend no longer busy")
+                    self._finish_track()
                     return False
 
             return self._is_playing
 
+    # --- End-of-track detection ---
+
+    def _finish_track(self) -> None:
+        """Record that pygame finished the current track on its own."""
+        self._is_playing = False
+        self._is_paused = False
+        self._play_start_time = None
+        self._position_cache = None
+        logger.debug("🔊 WM8960: Track ended, backend no longer busy")
+        if self._current_file_path:
+            self._publish_event(
+                TrackEndedEvent(self._backend_name, self._current_file_path, self._duration_ms())
+            )
+
+    def _start_end_watcher(self) -> None:
+        """Start the end-of-track watcher unless it is already running."""
+        if self._event_bus is None or self._end_watcher is not None:
+            return
+        self._end_watcher = threading.Thread(
+            target=self._watch_track_end, name="wm8960-track-end", daemon=True
+        )
+        self._end_watcher.start()
+
+    def _watch_track_end(self) -> None:
+        """Poll pygame while playing; exits on pause, stop or track end."""
+        while True:
+            time.sleep(TRACK_END_POLL_INTERVAL)
+            with self._state_lock:
+                if self._is_playing and not self._is_paused:
+                    self._check_queued_transition()
+                    if pygame.mixer.music.get_busy():
+                        continue
+                    if self._is_playing:
+                        self._finish_track()
+                # Cleared under the lock so a resume or play restarts it
+                self._end_watcher = None
+                return
+
+    def _duration_ms(self) -> Optional[int]:
+        if self._current_file_duration:
+            return int(self._current_file_duration * 1000)
+        return None
+
     # Async methods required by AudioBackendProtocol
     async def pause(self) -> bool:
         """Async wrapper for pause method.
@@ -613,7 +1059,7 @@ class WM8960AudioBackend(BaseAudioBackend):
         return None
 
     def _detect_file_duration(self, file_path: str) -> Optional[float]:
-        """Detect duration of audio file using mutagen.
+        """Detect duration of audio file through the metadata cache or mutagen.
 
         Args:
             file_path: Path to audio file
@@ -621,20 +1067,7 @@ class WM8960AudioBackend(BaseAudioBackend):
         Returns:
             float: Duration in seconds or None if detection fails
         """
-        try:
-            # Try to use mutagen to get file duration
-            from mutagen import File
-            audio_file = File(file_path)
-            if audio_file and hasattr(audio_file, 'info') and hasattr(audio_file.info, 'length'):
-                duration = float(audio_file.info.length)
-                logger.info(f"🔊 WM8960: Detected file duration: {duration:.1f}s for {file_path}")
-                return duration
-        except ImportError:
-            logger.warning("🔊 WM8960: mutagen not available for duration detection")
-        except Exception as e:
-            logger.debug(f"🔊 WM8960: Could not detect duration for {file_path}: {e}")
-
-        return None
+        return self._get_file_duration(file_path)
 
     @handle_errors("cleanup")
     def cleanup(self) -> None:
@@ -642,6 +1075,8 @@ class WM8960AudioBackend(BaseAudioBackend):
         logger.info("🔊 Cleaning up WM8960 audio backend")
         with self._state_lock:
             self._stop_current_playback()
+        self._volume_writer.close()
+        self._mixer.close()
 
         # Clean up any SDL environment variables we might have set
         if 'SDL_AUDIODRIVER' in os.environ:
@@ -664,5 +1099,9 @@ class WM8960AudioBackend(BaseAudioBackend):
         self._is_paused = False
         self._play_start_time = None
         self._pause_time = None
+        self._seek_offset = 0.0
+        self._position_cache = None
         self._current_file_path = None
         self._current_file_duration = None
+        self._clear_queue_state()
+        self._pending_transition = None
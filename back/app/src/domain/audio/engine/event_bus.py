@@ -6,7 +6,7 @@
 
 import asyncio
 from collections import defaultdict
-from typing import Dict, List, Callable, Any, Type, TypeVar
+from typing import Dict, List, Callable, Any, Optional, Type, TypeVar
 
 from app.src.monitoring import get_logger
 from app.src.domain.protocols.event_bus_protocol import EventBusProtocol, AudioEvent
@@ -22,6 +22,17 @@ class EventBus(EventBusProtocol):
     def __init__(self):
         self._subscribers: Dict[Type, List[Callable]] = defaultdict(list)
         self._stats = {"events_published": 0, "events_handled": 0, "errors": 0}
+        # Loop that handlers run on when events come from other threads
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Set the event loop used for events published from other threads."""
+        self._loop = loop
+
+    @property
+    def loop_bound(self) -> bool:
+        """Whether events published from other threads can be delivered."""
+        return self._loop is not None and not self._loop.is_closed()
 
     def subscribe(self, event_type: Type[EventType], handler: Callable[[EventType], Any]) -> None:
         """Subscribe to an event type."""
@@ -38,6 +49,8 @@ class EventBus(EventBusProtocol):
     @handle_errors("publish")
     async def publish(self, event: EventType) -> None:
         """Publish an event to all subscribers."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
         event_type = type(event)
         subscribers = self._subscribers.get(event_type, [])
 
@@ -57,6 +70,17 @@ class EventBus(EventBusProtocol):
         logger.debug(f"Published {event_type.__name__} to {len(subscribers)} subscribers"
         )
 
+    def publish_threadsafe(self, event: EventType) -> bool:
+        """Publish an event from any thread without waiting for handlers.
+
+        Returns:
+            bool: False if no event loop is bound yet
+        """
+        if not self.loop_bound or not self._subscribers.get(type(event)):
+            return False
+        asyncio.run_coroutine_threadsafe(self.publish(event), self._loop)
+        return True
+
     def get_subscriber_count(self, event_type: Type[EventType]) -> int:
         """Get number of subscribers for an event type."""
         return len(self._subscribers.get(event_type, []))
@@ -5,7 +5,7 @@
 """Playlist domain entity following Domain-Driven Design principles."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .track import Track
 
@@ -23,6 +23,8 @@ class Playlist:
         description: Optional description of the playlist
         id: Optional unique identifier
         nfc_tag_id: Optional NFC tag associated with the playlist
+        track_count: Persisted track count, None if not loaded from storage
+        total_duration_ms: Persisted total duration, None if not loaded from storage
     """
 
     title: str
@@ -31,6 +33,8 @@ class Playlist:
     id: Optional[str] = None
     nfc_tag_id: Optional[str] = None
     path: Optional[str] = None
+    track_count: Optional[int] = None
+    total_duration_ms: Optional[int] = None
 
     @classmethod
     def from_api_data(cls, title: Optional[str] = None, name: Optional[str] = None, **kwargs) -> "Playlist":
@@ -99,6 +103,7 @@ class Playlist:
         self.tracks.append(track)
         # Domain business rule: Sort tracks by number
         self.tracks.sort(key=lambda t: t.track_number)
+        self._invalidate_aggregates()
 
     def remove_track(self, track_number: int) -> Optional[Track]:
         """Domain behavior: Remove a track by number and return it.
@@ -117,8 +122,14 @@ class Playlist:
             # Domain business rule: Reindex remaining tracks
             for i, t in enumerate(sorted(self.tracks, key=lambda x: x.track_number), 1):
                 t.track_number = i
+            self._invalidate_aggregates()
         return track
 
+    def _invalidate_aggregates(self) -> None:
+        """Drop persisted aggregates once the loaded tracks have been edited."""
+        self.track_count = None
+        self.total_duration_ms = None
+
     def __len__(self) -> int:
         """Return the number of tracks in the playlist."""
         return len(self.tracks)
@@ -232,6 +243,19 @@ class Playlist:
             return None  # Some tracks have unknown duration
         return sum(durations)
 
+    def get_summary(self) -> Tuple[int, int]:
+        """Domain query: Get the track count and total duration for summaries.
+
+        Uses the persisted aggregates when available so that tracks do not need
+        to be loaded; otherwise computes them from the loaded tracks.
+
+        Returns:
+            Tuple of (track count, total duration in milliseconds)
+        """
+        if self.track_count is not None and self.total_duration_ms is not None:
+            return self.track_count, self.total_duration_ms
+        return len(self.tracks), sum(track.duration_ms or 0 for track in self.tracks)
+
     def get_display_name(self) -> str:
         """Domain service: Get formatted display title.
 
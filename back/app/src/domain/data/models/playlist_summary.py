@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Playlist summary read model for track-free listings."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Playlist listing views: with full track lists, or track-free summaries
+VIEW_FULL = "full"
+VIEW_SUMMARY = "summary"
+PLAYLIST_VIEWS = (VIEW_FULL, VIEW_SUMMARY)
+
+# Fields exposed by summary listings, in output order
+SUMMARY_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "nfc_tag_id",
+    "path",
+    "track_count",
+    "total_duration_ms",
+    "created_at",
+    "updated_at",
+)
+
+
+@dataclass
+class PlaylistSummary:
+    """Lightweight view of a playlist without its tracks.
+
+    Built from the persisted playlist aggregates so listing screens never load
+    track rows.
+
+    Attributes:
+        id: Playlist identifier
+        title: Title of the playlist
+        description: Optional description of the playlist
+        nfc_tag_id: Optional NFC tag associated with the playlist
+        path: Optional folder name of the playlist
+        track_count: Number of tracks in the playlist
+        total_duration_ms: Sum of known track durations in milliseconds
+        created_at: Creation timestamp as stored
+        updated_at: Last update timestamp as stored
+    """
+
+    id: str
+    title: str
+    description: Optional[str] = None
+    nfc_tag_id: Optional[str] = None
+    path: Optional[str] = None
+    track_count: int = 0
+    total_duration_ms: int = 0
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a flat dictionary without deep-copying.
+
+        Returns:
+            Dictionary with the summary fields
+        """
+        return {name: getattr(self, name) for name in SUMMARY_FIELDS}
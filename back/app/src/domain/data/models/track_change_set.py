@@ -0,0 +1,84 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Track change set value object for delta-based track persistence."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .track import Track
+
+# Track attributes that are persisted as plain columns (besides track_number)
+TRACK_UPDATABLE_FIELDS = ("title", "filename", "file_path", "duration_ms", "artist", "album")
+
+
+@dataclass
+class TrackChangeSet:
+    """Minimal set of track changes to apply to a playlist.
+
+    Repositories translate each category into a single batched statement so
+    that editing one track never rewrites the whole playlist.
+
+    Attributes:
+        inserts: New tracks to insert
+        deletes: IDs of tracks to delete
+        renumbers: Mapping of track ID to its new track number
+        updates: Mapping of track ID to the changed persisted fields
+    """
+
+    inserts: List[Track] = field(default_factory=list)
+    deletes: List[str] = field(default_factory=list)
+    renumbers: Dict[str, int] = field(default_factory=dict)
+    updates: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def diff(cls, current: List[Track], desired: List[Track]) -> "TrackChangeSet":
+        """Domain factory method: Compute the changes turning current into desired.
+
+        Tracks are matched by ID; desired tracks without an ID, or with an ID
+        unknown to the current list, are inserted.
+
+        Args:
+            current: Tracks as currently persisted
+            desired: Tracks as they should be persisted
+
+        Returns:
+            Change set with only the differing tracks
+        """
+        current_by_id = {track.id: track for track in current if track.id}
+        desired_ids = set()
+        changes = cls()
+
+        for track in desired:
+            existing = current_by_id.get(track.id) if track.id else None
+            if existing is None:
+                changes.inserts.append(track)
+                continue
+
+            desired_ids.add(track.id)
+            if existing.track_number != track.track_number:
+                changes.renumbers[track.id] = track.track_number
+
+            changed_fields = {
+                name: getattr(track, name)
+                for name in TRACK_UPDATABLE_FIELDS
+                if getattr(track, name) != getattr(existing, name)
+            }
+            if changed_fields:
+                changes.updates[track.id] = changed_fields
+
+        changes.deletes = [track_id for track_id in current_by_id if track_id not in desired_ids]
+        return changes
+
+    def is_empty(self) -> bool:
+        """Domain query: Check if the change set contains no changes.
+
+        Returns:
+            True if there is nothing to persist
+        """
+        return not (self.inserts or self.deletes or self.renumbers or self.updates)
+
+    def __len__(self) -> int:
+        """Return the number of affected tracks."""
+        return len(self.inserts) + len(self.deletes) + len(set(self.renumbers) | set(self.updates))
@@ -70,6 +70,11 @@ class TrackRepositoryProtocol(Protocol):
         """Add a track to a playlist."""
         ...
 
+    @abstractmethod
+    async def get_next_track_number(self, playlist_id: str) -> int:
+        """Get the track number following the last track of a playlist."""
+        ...
+
     @abstractmethod
     async def update(self, track_id: str, track_data: Dict[str, Any]) -> bool:
         """Update a track."""
@@ -12,8 +12,14 @@ class PlaylistServiceProtocol(Protocol):
     """Protocol for playlist service operations."""
 
     @abstractmethod
-    async def get_playlists(self, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
-        """Get paginated playlists."""
+    async def get_playlists(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+        view: str = "full",
+    ) -> Dict[str, Any]:
+        """Get paginated playlists, by page number or keyset cursor, full or summary view."""
         ...
 
     @abstractmethod
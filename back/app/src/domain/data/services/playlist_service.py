@@ -7,13 +7,20 @@
 import os
 import uuid
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 from dataclasses import asdict
 import logging
 
 from app.src.domain.decorators.error_handler import handle_domain_errors
 from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.track import Track
+from app.src.domain.data.models.playlist_summary import (
+    PLAYLIST_VIEWS,
+    VIEW_FULL,
+    PlaylistSummary,
+)
+from app.src.utils.pagination import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -37,42 +44,102 @@ class PlaylistService:
         logger.info("✅ PlaylistService initialized in data domain")
 
     @handle_domain_errors(operation_name="get_playlists")
-    async def get_playlists(self, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
+    async def get_playlists(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+        view: str = VIEW_FULL,
+    ) -> Dict[str, Any]:
         """Get paginated playlists.
 
+        Passing a cursor (an empty string for the first page) switches to
+        keyset pagination, whose cost does not grow with the page position.
+        The summary view skips track loading entirely and returns the
+        persisted track count and duration instead of track lists.
+
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored in cursor mode
             page_size: Number of items per page
+            cursor: Opaque cursor returned as ``next_cursor`` by a previous call
+            view: ``"full"`` for playlists with tracks, ``"summary"`` without
 
         Returns:
-            Dictionary with playlists and pagination info
+            Dictionary with playlists and pagination info; in cursor mode
+            ``next_cursor`` is None on the last page
+
+        Raises:
+            ValueError: If the cursor cannot be decoded or the view is unknown
         """
+        if view not in PLAYLIST_VIEWS:
+            raise ValueError(f"Unknown playlist view: {view}")
+        include_tracks = view == VIEW_FULL
+
+        if cursor is not None:
+            return await self._get_playlists_after_cursor(cursor, page_size, include_tracks)
+
         skip = (page - 1) * page_size
 
         # Get playlists and total count
-        playlist_entities = await self._playlist_repo.find_all(offset=skip, limit=page_size)
+        playlist_entities = await self._playlist_repo.find_all(
+            offset=skip, limit=page_size, include_tracks=include_tracks
+        )
         total = await self._playlist_repo.count()
 
-        # Convert Playlist entities to dicts
+        return {
+            'playlists': self._playlists_to_dicts(playlist_entities),
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'total_pages': (total + page_size - 1) // page_size
+        }
+
+    async def _get_playlists_after_cursor(
+        self, cursor: str, page_size: int, include_tracks: bool
+    ) -> Dict[str, Any]:
+        """Get a page of playlists following a keyset cursor."""
+        after = None
+        if cursor:
+            updated_at, playlist_id = decode_cursor(cursor)
+            if updated_at is None or playlist_id is None:
+                raise ValueError("Invalid pagination cursor")
+            after = (updated_at, playlist_id)
+
+        playlist_entities, next_key = await self._playlist_repo.find_page(
+            limit=page_size, after=after, include_tracks=include_tracks
+        )
+        total = await self._playlist_repo.count()
+
+        return {
+            'playlists': self._playlists_to_dicts(playlist_entities),
+            'total': total,
+            'page_size': page_size,
+            'total_pages': (total + page_size - 1) // page_size,
+            'next_cursor': encode_cursor(*next_key) if next_key else None
+        }
+
+    @staticmethod
+    def _playlists_to_dicts(
+        playlist_entities: List[Union[Playlist, PlaylistSummary]]
+    ) -> List[Dict[str, Any]]:
+        """Convert playlist entities or summaries to API-compatible dictionaries."""
         playlists = []
         for playlist_entity in playlist_entities:
             if playlist_entity is None:
                 continue
+            if isinstance(playlist_entity, PlaylistSummary):
+                playlists.append(playlist_entity.to_dict())
+                continue
             playlist_dict = asdict(playlist_entity)
-            # Add track count for each playlist
-            playlist_dict['track_count'] = len(playlist_entity.tracks)
+            # Summary comes from the persisted aggregates when available
+            track_count, total_duration_ms = playlist_entity.get_summary()
+            playlist_dict['track_count'] = track_count
+            playlist_dict['total_duration_ms'] = total_duration_ms
             # Ensure title field exists (for API compatibility)
             if 'title' not in playlist_dict and 'name' in playlist_dict:
                 playlist_dict['title'] = playlist_dict['name']
             playlists.append(playlist_dict)
-
-        return {
-            'playlists': playlists,
-            'total': total,
-            'page': page,
-            'page_size': page_size,
-            'total_pages': (total + page_size - 1) // page_size
-        }
+        return playlists
 
     @handle_domain_errors(operation_name="get_playlist")
     async def get_playlist(self, playlist_id: str) -> Optional[Dict[str, Any]]:
@@ -129,6 +196,50 @@ class PlaylistService:
             playlist_dict['title'] = playlist_dict['name']
         return playlist_dict
 
+    @handle_domain_errors(operation_name="import_playlists")
+    async def import_playlists(self, playlists_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create or replace many playlists with their tracks in one write.
+
+        Args:
+            playlists_data: Playlist dicts (title, optional id/description) each
+                with a ``tracks`` list; tracks without a track_number are
+                numbered in list order
+
+        Returns:
+            IDs of the imported playlists and imported counts
+        """
+        playlists = []
+        for playlist_data in playlists_data:
+            tracks = []
+            for position, track_data in enumerate(playlist_data.get('tracks', []), 1):
+                tracks.append(Track(
+                    id=track_data.get('id'),
+                    track_number=track_data.get('track_number') or position,
+                    title=track_data.get('title') or 'Unknown Track',
+                    filename=track_data.get('filename') or '',
+                    file_path=track_data.get('file_path') or '',
+                    duration_ms=track_data.get('duration_ms'),
+                    artist=track_data.get('artist'),
+                    album=track_data.get('album'),
+                ))
+            playlists.append(Playlist(
+                id=playlist_data.get('id'),
+                title=playlist_data['title'],
+                description=playlist_data.get('description') or '',
+                nfc_tag_id=playlist_data.get('nfc_tag_id'),
+                tracks=tracks,
+            ))
+
+        saved = await self._playlist_repo.bulk_upsert_playlists(playlists)
+        track_total = sum(len(playlist.tracks) for playlist in saved)
+        logger.info(f"✅ Imported {len(saved)} playlists with {track_total} tracks")
+
+        return {
+            'playlist_ids': [playlist.id for playlist in saved],
+            'playlists_imported': len(saved),
+            'tracks_imported': track_total,
+        }
+
     @handle_domain_errors(operation_name="update_playlist")
     async def update_playlist(self, playlist_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update playlist metadata and rename filesystem directory if title changed.
@@ -395,6 +506,21 @@ class PlaylistService:
 
         return playlist_dict
 
+    @handle_domain_errors(operation_name="get_nfc_tagged_playlists")
+    async def get_nfc_tagged_playlists(self) -> List[Dict[str, Any]]:
+        """Get every playlist that has an NFC tag associated.
+
+        Returns:
+            List of playlist data with tracks
+        """
+        playlist_entities = await self._playlist_repo.find_with_nfc_tags()
+        playlists = []
+        for playlist_entity in playlist_entities:
+            playlist_dict = asdict(playlist_entity)
+            playlist_dict['track_count'] = len(playlist_entity.tracks)
+            playlists.append(playlist_dict)
+        return playlists
+
     @handle_domain_errors(operation_name="sync_with_filesystem")
     async def sync_with_filesystem(self, upload_folder: str) -> Dict[str, Any]:
         """Synchronize playlists with filesystem.
@@ -456,11 +582,11 @@ class PlaylistService:
             playlist_dir: Directory containing audio files
             stats: Statistics dictionary to update
         """
-        # Get audio files
+        # Get audio files; hidden files such as cached renditions are not tracks
         audio_extensions = {'.mp3', '.flac', '.wav', '.m4a', '.ogg'}
         audio_files = sorted([
             f for f in playlist_dir.iterdir()
-            if f.is_file() and f.suffix.lower() in audio_extensions
+            if f.is_file() and not f.name.startswith('.') and f.suffix.lower() in audio_extensions
         ])
 
         # Get existing tracks
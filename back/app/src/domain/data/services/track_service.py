@@ -67,16 +67,17 @@ class TrackService:
         if not await self._playlist_repo.exists(playlist_id):
             raise ValueError(f"Playlist {playlist_id} not found")
 
-        # Get current tracks to determine track number
-        existing_tracks = await self._track_repo.get_by_playlist(playlist_id)
-        next_track_number = len(existing_tracks) + 1
+        # Append after the last track unless the caller chose a position
+        track_number = track_data.get('track_number')
+        if track_number is None:
+            track_number = await self._track_repo.get_next_track_number(playlist_id)
 
         # Prepare track data
         track_id = str(uuid.uuid4())
         full_track_data = {
             'id': track_id,
             'playlist_id': playlist_id,
-            'track_number': track_data.get('track_number', next_track_number),
+            'track_number': track_number,
             'title': track_data.get('title', 'Unknown Track'),
             'filename': track_data.get('filename'),
             'file_path': track_data.get('file_path'),
@@ -112,3 +112,10 @@ class NfcRepositoryProtocol(ABC):
             True if deleted, False if not found
         """
         pass
+
+    async def close(self) -> None:
+        """Persist any buffered writes and release resources.
+
+        Repositories that write through have nothing to do.
+        """
+        pass
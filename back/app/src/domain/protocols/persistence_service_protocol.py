@@ -127,6 +127,100 @@ class PersistenceServiceProtocol(ABC):
     ) -> List[Any]:
         """Execute multiple operations in a single transaction.
 
+        Args:
+            operations: List of operations with 'query', 'params', 'type'.
+                Type "many" runs the query once per parameter tuple in 'params'.
+            operation_name: Operation name for logging/monitoring
+
+        Returns:
+            List of results from each operation
+        """
+        pass
+
+    @abstractmethod
+    async def execute_query_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "query"
+    ) -> List[Any]:
+        """Execute a SELECT query without blocking the event loop.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            operation_name: Operation name for logging/monitoring
+
+        Returns:
+            List of result rows
+        """
+        pass
+
+    @abstractmethod
+    async def execute_single_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "query_single"
+    ) -> Optional[Any]:
+        """Execute a SELECT query returning one row without blocking the event loop.
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            operation_name: Operation name for logging/monitoring
+
+        Returns:
+            Single row or None
+        """
+        pass
+
+    @abstractmethod
+    async def execute_command_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "command"
+    ) -> int:
+        """Execute an INSERT/UPDATE/DELETE command without blocking the event loop.
+
+        Args:
+            query: SQL command string
+            params: Command parameters
+            operation_name: Operation name for logging/monitoring
+
+        Returns:
+            Number of affected rows
+        """
+        pass
+
+    @abstractmethod
+    async def execute_insert_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "insert"
+    ) -> str:
+        """Execute an INSERT command without blocking the event loop.
+
+        Args:
+            query: SQL INSERT string
+            params: Insert parameters
+            operation_name: Operation name for logging/monitoring
+
+        Returns:
+            Last inserted row ID
+        """
+        pass
+
+    @abstractmethod
+    async def execute_batch_async(
+        self,
+        operations: List[Dict[str, Any]],
+        operation_name: str = "batch"
+    ) -> List[Any]:
+        """Execute multiple operations in one transaction without blocking the event loop.
+
         Args:
             operations: List of operations with 'query', 'params', 'type'
             operation_name: Operation name for logging/monitoring
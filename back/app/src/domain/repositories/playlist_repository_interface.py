@@ -10,7 +10,7 @@ that infrastructure implementations must fulfill.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 
 
 class PlaylistRepositoryProtocol(ABC):
@@ -33,6 +33,18 @@ class PlaylistRepositoryProtocol(ABC):
         """
         pass
 
+    @abstractmethod
+    async def bulk_upsert_playlists(self, playlists: List[Any]) -> List[Any]:
+        """Save many playlists with their tracks in one transaction.
+
+        Args:
+            playlists: Playlist entities with their tracks
+
+        Returns:
+            Saved playlist entities with IDs assigned
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, playlist_id: str) -> Optional[Any]:
         """Find a playlist by its ID.
@@ -70,15 +82,44 @@ class PlaylistRepositoryProtocol(ABC):
         pass
 
     @abstractmethod
-    async def find_all(self, limit: int = None, offset: int = 0) -> List[Any]:
+    async def find_with_nfc_tags(self) -> List[Any]:
+        """Find every playlist that has an NFC tag associated.
+
+        Returns:
+            Playlist entities with their tracks
+        """
+        pass
+
+    @abstractmethod
+    async def find_all(
+        self, limit: int = None, offset: int = 0, include_tracks: bool = True
+    ) -> List[Any]:
         """Find all playlists with optional pagination.
 
         Args:
             limit: Maximum number of playlists to return
             offset: Number of playlists to skip
+            include_tracks: False to return track-free playlist summaries
+
+        Returns:
+            List of playlist entities, or summaries without tracks
+        """
+        pass
+
+    @abstractmethod
+    async def find_page(
+        self, limit: int, after: Optional[Tuple[str, str]] = None, include_tracks: bool = True
+    ) -> Tuple[List[Any], Optional[Tuple[str, str]]]:
+        """Find a page of playlists using keyset pagination.
+
+        Args:
+            limit: Maximum number of playlists to return
+            after: Sort key (updated_at, id) of the last playlist already seen
+            include_tracks: False to return track-free playlist summaries
 
         Returns:
-            List of playlist entities
+            Tuple of (playlist entities, sort key of the last returned playlist
+            if more playlists follow, otherwise None)
         """
         pass
 
@@ -0,0 +1,276 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""
+Persistent cache of parsed audio metadata.
+
+Tags and durations are read with mutagen once per file version: results are
+stored in the ``audio_metadata`` table keyed by path and trusted while the
+file's size and modification time match, with an in-process LRU in front so
+repeated plays and syncs of the same file never reach SQLite or the file.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from app.src.monitoring import get_logger
+
+try:
+    from mutagen import File as MutagenFile
+
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MutagenFile = None
+    MUTAGEN_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Tag keys tried in order: ID3, Vorbis/APE, MP4
+_TITLE_KEYS = ("TIT2", "TITLE", "\xa9nam")
+_ARTIST_KEYS = ("TPE1", "ARTIST", "\xa9ART")
+_ALBUM_KEYS = ("TALB", "ALBUM", "\xa9alb")
+# Frames holding pictures or binary payloads, never copied into the text tags
+_BINARY_TAG_KEYS = {"APIC", "PRIV", "GEOB", "COVR", "METADATA_BLOCK_PICTURE"}
+
+_SELECT_QUERY = """
+    SELECT size, mtime, title, artist, album, duration, bitrate, sample_rate, tags
+    FROM audio_metadata WHERE path = ?
+"""
+
+_UPSERT_COMMAND = """
+    INSERT OR REPLACE INTO audio_metadata
+    (path, size, mtime, title, artist, album, duration, bitrate, sample_rate, tags, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+FileKey = Tuple[str, int, float]
+
+
+@dataclass(frozen=True)
+class AudioMetadata:
+    """Tags and stream properties of one version of an audio file."""
+
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    album: Optional[str] = None
+    duration: Optional[float] = None
+    bitrate: Optional[int] = None
+    sample_rate: Optional[int] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+
+
+def read_audio_metadata(file_path: str) -> Optional[AudioMetadata]:
+    """Parse a file's tags and stream info with mutagen.
+
+    Returns:
+        The metadata, or None if mutagen is missing or cannot read the file
+    """
+    if not MUTAGEN_AVAILABLE:
+        return None
+    try:
+        audio_file = MutagenFile(file_path)
+    except Exception as e:
+        logger.warning(f"⚠️ Error reading audio metadata from {file_path}: {e}")
+        return None
+    if audio_file is None:
+        return None
+
+    info = getattr(audio_file, "info", None)
+    tags = {}
+    raw_tags = getattr(audio_file, "tags", None)
+    if raw_tags:
+        for key, value in raw_tags.items():
+            values = value if isinstance(value, list) else [value]
+            if _is_binary_tag(str(key)) or any(isinstance(v, (bytes, bytearray)) for v in values):
+                continue
+            tags[str(key)] = str(values[0]) if len(values) == 1 else str(value)
+
+    return AudioMetadata(
+        title=_tag_value(raw_tags, _TITLE_KEYS),
+        artist=_tag_value(raw_tags, _ARTIST_KEYS),
+        album=_tag_value(raw_tags, _ALBUM_KEYS),
+        duration=getattr(info, "length", None),
+        bitrate=getattr(info, "bitrate", None),
+        sample_rate=getattr(info, "sample_rate", None),
+        tags=tags,
+    )
+
+
+def _is_binary_tag(key: str) -> bool:
+    # ID3 keys carry a description after the frame id, e.g. "APIC:cover"
+    return key.split(":", 1)[0].upper() in _BINARY_TAG_KEYS
+
+
+def _tag_value(raw_tags: Any, keys: Sequence[str]) -> Optional[str]:
+    if not raw_tags:
+        return None
+    for key in keys:
+        try:
+            value = raw_tags.get(key)
+        except (KeyError, AttributeError, ValueError):
+            continue
+        if value:
+            if isinstance(value, list):
+                return str(value[0]) if value else None
+            return str(value)
+    return None
+
+
+class AudioMetadataCache:
+    """Audio metadata cached in memory and in SQLite.
+
+    Files mutagen cannot read are remembered in memory only, so they are
+    tried again after a restart.
+    """
+
+    def __init__(self, database_service: Any = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            database_service: SQLite database service; defaults to the
+                application database when registered, otherwise metadata is
+                only cached in memory
+            max_entries: Number of files kept in memory
+        """
+        self._db_service = database_service
+        self._max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[FileKey, Optional[AudioMetadata]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._database_hits = 0
+        self._parses = 0
+
+    @property
+    def _database_service(self) -> Any:
+        if self._db_service is None:
+            # Resolved on use: the cache may be created before the database is registered
+            try:
+                from app.src.infrastructure.di.container import get_container
+
+                container = get_container()
+                if container.has("database_manager"):
+                    self._db_service = container.get("database_manager").database_service
+            except Exception as e:
+                logger.debug(f"Audio metadata cache running without database: {e}")
+        return self._db_service
+
+    def get(self, file_path: str) -> Optional[AudioMetadata]:
+        """Get the metadata of a file, parsing it only if this version is unknown.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            The metadata, or None if the file is missing or unreadable
+        """
+        path = os.path.abspath(str(file_path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (path, stat.st_size, stat.st_mtime)
+
+        with self._lock:
+            if key in self._entries:
+                self._memory_hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        metadata = self._load(key)
+        if metadata is not None:
+            with self._lock:
+                self._database_hits += 1
+        else:
+            metadata = read_audio_metadata(path)
+            with self._lock:
+                self._parses += 1
+            if metadata is not None:
+                self._store(key, metadata)
+
+        with self._lock:
+            self._entries[key] = metadata
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return metadata
+
+    def get_duration(self, file_path: str) -> Optional[float]:
+        """Get a file's duration in seconds, or None if unknown."""
+        metadata = self.get(file_path)
+        if metadata is None or not metadata.duration or metadata.duration <= 0:
+            return None
+        return float(metadata.duration)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries; stored rows are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache counters for health reporting."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory_hits": self._memory_hits,
+                "database_hits": self._database_hits,
+                "parses": self._parses,
+                "persistent": self._db_service is not None,
+            }
+
+    def _load(self, key: FileKey) -> Optional[AudioMetadata]:
+        database_service = self._database_service
+        if database_service is None:
+            return None
+        path, size, mtime = key
+        try:
+            row = database_service.execute_single(_SELECT_QUERY, (path,), "get_audio_metadata")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read cached audio metadata for {path}: {e}")
+            return None
+        if row is None or row["size"] != size or row["mtime"] != mtime:
+            return None
+        return AudioMetadata(
+            title=row["title"],
+            artist=row["artist"],
+            album=row["album"],
+            duration=row["duration"],
+            bitrate=row["bitrate"],
+            sample_rate=row["sample_rate"],
+            tags=json.loads(row["tags"]) if row["tags"] else {},
+        )
+
+    def _store(self, key: FileKey, metadata: AudioMetadata) -> None:
+        database_service = self._database_service
+        if database_service is None:
+            return
+        path, size, mtime = key
+        try:
+            database_service.execute_command(
+                _UPSERT_COMMAND,
+                (path, size, mtime, metadata.title, metadata.artist, metadata.album,
+                 metadata.duration, metadata.bitrate, metadata.sample_rate,
+                 json.dumps(metadata.tags)),
+                "save_audio_metadata",
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not store audio metadata for {path}: {e}")
+
+
+_shared_cache: Optional[AudioMetadataCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_audio_metadata_cache() -> AudioMetadataCache:
+    """Get the process-wide audio metadata cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AudioMetadataCache()
+        return _shared_cache
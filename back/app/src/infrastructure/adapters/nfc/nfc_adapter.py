@@ -135,12 +135,16 @@ class NFCHandlerAdapter:
         Returns:
             Dictionary with hardware status information
         """
-        return {
+        status = {
             "is_available": True,
             "is_running": self.is_running(),
             "hardware_type": "Mock" if self._is_mock else "PN532",
             "status": "operational" if self.is_running() else "stopped",
         }
+        # Reader timing (poll duration, loop lag) when the hardware reports it
+        if hasattr(self._hardware, "get_status"):
+            status["reader"] = self._hardware.get_status()
+        return status
 
     @handle_errors("_on_hardware_tag_event")
     def _on_hardware_tag_event(self, tag_data):
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 import logging
 from app.src.domain.data.models.playlist import Playlist
 from app.src.domain.data.models.track import Track
+from app.src.domain.data.models.track_change_set import TrackChangeSet
 from app.src.services.error.unified_error_decorator import handle_repository_errors
 
 logger = logging.getLogger(__name__)
@@ -41,14 +42,31 @@ class PurePlaylistRepositoryAdapter:
         """Lazy-loaded repository instance from container."""
         if self._repository is None:
             # Direct container access to avoid circular dependency
-            from app.src.infrastructure.repositories.pure_sqlite_playlist_repository import PureSQLitePlaylistRepository
-            self._repository = PureSQLitePlaylistRepository()
+            from app.src.infrastructure.repositories.cached_playlist_repository import CachedPlaylistRepository
+            self._repository = CachedPlaylistRepository()
             logger.info("✅ Repository directly instantiated to avoid circular dependency")
         return self._repository
 
     @_handle_repository_errors("playlist_adapter")
     async def create_playlist(self, playlist_data: Dict[str, Any]) -> str:
         """Create playlist using pure DDD principles."""
+        playlist = self._playlist_from_dict(playlist_data)
+
+        # Save using pure DDD repository
+        saved_playlist = await self._repo.save(playlist)
+        logger.info(f"✅ Created playlist: {playlist.title}")
+        return saved_playlist.id
+
+    @_handle_repository_errors("playlist_adapter")
+    async def bulk_create_playlists(self, playlists_data: List[Dict[str, Any]]) -> List[str]:
+        """Create many playlists with their tracks in a single transaction."""
+        playlists = [self._playlist_from_dict(data) for data in playlists_data]
+        saved_playlists = await self._repo.bulk_upsert_playlists(playlists)
+        return [playlist.id for playlist in saved_playlists]
+
+    @staticmethod
+    def _playlist_from_dict(playlist_data: Dict[str, Any]) -> Playlist:
+        """Build a playlist entity, with its tracks, from adapter dict data."""
         # Create tracks first from data
         tracks = []
         if "tracks" in playlist_data:
@@ -66,18 +84,13 @@ class PurePlaylistRepositoryAdapter:
                 tracks.append(track)
 
         # Create playlist domain entity
-        playlist = Playlist(
+        return Playlist(
             title=playlist_data.get("title", ""),
             tracks=tracks,
             description=playlist_data.get("description"),
             id=playlist_data.get("id"),
         )
 
-        # Save using pure DDD repository
-        saved_playlist = await self._repo.save(playlist)
-        logger.info(f"✅ Created playlist: {playlist.title}")
-        return saved_playlist.id
-
     @_handle_repository_errors("playlist_adapter")
     async def get_playlist_by_id(self, playlist_id: str) -> Optional[Dict[str, Any]]:
         """Get playlist by ID using pure DDD principles."""
@@ -122,32 +135,24 @@ class PurePlaylistRepositoryAdapter:
 
     @_handle_repository_errors("playlist_adapter")
     async def add_track(self, playlist_id: str, track_data: Dict[str, Any]) -> bool:
-        """Add track to playlist using pure DDD principles."""
-        # Get playlist
-        playlist = await self._repo.find_by_id(playlist_id)
-        if playlist is None:
+        """Add track to playlist using pure DDD principles.
+
+        Only the new track row is written; existing tracks are left untouched.
+        """
+        if not await self._repo.exists(playlist_id):
             logger.error(f"❌ Playlist {playlist_id} not found")
             return False
 
         # Create track from dict
-        track = Track(
-            track_number=track_data.get("track_number", 0),
-            title=track_data.get("title", ""),
-            filename=track_data.get("filename", ""),
-            file_path=track_data.get("file_path", ""),
-            duration_ms=track_data.get("duration", track_data.get("duration_ms")),
-            artist=track_data.get("artist"),
-            album=track_data.get("album"),
-            id=track_data.get("id"),
-        )
+        track = self._track_from_dict(track_data, default_title="", default_duration_ms=None)
 
-        # Add track to playlist (domain logic)
-        playlist.add_track(track)
+        # Domain business rule: auto-assign track number if not set
+        if track.track_number <= 0:
+            track.track_number = await self._repo.get_next_track_number(playlist_id)
 
-        # Save updated playlist
-        await self._repo.update(playlist)
+        await self._repo.apply_track_changes(playlist_id, TrackChangeSet(inserts=[track]))
 
-        logger.info(f"✅ Added track '{track.title}' to playlist '{playlist.title}'")
+        logger.info(f"✅ Added track '{track.title}' to playlist {playlist_id}")
         return True
 
     @_handle_repository_errors("playlist_adapter")
@@ -326,32 +331,27 @@ class PurePlaylistRepositoryAdapter:
 
     @_handle_repository_errors("playlist_adapter")
     async def replace_tracks(self, playlist_id: str, tracks_data: List[Dict[str, Any]]) -> bool:
-        """Replace all tracks in a playlist using pure DDD principles."""
-        # Get existing playlist
+        """Replace all tracks in a playlist using pure DDD principles.
+
+        The new track list is diffed against the stored one so that only
+        inserted, deleted, renumbered or edited tracks are written.
+        """
         playlist = await self._repo.find_by_id(playlist_id)
         if playlist is None:
             logger.error(f"❌ Playlist {playlist_id} not found")
             return False
 
-        # Clear existing tracks and add new ones
-        playlist.tracks = []
-
+        # Build the desired track list with the same domain rules as Playlist.add_track
+        desired = Playlist(title=playlist.title)
         for track_data in tracks_data:
-            track = Track(
-                track_number=track_data.get("track_number", 0),
-                title=track_data.get("title", "Unknown"),
-                filename=track_data.get("filename", ""),
-                file_path=track_data.get("file_path", ""),
-                duration_ms=track_data.get("duration", track_data.get("duration_ms", 0)),
-                artist=track_data.get("artist"),
-                album=track_data.get("album"),
-                id=track_data.get("id"),
-            )
-            playlist.add_track(track)
+            desired.add_track(self._track_from_dict(track_data))
 
-        # Save updated playlist
-        await self._repo.update(playlist)
-        logger.info(f"✅ Replaced tracks for playlist '{playlist.title}' with {len(tracks_data)} tracks")
+        changes = TrackChangeSet.diff(playlist.tracks, desired.tracks)
+        await self._repo.apply_track_changes(playlist_id, changes)
+        logger.info(
+            f"✅ Replaced tracks for playlist '{playlist.title}' with {len(tracks_data)} tracks "
+            f"({len(changes)} rows changed)"
+        )
         return True
 
     @_handle_repository_errors("playlist_adapter")
@@ -379,6 +379,24 @@ class PurePlaylistRepositoryAdapter:
 
         return success
 
+    @staticmethod
+    def _track_from_dict(
+        track_data: Dict[str, Any],
+        default_title: str = "Unknown",
+        default_duration_ms: Optional[int] = 0,
+    ) -> Track:
+        """Convert an API track dict to a Track domain entity."""
+        return Track(
+            track_number=track_data.get("track_number", 0),
+            title=track_data.get("title", default_title),
+            filename=track_data.get("filename", ""),
+            file_path=track_data.get("file_path", ""),
+            duration_ms=track_data.get("duration", track_data.get("duration_ms", default_duration_ms)),
+            artist=track_data.get("artist"),
+            album=track_data.get("album"),
+            id=track_data.get("id"),
+        )
+
     def _domain_to_dict(self, playlist: Playlist) -> Dict[str, Any]:
         """Convert domain model to dict format for API compatibility."""
         return {
@@ -7,17 +7,25 @@ SQLite Database Service Implementation
 
 Pure infrastructure implementation of PersistenceServiceProtocol.
 Handles all SQLite-specific connection management, transactions, and operations.
+
+Async callers use the ``*_async`` variants, which run on dedicated threads so
+the event loop never blocks on disk I/O: a single writer thread serializes
+all writes (matching SQLite's single-writer WAL model) and a small reader pool
+serves concurrent SELECTs.
 """
 
+import asyncio
 import sqlite3
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
 from contextlib import contextmanager
 from pathlib import Path
 
 import logging
 from app.src.domain.protocols.persistence_service_protocol import PersistenceServiceProtocol
 from app.src.data.connection_pool import ConnectionPool
+from app.src.monitoring import LatencyHistogram
 from app.src.services.error.unified_error_decorator import handle_infrastructure_errors
 
 def _handle_infrastructure_errors(component_name: str = "infrastructure"):
@@ -33,17 +41,26 @@ class SQLiteDatabaseService(PersistenceServiceProtocol):
     PersistenceServiceProtocol using SQLite and connection pooling.
     """
 
-    def __init__(self, database_path: str, pool_size: int = 5):
+    def __init__(self, database_path: str, pool_size: int = 5, reader_threads: int = 2):
         """Initialize SQLite database service.
 
         Args:
             database_path: Path to SQLite database file
             pool_size: Number of connections to maintain in pool
+            reader_threads: Number of threads serving async read queries
         """
         self.database_path = database_path
         self.pool_size = pool_size
+        self.reader_threads = reader_threads
         self._connection_pool = None
+        self._writer_executor = None
+        self._reader_executor = None
+        self._timings = {
+            lane: {"queue_wait": LatencyHistogram(), "execution": LatencyHistogram()}
+            for lane in ("read", "write")
+        }
         self._setup_database()
+        self._setup_executors()
 
     def _setup_database(self):
         """Setup database file and connection pool."""
@@ -66,18 +83,48 @@ class SQLiteDatabaseService(PersistenceServiceProtocol):
             pool_size=self.pool_size
         )
 
+    def _setup_executors(self):
+        """Create the writer thread and reader pool used by the async API."""
+        self._writer_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-writer"
+        )
+        self._reader_executor = ThreadPoolExecutor(
+            max_workers=self.reader_threads, thread_name_prefix="sqlite-reader"
+        )
+
+    async def _run_in_lane(self, lane: str, func: Callable, *args) -> Any:
+        """Run a blocking database call on the read or write lane.
+
+        Args:
+            lane: "read" for the reader pool, "write" for the writer thread
+            func: Blocking callable to execute
+            *args: Arguments forwarded to the callable
+
+        Returns:
+            Result of the callable
+        """
+        executor = self._writer_executor if lane == "write" else self._reader_executor
+        timings = self._timings[lane]
+        submitted_at = time.perf_counter()
+
+        def timed_call():
+            started_at = time.perf_counter()
+            timings["queue_wait"].record((started_at - submitted_at) * 1000)
+            try:
+                return func(*args)
+            finally:
+                timings["execution"].record((time.perf_counter() - started_at) * 1000)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, timed_call)
+
     @contextmanager
     def get_connection(self):
         """Get a database connection with proper lifecycle management."""
         connection = None
         try:
+            # Pooled connections are configured once when the pool opens them
             connection = self._connection_pool.get_connection()
-            # Configure SQLite for optimal performance
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute("PRAGMA journal_mode = WAL")
-            connection.execute("PRAGMA synchronous = NORMAL")
-            connection.execute("PRAGMA cache_size = 10000")
-
             yield connection
         except Exception as e:
             if connection:
@@ -237,7 +284,10 @@ class SQLiteDatabaseService(PersistenceServiceProtocol):
                 params = op.get("params")
                 op_type = op.get("type", "command")
 
-                if params:
+                if op_type == "many":
+                    # params is a sequence of parameter tuples (executemany)
+                    cursor.executemany(query, params or [])
+                elif params:
                     cursor.execute(query, params)
                 else:
                     cursor.execute(query)
@@ -259,6 +309,65 @@ class SQLiteDatabaseService(PersistenceServiceProtocol):
 
             return results
 
+    async def execute_query_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "query"
+    ) -> List[Any]:
+        """Awaitable execute_query served by the reader pool."""
+        return await self._run_in_lane("read", self.execute_query, query, params, operation_name)
+
+    async def execute_single_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "query_single"
+    ) -> Optional[Any]:
+        """Awaitable execute_single served by the reader pool."""
+        return await self._run_in_lane("read", self.execute_single, query, params, operation_name)
+
+    async def execute_command_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "command"
+    ) -> int:
+        """Awaitable execute_command serialized on the writer thread."""
+        return await self._run_in_lane("write", self.execute_command, query, params, operation_name)
+
+    async def execute_insert_async(
+        self,
+        query: str,
+        params: Union[tuple, dict] = None,
+        operation_name: str = "insert"
+    ) -> str:
+        """Awaitable execute_insert serialized on the writer thread."""
+        return await self._run_in_lane("write", self.execute_insert, query, params, operation_name)
+
+    async def execute_batch_async(
+        self,
+        operations: List[Dict[str, Any]],
+        operation_name: str = "batch"
+    ) -> List[Any]:
+        """Awaitable execute_batch serialized on the writer thread."""
+        return await self._run_in_lane("write", self.execute_batch, operations, operation_name)
+
+    def get_execution_statistics(self) -> Dict[str, Any]:
+        """Get queue-wait and execution timings of the async API.
+
+        Returns:
+            Per-lane histograms for time spent queued and executing
+        """
+        return {
+            "reader_threads": self.reader_threads,
+            "writer_threads": 1,
+            **{
+                lane: {name: histogram.snapshot() for name, histogram in histograms.items()}
+                for lane, histograms in self._timings.items()
+            },
+        }
+
     def get_health_info(self) -> Dict[str, Any]:
         """Get database health information."""
         try:
@@ -278,6 +387,8 @@ class SQLiteDatabaseService(PersistenceServiceProtocol):
                     "database_info": [dict(row) for row in db_info],
                     "tables_count": len(tables),
                     "connection_pool_size": self.pool_size,
+                    "connection_pool": self._connection_pool.get_statistics(),
+                    "async_execution": self.get_execution_statistics(),
                 }
         except Exception as e:
             return {
@@ -288,6 +399,9 @@ class SQLiteDatabaseService(PersistenceServiceProtocol):
 
     def cleanup(self):
         """Clean up database service resources."""
+        for executor in (self._writer_executor, self._reader_executor):
+            if executor:
+                executor.shutdown(wait=True)
         if self._connection_pool:
             self._connection_pool.close_all()
             logger.info("✅ SQLite database service cleaned up")
@@ -28,10 +28,10 @@ def register_data_domain_services() -> None:
         from app.src.data.database_manager import DatabaseManager
         return DatabaseManager()
 
-    # Register base playlist repository (PureSQLitePlaylistRepository)
+    # Register base playlist repository (PureSQLitePlaylistRepository behind the playlist cache)
     def create_playlist_repository():
-        from app.src.infrastructure.repositories.pure_sqlite_playlist_repository import PureSQLitePlaylistRepository
-        return PureSQLitePlaylistRepository()
+        from app.src.infrastructure.repositories.cached_playlist_repository import CachedPlaylistRepository
+        return CachedPlaylistRepository()
 
     # Register repository factories
     def create_data_playlist_repository():
@@ -2,23 +2,218 @@
 # This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
 # See the LICENSE file for details.
 
-"""PN532 NFC Hardware Implementation for Raspberry Pi."""
+"""PN532 NFC Hardware Implementation for Raspberry Pi.
+
+The PN532 driver is blocking, so polling runs on a dedicated reader thread.
+The thread only posts tag present/absent transitions into the event loop
+through a thread-safe queue; subscribers are always notified on the loop.
+Poll intervals come from an adaptive scheduler: fast right after activity,
+backing off while idle, and cheap presence checks while a tag is held. Raw
+poll results go through a presence filter, so a tag at the edge of the field
+does not produce bursts of transitions.
+"""
 
 import asyncio
+import threading
 import time
+from collections import deque
 from typing import Optional, Dict, Any
 from rx.subject import Subject
 import logging
 
 from .nfc_hardware_interface import NFCHardwareInterface
+from app.src.monitoring import LatencyHistogram, get_latency_tracer
 from app.src.services.error.unified_error_decorator import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Reader thread transitions posted to the event loop
+_TAG_PRESENT = "present"
+_TAG_ABSENT = "absent"
+
+# How often the event loop is probed for scheduling lag, in seconds
+_LOOP_LAG_PROBE_INTERVAL = 0.5
+
+# Polling modes reported by the scheduler
+POLL_MODE_FIXED = "fixed"
+POLL_MODE_ACTIVE = "active"
+POLL_MODE_IDLE = "idle"
+POLL_MODE_PRESENCE_HOLD = "presence_hold"
+
 def _handle_errors(operation_name: str):
     return handle_errors(operation_name)
 
 
+class AdaptivePollScheduler:
+    """Chooses the delay before the next PN532 poll.
+
+    Polls at ``poll_interval_min`` for ``idle_backoff_delay`` seconds after
+    any tag activity, then grows the interval by ``poll_backoff_factor`` per
+    poll up to ``poll_interval_max``. While a tag sits on the reader it uses
+    ``presence_hold_interval``. With adaptive polling disabled the interval is
+    the fixed ``debounce_time``. Only the reader thread drives it.
+    """
+
+    def __init__(self, config: Any):
+        """Initialize the scheduler.
+
+        Args:
+            config: NFC configuration parameters
+        """
+        self._config = config
+        self._last_activity = time.monotonic()
+        self._interval = config.poll_interval_min
+        self._mode = POLL_MODE_ACTIVE if config.adaptive_polling_enabled else POLL_MODE_FIXED
+        self._poll_times = deque(maxlen=4096)
+        self._last_empty_poll_at: Optional[float] = None
+        self._detection_latency = LatencyHistogram()
+        self._presence_checks = 0
+
+    def record_poll(self, tag_present: bool, now: Optional[float] = None) -> None:
+        """Record a completed poll."""
+        now = time.monotonic() if now is None else now
+        self._poll_times.append(now)
+        if not tag_present:
+            self._last_empty_poll_at = now
+
+    def record_presence_check(self) -> None:
+        """Record a presence-hold check of the current tag."""
+        self._presence_checks += 1
+
+    def record_detection(self, now: Optional[float] = None) -> None:
+        """Record a new tag, bounding how long it waited to be noticed.
+
+        The tag arrived after the last empty poll completed, so the time since
+        then is an upper bound of its detection latency.
+        """
+        now = time.monotonic() if now is None else now
+        if self._last_empty_poll_at is not None:
+            self._detection_latency.record((now - self._last_empty_poll_at) * 1000)
+        self.record_activity(now)
+
+    def record_activity(self, now: Optional[float] = None) -> None:
+        """Return to fast polling after a tag was placed or removed."""
+        self._last_activity = time.monotonic() if now is None else now
+        self._interval = self._config.poll_interval_min
+
+    def next_interval(self, tag_present: bool, now: Optional[float] = None) -> float:
+        """Get the delay before the next poll in seconds."""
+        config = self._config
+        if not config.adaptive_polling_enabled:
+            self._mode = POLL_MODE_FIXED
+            return config.debounce_time
+
+        if tag_present:
+            self._mode = POLL_MODE_PRESENCE_HOLD
+            return config.presence_hold_interval
+
+        now = time.monotonic() if now is None else now
+        if now - self._last_activity < config.idle_backoff_delay:
+            self._mode = POLL_MODE_ACTIVE
+            self._interval = config.poll_interval_min
+        else:
+            self._mode = POLL_MODE_IDLE
+            self._interval = min(config.poll_interval_max, self._interval * config.poll_backoff_factor)
+        return self._interval
+
+    def get_statistics(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Get poll rate and detection latency statistics."""
+        now = time.monotonic() if now is None else now
+        recent = [t for t in list(self._poll_times) if now - t <= 60.0]
+        return {
+            "mode": self._mode,
+            "interval_ms": round(self._interval * 1000, 1),
+            "polls_last_minute": len(recent),
+            "presence_checks": self._presence_checks,
+            "idle_for_s": round(now - self._last_activity, 1),
+            "detection_latency_ms": self._detection_latency.snapshot(),
+        }
+
+
+class TagPresenceFilter:
+    """Debounces raw poll results into tag present/absent transitions.
+
+    A UID is confirmed present once read in ``presence_confirm_reads`` of the
+    last ``presence_window_size`` polls. A confirmed tag is reported absent
+    only after ``tag_removal_threshold`` seconds without a read of it; a tag
+    read again before that is a suppressed flap. Only the reader thread
+    drives it.
+    """
+
+    def __init__(self, config: Any):
+        """Initialize the filter.
+
+        Args:
+            config: NFC configuration parameters
+        """
+        self._config = config
+        self._window = deque(maxlen=max(1, config.presence_window_size))
+        self._present_uid: Optional[str] = None
+        self._missing_since: Optional[float] = None
+        self._candidate: Optional[str] = None
+        self._confirmed_presences = 0
+        self._confirmed_absences = 0
+        self._suppressed_absences = 0
+        self._suppressed_detections = 0
+
+    @property
+    def present_uid(self) -> Optional[str]:
+        """UID of the confirmed present tag, if any."""
+        return self._present_uid
+
+    def update(self, uid: Optional[str], now: Optional[float] = None) -> Optional[str]:
+        """Feed one poll result.
+
+        Args:
+            uid: UID read by the poll, or None if nothing was read
+            now: ``time.monotonic()`` of the poll
+
+        Returns:
+            The confirmed transition (tag present or absent), if any
+        """
+        now = time.monotonic() if now is None else now
+        self._window.append(uid)
+        if self._candidate is not None and self._candidate not in self._window:
+            # Seen, but not often enough to be believed
+            self._suppressed_detections += 1
+            self._candidate = None
+
+        if uid is not None and uid == self._present_uid:
+            if self._missing_since is not None:
+                self._suppressed_absences += 1
+                self._missing_since = None
+            return None
+
+        if uid is not None:
+            if self._window.count(uid) >= self._config.presence_confirm_reads:
+                self._present_uid = uid
+                self._missing_since = None
+                self._candidate = None
+                self._confirmed_presences += 1
+                return _TAG_PRESENT
+            self._candidate = uid
+
+        if self._present_uid is not None:
+            if self._missing_since is None:
+                self._missing_since = now
+            if now - self._missing_since >= self._config.tag_removal_threshold:
+                self._present_uid = None
+                self._missing_since = None
+                self._confirmed_absences += 1
+                return _TAG_ABSENT
+        return None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get transition and flap counters for status reporting."""
+        return {
+            "confirmed_presences": self._confirmed_presences,
+            "confirmed_absences": self._confirmed_absences,
+            "suppressed_absences": self._suppressed_absences,
+            "suppressed_detections": self._suppressed_detections,
+            "absence_pending": self._missing_since is not None,
+        }
+
+
 class PN532NFCHardware(NFCHardwareInterface):
     """PN532 NFC hardware implementation for Raspberry Pi.
 
@@ -42,13 +237,30 @@ class PN532NFCHardware(NFCHardwareInterface):
             self._config = config
         self._tag_subject = Subject()
         self._running = False
-        self._reader_task = None
-        self._stop_event = asyncio.Event()
         self._pn532 = None
         self._last_tag_uid = None
         self._tag_present = False
         self._consecutive_errors = 0
 
+        # Reader thread and its bridge into the event loop
+        self._reader_thread: Optional[threading.Thread] = None
+        self._thread_stop = threading.Event()
+        self._device_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._events: Optional[asyncio.Queue] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._lag_task: Optional[asyncio.Task] = None
+
+        # Runtime statistics
+        self._poll_durations = LatencyHistogram()
+        self._dispatch_delays = LatencyHistogram()
+        self._loop_lag = LatencyHistogram()
+        self._poll_count = 0
+        self._read_errors = 0
+        self._recoveries = 0
+        self._scheduler = AdaptivePollScheduler(self._config)
+        self._presence_filter = TagPresenceFilter(self._config)
+
         logger.info("🔧 PN532 NFC Hardware initializing...")
 
     @property
@@ -59,6 +271,12 @@ class PN532NFCHardware(NFCHardwareInterface):
     @_handle_errors("initialize")
     async def initialize(self) -> None:
         """Initialize the PN532 hardware."""
+        with self._device_lock:
+            self._initialize_device()
+        logger.info("🚀 PN532 NFC Hardware initialized successfully")
+
+    def _initialize_device(self) -> None:
+        """Open the bus and configure the PN532; the caller holds the device lock."""
         # Import PN532 libraries (only available on Raspberry Pi)
         from adafruit_pn532.i2c import PN532_I2C
         import board
@@ -73,7 +291,6 @@ class PN532NFCHardware(NFCHardwareInterface):
         logger.info(f"✅ PN532 found - Firmware version: {ver}.{rev}, IC: 0x{ic:02x}")
         # Configure the PN532 for NFC card detection
         self._pn532.SAM_configuration()
-        logger.info("🚀 PN532 NFC Hardware initialized successfully")
 
     async def start_nfc_reader(self) -> None:
         """Start the PN532 NFC reader scanning process."""
@@ -84,10 +301,17 @@ class PN532NFCHardware(NFCHardwareInterface):
         if not self._pn532:
             await self.initialize()
 
-        self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
+        self._events = asyncio.Queue()
+        self._thread_stop.clear()
         self._running = True
         self._consecutive_errors = 0
-        self._reader_task = asyncio.create_task(self._scan_loop())
+        self._dispatch_task = asyncio.create_task(self._dispatch_events())
+        self._lag_task = asyncio.create_task(self._monitor_loop_lag())
+        self._reader_thread = threading.Thread(
+            target=self._reader_thread_main, name="pn532-reader", daemon=True
+        )
+        self._reader_thread.start()
 
         logger.info("🚀 PN532 NFC Reader started - scanning for tags...")
 
@@ -96,18 +320,25 @@ class PN532NFCHardware(NFCHardwareInterface):
         if not self._running:
             return
 
-        self._stop_event.set()
+        self._thread_stop.set()
         self._running = False
 
-        if self._reader_task and not self._reader_task.done():
-            try:
-                await asyncio.wait_for(self._reader_task, timeout=2.0)
-            except asyncio.TimeoutError:
-                self._reader_task.cancel()
+        if self._reader_thread and self._reader_thread.is_alive():
+            # A poll in progress finishes within its read timeouts
+            await asyncio.to_thread(self._reader_thread.join, 2.0)
+            if self._reader_thread.is_alive():
+                logger.warning("⚠️ PN532 reader thread did not stop in time")
+        self._reader_thread = None
+
+        for task in (self._dispatch_task, self._lag_task):
+            if task and not task.done():
+                task.cancel()
                 try:
-                    await self._reader_task
+                    await task
                 except asyncio.CancelledError:
                     pass
+        self._dispatch_task = None
+        self._lag_task = None
 
         logger.info("⏹️ PN532 NFC Reader stopped")
 
@@ -122,74 +353,195 @@ class PN532NFCHardware(NFCHardwareInterface):
             return None
 
         async with self._bus_lock:
-            # Try to read a MIFARE Classic card
-            uid = self._pn532.read_passive_target(timeout=self._config.read_timeout)
+            # Blocking driver call runs off the event loop
+            uid = await asyncio.to_thread(self._read_passive_target)
             if uid:
-                tag_uid = "".join([f"{b:02x}" for b in uid])
-                return {
-                    "uid": tag_uid,
-                    "present": True,
-                    "timestamp": time.time(),
-                    "hardware": "PN532",
-                    "raw_uid": uid.hex(),
-                }
+                return self._build_tag_data(uid)
         return None
 
     def cleanup(self) -> None:
         """Clean up PN532 hardware resources."""
+        self._thread_stop.set()
         if self._running:
             asyncio.create_task(self.stop_nfc_reader())
 
         self._pn532 = None
         logger.info("🧹 PN532 NFC Hardware cleaned up")
 
-    @_handle_errors("_scan_loop")
-    async def _scan_loop(self) -> None:
-        """Main scanning loop for PN532 tag detection."""
-        logger.info("🔄 PN532 scanning loop started")
-        last_status_log = 0
-        scan_count = 0
-
-        while not self._stop_event.is_set():
-            scan_count += 1
-            # Read tag with timeout
-            tag_data = await self._read_tag_with_retry()
-            if tag_data:
-                await self._handle_tag_present(tag_data)
-            else:
-                await self._handle_tag_absent()
+    def get_status(self) -> Dict[str, Any]:
+        """Get reader status and timing statistics.
+
+        ``poll_duration_ms`` is the time one poll holds the reader (all
+        retries), ``event_dispatch_delay_ms`` the time between the thread
+        posting a transition and the loop handling it, and ``loop_lag_ms`` how
+        late the event loop runs a timer it scheduled.
+        """
+        return {
+            "hardware": "PN532",
+            "running": self._running,
+            "reader_thread_alive": bool(self._reader_thread and self._reader_thread.is_alive()),
+            "tag_present": self._tag_present,
+            "polls": self._poll_count,
+            "read_errors": self._read_errors,
+            "consecutive_errors": self._consecutive_errors,
+            "recoveries": self._recoveries,
+            "poll_duration_ms": self._poll_durations.snapshot(),
+            "event_dispatch_delay_ms": self._dispatch_delays.snapshot(),
+            "loop_lag_ms": self._loop_lag.snapshot(),
+            "polling": self._scheduler.get_statistics(),
+            "presence": self._presence_filter.get_statistics(),
+        }
+
+    # --- Reader thread ---
+
+    def _reader_thread_main(self) -> None:
+        """Poll the PN532 and post tag transitions until stopped."""
+        logger.info("🔄 PN532 reader thread started")
+        last_status_log = 0.0
+        present_uid = None
+
+        while not self._thread_stop.is_set():
+            started_at = time.perf_counter()
+            try:
+                if present_uid and self._config.adaptive_polling_enabled:
+                    tag_data = self._check_presence()
+                else:
+                    tag_data = self._read_tag_with_retry()
+            except Exception as e:
+                self._on_poll_error(e)
+                continue
+            finally:
+                self._poll_durations.record((time.perf_counter() - started_at) * 1000)
+                self._poll_count += 1
+
             # Reset error count on successful scan
             self._consecutive_errors = 0
+
+            uid = tag_data["uid"] if tag_data else None
+            self._scheduler.record_poll(uid is not None)
+            transition = self._presence_filter.update(uid)
+            if transition == _TAG_PRESENT:
+                self._scheduler.record_detection()
+                self._post_event(_TAG_PRESENT, tag_data)
+            elif transition == _TAG_ABSENT:
+                self._scheduler.record_activity()
+                self._post_event(_TAG_ABSENT, None)
+            present_uid = self._presence_filter.present_uid
+
             # Log status periodically (reduced verbosity)
             now = time.time()
-            if now - last_status_log > 30:  # Increased from 10s to 30s
-                status = "tag present" if self._tag_present else "waiting"
-                logger.debug(
-                    f"📡 PN532: {status} (scans: {scan_count}, errors: {self._consecutive_errors})",
-                )
+            if now - last_status_log > 30:
+                status = "tag present" if present_uid else "waiting"
+                logger.debug(f"📡 PN532: {status} (scans: {self._poll_count}, errors: {self._read_errors})")
                 last_status_log = now
-            # Short delay between scans
-            await asyncio.sleep(self._config.debounce_time)
 
-    @_handle_errors("_read_tag_with_retry")
-    async def _read_tag_with_retry(self) -> Optional[Dict[str, Any]]:
-        """Read tag data with retry logic."""
+            # Delay before the next scan adapts to reader activity
+            self._thread_stop.wait(self._scheduler.next_interval(present_uid is not None))
+
+        logger.info("⏹️ PN532 reader thread stopped")
+
+    def _read_tag_with_retry(self) -> Optional[Dict[str, Any]]:
+        """Read tag data with retry logic (blocking, reader thread only)."""
         for attempt in range(self._config.max_retries):
-            async with self._bus_lock:
-                # Try to read a MIFARE Classic card
-                uid = self._pn532.read_passive_target(timeout=self._config.read_timeout)
-                if uid:
-                    tag_uid = "".join([f"{b:02x}" for b in uid])
-                    return {
-                        "uid": tag_uid,
-                        "present": True,
-                        "timestamp": time.time(),
-                        "hardware": "PN532",
-                        "raw_uid": uid.hex(),
-                        "attempt": attempt + 1,
-                    }
+            uid = self._read_passive_target()
+            if uid:
+                return self._build_tag_data(uid, attempt + 1)
         return None
 
+    def _check_presence(self) -> Optional[Dict[str, Any]]:
+        """Presence-hold check: one read of the tag currently on the reader.
+
+        The caller compares the UID with the held one. Only a missed read falls
+        back to the full retry sequence, so a tag is not reported removed
+        because of a single failed read.
+        """
+        self._scheduler.record_presence_check()
+        uid = self._read_passive_target()
+        if uid:
+            return self._build_tag_data(uid, 1)
+        return self._read_tag_with_retry()
+
+    def _read_passive_target(self):
+        """Run one blocking PN532 read; serialized across threads."""
+        with self._device_lock:
+            # Try to read a MIFARE Classic card
+            return self._pn532.read_passive_target(timeout=self._config.read_timeout)
+
+    @staticmethod
+    def _build_tag_data(uid, attempt: Optional[int] = None) -> Dict[str, Any]:
+        tag_data = {
+            "uid": "".join([f"{b:02x}" for b in uid]),
+            "present": True,
+            "timestamp": time.time(),
+            "hardware": "PN532",
+            "raw_uid": uid.hex(),
+        }
+        if attempt is not None:
+            tag_data["attempt"] = attempt
+        return tag_data
+
+    def _post_event(self, kind: str, tag_data: Optional[Dict[str, Any]]) -> None:
+        """Hand a transition to the event loop from the reader thread."""
+        try:
+            self._loop.call_soon_threadsafe(
+                self._events.put_nowait, (kind, tag_data, time.perf_counter())
+            )
+        except RuntimeError:
+            # Event loop closed underneath us: nothing left to notify
+            logger.warning("⚠️ Event loop closed, stopping PN532 reader thread")
+            self._thread_stop.set()
+
+    def _on_poll_error(self, error: Exception) -> None:
+        """Count a failed poll, reinitializing the reader after repeated failures."""
+        self._consecutive_errors += 1
+        self._read_errors += 1
+        logger.warning(f"⚠️ PN532 read failed ({self._consecutive_errors} in a row): {error}")
+        if self._consecutive_errors >= self._config.max_errors:
+            self._attempt_recovery()
+        self._thread_stop.wait(self._config.retry_delay)
+
+    def _attempt_recovery(self) -> None:
+        """Attempt to recover from consecutive errors (reader thread only)."""
+        try:
+            logger.info("🔄 Attempting PN532 recovery...")
+
+            # Try to reinitialize the PN532
+            with self._device_lock:
+                self._initialize_device()
+
+            self._consecutive_errors = 0
+            self._recoveries += 1
+            logger.info("✅ PN532 recovery successful")
+
+        except Exception as e:
+            logger.error(f"❌ PN532 recovery failed: {e}")
+            # Continue with elevated error count - will retry later
+
+    # --- Event loop side ---
+
+    async def _dispatch_events(self) -> None:
+        """Deliver reader thread transitions to subscribers on the event loop."""
+        while True:
+            kind, tag_data, posted_at = await self._events.get()
+            dispatch_delay_ms = (time.perf_counter() - posted_at) * 1000
+            self._dispatch_delays.record(dispatch_delay_ms)
+            if kind == _TAG_PRESENT:
+                # The tag-to-audio trace starts when the reader thread saw the UID
+                tracer = get_latency_tracer()
+                with tracer.trace("tag_to_audio", started_at=posted_at,
+                                  uid=tag_data["uid"], source="PN532"):
+                    tracer.record_span("detection", dispatch_delay_ms, offset_ms=0.0)
+                    await self._handle_tag_present(tag_data)
+            else:
+                await self._handle_tag_absent()
+
+    async def _monitor_loop_lag(self) -> None:
+        """Measure how late the event loop wakes up a sleeping task."""
+        while True:
+            expected_at = time.perf_counter() + _LOOP_LAG_PROBE_INTERVAL
+            await asyncio.sleep(_LOOP_LAG_PROBE_INTERVAL)
+            self._loop_lag.record(max(0.0, (time.perf_counter() - expected_at) * 1000))
+
     @_handle_errors("_handle_tag_present")
     async def _handle_tag_present(self, tag_data: Dict[str, Any]) -> None:
         """Handle when a tag is detected."""
@@ -228,18 +580,3 @@ class PN532NFCHardware(NFCHardwareInterface):
             }
             self._tag_subject.on_next(absence_data)
             logger.debug("📤 Tag absence event emitted successfully")
-
-    async def _attempt_recovery(self) -> None:
-        """Attempt to recover from consecutive errors."""
-        try:
-            logger.info("🔄 Attempting PN532 recovery...")
-
-            # Try to reinitialize the PN532
-            await self.initialize()
-
-            self._consecutive_errors = 0
-            logger.info("✅ PN532 recovery successful")
-
-        except Exception as e:
-            logger.error(f"❌ PN532 recovery failed: {e}")
-            # Continue with elevated error count - will retry later
@@ -20,6 +20,7 @@ from app.src.infrastructure.nfc.adapters.nfc_hardware_adapter import (
     MockNfcHardwareAdapter,
 )
 from app.src.infrastructure.nfc.repositories.nfc_memory_repository import NfcMemoryRepository
+from app.src.infrastructure.nfc.repositories.nfc_tag_repository import NfcTagRepository
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,7 @@ class NfcFactory:
             Tuple of (hardware, repository, domain_service) for use by Application layer
         """
         # Create repository
-        nfc_repository = repository or NfcMemoryRepository()
+        nfc_repository = repository or NfcTagRepository()
 
         # Create hardware adapter
         if use_mock_hardware:
@@ -64,7 +65,9 @@ class NfcFactory:
         Returns:
             NFC infrastructure components with mock implementations
         """
-        return NfcFactory.create_nfc_infrastructure_components(use_mock_hardware=True)
+        return NfcFactory.create_nfc_infrastructure_components(
+            use_mock_hardware=True, repository=NfcMemoryRepository()
+        )
 
     @staticmethod
     async def create_nfc_handler_adapter(nfc_lock: Optional[asyncio.Lock] = None) -> NFCHandlerAdapter:
@@ -14,8 +14,8 @@ from app.src.domain.nfc.protocols.nfc_hardware_protocol import NfcRepositoryProt
 class NfcMemoryRepository(NfcRepositoryProtocol):
     """In-memory implementation of NFC repository.
 
-    Simple implementation for development and testing.
-    Can be replaced with database implementation later.
+    Simple implementation for development and testing; the application
+    uses NfcTagRepository.
     """
 
     def __init__(self):
@@ -0,0 +1,314 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""SQLite NFC Tag Repository Implementation."""
+
+import asyncio
+import json
+import logging
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.src.domain.nfc.entities.nfc_tag import NfcTag
+from app.src.infrastructure.di.container import get_container
+from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier
+from app.src.domain.nfc.protocols.nfc_hardware_protocol import NfcRepositoryProtocol
+
+logger = logging.getLogger(__name__)
+
+# Seconds buffered detection updates may wait before being written
+DEFAULT_FLUSH_INTERVAL = 30.0
+# Buffered updates that trigger an immediate flush
+DEFAULT_MAX_PENDING = 100
+
+# Playlist association is only trusted while the playlists table agrees
+_TAG_COLUMNS = """
+    t.uid, t.last_detected_at, t.detection_count, t.metadata, p.id AS playlist_id
+"""
+
+_TAG_UPSERT_COMMAND = """
+    INSERT INTO nfc_tags
+    (uid, playlist_id, last_detected_at, detection_count, metadata, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT(uid) DO UPDATE SET
+        playlist_id = excluded.playlist_id,
+        last_detected_at = excluded.last_detected_at,
+        detection_count = excluded.detection_count,
+        metadata = excluded.metadata,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_DETECTION_UPDATE_COMMAND = """
+    UPDATE nfc_tags SET last_detected_at = ?, detection_count = ? WHERE uid = ?
+"""
+
+
+class NfcTagRepository(NfcRepositoryProtocol):
+    """SQLite implementation of NFC repository.
+
+    Reads are served from an in-memory cache (misses included) once a tag or
+    playlist has been looked up. Saves that only change detection fields
+    (last seen, scan count) of a stored tag are buffered and written in one
+    batch every ``flush_interval`` seconds or ``max_pending`` tags; any other
+    change is written immediately.
+    """
+
+    def __init__(
+        self,
+        database_service=None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """Initialize the repository.
+
+        Args:
+            database_service: SQLite database service; defaults to the
+                application database, resolved on first use
+            flush_interval: Seconds before buffered detection updates are written
+            max_pending: Number of buffered tags that forces a write
+        """
+        self._db_service = database_service
+        self._flush_interval = flush_interval
+        self._max_pending = max(1, max_pending)
+        # uid -> tag, or None if known to be missing
+        self._tags: Dict[str, Optional[NfcTag]] = {}
+        # playlist id -> uid, or None if no tag is bound to it
+        self._playlist_tags: Dict[str, Optional[str]] = {}
+        # uid -> (playlist id, metadata json) as stored in the database
+        self._stored: Dict[str, Tuple[Optional[str], str]] = {}
+        self._pending: Dict[str, NfcTag] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._writes = 0
+        self._buffered_updates = 0
+        self._flushes = 0
+
+    @property
+    def _database_service(self):
+        if self._db_service is None:
+            self._db_service = get_container().get("database_manager").database_service
+        return self._db_service
+
+    # --- NfcRepositoryProtocol ---
+
+    async def save_tag(self, tag: NfcTag) -> None:
+        """Save an NFC tag.
+
+        Args:
+            tag: NFC tag entity to save
+        """
+        uid = tag.identifier.uid
+        durable = (tag.associated_playlist_id, json.dumps(tag.metadata, sort_keys=True))
+        self._cache_tag(self._copy(tag))
+
+        if self._stored.get(uid) == durable:
+            self._pending[uid] = self._copy(tag)
+            self._buffered_updates += 1
+            if len(self._pending) >= self._max_pending:
+                await self.flush()
+            else:
+                self._schedule_flush()
+            return
+
+        self._pending.pop(uid, None)
+        await self._database_service.execute_command_async(
+            _TAG_UPSERT_COMMAND,
+            (uid, durable[0], self._format_time(tag.last_detected_at),
+             tag.detection_count, durable[1]),
+            "save_nfc_tag",
+        )
+        self._stored[uid] = durable
+        self._writes += 1
+
+    async def find_by_identifier(self, identifier: TagIdentifier) -> Optional[NfcTag]:
+        """Find tag by identifier.
+
+        Args:
+            identifier: Tag identifier to search for
+
+        Returns:
+            NFC tag if found, None otherwise
+        """
+        uid = identifier.uid
+        if uid in self._tags:
+            self._cache_hits += 1
+            tag = self._tags[uid]
+            return self._copy(tag) if tag else None
+
+        self._cache_misses += 1
+        row = await self._database_service.execute_single_async(
+            f"""
+            SELECT {_TAG_COLUMNS} FROM nfc_tags t
+            LEFT JOIN playlists p ON p.id = t.playlist_id AND p.nfc_tag_id = t.uid
+            WHERE t.uid = ?
+            """,
+            (uid,),
+            "find_nfc_tag",
+        )
+        if row is None:
+            self._tags[uid] = None
+            return None
+        tag = self._load_row(row)
+        return self._copy(tag)
+
+    async def find_by_playlist_id(self, playlist_id: str) -> Optional[NfcTag]:
+        """Find tag associated with a playlist.
+
+        Args:
+            playlist_id: Playlist ID to search for
+
+        Returns:
+            NFC tag if found, None otherwise
+        """
+        if playlist_id in self._playlist_tags:
+            self._cache_hits += 1
+            uid = self._playlist_tags[playlist_id]
+            tag = self._tags.get(uid) if uid else None
+            return self._copy(tag) if tag else None
+
+        self._cache_misses += 1
+        row = await self._database_service.execute_single_async(
+            f"""
+            SELECT {_TAG_COLUMNS} FROM nfc_tags t
+            JOIN playlists p ON p.id = t.playlist_id AND p.nfc_tag_id = t.uid
+            WHERE t.playlist_id = ?
+            LIMIT 1
+            """,
+            (playlist_id,),
+            "find_nfc_tag_by_playlist",
+        )
+        if row is None:
+            self._playlist_tags[playlist_id] = None
+            return None
+        uid = row["uid"]
+        # A buffered or cached tag is newer than the row
+        tag = self._tags.get(uid) or self._load_row(row)
+        self._playlist_tags[playlist_id] = uid
+        return self._copy(tag)
+
+    async def delete_tag(self, identifier: TagIdentifier) -> bool:
+        """Delete a tag.
+
+        Args:
+            identifier: Tag identifier to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        uid = identifier.uid
+        self._pending.pop(uid, None)
+        deleted = await self._database_service.execute_command_async(
+            "DELETE FROM nfc_tags WHERE uid = ?", (uid,), "delete_nfc_tag"
+        )
+        self._stored.pop(uid, None)
+        previous = self._tags.get(uid)
+        if previous is not None and previous.associated_playlist_id:
+            self._playlist_tags.pop(previous.associated_playlist_id, None)
+        self._tags[uid] = None
+        return deleted > 0 or previous is not None
+
+    async def flush(self) -> int:
+        """Write buffered detection updates in one batch.
+
+        Returns:
+            Number of tags written
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        params = [
+            (self._format_time(tag.last_detected_at), tag.detection_count, uid)
+            for uid, tag in pending.items()
+        ]
+        try:
+            await self._database_service.execute_batch_async(
+                [{"query": _DETECTION_UPDATE_COMMAND, "params": params, "type": "many"}],
+                f"flush_nfc_tag_detections_{len(params)}",
+            )
+        except Exception as e:
+            # Keep them for the next flush; updates buffered meanwhile are newer
+            for uid, tag in pending.items():
+                self._pending.setdefault(uid, tag)
+            logger.warning(f"⚠️ Could not write {len(params)} buffered NFC tag updates: {e}")
+            return 0
+        self._flushes += 1
+        self._writes += 1
+        return len(params)
+
+    async def close(self) -> None:
+        """Stop the flush timer and write buffered updates."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        await self.flush()
+
+    # --- Reporting ---
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache and write counters for health reporting."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "cached_tags": sum(1 for tag in self._tags.values() if tag is not None),
+            "pending_updates": len(self._pending),
+            "buffered_updates": self._buffered_updates,
+            "writes": self._writes,
+            "flushes": self._flushes,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "hit_rate": round(self._cache_hits / lookups, 4) if lookups else 0.0,
+        }
+
+    # --- Internals ---
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+        except RuntimeError:
+            # No loop: updates stay buffered until the next flush or close
+            self._flush_task = None
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        await self.flush()
+
+    def _cache_tag(self, tag: NfcTag) -> None:
+        uid = tag.identifier.uid
+        previous = self._tags.get(uid)
+        if previous is not None and previous.associated_playlist_id != tag.associated_playlist_id:
+            self._playlist_tags.pop(previous.associated_playlist_id, None)
+        if tag.associated_playlist_id:
+            self._playlist_tags[tag.associated_playlist_id] = uid
+        self._tags[uid] = tag
+
+    def _load_row(self, row) -> NfcTag:
+        """Cache a tag read from the database, unless a newer one is cached."""
+        uid = row["uid"]
+        cached = self._tags.get(uid)
+        if cached is not None:
+            return cached
+        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+        tag = NfcTag(
+            identifier=TagIdentifier(uid=uid),
+            associated_playlist_id=row["playlist_id"],
+            last_detected_at=(
+                datetime.fromisoformat(row["last_detected_at"]) if row["last_detected_at"] else None
+            ),
+            detection_count=row["detection_count"] or 0,
+            metadata=metadata,
+        )
+        self._stored[uid] = (tag.associated_playlist_id, json.dumps(metadata, sort_keys=True))
+        self._cache_tag(tag)
+        return tag
+
+    @staticmethod
+    def _copy(tag: NfcTag) -> NfcTag:
+        return replace(tag, metadata=dict(tag.metadata))
+
+    @staticmethod
+    def _format_time(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
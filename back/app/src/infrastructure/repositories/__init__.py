@@ -10,5 +10,6 @@ handling persistence concerns while respecting domain boundaries.
 """
 
 from .pure_sqlite_playlist_repository import PureSQLitePlaylistRepository
+from .cached_playlist_repository import CachedPlaylistRepository
 
-__all__ = ["PureSQLitePlaylistRepository"]
+__all__ = ["PureSQLitePlaylistRepository", "CachedPlaylistRepository"]
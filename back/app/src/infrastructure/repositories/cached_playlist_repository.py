@@ -0,0 +1,161 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""
+Read-through caching playlist repository.
+
+Serves playlist lookups by ID and NFC tag from a shared in-process LRU cache
+and invalidates affected entries after every write.
+"""
+
+from typing import List, Optional
+
+from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.track_change_set import TrackChangeSet
+from app.src.infrastructure.repositories.playlist_cache import PlaylistCache
+from app.src.infrastructure.repositories.pure_sqlite_playlist_repository import (
+    PureSQLitePlaylistRepository,
+)
+
+
+class CachedPlaylistRepository(PureSQLitePlaylistRepository):
+    """PureSQLitePlaylistRepository with a read-through playlist cache.
+
+    The cache is shared by every instance bound to the same database service,
+    so a write through one repository is visible to reads through another.
+    Listings and searches are not cached; they already run as a few batched
+    queries and their results depend on ordering and paging.
+    """
+
+    def __init__(self, cache: Optional[PlaylistCache] = None):
+        """Initialize the repository.
+
+        Args:
+            cache: Cache to use; defaults to the one shared by the database service
+        """
+        super().__init__()
+        self._cache = cache or PlaylistCache.for_database(self._db_service)
+
+    @property
+    def cache(self) -> PlaylistCache:
+        """Playlist cache backing this repository."""
+        return self._cache
+
+    async def find_by_id(self, playlist_id: str) -> Optional[Playlist]:
+        """Find playlist by ID, serving warm entries from the cache."""
+        cached = self._cache.get(playlist_id)
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation
+        playlist = await super().find_by_id(playlist_id)
+        if playlist is not None:
+            self._cache.put(playlist, generation)
+        return playlist
+
+    async def find_by_nfc_tag(self, nfc_tag_id: str) -> Optional[Playlist]:
+        """Find playlist by NFC tag, remembering unassociated tags too."""
+        found, cached = self._cache.lookup_nfc_tag(nfc_tag_id)
+        if found:
+            return cached
+
+        generation = self._cache.generation
+        playlist = await super().find_by_nfc_tag(nfc_tag_id)
+        if playlist is not None:
+            self._cache.put(playlist, generation)
+        else:
+            self._cache.put_missing_tag(nfc_tag_id, generation)
+        return playlist
+
+    async def save(self, playlist: Playlist) -> Playlist:
+        """Save a playlist and invalidate its cached entries."""
+        try:
+            return await super().save(playlist)
+        finally:
+            if playlist.id:
+                self._cache.invalidate(playlist.id)
+            if playlist.nfc_tag_id:
+                self._cache.invalidate_tag(playlist.nfc_tag_id)
+
+    async def bulk_upsert_playlists(self, playlists: List[Playlist]) -> List[Playlist]:
+        """Save many playlists and invalidate their cached entries."""
+        try:
+            return await super().bulk_upsert_playlists(playlists)
+        finally:
+            for playlist in playlists:
+                if playlist.id:
+                    self._cache.invalidate(playlist.id)
+                if playlist.nfc_tag_id:
+                    self._cache.invalidate_tag(playlist.nfc_tag_id)
+
+    async def delete(self, playlist_id: str) -> bool:
+        """Delete a playlist and drop it from the cache."""
+        try:
+            return await super().delete(playlist_id)
+        finally:
+            self._cache.invalidate(playlist_id)
+
+    async def update_nfc_tag_association(self, playlist_id: str, nfc_tag_id: str) -> bool:
+        """Move an NFC tag to a playlist and invalidate both ends."""
+        try:
+            return await super().update_nfc_tag_association(playlist_id, nfc_tag_id)
+        finally:
+            self._cache.invalidate_tag(nfc_tag_id)
+            self._cache.invalidate(playlist_id)
+
+    async def remove_nfc_tag_association(self, nfc_tag_id: str) -> bool:
+        """Remove an NFC tag association and invalidate its mapping."""
+        try:
+            return await super().remove_nfc_tag_association(nfc_tag_id)
+        finally:
+            self._cache.invalidate_tag(nfc_tag_id)
+
+    async def update_track_numbers(self, playlist_id: str, track_number_mapping: dict) -> bool:
+        """Renumber tracks and invalidate the playlist."""
+        try:
+            return await super().update_track_numbers(playlist_id, track_number_mapping)
+        finally:
+            self._cache.invalidate(playlist_id)
+
+    async def apply_track_changes(self, playlist_id: str, changes: TrackChangeSet) -> bool:
+        """Apply a track change set and invalidate the playlist."""
+        try:
+            return await super().apply_track_changes(playlist_id, changes)
+        finally:
+            self._cache.invalidate(playlist_id)
+
+    async def delete_tracks_by_playlist(self, playlist_id: str) -> bool:
+        """Delete a playlist's tracks and invalidate the playlist."""
+        try:
+            return await super().delete_tracks_by_playlist(playlist_id)
+        finally:
+            self._cache.invalidate(playlist_id)
+
+    async def add_track_to_playlist(self, playlist_id: str, track_data: dict) -> str:
+        """Add a track and invalidate the playlist."""
+        try:
+            return await super().add_track_to_playlist(playlist_id, track_data)
+        finally:
+            self._cache.invalidate(playlist_id)
+
+    async def update_track(self, track_id: str, track_data: dict) -> bool:
+        """Update a track and invalidate the playlist holding it."""
+        try:
+            return await super().update_track(track_id, track_data)
+        finally:
+            self._cache.invalidate_track(track_id)
+
+    async def delete_track(self, track_id: str) -> bool:
+        """Delete a track and invalidate the playlist holding it."""
+        try:
+            return await super().delete_track(track_id)
+        finally:
+            self._cache.invalidate_track(track_id)
+
+    async def reorder_tracks(self, playlist_id: str, track_orders: list) -> bool:
+        """Reorder tracks and invalidate the playlist."""
+        try:
+            return await super().reorder_tracks(playlist_id, track_orders)
+        finally:
+            self._cache.invalidate(playlist_id)
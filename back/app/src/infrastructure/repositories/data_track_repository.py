@@ -39,6 +39,10 @@ class DataTrackRepository(TrackRepositoryProtocol):
         """Add a track to a playlist."""
         return await self._repo.add_track_to_playlist(playlist_id, track_data)
 
+    async def get_next_track_number(self, playlist_id: str) -> int:
+        """Get the track number following the last track of a playlist."""
+        return await self._repo.get_next_track_number(playlist_id)
+
     async def update(self, track_id: str, track_data: Dict[str, Any]) -> bool:
         """Update a track."""
         return await self._repo.update_track(track_id, track_data)
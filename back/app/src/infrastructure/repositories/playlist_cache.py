@@ -0,0 +1,262 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""
+In-process LRU cache for hydrated playlists.
+
+Entries are keyed by playlist ID with a secondary NFC tag index, so tag scans
+and playlist loads resolve without touching SQLite once a playlist is warm.
+One cache is shared by every repository bound to the same database service,
+which keeps invalidation consistent across repository instances. Components
+holding derived state (such as the NFC playlist index) can subscribe to
+invalidations with :func:`add_playlist_change_listener`.
+"""
+
+import copy
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from app.src.domain.data.models.playlist import Playlist
+from app.src.monitoring import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 128
+
+# Sentinel stored in the NFC index for tags known to have no playlist
+_NO_PLAYLIST = object()
+
+_caches: "weakref.WeakKeyDictionary[Any, PlaylistCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+# Called as listener(playlist_id=..., nfc_tag_id=..., track_id=...) after a
+# write invalidated cached state; all three are None when everything changed
+PlaylistChangeListener = Callable[..., None]
+_listeners: List[PlaylistChangeListener] = []
+
+
+class PlaylistCache:
+    """Bounded LRU cache of playlist entities.
+
+    Playlists are copied on the way in and out because callers mutate the
+    entities they receive before saving them back.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of playlists kept before evicting the
+                least recently used one
+        """
+        self._max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Playlist]" = OrderedDict()
+        self._nfc_index: "OrderedDict[str, Any]" = OrderedDict()
+        self._track_index: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._generation = 0
+
+    @classmethod
+    def for_database(cls, database_service: Any) -> "PlaylistCache":
+        """Get the cache shared by all repositories of a database service."""
+        with _caches_lock:
+            cache = _caches.get(database_service)
+            if cache is None:
+                cache = cls()
+                _caches[database_service] = cache
+            return cache
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation.
+
+        Read it before querying the database and pass it to :meth:`put` so a
+        row read concurrently with a write is not cached after the write
+        invalidated it.
+        """
+        return self._generation
+
+    def get(self, playlist_id: str) -> Optional[Playlist]:
+        """Get a copy of a cached playlist, or None on a miss."""
+        with self._lock:
+            playlist = self._entries.get(playlist_id)
+            if playlist is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(playlist_id)
+            self._hits += 1
+            return copy.deepcopy(playlist)
+
+    def lookup_nfc_tag(self, nfc_tag_id: str) -> "tuple[bool, Optional[Playlist]]":
+        """Resolve an NFC tag from the cache.
+
+        Returns:
+            ``(found, playlist)`` where ``found`` is False on a miss and
+            ``playlist`` is None when the tag is known to be unassociated
+        """
+        with self._lock:
+            playlist_id = self._nfc_index.get(nfc_tag_id)
+            if playlist_id is _NO_PLAYLIST:
+                self._nfc_index.move_to_end(nfc_tag_id)
+                self._hits += 1
+                return True, None
+            playlist = self._entries.get(playlist_id) if playlist_id else None
+            if playlist is None:
+                self._misses += 1
+                return False, None
+            self._nfc_index.move_to_end(nfc_tag_id)
+            self._entries.move_to_end(playlist_id)
+            self._hits += 1
+            return True, copy.deepcopy(playlist)
+
+    def put(self, playlist: Playlist, generation: Optional[int] = None) -> None:
+        """Store a copy of a playlist, evicting the least recently used ones.
+
+        Args:
+            playlist: Playlist loaded from the database
+            generation: Value of :attr:`generation` before the load; the entry
+                is dropped if an invalidation happened since
+        """
+        if playlist is None or not playlist.id:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._discard(playlist.id)
+            self._entries[playlist.id] = copy.deepcopy(playlist)
+            if playlist.nfc_tag_id:
+                self._remember_tag(playlist.nfc_tag_id, playlist.id)
+            for track in playlist.tracks:
+                if track.id:
+                    self._track_index[track.id] = playlist.id
+            while len(self._entries) > self._max_entries:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+
+    def put_missing_tag(self, nfc_tag_id: str, generation: Optional[int] = None) -> None:
+        """Remember that no playlist is associated with an NFC tag."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remember_tag(nfc_tag_id, _NO_PLAYLIST)
+
+    def invalidate(self, playlist_id: str) -> None:
+        """Drop a playlist and the index entries pointing at it."""
+        with self._lock:
+            self._generation += 1
+            if self._discard(playlist_id):
+                self._invalidations += 1
+        _notify_listeners(playlist_id=playlist_id)
+
+    def invalidate_track(self, track_id: str) -> None:
+        """Drop the playlist that contains a track, if it is cached."""
+        with self._lock:
+            self._generation += 1
+            playlist_id = self._track_index.get(track_id)
+            if playlist_id and self._discard(playlist_id):
+                self._invalidations += 1
+        _notify_listeners(track_id=track_id)
+
+    def invalidate_tag(self, nfc_tag_id: str) -> None:
+        """Drop an NFC tag mapping and the playlist it resolved to."""
+        with self._lock:
+            self._generation += 1
+            playlist_id = self._nfc_index.pop(nfc_tag_id, None)
+            if playlist_id is _NO_PLAYLIST:
+                self._invalidations += 1
+            elif playlist_id and self._discard(playlist_id):
+                self._invalidations += 1
+        _notify_listeners(nfc_tag_id=nfc_tag_id)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._generation += 1
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._nfc_index.clear()
+            self._track_index.clear()
+        _notify_listeners()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache counters for health reporting."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _remember_tag(self, nfc_tag_id: str, playlist_id: Any) -> None:
+        self._nfc_index[nfc_tag_id] = playlist_id
+        self._nfc_index.move_to_end(nfc_tag_id)
+        # Negative entries are bounded alongside playlists
+        while len(self._nfc_index) > self._max_entries * 2:
+            self._nfc_index.popitem(last=False)
+
+    def _discard(self, playlist_id: str) -> bool:
+        """Remove a playlist's index entries; the caller holds the lock."""
+        playlist = self._entries.pop(playlist_id, None)
+        for tag, target in list(self._nfc_index.items()):
+            if target == playlist_id:
+                del self._nfc_index[tag]
+        if playlist is None:
+            return False
+        for track in playlist.tracks:
+            if self._track_index.get(track.id) == playlist_id:
+                del self._track_index[track.id]
+        return True
+
+
+def add_playlist_change_listener(listener: PlaylistChangeListener) -> None:
+    """Subscribe to invalidations of every playlist cache."""
+    with _caches_lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def remove_playlist_change_listener(listener: PlaylistChangeListener) -> None:
+    """Unsubscribe a listener added with :func:`add_playlist_change_listener`."""
+    with _caches_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def _notify_listeners(playlist_id: Optional[str] = None, nfc_tag_id: Optional[str] = None,
+                      track_id: Optional[str] = None) -> None:
+    """Tell subscribers what changed; called without the cache lock held."""
+    with _caches_lock:
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(playlist_id=playlist_id, nfc_tag_id=nfc_tag_id, track_id=track_id)
+        except Exception as e:
+            logger.warning(f"Playlist change listener failed: {e}")
+
+
+def get_playlist_cache_statistics() -> Dict[str, Any]:
+    """Aggregate counters of every live playlist cache."""
+    with _caches_lock:
+        caches = list(_caches.values())
+
+    totals = {"entries": 0, "max_entries": 0, "hits": 0, "misses": 0,
+              "evictions": 0, "invalidations": 0}
+    for cache in caches:
+        stats = cache.get_statistics()
+        for key in totals:
+            totals[key] += stats[key]
+    lookups = totals["hits"] + totals["misses"]
+    totals["hit_rate"] = round(totals["hits"] / lookups, 4) if lookups else 0.0
+    return totals
@@ -9,17 +9,46 @@ Clean implementation of playlist repository following DDD principles.
 Uses DatabaseManager for connection management and focuses only on data access.
 """
 
+import re
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 import logging
 from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.playlist_summary import PlaylistSummary
 from app.src.domain.data.models.track import Track
+from app.src.domain.data.models.track_change_set import TrackChangeSet
 from app.src.domain.repositories.playlist_repository_interface import PlaylistRepositoryProtocol
 from app.src.dependencies import get_database_manager
 from app.src.services.error.unified_error_decorator import handle_repository_errors
 
 logger = logging.getLogger(__name__)
 
+# SQLite builds before 3.32 cap bound parameters at 999 per statement
+_MAX_IN_CLAUSE_PARAMS = 900
+
+# bm25 scores are negative; scaling track scores down ranks them after playlist hits
+_TRACK_MATCH_WEIGHT = 0.5
+
+# Upsert rather than REPLACE so update triggers (search index) fire
+_PLAYLIST_UPSERT_COMMAND = """
+    INSERT INTO playlists
+    (id, title, description, nfc_tag_id, path, type, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        description = excluded.description,
+        nfc_tag_id = excluded.nfc_tag_id,
+        path = excluded.path,
+        type = excluded.type,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_TRACK_INSERT_COMMAND = """
+    INSERT INTO tracks
+    (id, playlist_id, track_number, title, filename, file_path, duration_ms, artist, album, created_at, updated_at, play_count, server_seq)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0, 0)
+"""
+
 def _handle_repository_errors(entity_name: str):
     return handle_repository_errors(entity_name)
 
@@ -42,6 +71,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         """
         self._database_manager = get_database_manager()
         self._db_service = self._database_manager.database_service
+        self._search_index_available: Optional[bool] = None
         logger.info("✅ Pure DDD SQLite Playlist Repository initialized")
 
     @_handle_repository_errors("playlist")
@@ -58,29 +88,11 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         if not playlist.id:
             playlist.id = str(uuid.uuid4())
 
-        # Save playlist data with consistent path generation
-        from app.src.utils.path_utils import normalize_folder_name
-        path = normalize_folder_name(playlist.title)
-
-        playlist_command = """
-            INSERT OR REPLACE INTO playlists
-            (id, title, description, nfc_tag_id, path, type, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-        """
-        playlist_params = (
-            playlist.id,
-            playlist.title,
-            playlist.description,
-            playlist.nfc_tag_id,
-            path,
-            "album",
-        )
-
         # Prepare batch operations for atomic transaction
         operations = [
             {
-                "query": playlist_command,
-                "params": playlist_params,
+                "query": _PLAYLIST_UPSERT_COMMAND,
+                "params": self._playlist_upsert_params(playlist),
                 "type": "command"
             },
             {
@@ -91,35 +103,78 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         ]
 
         # Add track insertions
-        for track in playlist.tracks:
-            track_command = """
-                INSERT INTO tracks
-                (id, playlist_id, track_number, title, filename, file_path, duration_ms, artist, album, created_at, updated_at, play_count, server_seq)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0, 0)
-            """
-            track_params = (
-                track.id or str(uuid.uuid4()),
-                playlist.id,
-                track.track_number,
-                track.title,
-                track.filename,
-                track.file_path,
-                track.duration_ms,
-                track.artist,
-                track.album,
-            )
+        if playlist.tracks:
             operations.append({
-                "query": track_command,
-                "params": track_params,
-                "type": "command"
+                "query": _TRACK_INSERT_COMMAND,
+                "params": [
+                    self._track_insert_params(playlist.id, track) for track in playlist.tracks
+                ],
+                "type": "many"
             })
 
         # Execute all operations in a single transaction
-        self._db_service.execute_batch(operations, f"save_playlist_{playlist.id}")
+        await self._db_service.execute_batch_async(operations, f"save_playlist_{playlist.id}")
 
         logger.info(f"✅ Saved playlist: {playlist.title}")
         return playlist
 
+    @_handle_repository_errors("playlist")
+    async def bulk_upsert_playlists(self, playlists: List[Playlist]) -> List[Playlist]:
+        """Save many playlists with their tracks in a single transaction.
+
+        Playlists are upserted and their tracks replaced with one
+        ``executemany`` per statement, so importing a whole library costs one
+        commit instead of one per playlist or track.
+
+        Args:
+            playlists: Playlist entities with their tracks
+
+        Returns:
+            The saved playlists, with playlist and track IDs assigned
+        """
+        if not playlists:
+            return []
+
+        for playlist in playlists:
+            if not playlist.id:
+                playlist.id = str(uuid.uuid4())
+            for track in playlist.tracks:
+                if not track.id:
+                    track.id = str(uuid.uuid4())
+
+        operations = [
+            {
+                "query": _PLAYLIST_UPSERT_COMMAND,
+                "params": [self._playlist_upsert_params(playlist) for playlist in playlists],
+                "type": "many"
+            },
+            {
+                "query": "DELETE FROM tracks WHERE playlist_id = ?",
+                "params": [(playlist.id,) for playlist in playlists],
+                "type": "many"
+            },
+        ]
+        track_params = [
+            self._track_insert_params(playlist.id, track)
+            for playlist in playlists
+            for track in playlist.tracks
+        ]
+        if track_params:
+            operations.append({
+                "query": _TRACK_INSERT_COMMAND,
+                "params": track_params,
+                "type": "many"
+            })
+
+        await self._db_service.execute_batch_async(
+            operations, f"bulk_upsert_playlists_{len(playlists)}"
+        )
+
+        logger.info(
+            f"✅ Bulk saved {len(playlists)} playlists with {len(track_params)} tracks"
+        )
+        return playlists
+
     async def find_by_id(self, playlist_id: str) -> Optional[Playlist]:
         """Find playlist by ID using pure DDD principles.
 
@@ -129,13 +184,9 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             Playlist domain entity or None if not found
         """
-        import asyncio
-        # Force async context (required for proper async/await behavior with synchronous code)
-        await asyncio.sleep(0)
-
         # Get playlist data
         playlist_query = "SELECT * FROM playlists WHERE id = ?"
-        playlist_row = self._db_service.execute_single(
+        playlist_row = await self._db_service.execute_single_async(
             playlist_query,
             (playlist_id,),
             f"find_playlist_{playlist_id}"
@@ -150,7 +201,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             WHERE playlist_id = ?
             ORDER BY track_number
         """
-        track_rows = self._db_service.execute_query(
+        track_rows = await self._db_service.execute_query_async(
             tracks_query,
             (playlist_id,),
             f"find_tracks_for_playlist_{playlist_id}"
@@ -167,11 +218,8 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             True if playlist exists, False otherwise
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         playlist_query = "SELECT 1 FROM playlists WHERE id = ? LIMIT 1"
-        result = self._db_service.execute_single(
+        result = await self._db_service.execute_single_async(
             playlist_query,
             (playlist_id,),
             f"exists_playlist_{playlist_id}"
@@ -189,7 +237,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             Playlist domain entity or None if not found
         """
         playlist_query = "SELECT * FROM playlists WHERE title = ?"
-        playlist_row = self._db_service.execute_single(
+        playlist_row = await self._db_service.execute_single_async(
             playlist_query,
             (name,),
             f"find_playlist_by_name_{name}"
@@ -204,7 +252,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             WHERE playlist_id = ?
             ORDER BY track_number
         """
-        track_rows = self._db_service.execute_query(
+        track_rows = await self._db_service.execute_query_async(
             tracks_query,
             (playlist_row["id"],),
             f"find_tracks_for_playlist_{playlist_row['id']}"
@@ -223,7 +271,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             Playlist domain entity or None if not found
         """
         playlist_query = "SELECT * FROM playlists WHERE nfc_tag_id = ?"
-        playlist_row = self._db_service.execute_single(
+        playlist_row = await self._db_service.execute_single_async(
             playlist_query,
             (nfc_tag_id,),
             f"find_playlist_by_nfc_{nfc_tag_id}"
@@ -238,7 +286,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             WHERE playlist_id = ?
             ORDER BY track_number
         """
-        track_rows = self._db_service.execute_query(
+        track_rows = await self._db_service.execute_query_async(
             tracks_query,
             (playlist_row["id"],),
             f"find_tracks_for_playlist_{playlist_row['id']}"
@@ -247,17 +295,34 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         return self._build_playlist_from_rows(playlist_row, track_rows)
 
     @_handle_repository_errors("playlist")
-    async def find_all(self, limit: int = None, offset: int = 0) -> List[Playlist]:
+    async def find_with_nfc_tags(self) -> List[Playlist]:
+        """Find every playlist that has an NFC tag associated.
+
+        Returns:
+            List of playlist domain entities with their tracks
+        """
+        playlist_rows = await self._db_service.execute_query_async(
+            "SELECT * FROM playlists WHERE nfc_tag_id IS NOT NULL ORDER BY id",
+            (),
+            "find_playlists_with_nfc_tags"
+        )
+        return await self._hydrate_playlists(playlist_rows)
+
+    @_handle_repository_errors("playlist")
+    async def find_all(
+        self, limit: int = None, offset: int = 0, include_tracks: bool = True
+    ) -> List[Union[Playlist, PlaylistSummary]]:
         """Find all playlists with pagination using pure DDD principles.
 
         Args:
             limit: Maximum number of playlists to return
             offset: Number of playlists to skip
+            include_tracks: False to return track-free summaries
 
         Returns:
-            List of playlist domain entities
+            List of playlist domain entities, or summaries without tracks
         """
-        query = "SELECT * FROM playlists ORDER BY updated_at DESC"
+        query = "SELECT * FROM playlists ORDER BY updated_at DESC, id"
         params = []
 
         if limit is not None:
@@ -268,30 +333,58 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             query += " OFFSET ?"
             params.append(offset)
 
-        playlist_rows = self._db_service.execute_query(
+        playlist_rows = await self._db_service.execute_query_async(
             query,
             tuple(params),
             f"find_all_playlists_limit_{limit}_offset_{offset}"
         )
 
-        playlists = []
-        for playlist_row in playlist_rows:
-            # Get tracks for each playlist
-            tracks_query = """
-                SELECT * FROM tracks
-                WHERE playlist_id = ?
-                ORDER BY track_number
-            """
-            track_rows = self._db_service.execute_query(
-                tracks_query,
-                (playlist_row["id"],),
-                f"find_tracks_for_playlist_{playlist_row['id']}"
-            )
+        if not include_tracks:
+            return self._build_summaries(playlist_rows)
+        return await self._hydrate_playlists(playlist_rows)
 
-            playlist = self._build_playlist_from_rows(playlist_row, track_rows)
-            playlists.append(playlist)
+    async def find_page(
+        self, limit: int, after: Optional[Tuple[str, str]] = None, include_tracks: bool = True
+    ) -> Tuple[List[Union[Playlist, PlaylistSummary]], Optional[Tuple[str, str]]]:
+        """Find a page of playlists using keyset pagination.
 
-        return playlists
+        Walks idx_playlists_updated_at_id in ``updated_at DESC, id`` order, so
+        the cost of a page does not depend on how deep it is.
+
+        Args:
+            limit: Maximum number of playlists to return
+            after: Sort key (updated_at, id) of the last playlist already seen
+            include_tracks: False to return track-free summaries
+
+        Returns:
+            Tuple of (playlists, sort key to resume after, or None on the last page)
+        """
+        query = "SELECT * FROM playlists"
+        params = []
+
+        if after is not None:
+            updated_at, playlist_id = after
+            query += " WHERE updated_at <= ? AND (updated_at < ? OR id > ?)"
+            params.extend([updated_at, updated_at, playlist_id])
+
+        # Fetch one extra row to know whether another page exists
+        query += " ORDER BY updated_at DESC, id LIMIT ?"
+        params.append(limit + 1)
+
+        playlist_rows = await self._db_service.execute_query_async(
+            query,
+            tuple(params),
+            f"find_playlist_page_limit_{limit}"
+        )
+
+        page_rows = playlist_rows[:limit]
+        next_key = None
+        if len(playlist_rows) > limit and page_rows:
+            next_key = (page_rows[-1]["updated_at"], page_rows[-1]["id"])
+
+        if not include_tracks:
+            return self._build_summaries(page_rows), next_key
+        return await self._hydrate_playlists(page_rows), next_key
 
     async def update(self, playlist: Playlist) -> Playlist:
         """Update existing playlist using pure DDD principles.
@@ -316,7 +409,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             True if deleted, False if not found
         """
         delete_command = "DELETE FROM playlists WHERE id = ?"
-        affected_rows = self._db_service.execute_command(
+        affected_rows = await self._db_service.execute_command_async(
             delete_command,
             (playlist_id,),
             f"delete_playlist_{playlist_id}"
@@ -336,20 +429,95 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             Total playlist count
         """
         count_query = "SELECT COUNT(*) FROM playlists"
-        result = self._db_service.execute_single(count_query, None, "count_playlists")
+        result = await self._db_service.execute_single_async(count_query, None, "count_playlists")
         return result[0] if result else 0
 
     @_handle_repository_errors("playlist")
     async def search(self, query: str, limit: int = None) -> List[Playlist]:
-        """Search playlists by name or description using pure DDD principles.
+        """Search playlists by title, description and track metadata.
+
+        Uses the FTS5 search index (ranked, prefix matching) when available
+        and falls back to a LIKE scan over playlist title and description.
 
         Args:
             query: Search query
             limit: Maximum results to return
 
         Returns:
-            List of matching playlist domain entities
+            List of matching playlist domain entities, best matches first
+        """
+        match_expression = self._build_fts_match(query)
+        if match_expression and await self._is_search_index_available():
+            playlist_rows = await self._search_fts(match_expression, limit)
+        else:
+            playlist_rows = await self._search_like(query, limit)
+
+        return await self._hydrate_playlists(playlist_rows)
+
+    async def _is_search_index_available(self) -> bool:
+        """Check once whether the FTS5 search index exists in the database."""
+        if self._search_index_available is None:
+            row = await self._db_service.execute_single_async(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)",
+                ("playlists_fts", "tracks_fts"),
+                "check_search_index"
+            )
+            self._search_index_available = bool(row) and row[0] == 2
+            if not self._search_index_available:
+                logger.warning("⚠️ FTS5 search index unavailable, using LIKE search")
+        return self._search_index_available
+
+    @staticmethod
+    def _build_fts_match(query: str) -> str:
+        """Build an FTS5 MATCH expression with prefix matching on every term.
+
+        Terms are quoted so user input never reaches the FTS5 query syntax.
+
+        Args:
+            query: Raw user query
+
+        Returns:
+            MATCH expression, or an empty string if the query has no terms
+        """
+        terms = re.findall(r"\w+", query or "")
+        return " ".join(f'"{term}"*' for term in terms)
+
+    async def _search_fts(self, match_expression: str, limit: Optional[int]) -> List:
+        """Ranked search through the FTS5 index.
+
+        Playlist matches outrank track matches; each playlist keeps its best score.
+        """
+        search_query = f"""
+            SELECT p.*
+            FROM (
+                SELECT p.id AS playlist_id, bm25(playlists_fts, 10.0, 2.0) AS score
+                FROM playlists_fts
+                JOIN playlists p ON p.rowid = playlists_fts.rowid
+                WHERE playlists_fts MATCH ?
+                UNION ALL
+                SELECT t.playlist_id, bm25(tracks_fts, 4.0, 3.0, 3.0) * {_TRACK_MATCH_WEIGHT}
+                FROM tracks_fts
+                JOIN tracks t ON t.rowid = tracks_fts.rowid
+                WHERE tracks_fts MATCH ?
+            ) matches
+            JOIN playlists p ON p.id = matches.playlist_id
+            GROUP BY p.id
+            ORDER BY MIN(matches.score), p.updated_at DESC
         """
+        params = [match_expression, match_expression]
+
+        if limit is not None:
+            search_query += " LIMIT ?"
+            params.append(limit)
+
+        return await self._db_service.execute_query_async(
+            search_query,
+            tuple(params),
+            f"search_playlists_fts_{match_expression}"
+        )
+
+    async def _search_like(self, query: str, limit: Optional[int]) -> List:
+        """Unindexed LIKE search over playlist title and description."""
         search_query = """
             SELECT * FROM playlists
             WHERE title LIKE ? OR description LIKE ?
@@ -361,31 +529,12 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             search_query += " LIMIT ?"
             params.append(limit)
 
-        playlist_rows = self._db_service.execute_query(
+        return await self._db_service.execute_query_async(
             search_query,
             tuple(params),
             f"search_playlists_{query}"
         )
 
-        playlists = []
-        for playlist_row in playlist_rows:
-            # Get tracks for each playlist
-            tracks_query = """
-                SELECT * FROM tracks
-                WHERE playlist_id = ?
-                ORDER BY track_number
-            """
-            track_rows = self._db_service.execute_query(
-                tracks_query,
-                (playlist_row["id"],),
-                f"find_tracks_for_playlist_{playlist_row['id']}"
-            )
-
-            playlist = self._build_playlist_from_rows(playlist_row, track_rows)
-            playlists.append(playlist)
-
-        return playlists
-
     @_handle_repository_errors("playlist")
     async def update_nfc_tag_association(self, playlist_id: str, nfc_tag_id: str) -> bool:
         """Update NFC tag association for a playlist.
@@ -411,7 +560,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             }
         ]
 
-        results = self._db_service.execute_batch(
+        results = await self._db_service.execute_batch_async(
             operations,
             f"update_nfc_association_{playlist_id}_{nfc_tag_id}"
         )
@@ -446,7 +595,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             WHERE nfc_tag_id = ?
         """
 
-        self._db_service.execute_command(
+        await self._db_service.execute_command_async(
             remove_command,
             (nfc_tag_id,),
             f"remove_nfc_association_{nfc_tag_id}"
@@ -473,58 +622,218 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             logger.warning("Empty track number mapping provided")
             return False
 
-        try:
-            # Use transaction to ensure atomicity
-            async def update_operation():
-                # First, temporarily set all track numbers to negative values to avoid conflicts
-                temp_mapping = {}
-                for old_num, new_num in track_number_mapping.items():
-                    temp_mapping[old_num] = -new_num
-
-                # Step 1: Update to temporary negative values
-                for old_num, temp_num in temp_mapping.items():
-                    await self._db_service.execute(
-                        """
-                        UPDATE tracks
-                        SET track_number = ?
-                        WHERE playlist_id = ? AND track_number = ?
-                        """,
-                        (temp_num, playlist_id, old_num),
-                        f"temp_update_track_{playlist_id}_{old_num}"
-                    )
-
-                # Step 2: Update from temporary values to final values
-                for old_num, new_num in track_number_mapping.items():
-                    await self._db_service.execute(
-                        """
-                        UPDATE tracks
-                        SET track_number = ?
-                        WHERE playlist_id = ? AND track_number = ?
-                        """,
-                        (new_num, playlist_id, -new_num),
-                        f"final_update_track_{playlist_id}_{new_num}"
-                    )
-
-                return True
-
-            # Execute within transaction
-            result = await self._db_service.transaction(update_operation)
-
-            if result:
-                logger.info(
-                    f"✅ Updated track numbers for playlist {playlist_id}: {len(track_number_mapping)} tracks reordered"
-                )
-            else:
-                logger.error(f"❌ Failed to update track numbers for playlist {playlist_id}"
-                )
-
-            return result
+        update_query = """
+            UPDATE tracks
+            SET track_number = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE playlist_id = ? AND track_number = ?
+        """
+        # Two passes through temporary negative numbers avoid collisions while
+        # tracks swap positions; both run in a single transaction.
+        operations = [
+            {
+                "query": update_query,
+                "params": [
+                    (-new_num, playlist_id, old_num)
+                    for old_num, new_num in track_number_mapping.items()
+                ],
+                "type": "many"
+            },
+            {
+                "query": update_query,
+                "params": [
+                    (new_num, playlist_id, -new_num)
+                    for new_num in track_number_mapping.values()
+                ],
+                "type": "many"
+            },
+        ]
 
+        try:
+            await self._db_service.execute_batch_async(
+                operations, f"update_track_numbers_{playlist_id}"
+            )
         except Exception as e:
             logger.error(f"❌ Error updating track numbers for playlist {playlist_id}: {e}"
             )
             return False
 
+        logger.info(
+            f"✅ Updated track numbers for playlist {playlist_id}: {len(track_number_mapping)} tracks reordered"
+        )
+        return True
+
+    @_handle_repository_errors("tracks")
+    async def apply_track_changes(self, playlist_id: str, changes: TrackChangeSet) -> bool:
+        """Persist a track change set with the minimal set of statements.
+
+        Each change category is written with a single ``executemany`` and all
+        of them run in one transaction, so untouched tracks are never rewritten.
+
+        Args:
+            playlist_id: Playlist identifier
+            changes: Inserts, deletes, renumbers and field updates to apply
+
+        Returns:
+            True if the changes were applied
+        """
+        if changes.is_empty():
+            return True
+
+        operations = []
+
+        if changes.deletes:
+            operations.append({
+                "query": "DELETE FROM tracks WHERE id = ? AND playlist_id = ?",
+                "params": [(track_id, playlist_id) for track_id in changes.deletes],
+                "type": "many"
+            })
+
+        if changes.renumbers:
+            operations.append({
+                "query": """
+                    UPDATE tracks
+                    SET track_number = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND playlist_id = ?
+                """,
+                "params": [
+                    (track_number, track_id, playlist_id)
+                    for track_id, track_number in changes.renumbers.items()
+                ],
+                "type": "many"
+            })
+
+        # Group field updates by column set so each shape is one executemany
+        updates_by_columns = {}
+        for track_id, fields in changes.updates.items():
+            columns = tuple(sorted(fields))
+            updates_by_columns.setdefault(columns, []).append(
+                tuple(fields[column] for column in columns) + (track_id, playlist_id)
+            )
+        for columns, params in updates_by_columns.items():
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            operations.append({
+                "query": f"""
+                    UPDATE tracks
+                    SET {assignments}, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND playlist_id = ?
+                """,
+                "params": params,
+                "type": "many"
+            })
+
+        if changes.inserts:
+            for track in changes.inserts:
+                if not track.id:
+                    track.id = str(uuid.uuid4())
+            operations.append({
+                "query": _TRACK_INSERT_COMMAND,
+                "params": [self._track_insert_params(playlist_id, track) for track in changes.inserts],
+                "type": "many"
+            })
+
+        operations.append({
+            "query": "UPDATE playlists SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            "params": (playlist_id,),
+            "type": "command"
+        })
+
+        await self._db_service.execute_batch_async(
+            operations, f"apply_track_changes_{playlist_id}"
+        )
+
+        logger.info(
+            f"✅ Applied track changes to playlist {playlist_id}: "
+            f"{len(changes.inserts)} inserted, {len(changes.deletes)} deleted, "
+            f"{len(changes.renumbers)} renumbered, {len(changes.updates)} updated"
+        )
+        return True
+
+    @_handle_repository_errors("tracks")
+    async def get_next_track_number(self, playlist_id: str) -> int:
+        """Get the track number following the last track of a playlist.
+
+        Args:
+            playlist_id: Playlist identifier
+
+        Returns:
+            Highest existing track number plus one (1 for an empty playlist)
+        """
+        result = await self._db_service.execute_single_async(
+            "SELECT COALESCE(MAX(track_number), 0) + 1 FROM tracks WHERE playlist_id = ?",
+            (playlist_id,),
+            f"next_track_number_{playlist_id}"
+        )
+        return result[0] if result else 1
+
+    @staticmethod
+    def _playlist_upsert_params(playlist: Playlist) -> tuple:
+        """Build the parameters for _PLAYLIST_UPSERT_COMMAND from a playlist entity."""
+        # Consistent path generation with the upload and folder services
+        from app.src.utils.path_utils import normalize_folder_name
+        return (
+            playlist.id,
+            playlist.title,
+            playlist.description,
+            playlist.nfc_tag_id,
+            normalize_folder_name(playlist.title),
+            "album",
+        )
+
+    @staticmethod
+    def _track_insert_params(playlist_id: str, track: Track) -> tuple:
+        """Build the parameters for _TRACK_INSERT_COMMAND from a track entity."""
+        return (
+            track.id or str(uuid.uuid4()),
+            playlist_id,
+            track.track_number,
+            track.title,
+            track.filename,
+            track.file_path,
+            track.duration_ms,
+            track.artist,
+            track.album,
+        )
+
+    async def _hydrate_playlists(self, playlist_rows) -> List[Playlist]:
+        """Attach tracks to a page of playlist rows using batched queries.
+
+        Tracks for every playlist are loaded with ``playlist_id IN (...)``
+        queries (chunked to stay under SQLite's bound-parameter limit) instead
+        of one query per playlist, then grouped in a single pass.
+
+        Args:
+            playlist_rows: SQLite playlist rows, already in the desired order
+
+        Returns:
+            List of playlist domain entities in the same order as the rows
+        """
+        if not playlist_rows:
+            return []
+
+        playlist_ids = [row["id"] for row in playlist_rows]
+        tracks_by_playlist = {playlist_id: [] for playlist_id in playlist_ids}
+
+        for start in range(0, len(playlist_ids), _MAX_IN_CLAUSE_PARAMS):
+            chunk = playlist_ids[start:start + _MAX_IN_CLAUSE_PARAMS]
+            placeholders = ", ".join("?" for _ in chunk)
+            tracks_query = f"""
+                SELECT * FROM tracks
+                WHERE playlist_id IN ({placeholders})
+                ORDER BY playlist_id, track_number
+            """
+            track_rows = await self._db_service.execute_query_async(
+                tracks_query,
+                tuple(chunk),
+                f"find_tracks_for_{len(chunk)}_playlists"
+            )
+            for track_row in track_rows:
+                tracks_by_playlist[track_row["playlist_id"]].append(track_row)
+
+        return [
+            self._build_playlist_from_rows(row, tracks_by_playlist[row["id"]])
+            for row in playlist_rows
+        ]
+
     def _build_playlist_from_rows(self, playlist_row, track_rows) -> Playlist:
         """Build playlist domain entity from database rows.
 
@@ -577,10 +886,44 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             nfc_tag_id=playlist_row["nfc_tag_id"],
             path=playlist_row["path"],
             tracks=tracks,
+            track_count=self._optional_column(playlist_row, "track_count"),
+            total_duration_ms=self._optional_column(playlist_row, "total_duration_ms"),
         )
 
         return playlist
 
+    def _build_summaries(self, playlist_rows) -> List[PlaylistSummary]:
+        """Build track-free playlist summaries from playlist rows.
+
+        Args:
+            playlist_rows: SQLite playlist rows
+
+        Returns:
+            List of playlist summaries
+        """
+        return [
+            PlaylistSummary(
+                id=row["id"],
+                title=row["title"],
+                description=row["description"],
+                nfc_tag_id=row["nfc_tag_id"],
+                path=row["path"],
+                track_count=self._optional_column(row, "track_count") or 0,
+                total_duration_ms=self._optional_column(row, "total_duration_ms") or 0,
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in playlist_rows
+        ]
+
+    @staticmethod
+    def _optional_column(row, column: str):
+        """Read a column that may be missing on databases not yet migrated."""
+        try:
+            return row[column]
+        except (IndexError, KeyError):
+            return None
+
     @_handle_repository_errors("tracks")
     async def get_by_playlist(self, playlist_id: str) -> List[Track]:
         """Alias for get_tracks_by_playlist - used by TrackService.
@@ -602,15 +945,12 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             List of track domain entities
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         tracks_query = """
             SELECT * FROM tracks
             WHERE playlist_id = ?
             ORDER BY track_number
         """
-        track_rows = self._db_service.execute_query(
+        track_rows = await self._db_service.execute_query_async(
             tracks_query,
             (playlist_id,),
             f"get_tracks_by_playlist_{playlist_id}"
@@ -657,7 +997,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             True if deletion successful
         """
         delete_command = "DELETE FROM tracks WHERE playlist_id = ?"
-        affected_rows = self._db_service.execute_command(
+        affected_rows = await self._db_service.execute_command_async(
             delete_command,
             (playlist_id,),
             f"delete_tracks_by_playlist_{playlist_id}"
@@ -676,11 +1016,8 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             Track data dictionary or None if not found
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         track_query = "SELECT * FROM tracks WHERE id = ?"
-        track_row = self._db_service.execute_single(
+        track_row = await self._db_service.execute_single_async(
             track_query,
             (track_id,),
             f"get_track_by_id_{track_id}"
@@ -728,17 +1065,10 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             The ID of the created track
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         # Generate track ID if not provided
         track_id = track_data.get('id', str(uuid.uuid4()))
 
-        track_command = """
-            INSERT INTO tracks
-            (id, playlist_id, track_number, title, filename, file_path, duration_ms, artist, album, created_at, updated_at, play_count, server_seq)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0, 0)
-        """
+        track_command = _TRACK_INSERT_COMMAND
         track_params = (
             track_id,
             playlist_id,
@@ -751,7 +1081,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
             track_data.get('album'),
         )
 
-        self._db_service.execute_command(
+        await self._db_service.execute_command_async(
             track_command,
             track_params,
             f"add_track_{track_id}_to_playlist_{playlist_id}"
@@ -771,9 +1101,6 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             True if update successful
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         # Build UPDATE statement dynamically based on provided fields
         update_fields = []
         params = []
@@ -795,7 +1122,7 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         params.append(track_id)
 
         update_command = f"UPDATE tracks SET {', '.join(update_fields)} WHERE id = ?"
-        affected_rows = self._db_service.execute_command(
+        affected_rows = await self._db_service.execute_command_async(
             update_command,
             tuple(params),
             f"update_track_{track_id}"
@@ -818,11 +1145,8 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             True if deleted, False if not found
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         delete_command = "DELETE FROM tracks WHERE id = ?"
-        affected_rows = self._db_service.execute_command(
+        affected_rows = await self._db_service.execute_command_async(
             delete_command,
             (track_id,),
             f"delete_track_{track_id}"
@@ -847,15 +1171,11 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
         Returns:
             True if reordering successful
         """
-        import asyncio
-        await asyncio.sleep(0)
-
         if not track_orders:
             logger.warning("Empty track orders list provided")
             return False
 
-        # Prepare batch operations for atomic transaction
-        operations = []
+        params = []
         for order in track_orders:
             track_id = order.get('track_id')
             track_number = order.get('track_number')
@@ -864,23 +1184,21 @@ class PureSQLitePlaylistRepository(PlaylistRepositoryProtocol):
                 logger.warning(f"Invalid track order entry: {order}")
                 continue
 
-            update_command = """
-                UPDATE tracks
-                SET track_number = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ? AND playlist_id = ?
-            """
-            operations.append({
-                "query": update_command,
-                "params": (track_number, track_id, playlist_id),
-                "type": "command"
-            })
+            params.append((track_number, track_id, playlist_id))
 
-        if not operations:
+        if not params:
             logger.warning("No valid track orders to process")
             return False
 
-        # Execute all operations in a single transaction
-        self._db_service.execute_batch(operations, f"reorder_tracks_playlist_{playlist_id}")
+        update_command = """
+            UPDATE tracks
+            SET track_number = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND playlist_id = ?
+        """
+        await self._db_service.execute_batch_async(
+            [{"query": update_command, "params": params, "type": "many"}],
+            f"reorder_tracks_playlist_{playlist_id}"
+        )
 
-        logger.info(f"✅ Reordered {len(operations)} tracks in playlist {playlist_id}")
+        logger.info(f"✅ Reordered {len(params)} tracks in playlist {playlist_id}")
         return True
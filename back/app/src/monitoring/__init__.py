@@ -11,6 +11,9 @@ Uses lazy loading to avoid circular dependencies.
 from typing import Optional
 import logging as _logging
 
+from app.src.monitoring.core.latency_histogram import LatencyHistogram
+from app.src.monitoring.core.latency_tracer import LatencyTracer, get_latency_tracer
+
 # Lazy loaded references
 _ImprovedLogger = None
 _error_handler = None
@@ -78,5 +81,8 @@ __all__ = [
     "get_event_monitor",
     "shutdown_monitoring",
     "get_monitoring_statistics",
+    "LatencyHistogram",
+    "LatencyTracer",
+    "get_latency_tracer",
     # Monitoring config removed from public interface
 ]
@@ -0,0 +1,103 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""
+Lightweight latency histogram for runtime statistics.
+
+Keeps lifetime counters plus a bounded window of recent samples so that
+percentiles can be reported from health/status endpoints without unbounded
+memory growth. Safe to record from worker threads.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict
+
+
+class LatencyHistogram:
+    """Thread-safe rolling latency statistics in milliseconds."""
+
+    def __init__(self, window_size: int = 256):
+        """Initialize the histogram.
+
+        Args:
+            window_size: Number of recent samples kept for percentile computation
+        """
+        self._samples = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._last_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Record a single latency sample.
+
+        Args:
+            value_ms: Observed latency in milliseconds
+        """
+        with self._lock:
+            self._samples.append(value_ms)
+            self._count += 1
+            self._total_ms += value_ms
+            self._last_ms = value_ms
+            if value_ms > self._max_ms:
+                self._max_ms = value_ms
+
+    @property
+    def count(self) -> int:
+        """Total number of samples recorded."""
+        return self._count
+
+    def percentile(self, percent: float) -> float:
+        """Get a percentile over the recent sample window.
+
+        Args:
+            percent: Percentile in the 0-100 range
+
+        Returns:
+            Latency in milliseconds, 0.0 when no samples were recorded
+        """
+        with self._lock:
+            ordered = sorted(self._samples)
+        return self._percentile_of(ordered, percent)
+
+    @staticmethod
+    def _percentile_of(ordered, percent: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, max(0, round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a JSON-friendly summary of the histogram.
+
+        Returns:
+            Dictionary with count, average, max, last and p50/p95/p99 values
+        """
+        with self._lock:
+            ordered = sorted(self._samples)
+            count = self._count
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+            last_ms = self._last_ms
+
+        return {
+            "count": count,
+            "avg_ms": round(total_ms / count, 3) if count else 0.0,
+            "max_ms": round(max_ms, 3),
+            "last_ms": round(last_ms, 3),
+            "p50_ms": round(self._percentile_of(ordered, 50), 3),
+            "p95_ms": round(self._percentile_of(ordered, 95), 3),
+            "p99_ms": round(self._percentile_of(ordered, 99), 3),
+        }
+
+    def reset(self) -> None:
+        """Discard all recorded samples and counters."""
+        with self._lock:
+            self._samples.clear()
+            self._count = 0
+            self._total_ms = 0.0
+            self._max_ms = 0.0
+            self._last_ms = 0.0
@@ -0,0 +1,237 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""
+Lightweight end-to-end latency tracing.
+
+A trace carries a correlation id through the stages of one operation (such as
+a tag scan up to audio output). The current trace lives in a context variable,
+so it follows ``await`` and ``asyncio.create_task`` hand-offs without being
+passed explicitly; code outside a trace pays only a context variable lookup.
+Finished traces feed per-stage histograms over the last N traces.
+"""
+
+import contextvars
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.src.monitoring.core.latency_histogram import LatencyHistogram
+
+DEFAULT_MAX_TRACES = 100
+
+TRACE_STATUS_OK = "ok"
+
+_current_trace: contextvars.ContextVar[Optional["LatencyTrace"]] = contextvars.ContextVar(
+    "latency_trace", default=None
+)
+
+
+@dataclass
+class LatencyTrace:
+    """Timings collected for one traced operation."""
+
+    name: str
+    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started_at: float = field(default_factory=time.perf_counter)
+    wall_time: float = field(default_factory=time.time)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # stage -> {"offset_ms", "duration_ms"}; offsets are relative to started_at
+    spans: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # stage -> offset in ms of an instant event
+    marks: Dict[str, float] = field(default_factory=dict)
+    total_ms: Optional[float] = None
+    status: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the trace was finished."""
+        return self.status is not None
+
+    def elapsed_ms(self, at: Optional[float] = None) -> float:
+        """Milliseconds since the trace started."""
+        return ((time.perf_counter() if at is None else at) - self.started_at) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON-friendly view of the trace."""
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "timestamp": self.wall_time,
+            "status": self.status,
+            "total_ms": round(self.total_ms, 3) if self.total_ms is not None else None,
+            "attributes": dict(self.attributes),
+            "spans": {
+                stage: {key: round(value, 3) for key, value in span.items()}
+                for stage, span in self.spans.items()
+            },
+            "marks": {stage: round(offset, 3) for stage, offset in self.marks.items()},
+        }
+
+
+class LatencyTracer:
+    """Collects traces and keeps per-stage statistics over recent traces."""
+
+    def __init__(self, max_traces: int = DEFAULT_MAX_TRACES):
+        """Initialize the tracer.
+
+        Args:
+            max_traces: Number of finished traces kept for statistics
+        """
+        self._max_traces = max(1, max_traces)
+        self._recent: deque = deque(maxlen=self._max_traces)
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, int] = {}
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._totals = LatencyHistogram(window_size=self._max_traces)
+
+    # --- Trace lifecycle ---
+
+    @contextmanager
+    def trace(self, name: str, started_at: Optional[float] = None, **attributes) -> Iterator[LatencyTrace]:
+        """Start a trace and make it current for the enclosed block.
+
+        Tasks created inside the block inherit the trace. Leaving the block
+        does not finish it; the last stage calls :meth:`finish`.
+
+        Args:
+            name: Operation name
+            started_at: ``time.perf_counter()`` value at which the operation
+                began, when it predates this call
+            **attributes: Extra values reported with the trace
+        """
+        trace = LatencyTrace(name=name, attributes=attributes)
+        if started_at is not None:
+            trace.started_at = started_at
+        token = _current_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _current_trace.reset(token)
+
+    @contextmanager
+    def ensure_trace(self, name: str, **attributes) -> Iterator[LatencyTrace]:
+        """Join the current unfinished trace, or start one for the block."""
+        current = self.current()
+        if current is not None:
+            yield current
+            return
+        with self.trace(name, **attributes) as trace:
+            yield trace
+
+    def current(self) -> Optional[LatencyTrace]:
+        """Get the unfinished trace of the current context, if any."""
+        trace = _current_trace.get()
+        if trace is None or trace.finished:
+            return None
+        return trace
+
+    def finish(self, status: str = TRACE_STATUS_OK, trace: Optional[LatencyTrace] = None,
+               end_mark: Optional[str] = None) -> Optional[LatencyTrace]:
+        """Finish a trace and fold it into the statistics.
+
+        Only traces finished with ``TRACE_STATUS_OK`` feed the histograms;
+        other statuses (lookups that found nothing, for instance) are counted.
+
+        Args:
+            status: Outcome of the operation
+            trace: Trace to finish; defaults to the current one
+            end_mark: Mark whose offset is the end of the operation, if it was
+                recorded; otherwise the trace ends now
+        """
+        trace = trace or self.current()
+        if trace is None or trace.finished:
+            return None
+
+        end_offset = trace.marks.get(end_mark) if end_mark else None
+        trace.total_ms = end_offset if end_offset is not None else trace.elapsed_ms()
+        trace.status = status
+
+        with self._lock:
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+            self._recent.append(trace)
+            if status == TRACE_STATUS_OK:
+                self._totals.record(trace.total_ms)
+                for stage, span in trace.spans.items():
+                    self._stage_histogram(stage).record(span["duration_ms"])
+        return trace
+
+    # --- Stages ---
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as a stage of the current trace."""
+        trace = self.current()
+        if trace is None:
+            yield
+            return
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_span(stage, (time.perf_counter() - started_at) * 1000,
+                             trace=trace, offset_ms=trace.elapsed_ms(started_at))
+
+    def record_span(self, stage: str, duration_ms: float, trace: Optional[LatencyTrace] = None,
+                    offset_ms: Optional[float] = None) -> None:
+        """Record a stage whose duration was measured elsewhere."""
+        trace = trace or self.current()
+        if trace is None:
+            return
+        if offset_ms is None:
+            offset_ms = trace.elapsed_ms() - duration_ms
+        trace.spans[stage] = {"offset_ms": offset_ms, "duration_ms": duration_ms}
+
+    def mark(self, stage: str) -> None:
+        """Record an instant event of the current trace."""
+        trace = self.current()
+        if trace is not None:
+            trace.marks[stage] = trace.elapsed_ms()
+
+    # --- Reporting ---
+
+    def get_statistics(self, limit: int = 10) -> Dict[str, Any]:
+        """Get percentiles over recent traces.
+
+        Args:
+            limit: Number of most recent traces included in full
+        """
+        with self._lock:
+            recent: List[LatencyTrace] = list(self._recent)[-limit:] if limit > 0 else []
+            stages = {stage: histogram.snapshot() for stage, histogram in self._stages.items()}
+            statuses = dict(self._statuses)
+        return {
+            "window": self._max_traces,
+            "statuses": statuses,
+            "total_ms": self._totals.snapshot(),
+            "stages": stages,
+            "recent": [trace.to_dict() for trace in reversed(recent)],
+        }
+
+    def reset(self) -> None:
+        """Drop all traces and statistics."""
+        with self._lock:
+            self._recent.clear()
+            self._statuses.clear()
+            self._stages.clear()
+            self._totals.reset()
+
+    def _stage_histogram(self, stage: str) -> LatencyHistogram:
+        histogram = self._stages.get(stage)
+        if histogram is None:
+            histogram = LatencyHistogram(window_size=self._max_traces)
+            self._stages[stage] = histogram
+        return histogram
+
+
+_tracer = LatencyTracer()
+
+
+def get_latency_tracer() -> LatencyTracer:
+    """Get the process-wide latency tracer."""
+    return _tracer
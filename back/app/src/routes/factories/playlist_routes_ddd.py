@@ -144,7 +144,8 @@ class PlaylistRoutesDDD:
             self.progress_service = TrackProgressService(
                 state_manager=self.state_manager,
                 audio_controller=playback_coordinator,
-                interval=0.2  # 200ms updates
+                interval=0.2,  # 200ms updates
+                event_bus=getattr(playback_coordinator, "audio_event_bus", None),
             )
             logger.info("✅ TrackProgressService initialized for auto-advance")
         except Exception as e:
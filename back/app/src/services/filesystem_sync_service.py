@@ -20,6 +20,7 @@ from datetime import datetime, timezone
 import logging
 
 from app.src.services.error.unified_error_decorator import handle_service_errors
+from app.src.services.transcoding_service import get_transcoding_service
 from app.src.services.upload_service import UploadService
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,15 @@ class FilesystemSyncService:
         self.upload_folder = Path(self.config.upload_folder)
         self._sync_lock = threading.RLock()
 
+    @classmethod
+    def _is_audio_file(cls, path: Path) -> bool:
+        """Whether a path is a track; hidden files such as cached renditions are not."""
+        return (
+            path.is_file()
+            and not path.name.startswith(".")
+            and path.suffix.lower() in cls.SUPPORTED_AUDIO_EXTENSIONS
+        )
+
     @handle_service_errors("filesystem_sync")
     async def create_playlist_from_folder(
         self, folder_path: Path, title: Optional[str] = None
@@ -72,6 +82,25 @@ class FilesystemSyncService:
         Returns:
             ID of the created playlist or None if an error occurred
         """
+        playlist_data = self._build_playlist_data(folder_path, UploadService(self.config), title)
+        if playlist_data is None:
+            return None
+        # Create the playlist in the repository
+        return await self.repository.create_playlist(playlist_data)
+
+    def _build_playlist_data(
+        self, folder_path: Path, upload_service: UploadService, title: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build playlist data, with one track per audio file, from a folder.
+
+        Args:
+            folder_path: Path to the folder
+            upload_service: Service used to extract audio metadata
+            title: Optional title for the playlist (default: folder name)
+
+        Returns:
+            Playlist data or None if the folder has no audio files
+        """
         # Check if the folder exists and is a directory
         if not folder_path.exists() or not folder_path.is_dir():
             logger.error(f"Folder does not exist: {folder_path}")
@@ -80,7 +109,7 @@ class FilesystemSyncService:
         audio_files = [
             f
             for f in folder_path.iterdir()
-            if f.is_file() and f.suffix.lower() in self.SUPPORTED_AUDIO_EXTENSIONS
+            if self._is_audio_file(f)
         ]
         # Check if there are any audio files
         if not audio_files:
@@ -98,7 +127,6 @@ class FilesystemSyncService:
             "tracks": [],
         }
         # Use UploadService to extract metadata for each audio file
-        upload_service = UploadService(self.config)
         for i, file_path in enumerate(sorted(audio_files), 1):
             metadata = upload_service.extract_metadata(file_path)
             # Convert duration from seconds to milliseconds for consistency
@@ -114,8 +142,7 @@ class FilesystemSyncService:
                 "play_counter": 0,
             }
             playlist_data["tracks"].append(track)
-        # Create the playlist in the repository
-        return await self.repository.create_playlist(playlist_data)
+        return playlist_data
 
     @handle_service_errors("filesystem_sync")
     async def update_playlist_tracks(
@@ -145,7 +172,7 @@ class FilesystemSyncService:
         audio_files = [
             f
             for f in folder_path.iterdir()
-            if f.is_file() and f.suffix.lower() in self.SUPPORTED_AUDIO_EXTENSIONS
+            if self._is_audio_file(f)
         ]
         # Create dictionaries for comparison
         existing_tracks = {t["filename"]: t for t in playlist.get("tracks", [])}
@@ -240,6 +267,8 @@ class FilesystemSyncService:
                 )
             else:
                 logger.warning("Skipping new playlists due to timeout")
+            # New or replaced files get their renditions in the background
+            get_transcoding_service().schedule_folder(self.upload_folder)
             elapsed = time.time() - start_time
             logger.info(f"Playlist sync completed in {elapsed:.2f}s",
                 extra=stats,
@@ -273,7 +302,7 @@ class FilesystemSyncService:
                         logger.warning(f"Partial scan of {rel_path} due to timeout",
                         )
                         break
-                    if f.is_file() and f.suffix.lower() in self.SUPPORTED_AUDIO_EXTENSIONS:
+                    if self._is_audio_file(f):
                         audio_files.append(f)
 
                 # Add to result if audio files were found
@@ -336,8 +365,10 @@ class FilesystemSyncService:
             stats: Dictionary of statistics to update
         """
         start_time = time.time()
+        upload_service = UploadService(self.config)
+        new_playlists = []
 
-        for path, audio_files in disk_playlists.items():
+        for path in disk_playlists:
             if time.time() - start_time > self.SYNC_TOTAL_TIMEOUT:
                 logger.warning("Add timeout reached, stopping additions")
                 break
@@ -357,16 +388,25 @@ class FilesystemSyncService:
                 )
                 continue
 
-            # If the playlist doesn't exist in the database, create it
-            if True:  # Keep the same indentation level for the rest of the code
-                try:
-                    folder_path = Path(self.upload_folder.parent / path)
-                    playlist_id = await self.create_playlist_from_folder(folder_path)
-                    if playlist_id:
-                        stats["playlists_added"] += 1
-                        stats["tracks_added"] += len(audio_files)
-                        logger.info(f"Created new playlist from folder: {path} (ID: {playlist_id})",
-                        )
-                except (OSError, IOError, PermissionError, ValueError) as e:
-                    logger.error(f"Error creating playlist from folder {path}: {str(e)}",
-                    )
+            # If the playlist doesn't exist in the database, prepare it
+            try:
+                folder_path = Path(self.upload_folder.parent / path)
+                playlist_data = self._build_playlist_data(folder_path, upload_service)
+                if playlist_data:
+                    new_playlists.append((path, playlist_data))
+            except (OSError, IOError, PermissionError, ValueError) as e:
+                logger.error(f"Error creating playlist from folder {path}: {str(e)}",
+                )
+
+        if not new_playlists:
+            return
+
+        # Write every new playlist and its tracks in a single transaction
+        playlist_ids = await self.repository.bulk_create_playlists(
+            [playlist_data for _, playlist_data in new_playlists]
+        )
+        for (path, playlist_data), playlist_id in zip(new_playlists, playlist_ids):
+            stats["playlists_added"] += 1
+            stats["tracks_added"] += len(playlist_data["tracks"])
+            logger.info(f"Created new playlist from folder: {path} (ID: {playlist_id})",
+            )
@@ -81,6 +81,8 @@ class UnifiedSerializationService:
                 "created_at": getattr(playlist, "created_at", None),
                 "updated_at": getattr(playlist, "updated_at", None),
                 "tracks": getattr(playlist, "tracks", []),
+                "track_count": getattr(playlist, "track_count", None),
+                "total_duration_ms": getattr(playlist, "total_duration_ms", None),
             }
         else:
             # Database row or tuple
@@ -109,11 +111,17 @@ class UnifiedSerializationService:
                 ]
             else:
                 result["tracks"] = []
-            # Calculate total duration if requested
+            # Calculate total duration if requested, preferring persisted aggregates
             if calculate_duration:
-                total_duration_ms = sum(track.get("duration_ms", 0) or 0 for track in result["tracks"])
+                track_count = playlist_data.get("track_count")
+                total_duration_ms = playlist_data.get("total_duration_ms")
+                if track_count is None or total_duration_ms is None:
+                    total_duration_ms = sum(
+                        track.get("duration_ms", 0) or 0 for track in result["tracks"]
+                    )
+                    track_count = len(result["tracks"])
                 result["total_duration_ms"] = total_duration_ms
-                result["track_count"] = len(result["tracks"])
+                result["track_count"] = track_count
         # Format-specific adjustments
         if format == UnifiedSerializationService.FORMAT_API:
             # API format includes additional metadata required by frontend
@@ -16,12 +16,22 @@ from contextlib import asynccontextmanager
 
 from app.src.monitoring import get_logger
 from app.src.domain.audio.engine.state_manager import StateManager
+from app.src.domain.audio.events.audio_events import (
+    PlaybackStateChangedEvent,
+    TrackEndedEvent,
+    TrackStartedEvent,
+)
 from app.src.common.socket_events import StateEventType
 from app.src.config.socket_config import socket_config
 from app.src.services.error.unified_error_decorator import handle_service_errors
 
 logger = get_logger(__name__)
 
+# Events that can change what the progress loop should report
+_ACTIVITY_EVENTS = (TrackStartedEvent, TrackEndedEvent, PlaybackStateChangedEvent)
+# Longest idle wait between status checks when playback events are available
+IDLE_STATUS_CHECK_INTERVAL = 5.0
+
 
 class TrackProgressService:
     """Service for lightweight track position updates via WebSocket events.
@@ -29,10 +39,17 @@ class TrackProgressService:
     This service monitors playback position and emits state:track_position events
     at high frequency (200ms default) for smooth frontend playback tracking.
     Uses the new lightweight position format for minimal bandwidth and latency.
+
+    With an audio event bus, the loop idles while nothing is playing and is
+    woken by track and playback state events instead of polling.
     """
 
     def __init__(
-        self, state_manager: StateManager, audio_controller: Optional[Union['AudioController', 'PlaybackCoordinator']] = None, interval: Optional[float] = None
+        self,
+        state_manager: StateManager,
+        audio_controller: Optional[Union['AudioController', 'PlaybackCoordinator']] = None,
+        interval: Optional[float] = None,
+        event_bus=None,
     ):
         """Initialize the track progress service.
 
@@ -40,6 +57,7 @@ class TrackProgressService:
             state_manager: StateManager instance for broadcasting events
             audio_controller: Audio controller or PlaybackCoordinator for getting playback status
             interval: Progress update interval in seconds (default: from socket_config)
+            event_bus: Audio event bus publishing playback events (optional)
         """
         self.state_manager = state_manager
         self.audio_controller = audio_controller
@@ -52,6 +70,8 @@ class TrackProgressService:
         self._max_consecutive_errors = 10
         self._recovery_delay = 5.0  # seconds
         self._last_track_end_time = 0  # Track last auto-advance to prevent duplicates
+        self._event_bus = event_bus
+        self._activity: Optional[asyncio.Event] = None
 
         # Diagnostic tracking - will be reset periodically to prevent memory leaks
         self._diagnostic_reset_interval = 100  # Reset every 100 iterations (100 seconds at 1000ms)
@@ -76,6 +96,11 @@ class TrackProgressService:
             return
 
         self._running = True
+        if self._event_bus is not None:
+            self._activity = asyncio.Event()
+            self._event_bus.bind_loop(asyncio.get_running_loop())
+            for event_type in _ACTIVITY_EVENTS:
+                self._event_bus.subscribe(event_type, self._on_playback_activity)
         self._task = asyncio.create_task(self._progress_loop())
         logger.info(f"✅ TrackProgressService STARTED - interval: {self.interval}s (should emit every {int(self.interval*1000)}ms)",
         )
@@ -89,6 +114,10 @@ class TrackProgressService:
 
         logger.info("Stopping TrackProgressService...")
         self._running = False
+        if self._event_bus is not None:
+            for event_type in _ACTIVITY_EVENTS:
+                self._event_bus.unsubscribe(event_type, self._on_playback_activity)
+            self._activity = None
 
         if self._task:
             self._task.cancel()
@@ -114,6 +143,9 @@ class TrackProgressService:
 
         while self._running:
             loop_counter += 1
+            if self._activity is not None:
+                # Events from here on wake the idle wait below
+                self._activity.clear()
 
             # Get current playback status first
             if self.audio_controller:
@@ -141,7 +173,25 @@ class TrackProgressService:
                 )
 
             # Sleep for the configured interval (critical!)
-            await asyncio.sleep(self.interval)
+            if last_playing_state or self._activity is None:
+                await asyncio.sleep(self.interval)
+            else:
+                await self._wait_for_activity()
+
+    def _on_playback_activity(self, event) -> None:
+        """Wake the progress loop on track and playback state events."""
+        if self._activity is not None:
+            self._activity.set()
+
+    async def _wait_for_activity(self) -> None:
+        """Idle until a playback event arrives, with a periodic safety check."""
+        activity = self._activity
+        if activity is None:
+            return
+        try:
+            await asyncio.wait_for(activity.wait(), timeout=IDLE_STATUS_CHECK_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
 
     @handle_service_errors("track_progress")
     async def _emit_progress(self):
@@ -425,6 +475,16 @@ class TrackProgressService:
 
             # Check if track has ended (with small buffer for timing precision)
             if current_time >= duration - 0.1:
+                # The coordinator advances on TrackEndedEvent itself
+                track_end_events_enabled = getattr(self.audio_controller, "track_end_events_enabled", None)
+                if callable(track_end_events_enabled) and track_end_events_enabled() is True:
+                    return
+
+                # A gaplessly queued track starts on its own; restarting would add a gap
+                is_next_track_queued = getattr(self.audio_controller, "is_next_track_queued", None)
+                if callable(is_next_track_queued) and is_next_track_queued() is True:
+                    return
+
                 # Prevent duplicate auto-advance within 2 seconds
                 current_timestamp = time.time()
                 if current_timestamp - self._last_track_end_time < 2.0:
@@ -0,0 +1,463 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Background transcoding cache for audio formats that are costly to decode.
+
+FLAC, M4A and high-bitrate files are converted with ffmpeg into an MP3
+rendition stored next to the original as a hidden ``.<name>.playback.mp3``
+file. Conversions run on a bounded pool, so at most ``transcode_workers``
+ffmpeg processes decode at once. Playback picks the rendition while it is
+newer than the original, and once a batch of conversions is done,
+renditions beyond the disk quota are evicted least recently played first.
+Sources whose rendition was evicted or could not be built are not converted
+again until the original file changes.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RENDITION_SUFFIX = ".playback.mp3"
+PARTIAL_SUFFIX = ".partial"
+# Formats whose bitrate decides whether a rendition is worth it
+BITRATE_CHECKED_FORMATS = {"mp3", "ogg"}
+FFMPEG_TIMEOUT = 600.0
+
+
+def rendition_path(file_path: Any) -> Path:
+    """Path of the rendition kept next to an original file."""
+    path = Path(file_path)
+    return path.with_name(f".{path.name}{RENDITION_SUFFIX}")
+
+
+def is_rendition(file_path: Any) -> bool:
+    """Whether a path names a cached rendition."""
+    name = Path(file_path).name
+    return name.startswith(".") and name.endswith(RENDITION_SUFFIX)
+
+
+def _original_path(rendition: Path) -> Path:
+    return rendition.with_name(rendition.name[1:-len(RENDITION_SUFFIX)])
+
+
+class TranscodingService:
+    """Converts costly files to MP3 renditions in the background.
+
+    Scheduling never blocks the caller: deciding whether a file needs a
+    rendition, converting it and enforcing the quota all happen on the pool.
+    """
+
+    def __init__(
+        self,
+        upload_folder: Optional[str] = None,
+        audio_config: Any = None,
+        metadata_cache: Any = None,
+        transcoder: Optional[Callable[[Path, Path], bool]] = None,
+    ):
+        """Initialize the service; the pool starts on the first conversion.
+
+        Args:
+            upload_folder: Folder scanned for renditions; defaults to config
+            audio_config: Audio configuration; defaults to config.audio
+            metadata_cache: Audio metadata cache used for bitrates; defaults
+                to the shared one
+            transcoder: Converts a source into an MP3 target; defaults to ffmpeg
+        """
+        from app.src.config import config as global_config
+
+        self._config = audio_config or global_config.audio
+        self._upload_folder = Path(upload_folder or global_config.upload_folder)
+        self._metadata_cache = metadata_cache
+        self._ffmpeg = None if transcoder else shutil.which("ffmpeg")
+        self._transcoder = transcoder or self._transcode_with_ffmpeg
+        self._available = transcoder is not None or self._ffmpeg is not None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._last_played: Dict[str, float] = {}
+        # Source path -> (size, mtime) of originals not to convert again
+        self._declined: Dict[str, Tuple[int, float]] = {}
+        self._closed = False
+        # Set by a conversion; the quota is enforced when the pool drains
+        self._quota_dirty = False
+        self._disk_usage: Optional[int] = None
+        self._rendition_count: Optional[int] = None
+        self._last_error: Optional[str] = None
+        self._counts = {
+            "scheduled": 0,
+            "transcoded": 0,
+            "skipped": 0,
+            "failed": 0,
+            "evicted": 0,
+            "playback_hits": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether conversions can run."""
+        return bool(self._config.transcode_enabled) and self._available
+
+    def needs_rendition(self, file_path: Any) -> bool:
+        """Whether a file is costly enough to decode to deserve a rendition."""
+        path = Path(file_path)
+        if is_rendition(path) or not path.is_file():
+            return False
+        extension = path.suffix.lower().lstrip(".")
+        if extension in self._config.transcode_formats:
+            return True
+        if extension not in BITRATE_CHECKED_FORMATS:
+            return False
+        cache = self._metadata_cache
+        if cache is None:
+            from app.src.infrastructure.adapters.audio.audio_metadata_cache import (
+                get_audio_metadata_cache,
+            )
+
+            cache = get_audio_metadata_cache()
+        metadata = cache.get(str(path))
+        bitrate = metadata.bitrate if metadata else None
+        return bool(bitrate) and bitrate > self._config.transcode_max_bitrate * 1000
+
+    def get_rendition(self, file_path: Any) -> Optional[Path]:
+        """Get the rendition of a file if it is newer than the original."""
+        rendition = rendition_path(file_path)
+        try:
+            if rendition.stat().st_mtime >= Path(file_path).stat().st_mtime:
+                return rendition
+        except OSError:
+            pass
+        return None
+
+    def playback_path(self, file_path: Optional[str]) -> Optional[str]:
+        """Get the path to hand to the audio backend for a track.
+
+        Args:
+            file_path: Path of the original file
+
+        Returns:
+            The rendition path when a current one exists, otherwise file_path
+        """
+        if not file_path or is_rendition(file_path):
+            return file_path
+        rendition = self.get_rendition(file_path)
+        if rendition is None:
+            return file_path
+        with self._lock:
+            self._last_played[str(rendition)] = time.time()
+            self._counts["playback_hits"] += 1
+        logger.debug(f"🎞️ Playing cached rendition of {Path(file_path).name}")
+        return str(rendition)
+
+    def schedule(self, file_paths: Iterable[Any]) -> int:
+        """Queue files for conversion; files that need none are skipped on the pool.
+
+        Returns:
+            Number of files queued
+        """
+        if not self.enabled:
+            return 0
+        queued = 0
+        with self._lock:
+            for file_path in file_paths:
+                source = Path(file_path)
+                key = str(source)
+                if self._closed or key in self._pending or is_rendition(source):
+                    continue
+                self._pending[key] = self._get_executor().submit(self._process, source)
+                self._counts["scheduled"] += 1
+                queued += 1
+        return queued
+
+    def schedule_folder(self, folder: Optional[Any] = None) -> bool:
+        """Scan a folder on the pool and queue every audio file in it.
+
+        Args:
+            folder: Folder to scan; defaults to the upload folder
+
+        Returns:
+            bool: True if the scan was queued
+        """
+        if not self.enabled:
+            return False
+        root = Path(folder) if folder else self._upload_folder
+        key = f"scan:{root}"
+        with self._lock:
+            if self._closed or key in self._pending:
+                return False
+            self._pending[key] = self._get_executor().submit(self._scan, root, key)
+        return True
+
+    def enforce_quota(self) -> int:
+        """Remove orphaned renditions, then evict the least recently played beyond the quota.
+
+        Returns:
+            Number of renditions removed
+        """
+        evicted = 0
+        kept: List[Tuple[float, int, Path]] = []
+        for rendition, size, modified in self._list_renditions():
+            if not _original_path(rendition).exists():
+                evicted += self._remove(rendition)
+                continue
+            with self._lock:
+                last_played = self._last_played.get(str(rendition), modified)
+            kept.append((last_played, size, rendition))
+
+        total = sum(size for _, size, _ in kept)
+        remaining = len(kept)
+        quota = self._config.transcode_quota_mb * 1024 * 1024
+        if quota > 0 and total > quota:
+            for _, size, rendition in sorted(kept, key=lambda entry: entry[0]):
+                if total <= quota:
+                    break
+                if self._remove(rendition):
+                    # Otherwise the next folder scan converts it again
+                    self._decline(_original_path(rendition))
+                    evicted += 1
+                    remaining -= 1
+                    total -= size
+
+        with self._lock:
+            self._disk_usage = total
+            self._rendition_count = remaining
+        if evicted:
+            logger.info(f"🎞️ Evicted {evicted} cached renditions, {total / 1048576:.1f} MB in use")
+        return evicted
+
+    def clear(self) -> int:
+        """Remove every cached rendition.
+
+        Returns:
+            Number of renditions removed
+        """
+        removed = sum(self._remove(rendition) for rendition, _, _ in self._list_renditions())
+        with self._lock:
+            self._disk_usage = 0
+            self._rendition_count = 0
+        return removed
+
+    def wait(self, timeout: float = 30.0) -> bool:
+        """Wait until queued scans and conversions are done.
+
+        Returns:
+            bool: True if nothing is left pending
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = list(self._pending.values())
+            remaining = deadline - time.monotonic()
+            if not pending:
+                return True
+            if remaining <= 0:
+                return False
+            wait_futures(pending, timeout=remaining)
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop conversions not yet started."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get conversion counters and the disk use measured at the last quota check."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "workers": self._config.transcode_workers,
+                "pending": len(self._pending),
+                "quota_mb": self._config.transcode_quota_mb,
+                "disk_usage_mb": (
+                    round(self._disk_usage / 1048576, 2) if self._disk_usage is not None else None
+                ),
+                "renditions": self._rendition_count,
+                "last_error": self._last_error,
+                **self._counts,
+            }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, self._config.transcode_workers),
+                thread_name_prefix="transcode",
+            )
+        return self._executor
+
+    def _scan(self, root: Path, key: str) -> None:
+        try:
+            candidates = set(self._config.transcode_formats) | BITRATE_CHECKED_FORMATS
+            sources = [
+                Path(directory) / name
+                for directory, _, names in os.walk(root)
+                for name in names
+                if not name.startswith(".") and Path(name).suffix.lower().lstrip(".") in candidates
+            ]
+            self.schedule(sources)
+        except Exception as e:
+            logger.warning(f"🎞️ Transcoding scan of {root} failed: {e}")
+        finally:
+            self._finish(key)
+
+    def _process(self, source: Path) -> None:
+        try:
+            if (
+                self._is_declined(source)
+                or self.get_rendition(source) is not None
+                or not self.needs_rendition(source)
+            ):
+                with self._lock:
+                    self._counts["skipped"] += 1
+                return
+            if self._transcode(source):
+                with self._lock:
+                    self._quota_dirty = True
+            else:
+                self._decline(source)
+        except Exception as e:
+            logger.warning(f"🎞️ Transcoding of {source.name} failed: {e}")
+            with self._lock:
+                self._counts["failed"] += 1
+                self._last_error = str(e)
+            self._decline(source)
+        finally:
+            self._finish(str(source))
+
+    def _finish(self, key: str) -> None:
+        """Drop a finished job, enforcing the quota once the last job of a batch ends.
+
+        The quota check walks the whole upload tree, so a library sync that
+        converts many files pays for it once instead of once per file.
+        """
+        with self._lock:
+            enforce = self._quota_dirty and list(self._pending) == [key]
+            if enforce:
+                self._quota_dirty = False
+        try:
+            if enforce:
+                self.enforce_quota()
+        except Exception as e:
+            logger.warning(f"🎞️ Rendition quota check failed: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _transcode(self, source: Path) -> bool:
+        target = rendition_path(source)
+        partial = target.with_name(target.name + PARTIAL_SUFFIX)
+        started = time.monotonic()
+        try:
+            if self._transcoder(source, partial) and partial.is_file() and partial.stat().st_size > 0:
+                # Playback never sees a half-written rendition
+                os.replace(partial, target)
+                with self._lock:
+                    self._counts["transcoded"] += 1
+                logger.info(
+                    f"🎞️ Cached rendition of {source.name} in {time.monotonic() - started:.1f}s"
+                )
+                return True
+            with self._lock:
+                self._counts["failed"] += 1
+                self._last_error = f"no output for {source.name}"
+            return False
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+    def _transcode_with_ffmpeg(self, source: Path, target: Path) -> bool:
+        command = [
+            self._ffmpeg, "-nostdin", "-loglevel", "error", "-y",
+            "-i", str(source),
+            "-vn", "-map_metadata", "0",
+            "-codec:a", "libmp3lame", "-b:a", f"{self._config.transcode_bitrate}k",
+            "-f", "mp3", str(target),
+        ]
+        nice = shutil.which("nice")
+        if nice:
+            # Keep playback and NFC ahead of the conversion on a single core
+            command = [nice, "-n", "10"] + command
+        result = subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=FFMPEG_TIMEOUT,
+        )
+        if result.returncode != 0:
+            error = result.stderr.decode(errors="replace").strip()
+            with self._lock:
+                self._last_error = error[-500:] or f"ffmpeg exited with {result.returncode}"
+            return False
+        return True
+
+    def _decline(self, source: Path) -> None:
+        """Skip a source in later scans until the original changes."""
+        try:
+            stat = source.stat()
+        except OSError:
+            return
+        with self._lock:
+            self._declined[str(source)] = (stat.st_size, stat.st_mtime)
+
+    def _is_declined(self, source: Path) -> bool:
+        with self._lock:
+            declined = self._declined.get(str(source))
+        if declined is None:
+            return False
+        try:
+            stat = source.stat()
+        except OSError:
+            return False
+        return declined == (stat.st_size, stat.st_mtime)
+
+    def _list_renditions(self) -> List[Tuple[Path, int, float]]:
+        renditions = []
+        if not self._upload_folder.exists():
+            return renditions
+        for directory, _, names in os.walk(self._upload_folder):
+            for name in names:
+                if not is_rendition(name):
+                    continue
+                path = Path(directory) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                renditions.append((path, stat.st_size, stat.st_mtime))
+        return renditions
+
+    def _remove(self, rendition: Path) -> int:
+        try:
+            rendition.unlink()
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.warning(f"🎞️ Could not remove rendition {rendition}: {e}")
+            return 0
+        with self._lock:
+            self._last_played.pop(str(rendition), None)
+            self._counts["evicted"] += 1
+        return 1
+
+
+_shared_service: Optional[TranscodingService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_transcoding_service() -> TranscodingService:
+    """Get the process-wide transcoding service."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = TranscodingService()
+        return _shared_service
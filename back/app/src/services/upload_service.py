@@ -12,11 +12,10 @@ upload workflows for integration with playlist systems.
 from pathlib import Path
 from typing import Dict, Tuple
 
-from mutagen import File as MutagenFile
-from mutagen.easyid3 import EasyID3
 from werkzeug.utils import secure_filename
 
 from app.src.infrastructure.error_handling.unified_error_handler import InvalidFileError
+from app.src.infrastructure.adapters.audio.audio_metadata_cache import get_audio_metadata_cache
 import logging
 from app.src.services.error.unified_error_decorator import handle_service_errors
 
@@ -31,13 +30,17 @@ class UploadService:
     integration.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, metadata_cache=None):
         """
         Initialize the UploadService with application config.
+
+        Args:     config: Application config.     metadata_cache: Audio metadata
+        cache; defaults to the shared one.
         """
         self.upload_folder = Path(config.upload_folder)
         self.allowed_extensions = set(config.upload_allowed_extensions)
         self.max_file_size = config.upload_max_size
+        self.metadata_cache = metadata_cache or get_audio_metadata_cache()
 
     def _allowed_file(self, filename: str) -> bool:
         """
@@ -66,14 +69,14 @@ class UploadService:
 
         Returns:     Dictionary with metadata fields: title, artist, album, duration.
         """
-        audio = MutagenFile(str(file_path), easy=True)
+        audio = self.metadata_cache.get(str(file_path))
         if audio is None:
-            audio = EasyID3(str(file_path))
+            raise InvalidFileError(f"Could not read audio metadata from {Path(file_path).name}")
         metadata = {
-            "title": audio.get("title", [Path(file_path).stem])[0],
-            "artist": audio.get("artist", ["Unknown"])[0],
-            "album": audio.get("album", ["Unknown"])[0],
-            "duration": audio.info.length if hasattr(audio.info, "length") else 0,
+            "title": audio.title or Path(file_path).stem,
+            "artist": audio.artist or "Unknown",
+            "album": audio.album or "Unknown",
+            "duration": audio.duration or 0,
         }
         return metadata
 
@@ -42,9 +42,12 @@ def decode_cursor(cursor: str) -> Tuple[Optional[str], Optional[str]]:
     try:
         cursor_json = base64.b64decode(cursor.encode("ascii")).decode("utf-8")
         cursor_data = json.loads(cursor_json)
-        return cursor_data.get("updated_at"), cursor_data.get("id")
-    except (ValueError, json.JSONDecodeError, UnicodeDecodeError):
+        updated_at, playlist_id = cursor_data["updated_at"], cursor_data["id"]
+    except (ValueError, json.JSONDecodeError, UnicodeDecodeError, AttributeError, TypeError, KeyError):
         return None, None
+    if updated_at is None or playlist_id is None:
+        return None, None
+    return updated_at, playlist_id
 
 
 def compute_playlist_aggregates(tracks: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -95,8 +98,17 @@ def create_playlist_index_item(
     Returns:
         Playlist index item dictionary
     """
-    tracks = playlist_data.get("tracks", [])
-    aggregates = compute_playlist_aggregates(tracks)
+    # Persisted aggregates avoid walking the tracks
+    if (
+        playlist_data.get("track_count") is not None
+        and playlist_data.get("total_duration_ms") is not None
+    ):
+        aggregates = {
+            "track_count": playlist_data["track_count"],
+            "total_duration_ms": playlist_data["total_duration_ms"],
+        }
+    else:
+        aggregates = compute_playlist_aggregates(playlist_data.get("tracks", []))
 
     # Ensure updated_at is present, use created_at or current time as fallback
     updated_at = playlist_data.get("updated_at") or playlist_data.get("created_at")
@@ -44,11 +44,13 @@ def create_playback_coordinator(socketio=None):
     if audio_domain_container.is_initialized:
         audio_backend = audio_domain_container.backend
         logger.info(f"✅ Creating PlaybackCoordinator with backend: {type(audio_backend).__name__}")
-        return PlaybackCoordinator(
+        coordinator = PlaybackCoordinator(
             audio_backend,
             playlist_service=playlist_service,
             socketio=socketio
         )
+        coordinator.attach_audio_events(audio_domain_container.event_bus)
+        return coordinator
 
     # Fallback: create with mock backend
     from app.src.domain.audio.backends.implementations.mock_audio_backend import MockAudioBackend
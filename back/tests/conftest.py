@@ -5,11 +5,16 @@
 import os
 import sys
 import warnings
+from unittest.mock import Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.src.data.database_manager import DatabaseManager
+from app.src.infrastructure.repositories.pure_sqlite_playlist_repository import (
+    PureSQLitePlaylistRepository,
+)
 from app.src.dependencies import get_audio_service, get_config
 from app.src.services.notification_service import PlaybackSubject
 
@@ -160,6 +165,24 @@ def tmp_db_file(tmp_path):
         os.remove(db_file)
 
 
+@pytest.fixture
+def migrated_db(tmp_db_file):
+    """Database manager over a freshly migrated temporary database."""
+    manager = DatabaseManager(tmp_db_file)
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture
+def sqlite_repository(migrated_db):
+    """Playlist repository backed by the migrated temporary database."""
+    with patch(
+        "app.src.infrastructure.repositories.pure_sqlite_playlist_repository.get_database_manager"
+    ) as mock_get_db_manager:
+        mock_get_db_manager.return_value = Mock(database_service=migrated_db.database_service)
+        yield PureSQLitePlaylistRepository()
+
+
 @pytest.fixture
 def test_client_with_mock_db(tmp_db_file):
     def get_test_config():
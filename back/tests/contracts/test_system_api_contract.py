@@ -2,7 +2,7 @@
 
 Validates that system API endpoints conform to the expected API contract.
 
-Progress: 3/3 endpoints tested ✅
+Progress: 4/4 endpoints tested ✅
 """
 
 import pytest
@@ -80,6 +80,25 @@ class TestSystemAPIContract:
             data = response.json()
             assert data["status"] == "success"
 
+    async def test_get_latency_statistics_contract(self, app_with_system_routes):
+        """Test GET /api/system/latency - Get tag-to-audio latency statistics.
+
+        Contract:
+        - Query params: limit? (int, default=10) number of recent traces
+        - Success response (200): {status: "success", data: {total_ms, stages, recent}}
+        - Percentiles are reported as p50_ms/p95_ms/p99_ms
+        """
+        app, routes = app_with_system_routes
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/api/system/latency?limit=5")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "success"
+            assert {"total_ms", "stages", "recent"} <= set(data["data"])
+            assert {"p50_ms", "p95_ms", "p99_ms"} <= set(data["data"]["total_ms"])
+
     async def test_restart_system_contract(self, app_with_system_routes):
         """Test POST /api/system/restart - Restart system.
 
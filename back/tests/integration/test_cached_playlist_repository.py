@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Integration tests for the read-through cached playlist repository."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.src.data.database_manager import DatabaseManager
+from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.track import Track
+from app.src.infrastructure.repositories.cached_playlist_repository import (
+    CachedPlaylistRepository,
+)
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Migrated temporary database manager."""
+    manager = DatabaseManager(str(tmp_path / "cache.db"))
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture
+def repositories(database):
+    """Two repositories sharing the database, as the DI singleton and adapter do."""
+    with patch(
+        "app.src.infrastructure.repositories.pure_sqlite_playlist_repository.get_database_manager"
+    ) as mock_get_db_manager:
+        mock_get_db_manager.return_value = Mock(database_service=database.database_service)
+        yield CachedPlaylistRepository(), CachedPlaylistRepository()
+
+
+def _track(track_id, number):
+    return Track(track_number=number, title=f"Song {track_id}", filename=f"{track_id}.mp3",
+                 file_path=f"/music/{track_id}.mp3", id=track_id)
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_cache(repositories):
+    repository, _ = repositories
+    playlist = Playlist(title="Lullabies", nfc_tag_id="tag-1")
+    playlist.add_track(_track("t1", 1))
+    await repository.save(playlist)
+
+    first = await repository.find_by_id(playlist.id)
+    with patch.object(repository._db_service, "execute_single_async") as db_read:
+        second = await repository.find_by_id(playlist.id)
+        by_tag = await repository.find_by_nfc_tag("tag-1")
+        db_read.assert_not_called()
+
+    assert second.title == first.title == "Lullabies"
+    assert [t.id for t in by_tag.tracks] == ["t1"]
+    assert repository.cache.get_statistics()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_through_any_instance_invalidate(repositories):
+    writer, reader = repositories
+    playlist = Playlist(title="Road Trip")
+    playlist.add_track(_track("t1", 1))
+    await writer.save(playlist)
+    assert await reader.find_by_nfc_tag("tag-9") is None
+    await reader.find_by_id(playlist.id)
+
+    await writer.update_nfc_tag_association(playlist.id, "tag-9")
+    assert (await reader.find_by_nfc_tag("tag-9")).id == playlist.id
+
+    await writer.update_track("t1", {"title": "Renamed"})
+    assert (await reader.find_by_id(playlist.id)).tracks[0].title == "Renamed"
+
+    await writer.add_track_to_playlist(playlist.id, {"id": "t2", "track_number": 2})
+    assert len((await reader.find_by_id(playlist.id)).tracks) == 2
+
+    await writer.remove_nfc_tag_association("tag-9")
+    assert await reader.find_by_nfc_tag("tag-9") is None
+
+    await writer.delete(playlist.id)
+    assert await reader.find_by_id(playlist.id) is None
+
+
+@pytest.mark.asyncio
+async def test_returned_playlists_do_not_alias_cache(repositories):
+    repository, _ = repositories
+    playlist = Playlist(title="Morning")
+    await repository.save(playlist)
+
+    loaded = await repository.find_by_id(playlist.id)
+    loaded.add_track(_track("t1", 1))
+
+    assert (await repository.find_by_id(playlist.id)).tracks == []
+
+
+@pytest.mark.asyncio
+async def test_find_with_nfc_tags_returns_tagged_playlists(repositories):
+    repository, _ = repositories
+    tagged = Playlist(title="Tagged", nfc_tag_id="tag-1")
+    tagged.add_track(_track("t1", 1))
+    await repository.save(tagged)
+    await repository.save(Playlist(title="Untagged"))
+
+    playlists = await repository.find_with_nfc_tags()
+
+    assert [p.nfc_tag_id for p in playlists] == ["tag-1"]
+    assert [t.id for t in playlists[0].tracks] == ["t1"]
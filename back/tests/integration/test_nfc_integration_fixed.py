@@ -79,7 +79,7 @@ class TestNfcIntegration:
 
         with patch('app.src.infrastructure.repositories.pure_sqlite_playlist_repository.get_database_manager') as mock_get_db_manager:
             mock_db_service = Mock()
-            mock_db_service.execute_query = Mock(return_value=[
+            mock_db_service.execute_query_async = AsyncMock(return_value=[
                 {
                     'id': 'track-1',
                     'playlist_id': 'playlist-1',
@@ -0,0 +1,120 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Integration tests for the trigger-maintained playlist aggregates."""
+
+import importlib.util
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2] / "app" / "src" / "data" / "migrations" / "004_playlist_aggregates.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("migration_004", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def database(migrated_db, tmp_db_file):
+    """Migrated database with two empty playlists."""
+    with sqlite3.connect(tmp_db_file) as conn:
+        conn.executemany(
+            "INSERT INTO playlists (id, title) VALUES (?, ?)", [("p1", "One"), ("p2", "Two")]
+        )
+    return migrated_db
+
+
+def _aggregates(conn):
+    return {
+        row[0]: (row[1], row[2])
+        for row in conn.execute("SELECT id, track_count, total_duration_ms FROM playlists")
+    }
+
+
+def _insert_tracks(conn, rows):
+    conn.executemany(
+        "INSERT INTO tracks (id, playlist_id, track_number, title, duration_ms) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def test_triggers_maintain_aggregates(database, tmp_db_file):
+    """Inserts, updates, moves and deletes keep the aggregates exact."""
+    with sqlite3.connect(tmp_db_file) as conn:
+        conn.execute("PRAGMA foreign_keys = ON")
+        _insert_tracks(conn, [
+            ("t1", "p1", 1, "A", 1000),
+            ("t2", "p1", 2, "B", None),
+            ("t3", "p1", 3, "C", 3000),
+        ])
+        assert _aggregates(conn)["p1"] == (3, 4000)
+
+        conn.execute("UPDATE tracks SET duration_ms = 2000 WHERE id = 't2'")
+        conn.execute("UPDATE tracks SET title = 'Renamed' WHERE id = 't1'")
+        assert _aggregates(conn)["p1"] == (3, 6000)
+
+        conn.execute("UPDATE tracks SET playlist_id = 'p2' WHERE id = 't3'")
+        assert _aggregates(conn) == {"p1": (2, 3000), "p2": (1, 3000)}
+
+        conn.execute("DELETE FROM tracks WHERE id = 't1'")
+        assert _aggregates(conn)["p1"] == (1, 2000)
+
+
+def test_migration_backfills_existing_tracks(database, tmp_db_file):
+    """Re-running the migration recomputes aggregates from the tracks table."""
+    with sqlite3.connect(tmp_db_file) as conn:
+        _insert_tracks(conn, [("t1", "p1", 1, "A", 1500), ("t2", "p2", 1, "B", 2500)])
+        conn.execute("UPDATE playlists SET track_count = 0, total_duration_ms = 0")
+
+        assert _load_migration().up(conn) is True
+        assert _aggregates(conn) == {"p1": (1, 1500), "p2": (1, 2500)}
+
+
+@pytest.mark.asyncio
+async def test_repository_exposes_persisted_summary(database, sqlite_repository):
+    """Loaded playlists carry the persisted aggregates."""
+    repository = sqlite_repository
+    await repository.add_track_to_playlist(
+        "p1", {"track_number": 1, "title": "A", "file_path": "/a.mp3", "duration_ms": 1200}
+    )
+
+    reloaded = await repository.find_by_id("p1")
+
+    assert (reloaded.track_count, reloaded.total_duration_ms) == (1, 1200)
+    assert reloaded.get_summary() == (1, 1200)
+
+
+@pytest.mark.asyncio
+async def test_summary_listing_does_not_query_tracks(database, sqlite_repository):
+    """Track-free listings read only the playlists table."""
+    statements = []
+    db_service = database.database_service
+    original = db_service.execute_query_async
+
+    async def recording_query(query, *args, **kwargs):
+        statements.append(query)
+        return await original(query, *args, **kwargs)
+
+    repository = sqlite_repository
+    await repository.add_track_to_playlist(
+        "p2", {"track_number": 1, "title": "B", "file_path": "/b.mp3", "duration_ms": 800}
+    )
+
+    with patch.object(db_service, "execute_query_async", side_effect=recording_query):
+        summaries = await repository.find_all(include_tracks=False)
+
+    assert {s.id: (s.track_count, s.total_duration_ms) for s in summaries} == {
+        "p1": (0, 0),
+        "p2": (1, 800),
+    }
+    assert len(statements) == 1
+    assert "tracks" not in statements[0]
@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Integration tests and benchmark for bulk playlist import.
+
+Run with ``pytest -s`` to see the benchmark report.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.track import Track
+
+
+def _library(playlist_count: int, tracks_per_playlist: int):
+    playlists = []
+    for p in range(playlist_count):
+        playlist = Playlist(title=f"Folder {p:03d}")
+        for t in range(1, tracks_per_playlist + 1):
+            playlist.add_track(Track(track_number=t, title=f"Song {p}-{t}",
+                                     filename=f"{t:02d}.mp3",
+                                     file_path=f"/music/{p:03d}/{t:02d}.mp3",
+                                     duration_ms=1000))
+        playlists.append(playlist)
+    return playlists
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_and_replaces_tracks(sqlite_repository, tmp_db_file):
+    playlists = await sqlite_repository.bulk_upsert_playlists(_library(3, 4))
+
+    assert all(p.id for p in playlists)
+    assert all(t.id for p in playlists for t in p.tracks)
+    with sqlite3.connect(tmp_db_file) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0] == 12
+        assert conn.execute(
+            "SELECT track_count, total_duration_ms FROM playlists WHERE id = ?",
+            (playlists[0].id,),
+        ).fetchone() == (4, 4000)
+
+    playlists[0].title = "Renamed"
+    playlists[0].tracks = playlists[0].tracks[:1]
+    await sqlite_repository.bulk_upsert_playlists([playlists[0]])
+
+    reloaded = await sqlite_repository.find_by_id(playlists[0].id)
+    assert reloaded.title == "Renamed"
+    assert [t.id for t in reloaded.tracks] == [playlists[0].tracks[0].id]
+    assert await sqlite_repository.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_is_atomic(sqlite_repository, tmp_db_file):
+    playlists = _library(2, 2)
+    # Duplicate track IDs violate the primary key on the last statement
+    playlists[1].tracks[0].id = "dup"
+    playlists[1].tracks[1].id = "dup"
+
+    with pytest.raises(Exception):
+        await sqlite_repository.bulk_upsert_playlists(playlists)
+
+    assert await sqlite_repository.count() == 0
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_bulk_import_benchmark(sqlite_repository):
+    """Compare per-track inserts with one bulk write for a 5,000-file library."""
+    playlist_count, tracks_per_playlist = 250, 20
+
+    start = time.perf_counter()
+    for playlist in _library(playlist_count, tracks_per_playlist):
+        tracks, playlist.tracks = playlist.tracks, []
+        await sqlite_repository.save(playlist)
+        for track in tracks:
+            await sqlite_repository.add_track_to_playlist(playlist.id, {
+                "title": track.title, "filename": track.filename,
+                "file_path": track.file_path, "track_number": track.track_number,
+            })
+    per_track = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await sqlite_repository.bulk_upsert_playlists(_library(playlist_count, tracks_per_playlist))
+    bulk = time.perf_counter() - start
+
+    print(
+        f"\nImport of {playlist_count * tracks_per_playlist} tracks: "
+        f"per-track {per_track:.2f}s, bulk {bulk:.2f}s"
+    )
+    assert await sqlite_repository.count() == playlist_count * 2
+    assert bulk < per_track
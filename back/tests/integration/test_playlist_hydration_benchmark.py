@@ -0,0 +1,163 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Benchmark for batched playlist hydration in PureSQLitePlaylistRepository.
+
+Seeds a real SQLite database with 500 playlists x 20 tracks and compares the
+legacy one-query-per-playlist hydration with the batched ``find_all`` path.
+Run with ``pytest -s`` to see the report.
+"""
+
+import sqlite3
+import time
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.src.data.database_manager import DatabaseManager
+from app.src.infrastructure.repositories.pure_sqlite_playlist_repository import (
+    PureSQLitePlaylistRepository,
+)
+
+PLAYLIST_COUNT = 500
+TRACKS_PER_PLAYLIST = 20
+
+
+def _seed_library(db_path: str) -> None:
+    """Insert PLAYLIST_COUNT playlists with TRACKS_PER_PLAYLIST tracks each."""
+    playlists = []
+    tracks = []
+    for p in range(PLAYLIST_COUNT):
+        playlist_id = str(uuid.uuid4())
+        playlists.append((playlist_id, f"Album {p:04d}", f"album_{p:04d}"))
+        for t in range(1, TRACKS_PER_PLAYLIST + 1):
+            tracks.append((
+                str(uuid.uuid4()),
+                playlist_id,
+                t,
+                f"Track {t:02d}",
+                f"{t:02d}.mp3",
+                f"/music/album_{p:04d}/{t:02d}.mp3",
+                180000,
+            ))
+
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO playlists (id, title, path) VALUES (?, ?, ?)", playlists
+        )
+        conn.executemany(
+            """
+            INSERT INTO tracks
+            (id, playlist_id, track_number, title, filename, file_path, duration_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            tracks,
+        )
+
+
+class _CountingDatabaseService:
+    """Proxy around SQLiteDatabaseService counting read queries."""
+
+    def __init__(self, inner):
+        self._inner = inner
+        self.query_count = 0
+
+    def execute_query(self, *args, **kwargs):
+        self.query_count += 1
+        return self._inner.execute_query(*args, **kwargs)
+
+    async def execute_query_async(self, *args, **kwargs):
+        self.query_count += 1
+        return await self._inner.execute_query_async(*args, **kwargs)
+
+    async def execute_single_async(self, *args, **kwargs):
+        self.query_count += 1
+        return await self._inner.execute_single_async(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+@pytest.fixture
+def seeded_repository(tmp_path):
+    """Repository backed by a seeded on-disk database."""
+    db_path = str(tmp_path / "benchmark.db")
+    database_manager = DatabaseManager(db_path)
+    _seed_library(db_path)
+
+    db_service = _CountingDatabaseService(database_manager.database_service)
+    with patch(
+        "app.src.infrastructure.repositories.pure_sqlite_playlist_repository.get_database_manager"
+    ) as mock_get_db_manager:
+        mock_get_db_manager.return_value = Mock(database_service=db_service)
+        repository = PureSQLitePlaylistRepository()
+
+    yield repository, db_service
+    database_manager.cleanup()
+
+
+def _legacy_find_all(repository, db_service):
+    """Reference implementation of the previous N+1 hydration."""
+    playlist_rows = db_service.execute_query(
+        "SELECT * FROM playlists ORDER BY updated_at DESC"
+    )
+    return [
+        repository._build_playlist_from_rows(
+            row,
+            db_service.execute_query(
+                "SELECT * FROM tracks WHERE playlist_id = ? ORDER BY track_number",
+                (row["id"],),
+            ),
+        )
+        for row in playlist_rows
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_find_all_hydration_benchmark(seeded_repository):
+    """Batched hydration returns the same data with a constant query count."""
+    repository, db_service = seeded_repository
+
+    db_service.query_count = 0
+    start = time.perf_counter()
+    legacy = _legacy_find_all(repository, db_service)
+    legacy_ms = (time.perf_counter() - start) * 1000
+    legacy_queries = db_service.query_count
+
+    db_service.query_count = 0
+    start = time.perf_counter()
+    batched = await repository.find_all()
+    batched_ms = (time.perf_counter() - start) * 1000
+    batched_queries = db_service.query_count
+
+    print(
+        f"\nHydration of {PLAYLIST_COUNT}x{TRACKS_PER_PLAYLIST}: "
+        f"before {legacy_queries} queries / {legacy_ms:.1f}ms, "
+        f"after {batched_queries} queries / {batched_ms:.1f}ms"
+    )
+
+    assert legacy_queries == PLAYLIST_COUNT + 1
+    assert batched_queries == 2
+    assert len(batched) == PLAYLIST_COUNT
+    assert [p.id for p in batched] == [p.id for p in legacy]
+    assert all(len(p.tracks) == TRACKS_PER_PLAYLIST for p in batched)
+    assert [t.track_number for t in batched[0].tracks] == list(
+        range(1, TRACKS_PER_PLAYLIST + 1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_uses_batched_hydration(seeded_repository):
+    """Search results are hydrated with a single tracks query."""
+    repository, db_service = seeded_repository
+    await repository.search("warm up search index detection")
+
+    db_service.query_count = 0
+    results = await repository.search("Album 00")
+
+    assert len(results) == 100
+    assert all(len(p.tracks) == TRACKS_PER_PLAYLIST for p in results)
+    assert db_service.query_count == 2
@@ -0,0 +1,67 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Integration tests for keyset pagination of the playlist list."""
+
+import sqlite3
+
+import pytest
+
+from app.src.domain.data.services.playlist_service import PlaylistService
+
+PLAYLIST_COUNT = 53
+
+
+@pytest.fixture
+def service(tmp_db_file, sqlite_repository):
+    """Playlist service backed by a database seeded with playlists sharing timestamps."""
+    with sqlite3.connect(tmp_db_file) as conn:
+        conn.executemany(
+            "INSERT INTO playlists (id, title, updated_at) VALUES (?, ?, ?)",
+            [
+                # Groups of five playlists share an updated_at to exercise tie-breaking
+                (f"p{i:03d}", f"Playlist {i}", f"2025-01-{1 + i // 5:02d} 12:00:00")
+                for i in range(PLAYLIST_COUNT)
+            ],
+        )
+    return PlaylistService(sqlite_repository, sqlite_repository)
+
+
+@pytest.mark.asyncio
+async def test_cursor_walk_matches_offset_order(service):
+    """Walking all cursor pages yields every playlist once, in listing order."""
+    offset_page = await service.get_playlists(page=1, page_size=PLAYLIST_COUNT)
+    expected_ids = [p["id"] for p in offset_page["playlists"]]
+
+    seen_ids = []
+    cursor = ""
+    pages = 0
+    while cursor is not None:
+        result = await service.get_playlists(page_size=10, cursor=cursor)
+        assert result["total"] == PLAYLIST_COUNT
+        seen_ids.extend(p["id"] for p in result["playlists"])
+        cursor = result["next_cursor"]
+        pages += 1
+
+    assert pages == 6
+    assert seen_ids == expected_ids
+    assert len(set(seen_ids)) == PLAYLIST_COUNT
+
+
+def test_cursor_query_uses_listing_index(migrated_db, tmp_db_file):
+    """The keyset query is an index range scan without a sort step."""
+    with sqlite3.connect(tmp_db_file) as conn:
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT * FROM playlists
+            WHERE updated_at <= ? AND (updated_at < ? OR id > ?)
+            ORDER BY updated_at DESC, id LIMIT ?
+            """,
+            ("2025-01-05 12:00:00", "2025-01-05 12:00:00", "p020", 11),
+        ).fetchall()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_playlists_updated_at_id" in details
+    assert "TEMP B-TREE" not in details
@@ -0,0 +1,174 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Integration tests and benchmark for the FTS5 playlist search index.
+
+Covers trigger synchronisation, ranked prefix search over track metadata, the
+LIKE fallback and a comparison of both paths on a 10k-track library.
+Run with ``pytest -s`` to see the benchmark report.
+"""
+
+import sqlite3
+import time
+import uuid
+
+import pytest
+
+from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.track import Track
+
+PLAYLIST_COUNT = 500
+TRACKS_PER_PLAYLIST = 20
+
+
+def _seed_library(db_path: str) -> None:
+    """Insert a 10k-track library with artists and albums."""
+    playlists = []
+    tracks = []
+    for p in range(PLAYLIST_COUNT):
+        playlist_id = str(uuid.uuid4())
+        artist = f"Artist{p % 50:02d}"
+        playlists.append((playlist_id, f"Album {p:04d}", f"Collection volume {p % 7}"))
+        for t in range(1, TRACKS_PER_PLAYLIST + 1):
+            tracks.append((
+                str(uuid.uuid4()),
+                playlist_id,
+                t,
+                f"Song {p:04d}-{t:02d}",
+                f"/music/{p:04d}/{t:02d}.mp3",
+                artist,
+                f"Record {p:04d}",
+            ))
+
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO playlists (id, title, description) VALUES (?, ?, ?)", playlists
+        )
+        conn.executemany(
+            """
+            INSERT INTO tracks (id, playlist_id, track_number, title, file_path, artist, album)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            tracks,
+        )
+
+
+def _fts_count(db_path: str, table: str, match: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {table} MATCH ?", (match,)
+        ).fetchone()[0]
+
+
+class TestSearchIndexSync:
+    """Triggers keep the search index in sync with playlists and tracks."""
+
+    @pytest.mark.asyncio
+    async def test_insert_update_and_delete_are_indexed(self, sqlite_repository, tmp_db_file):
+        playlist = Playlist(title="Lullabies", description="Bedtime songs")
+        playlist.add_track(Track(track_number=1, title="Twinkle", filename="t.mp3",
+                                 file_path="/music/t.mp3", artist="Mozart"))
+        await sqlite_repository.save(playlist)
+
+        assert [p.id for p in await sqlite_repository.search("lull")] == [playlist.id]
+        assert [p.id for p in await sqlite_repository.search("mozart")] == [playlist.id]
+
+        playlist.title = "Nursery Rhymes"
+        await sqlite_repository.save(playlist)
+
+        assert await sqlite_repository.search("lullabies") == []
+        assert [p.id for p in await sqlite_repository.search("nursery")] == [playlist.id]
+
+        await sqlite_repository.delete(playlist.id)
+
+        assert await sqlite_repository.search("nursery") == []
+        assert _fts_count(tmp_db_file, "tracks_fts", "twinkle") == 0
+
+    @pytest.mark.asyncio
+    async def test_playlist_title_matches_rank_before_track_matches(self, sqlite_repository):
+        by_track = Playlist(title="Road Trip")
+        by_track.add_track(Track(track_number=1, title="Jazz Intro", filename="j.mp3",
+                                 file_path="/music/j.mp3"))
+        by_title = Playlist(title="Jazz Classics")
+        await sqlite_repository.save(by_track)
+        await sqlite_repository.save(by_title)
+
+        results = await sqlite_repository.search("jazz")
+
+        assert [p.id for p in results] == [by_title.id, by_track.id]
+
+    @pytest.mark.asyncio
+    async def test_query_syntax_is_not_interpreted(self, sqlite_repository):
+        await sqlite_repository.save(Playlist(title="Rock"))
+
+        assert [p.title for p in await sqlite_repository.search('ro" OR NEAR(')] == []
+        assert [p.title for p in await sqlite_repository.search("ro*")] == ["Rock"]
+
+
+class TestSearchFallback:
+    """LIKE search is used when the FTS5 index is missing."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_like_without_search_index(self, sqlite_repository, tmp_db_file):
+        await sqlite_repository.save(Playlist(title="Morning Mix"))
+        with sqlite3.connect(tmp_db_file) as conn:
+            conn.execute("DROP TABLE tracks_fts")
+
+        results = await sqlite_repository.search("ing Mi")
+
+        assert sqlite_repository._search_index_available is False
+        assert [p.title for p in results] == ["Morning Mix"]
+
+
+async def _like_search_with_tracks(db_service, query: str, limit: int):
+    """Reference LIKE scan covering the same columns as the search index."""
+    return await db_service.execute_query_async(
+        """
+        SELECT DISTINCT p.* FROM playlists p
+        LEFT JOIN tracks t ON t.playlist_id = p.id
+        WHERE p.title LIKE ?1 OR p.description LIKE ?1
+           OR t.title LIKE ?1 OR t.artist LIKE ?1 OR t.album LIKE ?1
+        LIMIT ?2
+        """,
+        (f"%{query}%", limit),
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_search_benchmark_fts_vs_like(sqlite_repository, migrated_db, tmp_db_file):
+    """Compare FTS5 and an equivalent LIKE scan over a 10k-track library."""
+    _seed_library(tmp_db_file)
+    queries = ["Album 04", "Collection", "Artist07", "Record 0123", "Song 0042"]
+    iterations = 20
+    db_service = migrated_db.database_service
+
+    await sqlite_repository.search("warm up")
+    timings = {}
+    for mode in ("like", "fts"):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for query in queries:
+                if mode == "fts":
+                    await sqlite_repository._search_fts(sqlite_repository._build_fts_match(query), 50)
+                else:
+                    await _like_search_with_tracks(db_service, query, 50)
+        timings[mode] = (time.perf_counter() - start) * 1000 / (iterations * len(queries))
+
+    print(
+        f"\nSearch over {PLAYLIST_COUNT * TRACKS_PER_PLAYLIST} tracks: "
+        f"LIKE {timings['like']:.2f}ms/query, FTS5 {timings['fts']:.2f}ms/query"
+    )
+
+    # The fallback only covers playlist columns; track metadata needs the index
+    sqlite_repository._search_index_available = False
+    assert await sqlite_repository.search("Artist07") == []
+    assert await sqlite_repository.search("Record 0123") == []
+
+    sqlite_repository._search_index_available = True
+    assert len(await sqlite_repository.search("Artist07")) == PLAYLIST_COUNT // 50
+    assert [p.title for p in await sqlite_repository.search("Record 0123")] == ["Album 0123"]
+    assert sorted(p.title for p in await sqlite_repository.search("Album 040")) == [
+        f"Album 040{i}" for i in range(10)
+    ]
@@ -127,6 +127,76 @@ class TestPlaylistAPIRoutes:
             assert response.status_code == 200
             mock_playlist_service.get_playlists_use_case.assert_called_once_with(page=2, page_size=10)
 
+    @pytest.mark.asyncio
+    async def test_list_playlists_with_cursor(self, client, mock_playlist_service):
+        """Test cursor pagination forwards the cursor and reports next_cursor and total."""
+        mock_playlist_service.get_playlists_use_case.return_value = {
+            "playlists": [],
+            "total": 42,
+            "page_size": 10,
+            "total_pages": 5,
+            "next_cursor": "next",
+        }
+
+        with patch("app.src.services.serialization.unified_serialization_service.UnifiedSerializationService.serialize_bulk_playlists") as mock_serialize:
+            mock_serialize.return_value = []
+
+            response = client.get("/api/playlists?limit=10&cursor=")
+
+            assert response.status_code == 200
+            data = response.json()["data"]
+            assert data["next_cursor"] == "next"
+            assert data["total"] == 42
+            mock_playlist_service.get_playlists_use_case.assert_called_once_with(
+                page_size=10, cursor=""
+            )
+
+    @pytest.mark.asyncio
+    async def test_list_playlists_with_invalid_cursor(self, client, mock_playlist_service):
+        """Test an undecodable cursor is rejected with 400."""
+        response = client.get("/api/playlists?cursor=%%%")
+
+        assert response.status_code == 400
+        mock_playlist_service.get_playlists_use_case.assert_not_called()
+
+    @pytest.mark.parametrize("payload", [b"[1]", b"5", b'"text"', b'{"id": "p1"}', b'{"updated_at": null, "id": "p1"}'])
+    def test_list_playlists_with_malformed_cursor_payload(self, client, mock_playlist_service, payload):
+        """Test a cursor that decodes to anything but both sort keys is rejected with 400."""
+        import base64
+
+        cursor = base64.b64encode(payload).decode("ascii")
+        response = client.get("/api/playlists", params={"cursor": cursor})
+
+        assert response.status_code == 400
+        mock_playlist_service.get_playlists_use_case.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_playlists_summary_fields(self, client, mock_playlist_service):
+        """Test fields projection requests the summary view and trims the payload."""
+        mock_playlist_service.get_playlists_use_case.return_value = {
+            "playlists": [
+                {"id": "1", "title": "One", "description": "", "track_count": 3, "total_duration_ms": 9000}
+            ],
+            "total": 1,
+        }
+
+        response = client.get("/api/playlists?fields=title,track_count")
+
+        assert response.status_code == 200
+        playlists = response.json()["data"]["playlists"]
+        assert playlists == [{"id": "1", "title": "One", "track_count": 3}]
+        mock_playlist_service.get_playlists_use_case.assert_called_once_with(
+            page=1, page_size=50, view="summary"
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_playlists_rejects_unknown_fields(self, client, mock_playlist_service):
+        """Test unknown projection fields are rejected with 400."""
+        response = client.get("/api/playlists?fields=title,secret")
+
+        assert response.status_code == 400
+        mock_playlist_service.get_playlists_use_case.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_playlist_success(self, client, mock_playlist_service, mock_broadcasting_service):
         """Test successful playlist creation."""
@@ -269,7 +269,7 @@ class TestSeekFunctionality:
     @pytest.fixture
     def backend(self):
         """Create mock backend with seek support."""
-        backend = Mock()
+        backend = Mock(spec=["play_file", "seek"])
         backend.play_file = Mock(return_value=True)
         backend.seek = Mock(return_value=True)
         return backend
@@ -302,6 +302,24 @@ class TestSeekFunctionality:
         assert success is True
         backend.seek.assert_called_with(0)
 
+    def test_sync_set_position_is_preferred(self, player, backend):
+        """Test a backend with a sync set_position() is seeked without an event loop."""
+        backend.set_position = Mock(return_value=True)
+        player.play_file("/music/song.mp3")
+
+        assert player.seek(42.5) is True
+
+        backend.set_position.assert_called_once_with(42.5)
+        backend.seek.assert_not_called()
+
+    def test_backend_statistics(self, player, backend):
+        """Test seek statistics are passed through only when the backend keeps them."""
+        assert player.get_backend_statistics() == {}
+
+        backend.get_statistics = Mock(return_value={"seek": {"in_place": 1}})
+
+        assert player.get_backend_statistics() == {"seek": {"in_place": 1}}
+
 
 class TestStateQueries:
     """Test state query methods."""
@@ -442,7 +460,7 @@ class TestErrorHandling:
 
     def test_seek_backend_error(self):
         """Test seek handles backend errors."""
-        backend = Mock()
+        backend = Mock(spec=["play_file", "seek"])
         backend.play_file = Mock(return_value=True)
         backend.seek = Mock(side_effect=Exception("Seek error"))
 
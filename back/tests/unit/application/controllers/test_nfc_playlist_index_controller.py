@@ -0,0 +1,274 @@
+"""
+Tests for NfcPlaylistIndex.
+
+Tests cover:
+- Prewarming from the playlist service
+- Lookups returning prepared playlists
+- Invalidation and background refresh
+- Tag scans served without database access
+- Speculative preload on tag detection
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+from app.src.application.services.nfc_application_service import NfcApplicationService
+from app.src.application.controllers.nfc_playlist_index_controller import NfcPlaylistIndex
+from app.src.application.controllers.playback_coordinator_controller import PlaybackCoordinator
+from app.src.application.controllers.playlist_controller import PlaylistController
+from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier
+from app.src.monitoring import get_latency_tracer
+from app.src.utils.async_file_utils import AsyncFileUtils
+
+
+def _playlist_data(playlist_id, tag, titles=("Song",)):
+    return {
+        "id": playlist_id,
+        "title": f"Playlist {playlist_id}",
+        "nfc_tag_id": tag,
+        "tracks": [
+            {"id": f"{playlist_id}-t{i}", "title": title, "filename": f"{playlist_id}-{i}.mp3"}
+            for i, title in enumerate(titles, start=1)
+        ],
+    }
+
+
+@pytest.fixture
+def playlist_service():
+    """Playlist service with two tagged playlists."""
+    service = Mock()
+    service.get_nfc_tagged_playlists = AsyncMock(return_value=[
+        _playlist_data("pl-1", "tag-1", ("One", "Two")),
+        _playlist_data("pl-2", "tag-2"),
+    ])
+    service.get_playlist = AsyncMock(return_value=None)
+    service.get_playlist_by_nfc = AsyncMock(return_value=None)
+    return service
+
+
+@pytest.fixture
+def playlist_controller(playlist_service):
+    """Playlist controller whose resolver accepts every file."""
+    resolver = Mock()
+    resolver.resolve_path = Mock(side_effect=lambda filename: f"/music/{filename}")
+    resolver.validate_path = Mock(return_value=True)
+    return PlaylistController(resolver, playlist_service)
+
+
+@pytest.fixture
+def index(playlist_controller, playlist_service):
+    """Empty index."""
+    return NfcPlaylistIndex(playlist_controller, playlist_service)
+
+
+class TestNfcPlaylistIndex:
+    """Test index population and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_prewarm_prepares_playlists(self, index):
+        """Test prewarm indexes tags with resolved track paths."""
+        assert await index.prewarm() == 2
+
+        playlist = index.get("tag-1")
+        assert playlist.id == "pl-1"
+        assert [t.file_path for t in playlist.tracks] == ["/music/pl-1-1.mp3", "/music/pl-1-2.mp3"]
+        assert index.get("tag-unknown") is None
+        assert index.get_statistics()["tags"] == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_playlist_does_not_alias_index(self, index):
+        """Test callers cannot shrink the indexed track list."""
+        await index.prewarm()
+
+        index.get("tag-1").tracks.clear()
+
+        assert len(index.get("tag-1").tracks) == 2
+
+    @pytest.mark.asyncio
+    async def test_tag_change_drops_and_refreshes(self, index, playlist_service):
+        """Test moving a tag re-indexes it under the new playlist."""
+        await index.prewarm()
+        playlist_service.get_playlist_by_nfc = AsyncMock(return_value=_playlist_data("pl-2", "tag-1"))
+
+        index.handle_playlist_change(nfc_tag_id="tag-1")
+        assert index.get("tag-1") is None
+        await index.wait_for_refreshes()
+
+        assert index.get("tag-1").id == "pl-2"
+        assert index.get("tag-2") is None
+
+    @pytest.mark.asyncio
+    async def test_delete_and_track_change_invalidate(self, index, playlist_service):
+        """Test deleted playlists stay out and track edits reload the owner."""
+        await index.prewarm()
+        playlist_service.get_playlist = AsyncMock(
+            side_effect=lambda pid: _playlist_data("pl-1", "tag-1", ("Renamed",)) if pid == "pl-1" else None
+        )
+
+        index.handle_playlist_change(playlist_id="pl-2")
+        index.handle_playlist_change(track_id="pl-1-t1")
+        await index.wait_for_refreshes()
+
+        assert index.get("tag-2") is None
+        assert [t.title for t in index.get("tag-1").tracks] == ["Renamed"]
+
+    @pytest.mark.asyncio
+    async def test_stale_refresh_is_discarded(self, index, playlist_service):
+        """Test a refresh that raced a newer change does not win."""
+        await index.prewarm()
+        playlist_service.get_playlist_by_nfc = AsyncMock(return_value=_playlist_data("pl-2", "tag-1"))
+
+        index.handle_playlist_change(nfc_tag_id="tag-1")
+        # A second change before the first refresh ran
+        index._bump("tag:tag-1")
+        await index.wait_for_refreshes()
+
+        assert index.get("tag-1") is None
+
+
+class TestIndexedTagScan:
+    """Test the coordinator scan path through the index."""
+
+    @pytest.mark.asyncio
+    async def test_indexed_scan_starts_without_database(self, playlist_service):
+        """Test an indexed tag starts playback with no service lookups."""
+        data_service = Mock()
+        data_service.get_playlist_by_nfc_use_case = AsyncMock()
+        coordinator = PlaybackCoordinator(Mock(), playlist_service, data_application_service=data_service)
+        resolver = coordinator.playlist_controller._track_resolver
+        resolver.resolve_path = Mock(side_effect=lambda filename: f"/music/{filename}")
+        resolver.validate_path = Mock(return_value=True)
+        await coordinator.nfc_playlist_index.prewarm()
+        playlist_service.get_playlist.reset_mock()
+        coordinator.start_playlist = Mock(return_value=True)
+
+        await coordinator.handle_tag_scanned("tag-1")
+
+        data_service.get_playlist_by_nfc_use_case.assert_not_called()
+        playlist_service.get_playlist.assert_not_called()
+        coordinator.start_playlist.assert_called_once_with(1)
+        assert coordinator.playlist_controller.state_manager.get_current_track().title == "One"
+
+    @pytest.mark.asyncio
+    async def test_indexed_scan_is_traced_to_audio_start(self, playlist_service):
+        """Test a traced scan records each stage and finishes on playback."""
+        backend = Mock()
+        backend.play_file = Mock(return_value=True)
+        coordinator = PlaybackCoordinator(backend, playlist_service)
+        resolver = coordinator.playlist_controller._track_resolver
+        resolver.resolve_path = Mock(side_effect=lambda filename: f"/music/{filename}")
+        resolver.validate_path = Mock(return_value=True)
+        await coordinator.nfc_playlist_index.prewarm()
+
+        with get_latency_tracer().trace("tag_to_audio", uid="tag-1") as trace:
+            await coordinator.handle_tag_scanned("tag-1")
+
+        assert trace.status == "ok"
+        assert {"tag_lookup", "load_playlist", "play_file"} <= set(trace.spans)
+
+
+def _coordinator(playlist_service, data_service=None):
+    coordinator = PlaybackCoordinator(Mock(), playlist_service, data_application_service=data_service)
+    resolver = coordinator.playlist_controller._track_resolver
+    resolver.resolve_path = Mock(side_effect=lambda filename: f"/music/{filename}")
+    resolver.validate_path = Mock(return_value=True)
+    return coordinator
+
+
+class TestSpeculativePreload:
+    """Test preparing a tag's playlist before it is routed to playback."""
+
+    @pytest.mark.asyncio
+    async def test_preload_indexes_tag_and_warms_first_track(self, playlist_service, monkeypatch):
+        """Test a preload resolves the playlist once and prefetches track 1."""
+        data_service = Mock()
+        data_service.get_playlist_by_nfc_use_case = AsyncMock(return_value=_playlist_data("pl-9", "tag-9"))
+        prefetch = AsyncMock(return_value=True)
+        monkeypatch.setattr(AsyncFileUtils, "prefetch", prefetch)
+        coordinator = _coordinator(playlist_service, data_service)
+        coordinator.start_playlist = Mock(return_value=True)
+
+        coordinator.start_tag_preload("tag-9")
+        await coordinator.handle_tag_scanned("tag-9")
+
+        data_service.get_playlist_by_nfc_use_case.assert_awaited_once_with("tag-9")
+        prefetch.assert_awaited_once_with("/music/pl-9-1.mp3")
+        coordinator.start_playlist.assert_called_once_with(1)
+        assert coordinator.nfc_playlist_index.get_statistics()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_preload_warms_cached_rendition(self, playlist_service, monkeypatch):
+        """Test a preload prefetches the rendition that plays instead of the original."""
+        data_service = Mock()
+        data_service.get_playlist_by_nfc_use_case = AsyncMock(return_value=_playlist_data("pl-9", "tag-9"))
+        prefetch = AsyncMock(return_value=True)
+        monkeypatch.setattr(AsyncFileUtils, "prefetch", prefetch)
+        coordinator = _coordinator(playlist_service, data_service)
+        coordinator._track_resolver.resolve_playback_path = Mock(
+            side_effect=lambda path: f"{path}.playback.mp3"
+        )
+
+        await coordinator._preload_tag("tag-9")
+
+        prefetch.assert_awaited_once_with("/music/pl-9-1.mp3.playback.mp3")
+
+    @pytest.mark.asyncio
+    async def test_change_during_lookup_is_not_indexed(self, playlist_service):
+        """Test data loaded before a change to its tag never reaches the index."""
+        coordinator = _coordinator(playlist_service)
+        index = coordinator.nfc_playlist_index
+
+        async def lookup_racing_a_change(tag_uid):
+            index.handle_playlist_change(nfc_tag_id=tag_uid)
+            return _playlist_data("pl-9", tag_uid)
+
+        data_service = Mock()
+        data_service.get_playlist_by_nfc_use_case = AsyncMock(side_effect=lookup_racing_a_change)
+        coordinator._data_application_service = data_service
+
+        await coordinator._preload_tag("tag-9")
+        await index.wait_for_refreshes()
+
+        assert index.peek("tag-9") is None
+
+    @pytest.mark.asyncio
+    async def test_association_mode_cancels_preload(self, playlist_service):
+        """Test a tag scanned for association is neither played nor indexed."""
+        data_service = Mock()
+        data_service.get_playlist_by_nfc_use_case = AsyncMock(return_value=_playlist_data("pl-9", "a1b2c3d4"))
+        coordinator = _coordinator(playlist_service, data_service)
+        association_service = Mock()
+        association_service.get_active_sessions = Mock(return_value=[Mock()])
+        association_service.process_tag_detection = AsyncMock(return_value=None)
+        service = NfcApplicationService(Mock(), Mock(), nfc_association_service=association_service)
+        preloads = []
+
+        def start_preload(tag_uid):
+            preloads.append(coordinator.start_tag_preload(tag_uid))
+            return preloads[-1]
+
+        service.register_tag_preload_callback(start_preload)
+        playback = Mock()
+        service.register_tag_detected_callback(playback)
+
+        await service._handle_tag_detection(TagIdentifier(uid="a1b2c3d4"))
+        await asyncio.gather(*preloads, return_exceptions=True)
+
+        assert preloads[0].cancelled()
+        playback.assert_not_called()
+        data_service.get_playlist_by_nfc_use_case.assert_not_called()
+        assert coordinator.nfc_playlist_index.peek("a1b2c3d4") is None
+        assert coordinator._tag_preloads == {}
+
+
+class TestFilePrefetch:
+    """Test warming files into the page cache."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_existing_and_missing_files(self, tmp_path):
+        track = tmp_path / "track.mp3"
+        track.write_bytes(b"\0" * 4096)
+
+        assert await AsyncFileUtils.prefetch(track) is True
+        assert await AsyncFileUtils.prefetch(tmp_path / "missing.mp3") is False
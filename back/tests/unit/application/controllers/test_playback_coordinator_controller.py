@@ -528,6 +528,134 @@ class TestAutoAdvance:
         assert coordinator._audio_player.stop.call_count == 2
 
 
+class TestGaplessPlayback:
+    """Test queueing the next track on a gapless-capable backend."""
+
+    @pytest.fixture
+    def coordinator(self):
+        """Create coordinator on a gapless backend with a three-track playlist."""
+        from app.src.application.controllers.playlist_state_manager_controller import Playlist, Track
+
+        audio_backend = Mock()
+        audio_backend.gapless_enabled = True
+        audio_backend.play_file = Mock(return_value=True)
+        audio_backend.queue_next = Mock(return_value=True)
+        audio_backend.consume_track_transition = Mock(return_value=None)
+        coord = PlaybackCoordinator(audio_backend, Mock())
+        coord._playlist_controller.state_manager.set_playlist(Playlist(
+            id="pl-1",
+            title="Test",
+            tracks=[
+                Track(id=f"t{i}", title=f"Song {i}", filename=f"s{i}.mp3", file_path=f"/music/s{i}.mp3")
+                for i in range(1, 4)
+            ]
+        ))
+        return coord
+
+    def test_play_queues_following_track(self, coordinator):
+        """Test starting a track queues the next one in the backend."""
+        coordinator.play()
+
+        coordinator._audio_player._backend.queue_next.assert_called_once_with("/music/s2.mp3", None)
+
+    def test_transition_advances_playlist_without_replaying(self, coordinator):
+        """Test a backend transition moves the playlist on and queues the next track."""
+        backend = coordinator._audio_player._backend
+        coordinator.play()
+        backend.consume_track_transition.return_value = "/music/s2.mp3"
+
+        coordinator.update_auto_advance()
+
+        assert coordinator.get_current_track()["id"] == "t2"
+        backend.play_file.assert_called_once()
+        backend.queue_next.assert_called_with("/music/s3.mp3", None)
+
+    def test_repeat_change_requeues(self, coordinator):
+        """Test changing repeat mode replaces the queued track."""
+        backend = coordinator._audio_player._backend
+        coordinator.play()
+
+        coordinator.set_repeat_mode("one")
+
+        backend.queue_next.assert_called_with("/music/s1.mp3", None)
+
+
+class TestTrackEndEvents:
+    """Test auto-advance driven by TrackEndedEvent."""
+
+    @pytest.mark.asyncio
+    async def test_track_end_event_advances_instead_of_polling(self):
+        """Test polling no longer advances and a threaded end event does."""
+        import asyncio
+        import threading
+        from app.src.application.controllers.playlist_state_manager_controller import Playlist, Track
+        from app.src.domain.audio.engine.event_bus import EventBus
+        from app.src.domain.audio.events.audio_events import TrackEndedEvent
+
+        audio_backend = Mock()
+        audio_backend.emits_track_end_events = True
+        audio_backend.play_file = Mock(return_value=True)
+        audio_backend.is_busy = True
+        coordinator = PlaybackCoordinator(audio_backend, Mock())
+        coordinator._playlist_controller.state_manager.set_playlist(Playlist(
+            id="pl-1",
+            title="Test",
+            tracks=[
+                Track(id=f"t{i}", title=f"Song {i}", filename=f"s{i}.mp3", file_path=f"/music/s{i}.mp3")
+                for i in range(1, 3)
+            ]
+        ))
+        event_bus = EventBus()
+        coordinator.attach_audio_events(event_bus)
+        coordinator.play()
+
+        audio_backend.attach_event_bus.assert_called_once_with(event_bus)
+        assert coordinator.track_end_events_enabled() is True
+
+        audio_backend.is_busy = False
+        coordinator.update_auto_advance()
+        assert coordinator.get_current_track()["id"] == "t1"
+
+        publisher = threading.Thread(
+            target=event_bus.publish_threadsafe, args=(TrackEndedEvent("test", "/music/s1.mp3"),)
+        )
+        publisher.start()
+        publisher.join()
+        for _ in range(100):
+            if audio_backend.play_file.call_count == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert coordinator.get_current_track()["id"] == "t2"
+        audio_backend.play_file.assert_called_with("/music/s2.mp3")
+
+    @pytest.mark.asyncio
+    async def test_stale_track_end_event_is_ignored(self):
+        """Test the end of a file no longer playing does not advance."""
+        from app.src.application.controllers.playlist_state_manager_controller import Playlist, Track
+        from app.src.domain.audio.events.audio_events import TrackEndedEvent
+
+        audio_backend = Mock()
+        audio_backend.play_file = Mock(return_value=True)
+        audio_backend.is_busy = False
+        coordinator = PlaybackCoordinator(audio_backend, Mock())
+        coordinator._playlist_controller.state_manager.set_playlist(Playlist(
+            id="pl-1",
+            title="Test",
+            tracks=[
+                Track(id=f"t{i}", title=f"Song {i}", filename=f"s{i}.mp3", file_path=f"/music/s{i}.mp3")
+                for i in range(1, 3)
+            ]
+        ))
+        coordinator.play()
+
+        await coordinator._on_track_ended(TrackEndedEvent("test", "/music/other.mp3"))
+        assert coordinator.get_current_track()["id"] == "t1"
+
+        await coordinator._on_track_ended(TrackEndedEvent("test", "/music/s1.mp3"))
+        assert coordinator.get_current_track()["id"] == "t2"
+
+
 class TestNFCIntegration:
     """Test NFC tag handling."""
 
@@ -465,3 +465,38 @@ class TestEdgeCases:
 
         assert len(manager._shuffle_order) == 1
         assert manager._shuffle_order[0] == 0
+
+
+class TestPeekNext:
+    """Test looking ahead at the next track without moving."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create manager with a three-track playlist."""
+        mgr = PlaylistStateManager()
+        mgr.set_playlist(Playlist(
+            id="pl-1",
+            title="Test",
+            tracks=[Track(id=f"t{i}", title=f"Song {i}", filename=f"s{i}.mp3") for i in range(1, 4)]
+        ))
+        return mgr
+
+    def test_peek_matches_move_without_moving(self, manager):
+        """Test peek returns what move_to_next will select."""
+        manager.set_shuffle(True)
+
+        peeked = manager.peek_next()
+
+        assert manager.get_current_track().id == "t1"
+        assert manager.move_to_next() is peeked
+
+    def test_peek_honours_repeat_modes(self, manager):
+        """Test peek at the last track depends on the repeat mode."""
+        manager.move_to_track(2)
+        assert manager.peek_next() is None
+
+        manager.set_repeat_mode("all")
+        assert manager.peek_next().id == "t1"
+
+        manager.set_repeat_mode("one")
+        assert manager.peek_next().id == "t3"
@@ -145,6 +145,30 @@ class TestFileValidation:
                     assert resolver.validate_path("/valid/song.mp3") is True
 
 
+class TestPlaybackPath:
+    """Test the file handed to the audio backend."""
+
+    def test_cached_rendition_is_preferred(self, tmp_path):
+        """Test a current rendition replaces the original."""
+        original = tmp_path / "song.flac"
+        original.write_bytes(b"flac")
+        rendition = tmp_path / ".song.flac.playback.mp3"
+        rendition.write_bytes(b"mp3")
+
+        resolver = TrackResolver(str(tmp_path))
+
+        assert resolver.resolve_playback_path(str(original)) == str(rendition)
+
+    def test_original_without_rendition(self, tmp_path):
+        """Test the original path is kept when nothing is cached."""
+        original = tmp_path / "song.mp3"
+        original.write_bytes(b"mp3")
+
+        resolver = TrackResolver(str(tmp_path))
+
+        assert resolver.resolve_playback_path(str(original)) == str(original)
+
+
 class TestRecursiveSearch:
     """Test recursive file searching."""
 
@@ -110,6 +110,20 @@ class TestDataApplicationService:
         with pytest.raises(BusinessLogicError, match="Playlist name is required"):
             await service.create_playlist_use_case('   ')
 
+    @pytest.mark.asyncio
+    async def test_import_playlists_use_case(self, service, mock_playlist_service):
+        """Test bulk import trims titles and rejects nameless playlists."""
+        expected = {'playlist_ids': ['p1'], 'playlists_imported': 1, 'tracks_imported': 0}
+        mock_playlist_service.import_playlists.return_value = expected
+
+        result = await service.import_playlists_use_case([{'title': ' Album ', 'tracks': []}])
+
+        assert result == expected
+        mock_playlist_service.import_playlists.assert_called_once_with([{'title': 'Album', 'tracks': []}])
+
+        with pytest.raises(BusinessLogicError, match="Playlist name is required"):
+            await service.import_playlists_use_case([{'title': '  '}])
+
     @pytest.mark.asyncio
     async def test_update_playlist_use_case_success(self, service, mock_playlist_service):
         """Test successful playlist update."""
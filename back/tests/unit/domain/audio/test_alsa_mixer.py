@@ -0,0 +1,100 @@
+"""
+Tests for the ALSA mixer co-process and coalesced volume writes.
+
+Tests cover:
+- One amixer process reused across volume changes
+- Restart after the process died, and missing amixer
+- Bursts of volume requests collapsed into few writes of the latest target
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.src.domain.audio.backends.implementations.alsa_mixer import (
+    AmixerCoprocess,
+    CoalescedVolumeWriter,
+)
+
+
+@pytest.fixture
+def popen():
+    """Patch Popen with a process that stays alive."""
+    with patch("app.src.domain.audio.backends.implementations.alsa_mixer.subprocess.Popen") as mock_popen:
+        mock_popen.return_value.poll.return_value = None
+        yield mock_popen
+
+
+class TestAmixerCoprocess:
+    """Test the persistent amixer process."""
+
+    def test_process_is_started_once(self, popen):
+        mixer = AmixerCoprocess("Master")
+
+        assert mixer.set_volume(40) is True
+        assert mixer.set_volume(45) is True
+
+        popen.assert_called_once()
+        assert popen.call_args[0][0] == ["amixer", "-s", "-q"]
+        stdin = popen.return_value.stdin
+        assert [c[0][0] for c in stdin.write.call_args_list] == [b"sset Master 40%\n", b"sset Master 45%\n"]
+
+    def test_dead_process_is_restarted(self, popen):
+        mixer = AmixerCoprocess()
+        mixer.set_volume(40)
+        popen.return_value.poll.return_value = 1
+
+        assert mixer.set_volume(50) is True
+        assert popen.call_count == 2
+
+    def test_missing_amixer_disables_writes(self, popen):
+        popen.side_effect = FileNotFoundError("amixer")
+        mixer = AmixerCoprocess()
+
+        assert mixer.set_volume(40) is False
+        assert mixer.set_volume(50) is False
+        popen.assert_called_once()
+        assert mixer.get_statistics()["available"] is False
+
+
+class TestCoalescedVolumeWriter:
+    """Test collapsing bursts of volume requests."""
+
+    def test_burst_is_written_as_latest_target(self):
+        written = []
+
+        def write(volume):
+            written.append(volume)
+            return True
+
+        writer = CoalescedVolumeWriter(write, window=0.1)
+        for volume in range(0, 100, 5):
+            writer.request(volume)
+            time.sleep(0.002)
+
+        assert writer.flush(timeout=2.0)
+        stats = writer.get_statistics()
+        writer.close()
+
+        assert written[-1] == 95
+        assert len(written) <= 3
+        assert stats["requests"] == 20
+        assert stats["writes"] == len(written)
+        assert stats["coalesced"] == 20 - len(written)
+        assert stats["last_volume"] == 95
+        assert stats["last_write_latency_ms"] is not None
+        assert stats["latency"]["count"] == len(written)
+
+    def test_close_writes_pending_target(self):
+        write = Mock(return_value=True)
+        writer = CoalescedVolumeWriter(write, window=10.0)
+        writer.request(30)
+        writer.flush(timeout=2.0)
+        writer.request(60)
+
+        writer.close()
+
+        assert write.call_args_list[-1][0][0] == 60
+        writer.request(90)
+        assert write.call_count == 2
@@ -0,0 +1,118 @@
+"""
+Tests for mixer latency profiles and the output self-test.
+
+Tests cover:
+- Profile lookup, buffer latency and validation of the profile name
+- Time-to-first-audio and underrun counting from the mixer callbacks
+- Self-test on the mock backend
+"""
+
+import time
+import wave
+
+import pytest
+
+from app.src.config.audio_config import MIXER_PROFILES, AudioConfig
+from app.src.domain.audio.backends.implementations.mixer_self_test import (
+    SimulatedMixer,
+    measure_output,
+    write_silence,
+)
+
+
+class TestMixerProfiles:
+    """Test the latency profiles in the audio config."""
+
+    def test_profiles_trade_latency_for_buffer(self):
+        low = MIXER_PROFILES["low_latency"]
+        balanced = MIXER_PROFILES["balanced"]
+        low_cpu = MIXER_PROFILES["low_cpu"]
+
+        assert low.buffer_latency_ms < balanced.buffer_latency_ms < low_cpu.buffer_latency_ms
+        assert balanced.buffer_latency_ms == pytest.approx(2048 / 48000 * 1000, abs=0.1)
+
+    def test_selected_profile_is_returned(self):
+        assert AudioConfig(mixer_profile="low_cpu").get_mixer_profile().name == "low_cpu"
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            AudioConfig(mixer_profile="turbo").validate()
+
+
+class TestMeasureOutput:
+    """Test measurements taken from the mixer callbacks."""
+
+    def test_steady_mixer_has_no_underruns(self):
+        mixer = SimulatedMixer(10.7)
+
+        result = measure_output(
+            "low_latency", mixer.start, mixer.position_ms, mixer.mixed_ms, 10.7, duration=0.1
+        )
+
+        assert result.passed
+        assert result.underruns == 0
+        # The first callback comes half a buffer after start
+        assert 5.0 <= result.time_to_first_audio_ms < 40.0
+
+    def test_late_callback_counts_underruns(self):
+        mixer = SimulatedMixer(10.7)
+        mixer.stall(at_ms=40.0, length_ms=60.0)
+
+        result = measure_output(
+            "low_latency", mixer.start, mixer.position_ms, mixer.mixed_ms, 10.7, duration=0.2
+        )
+
+        assert result.underruns >= 1
+        assert not result.passed
+
+    def test_wall_clock_position_without_mixed_audio_fails(self):
+        started = []
+
+        def start():
+            started.append(time.monotonic())
+            return True
+
+        result = measure_output(
+            "balanced",
+            start,
+            lambda: (time.monotonic() - started[0]) * 1000,
+            lambda: 0.0,
+            42.7,
+            first_audio_timeout=0.05,
+        )
+
+        assert result.error == "no audio within timeout"
+        assert not result.passed
+
+    def test_playback_that_never_starts(self):
+        result = measure_output("balanced", lambda: False, lambda: None, lambda: None, 42.7)
+
+        assert result.error == "playback did not start"
+        assert result.time_to_first_audio_ms is None
+
+    def test_silence_clip_has_requested_length(self, tmp_path):
+        clip = tmp_path / "silence.wav"
+
+        write_silence(str(clip), 48000, 2, 0.5)
+
+        with wave.open(str(clip), "rb") as wav:
+            assert wav.getframerate() == 48000
+            assert wav.getnchannels() == 2
+            assert wav.getnframes() == 24000
+
+
+class TestMockBackendSelfTest:
+    """Test the self-test on the mock backend."""
+
+    def test_result_is_reported_in_statistics(self):
+        from app.src.domain.audio.backends.implementations.mock_audio_backend import MockAudioBackend
+
+        backend = MockAudioBackend()
+        assert backend.get_statistics()["mixer"]["self_test"] is None
+
+        result = backend.run_mixer_self_test(duration=0.05)
+
+        assert result.passed
+        mixer = backend.get_statistics()["mixer"]
+        assert mixer["self_test"]["underruns"] == 0
+        assert mixer["profile"]["name"] == "balanced"
@@ -0,0 +1,116 @@
+"""
+Tests for the MP3 frame index.
+
+Tests cover:
+- Frame header parsing
+- Indexing past ID3v2 tags and Xing frames
+- Frame lookup by position
+- Cache invalidation on file changes
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.src.domain.audio.backends.implementations.mp3_frame_index import (
+    Mp3FrameIndex,
+    Mp3FrameIndexCache,
+    parse_frame_header,
+)
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417 bytes, 1152 samples
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 417
+
+
+def _frame(payload=b""):
+    return FRAME_HEADER + payload + b"\0" * (FRAME_LENGTH - 4 - len(payload))
+
+
+@pytest.fixture
+def mp3_file(tmp_path):
+    """MP3 with an ID3v2 tag, a Xing frame and 100 audio frames."""
+    path = tmp_path / "track.mp3"
+    id3 = b"ID3\x03\x00\x00\x00\x00\x00\x0a" + b"\0" * 10
+    path.write_bytes(id3 + _frame(b"\0" * 32 + b"Xing") + _frame() * 100 + b"TAG" + b"\0" * 125)
+    return path
+
+
+class TestMp3FrameIndex:
+    """Test frame scanning and lookup."""
+
+    def test_parse_frame_header(self):
+        assert parse_frame_header(FRAME_HEADER) == (FRAME_LENGTH, 1152, 44100)
+        assert parse_frame_header(b"\xff\xfb\xf0\x00") is None  # bad bitrate
+        assert parse_frame_header(b"TAG\x00") is None
+
+    def test_index_skips_tags_and_info_frame(self, mp3_file):
+        index = Mp3FrameIndex.build(str(mp3_file))
+
+        assert index.frame_count == 100
+        assert index.duration == pytest.approx(100 * 1152 / 44100)
+        assert index.frame_at(0.0) == 0.0
+
+    def test_frame_at_snaps_to_frame_start(self, mp3_file):
+        index = Mp3FrameIndex.build(str(mp3_file))
+        frame_seconds = 1152 / 44100
+
+        assert index.frame_at(10.5 * frame_seconds) == pytest.approx(10 * frame_seconds)
+
+    def test_non_mpeg_file_has_no_index(self, tmp_path):
+        path = tmp_path / "noise.mp3"
+        path.write_bytes(b"\x01" * 4096)
+
+        assert Mp3FrameIndex.build(str(path)) is None
+
+
+class TestMp3FrameIndexCache:
+    """Test the frame index cache."""
+
+    def test_cached_until_file_changes(self, mp3_file):
+        cache = Mp3FrameIndexCache()
+
+        first = cache.get(str(mp3_file))
+        assert cache.get(str(mp3_file)) is first
+
+        mp3_file.write_bytes(_frame() * 10)
+        assert cache.get(str(mp3_file)).frame_count == 10
+        assert cache.get_statistics() == {"indexes": 2, "hits": 1, "misses": 2}
+
+    def test_peek_never_scans(self, mp3_file):
+        cache = Mp3FrameIndexCache()
+
+        assert cache.peek(str(mp3_file)) is None
+
+        index = cache.get(str(mp3_file))
+        assert cache.peek(str(mp3_file)) is index
+
+    def test_concurrent_requests_share_one_scan(self, mp3_file):
+        cache = Mp3FrameIndexCache()
+        scanning, release = threading.Event(), threading.Event()
+        build = Mp3FrameIndex.build
+
+        def slow_build(file_path):
+            scanning.set()
+            release.wait(5)
+            return build(file_path)
+
+        results = []
+
+        def request():
+            results.append(cache.get(str(mp3_file)))
+
+        with patch.object(Mp3FrameIndex, "build", side_effect=slow_build) as mock_build:
+            threads = [threading.Thread(target=request) for _ in range(3)]
+            threads[0].start()
+            assert scanning.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert mock_build.call_count == 1
+        assert len(results) == 3 and results[0] is not None
+        assert all(result is results[0] for result in results)
@@ -236,6 +236,23 @@ class TestDurationDetection:
 
         assert duration is None
 
+    @patch('app.src.domain.audio.backends.implementations.wm8960_audio_backend.pygame')
+    @patch('app.src.domain.audio.backends.implementations.wm8960_audio_backend.PYGAME_AVAILABLE', True)
+    def test_get_file_duration_from_metadata_cache(self, mock_pygame, mock_subprocess, mock_mutagen, temp_audio_file):
+        """Test an attached metadata cache answers without mutagen."""
+        mock_pygame.mixer.get_init.return_value = (48000, -16, 2)
+
+        from app.src.domain.audio.backends.implementations.wm8960_audio_backend import WM8960AudioBackend
+
+        backend = WM8960AudioBackend()
+        metadata_cache = Mock()
+        metadata_cache.get_duration.return_value = 42.0
+        backend.attach_metadata_cache(metadata_cache)
+
+        assert backend._detect_file_duration(str(temp_audio_file)) == 42.0
+        metadata_cache.get_duration.assert_called_once_with(str(temp_audio_file))
+        mock_mutagen.assert_not_called()
+
 
 class TestPlaybackWithMockedDependencies:
     """Test playback methods with mocked dependencies."""
@@ -375,3 +392,294 @@ class TestIntegrationScenarios:
         assert backend._pause_time is None
         assert backend._current_file_path is None
         assert backend._current_file_duration is None
+
+
+@pytest.fixture
+def playing_backend(mock_subprocess):
+    """Create backend whose mixer reports playback as busy."""
+    with patch('app.src.domain.audio.backends.implementations.wm8960_audio_backend.pygame') as mock_pg:
+        mock_pg.mixer.get_init.return_value = (48000, -16, 2)
+        mock_pg.mixer.music.get_busy.return_value = True
+        mock_pg.mixer.music.get_pos.return_value = 0
+
+        with patch('app.src.domain.audio.backends.implementations.wm8960_audio_backend.PYGAME_AVAILABLE', True):
+            from app.src.domain.audio.backends.implementations.wm8960_audio_backend import WM8960AudioBackend
+            backend = WM8960AudioBackend()
+            backend._mock_pygame = mock_pg
+            yield backend
+
+
+@pytest.fixture
+def tracks(tmp_path):
+    """Create two audio files."""
+    paths = [tmp_path / "one.mp3", tmp_path / "two.mp3"]
+    for path in paths:
+        path.write_text("fake audio data")
+    return [str(path) for path in paths]
+
+
+class TestGaplessPlayback:
+    """Test queueing the next track and following pygame onto it."""
+
+    def test_queued_track_takes_over_when_position_restarts(self, playing_backend, tracks):
+        """Test the queued file becomes current once pygame starts it."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0], duration_ms=10000)
+
+        assert playing_backend.queue_next(tracks[1], duration_ms=20000) is True
+        music.queue.assert_called_once_with(tracks[1])
+
+        music.get_pos.return_value = 9900
+        assert playing_backend.consume_track_transition() is None
+        assert playing_backend.has_queued_track is True
+
+        music.get_pos.return_value = 150
+        assert playing_backend.consume_track_transition() == tracks[1]
+        assert playing_backend.consume_track_transition() is None
+        assert playing_backend._current_file_path == tracks[1]
+        assert playing_backend.get_duration() == 20.0
+        assert playing_backend.has_queued_track is False
+        assert playing_backend.is_busy is True
+
+    def test_cancelled_queued_track_is_stopped(self, playing_backend, tracks):
+        """Test a queued file that can no longer be unqueued stops when it starts."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0])
+        playing_backend.queue_next(tracks[1])
+        music.get_pos.return_value = 5000
+        playing_backend.clear_queued()
+
+        assert playing_backend.has_queued_track is False
+        music.get_pos.return_value = 100
+        assert playing_backend.consume_track_transition() is None
+        assert playing_backend.is_busy is False
+        music.stop.assert_called()
+
+    def test_queue_refused_when_gapless_disabled(self, playing_backend, tracks):
+        """Test disabling gapless mode falls back to per-track playback."""
+        playing_backend.play_file(tracks[0])
+        playing_backend.set_gapless_enabled(False)
+
+        assert playing_backend.gapless_enabled is False
+        assert playing_backend.queue_next(tracks[1]) is False
+        playing_backend._mock_pygame.mixer.music.queue.assert_not_called()
+
+
+class TestTrackEndEvents:
+    """Test track end detection published on the audio event bus."""
+
+    def test_watcher_publishes_end_of_track(self, playing_backend, tracks):
+        """Test the watcher reports the end and stops running."""
+        event_bus = Mock()
+        playing_backend.attach_event_bus(event_bus)
+        playing_backend.play_file(tracks[0], duration_ms=10000)
+        watcher = playing_backend._end_watcher
+
+        playing_backend._mock_pygame.mixer.music.get_busy.return_value = False
+        watcher.join(timeout=2)
+
+        events = [call.args[0] for call in event_bus.publish_threadsafe.call_args_list]
+        assert [type(event).__name__ for event in events] == ["TrackStartedEvent", "TrackEndedEvent"]
+        assert (events[1].file_path, events[1].duration_ms, events[1].reason) == (tracks[0], 10000, "completed")
+        assert playing_backend._end_watcher is None
+        assert playing_backend.is_busy is False
+
+    def test_watcher_idles_while_paused(self, playing_backend, tracks):
+        """Test pausing ends the watcher and stopping reports a stopped track."""
+        event_bus = Mock()
+        playing_backend.attach_event_bus(event_bus)
+        playing_backend.play_file(tracks[0])
+        watcher = playing_backend._end_watcher
+
+        playing_backend.pause_sync()
+        watcher.join(timeout=2)
+        assert playing_backend._end_watcher is None
+
+        playing_backend.stop_sync()
+        ended = event_bus.publish_threadsafe.call_args_list[-1].args[0]
+        assert (type(ended).__name__, ended.reason) == ("TrackEndedEvent", "stopped")
+
+
+class TestDecoderPosition:
+    """Test position reporting from the decoder."""
+
+    def test_position_follows_decoder_and_seek_offset(self, playing_backend, tracks):
+        """Test position is get_pos() plus the offset of the last seek."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0])
+        music.get_pos.return_value = 2500
+
+        assert playing_backend.get_position_sync() == 2.5
+
+        assert playing_backend.set_position(60.0) is True
+        music.set_pos.assert_called_once_with(60.0)
+        # get_pos() keeps counting across an in-place seek
+        music.get_pos.return_value = 3500
+
+        assert playing_backend.get_position_sync() == 61.0
+
+    def test_reads_within_a_tick_are_cached(self, playing_backend, tracks):
+        """Test consecutive reads do not query the decoder again."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0])
+        music.get_pos.return_value = 1200
+        music.get_pos.reset_mock()
+
+        first = playing_backend.get_position_sync()
+        music.get_pos.return_value = 1300
+
+        assert playing_backend.get_position_sync() == first
+        assert music.get_pos.call_count == 1
+
+    def test_clock_fallback_without_decoder_position(self, playing_backend, tracks):
+        """Test the monotonic clock is used when get_pos() is unavailable."""
+        playing_backend.play_file(tracks[0])
+        playing_backend._mock_pygame.mixer.music.get_pos.return_value = -1
+        playing_backend._play_start_time -= 3.0
+
+        assert 3.0 <= playing_backend.get_position_sync() < 4.0
+
+
+class TestSeekEngine:
+    """Test in-place seeking, the reload fallback and seek statistics."""
+
+    def test_in_place_seek_keeps_file_loaded(self, playing_backend, tracks):
+        """Test a seek neither stops nor reloads the file."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0])
+        music.load.reset_mock()
+        music.stop.reset_mock()
+
+        for position in (10.0, 20.0, 30.0):
+            assert playing_backend.set_position(position) is True
+
+        music.load.assert_not_called()
+        music.stop.assert_not_called()
+        seek = playing_backend.get_statistics()["seek"]
+        assert (seek["in_place"], seek["reload"], seek["latency"]["count"]) == (3, 0, 3)
+
+    def test_mp3_seek_rewinds_before_absolute_set_pos(self, playing_backend, tracks):
+        """Test MP3 seeks start from the file start, where set_pos() is absolute."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0])
+        music.reset_mock()
+
+        assert playing_backend.set_position(10.0) is True
+
+        calls = [name for name, _, _ in music.mock_calls if name in ("rewind", "set_pos")]
+        assert calls == ["rewind", "set_pos"]
+
+    def test_seek_before_frame_index_is_ready_does_not_scan(self, playing_backend, tracks):
+        """Test a seek right after play goes unsnapped instead of scanning the file."""
+        music = playing_backend._mock_pygame.mixer.music
+        playing_backend.play_file(tracks[0])
+        playing_backend._frame_indexes = Mock()
+        playing_backend._frame_indexes.peek.return_value = None
+
+        assert playing_backend.set_position(10.5) is True
+
+        playing_backend._frame_indexes.get.assert_not_called()
+        music.set_pos.assert_called_with(10.5)
+
+    @pytest.mark.asyncio
+    async def test_player_seek_on_running_loop_seeks_in_place(self, playing_backend, tracks):
+        """Test a seek through AudioPlayer from the server's event loop reaches set_pos()."""
+        from app.src.application.controllers.audio_player_controller import AudioPlayer
+
+        music = playing_backend._mock_pygame.mixer.music
+        player = AudioPlayer(playing_backend)
+        player.play_file(tracks[0])
+        music.load.reset_mock()
+
+        assert player.seek(10.0) is True
+
+        music.set_pos.assert_called_once()
+        music.load.assert_not_called()
+        assert playing_backend.get_statistics()["seek"]["in_place"] == 1
+
+    def test_unsupported_format_falls_back_to_reload_once(self, playing_backend, tracks):
+        """Test a format rejected by set_pos() is reloaded without retrying set_pos()."""
+        music = playing_backend._mock_pygame.mixer.music
+        music.set_pos.side_effect = RuntimeError("Position not implemented for music type")
+        playing_backend.play_file(tracks[0])
+        music.get_pos.return_value = 0
+
+        assert playing_backend.set_position(10.0) is True
+        assert playing_backend.set_position(20.0) is True
+
+        assert music.set_pos.call_count == 1
+        music.play.assert_called_with(start=20.0)
+        assert playing_backend.get_position_sync() == 20.0
+        assert playing_backend.get_statistics()["seek"]["reload"] == 2
+
+
+class TestVolumeControl:
+    """Test volume changes through pygame and the coalesced ALSA writer."""
+
+    def test_volume_burst_is_one_mixer_write(self, playing_backend):
+        """Test every change reaches pygame while ALSA gets the latest target."""
+        from app.src.domain.audio.backends.implementations.alsa_mixer import CoalescedVolumeWriter
+
+        mixer_write = Mock(return_value=True)
+        playing_backend._volume_writer = CoalescedVolumeWriter(mixer_write, window=10.0)
+
+        for volume in (50, 55, 60, 65):
+            assert playing_backend.set_volume_sync(volume) is True
+        playing_backend.cleanup()
+
+        assert playing_backend._mock_pygame.mixer.music.set_volume.call_count == 4
+        assert mixer_write.call_args[0][0] == 65
+        assert mixer_write.call_count <= 2
+        volume = playing_backend.get_statistics()["volume"]
+        assert volume["requests"] - volume["coalesced"] == mixer_write.call_count
+
+
+class TestMixerProfile:
+    """Test the configured mixer profile and its self-test."""
+
+    @patch('app.src.domain.audio.backends.implementations.wm8960_audio_backend.pygame')
+    @patch('app.src.domain.audio.backends.implementations.wm8960_audio_backend.PYGAME_AVAILABLE', True)
+    def test_pre_init_uses_configured_profile(self, mock_pygame, mock_subprocess):
+        """Test the mixer opens with the buffer of the selected profile."""
+        from app.src.config import config
+        from app.src.domain.audio.backends.implementations.wm8960_audio_backend import WM8960AudioBackend
+
+        mock_pygame.mixer.get_init.return_value = (48000, -16, 2)
+        with patch.object(config.audio, "mixer_profile", "low_latency"):
+            backend = WM8960AudioBackend()
+
+        mock_pygame.mixer.pre_init.assert_called_with(frequency=48000, size=-16, channels=2, buffer=512)
+        assert backend.get_statistics()["mixer"]["profile"]["name"] == "low_latency"
+
+    def test_self_test_measures_first_audio(self, playing_backend):
+        """Test the self-test plays a clip, reports the result and stops."""
+        from app.src.domain.audio.backends.implementations.mixer_self_test import SimulatedMixer
+
+        music = playing_backend._mock_pygame.mixer.music
+        mixer = SimulatedMixer(42.7)
+        paused = []
+
+        def get_pos():
+            position = mixer.mixed_ms() if paused else mixer.position_ms()
+            return -1 if position is None else int(position)
+
+        music.play.side_effect = lambda *args: mixer.start()
+        music.pause.side_effect = lambda: paused.append(True)
+        music.unpause.side_effect = paused.clear
+        music.get_pos.side_effect = get_pos
+
+        result = playing_backend.run_mixer_self_test(duration=0.1)
+
+        assert result.passed
+        assert result.time_to_first_audio_ms >= 20.0
+        music.stop.assert_called()
+        assert playing_backend.get_statistics()["mixer"]["self_test"]["profile"] == "balanced"
+
+    def test_self_test_refused_while_track_loaded(self, playing_backend, tracks):
+        """Test the self-test never interrupts a loaded track."""
+        playing_backend.play_file(tracks[0])
+
+        result = playing_backend.run_mixer_self_test(duration=0.1)
+
+        assert result.error is not None
+        assert not result.passed
@@ -442,6 +442,40 @@ class TestPlaylistCalculations:
         # Empty playlist has no tracks with unknown duration, so returns 0
         assert total == 0
 
+    def test_get_summary_prefers_persisted_aggregates(self):
+        """Test summary uses stored aggregates without needing tracks."""
+        playlist = Playlist(title="Stored", track_count=12, total_duration_ms=3600000)
+
+        assert playlist.get_summary() == (12, 3600000)
+
+    def test_get_summary_computed_from_tracks(self):
+        """Test summary falls back to loaded tracks, counting unknown durations as zero."""
+        playlist = Playlist(title="Test")
+        track1 = Track.from_file("/s1.mp3", 1)
+        track1.duration_ms = 180000
+        track2 = Track.from_file("/s2.mp3", 2)
+        track2.duration_ms = None
+        playlist.tracks = [track1, track2]
+
+        assert playlist.get_summary() == (2, 180000)
+
+    def test_get_summary_follows_in_memory_track_edits(self):
+        """Test adding or removing a track drops the stored aggregates."""
+        track1 = Track.from_file("/s1.mp3", 1)
+        track1.duration_ms = 180000
+        playlist = Playlist(
+            title="Stored", tracks=[track1], track_count=1, total_duration_ms=180000
+        )
+        track2 = Track.from_file("/s2.mp3", 2)
+        track2.duration_ms = 60000
+
+        playlist.add_track(track2)
+        assert playlist.get_summary() == (2, 240000)
+
+        playlist.track_count, playlist.total_duration_ms = 2, 240000
+        playlist.remove_track(1)
+        assert playlist.get_summary() == (1, 60000)
+
     def test_get_display_name_with_tracks(self):
         """Test display name with tracks."""
         playlist = Playlist.from_files("My Playlist", ["/s1.mp3", "/s2.mp3", "/s3.mp3"])
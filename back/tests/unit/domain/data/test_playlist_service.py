@@ -62,7 +62,7 @@ class TestPlaylistService:
         assert result['page'] == 1
         assert result['page_size'] == 50
         assert result['total_pages'] == 0
-        mock_playlist_repo.find_all.assert_called_once_with(offset=0, limit=50)
+        mock_playlist_repo.find_all.assert_called_once_with(offset=0, limit=50, include_tracks=True)
 
     @pytest.mark.asyncio
     async def test_get_playlists_with_data(self, service, mock_playlist_repo, mock_track_repo):
@@ -90,6 +90,69 @@ class TestPlaylistService:
         assert result['playlists'][0]['track_count'] == 2
         assert result['playlists'][1]['track_count'] == 2
 
+    @pytest.mark.asyncio
+    async def test_get_playlists_cursor_mode(self, service, mock_playlist_repo):
+        """Test keyset pagination returns next_cursor and the full total."""
+        from app.src.utils.pagination import decode_cursor, encode_cursor
+
+        mock_playlist_repo.find_page.return_value = (
+            [Playlist(id="playlist-3", title="Third")],
+            ("2025-01-01 10:00:00", "playlist-3"),
+        )
+        mock_playlist_repo.count.return_value = 7
+
+        cursor = encode_cursor("2025-01-02 10:00:00", "playlist-2")
+        result = await service.get_playlists(page_size=1, cursor=cursor)
+
+        mock_playlist_repo.find_page.assert_called_once_with(
+            limit=1, after=("2025-01-02 10:00:00", "playlist-2"), include_tracks=True
+        )
+        mock_playlist_repo.find_all.assert_not_called()
+        assert [p['id'] for p in result['playlists']] == ["playlist-3"]
+        assert result['total'] == 7
+        assert decode_cursor(result['next_cursor']) == ("2025-01-01 10:00:00", "playlist-3")
+
+    @pytest.mark.asyncio
+    async def test_get_playlists_cursor_first_and_last_page(self, service, mock_playlist_repo):
+        """Test an empty cursor starts from the top and the last page has no cursor."""
+        mock_playlist_repo.find_page.return_value = ([], None)
+
+        result = await service.get_playlists(page_size=10, cursor="")
+
+        mock_playlist_repo.find_page.assert_called_once_with(
+            limit=10, after=None, include_tracks=True
+        )
+        assert result['next_cursor'] is None
+
+    @pytest.mark.asyncio
+    async def test_get_playlists_invalid_cursor(self, service):
+        """Test an undecodable cursor is rejected."""
+        with pytest.raises(ValueError):
+            await service.get_playlists(cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_get_playlists_summary_view(self, service, mock_playlist_repo):
+        """Test the summary view requests no tracks and returns flat summaries."""
+        from app.src.domain.data.models.playlist_summary import PlaylistSummary
+
+        mock_playlist_repo.find_all.return_value = [
+            PlaylistSummary(id="playlist-1", title="One", track_count=12, total_duration_ms=3600000)
+        ]
+        mock_playlist_repo.count.return_value = 1
+
+        result = await service.get_playlists(page=1, page_size=20, view="summary")
+
+        mock_playlist_repo.find_all.assert_called_once_with(offset=0, limit=20, include_tracks=False)
+        assert result['playlists'][0]['track_count'] == 12
+        assert result['playlists'][0]['total_duration_ms'] == 3600000
+        assert 'tracks' not in result['playlists'][0]
+
+    @pytest.mark.asyncio
+    async def test_get_playlists_unknown_view(self, service):
+        """Test an unknown view is rejected."""
+        with pytest.raises(ValueError):
+            await service.get_playlists(view="compact")
+
     @pytest.mark.asyncio
     async def test_get_playlist_found(self, service, mock_playlist_repo, mock_track_repo):
         """Test getting a single playlist that exists."""
@@ -142,6 +205,26 @@ class TestPlaylistService:
         assert result['track_count'] == 0
         mock_playlist_repo.save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_import_playlists_builds_entities_in_one_call(self, service, mock_playlist_repo):
+        """Test importing playlists writes them all through one bulk call."""
+        mock_playlist_repo.bulk_upsert_playlists.side_effect = lambda playlists: playlists
+
+        result = await service.import_playlists([
+            {'id': 'p1', 'title': 'Album', 'tracks': [
+                {'title': 'One', 'filename': '1.mp3'},
+                {'title': 'Two', 'filename': '2.mp3', 'track_number': 5},
+            ]},
+            {'id': 'p2', 'title': 'Empty'},
+        ])
+
+        mock_playlist_repo.bulk_upsert_playlists.assert_called_once()
+        playlists = mock_playlist_repo.bulk_upsert_playlists.call_args[0][0]
+        assert [t.track_number for t in playlists[0].tracks] == [1, 5]
+        assert playlists[1].tracks == []
+        assert result == {'playlist_ids': ['p1', 'p2'], 'playlists_imported': 2, 'tracks_imported': 2}
+        mock_playlist_repo.save.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_playlist_success(self, mock_track_repo):
         """Test updating a playlist successfully."""
@@ -0,0 +1,59 @@
+"""
+Tests for the TrackChangeSet value object.
+
+Tests cover:
+- Diff of identical track lists
+- Inserts, deletes, renumbers and field updates
+- Change counting
+"""
+
+from app.src.domain.data.models.track import Track
+from app.src.domain.data.models.track_change_set import TrackChangeSet
+
+
+def _track(track_id, number, title=None):
+    return Track(
+        id=track_id,
+        track_number=number,
+        title=title or f"Track {track_id}",
+        filename=f"{track_id}.mp3",
+        file_path=f"/music/{track_id}.mp3",
+    )
+
+
+class TestTrackChangeSetDiff:
+    """Test change set computation."""
+
+    def test_identical_lists_produce_empty_change_set(self):
+        """Test that unchanged tracks are not part of the change set."""
+        current = [_track("a", 1), _track("b", 2)]
+        desired = [_track("a", 1), _track("b", 2)]
+
+        changes = TrackChangeSet.diff(current, desired)
+
+        assert changes.is_empty()
+        assert len(changes) == 0
+
+    def test_diff_detects_each_change_category(self):
+        """Test inserts, deletes, renumbers and field updates are separated."""
+        current = [_track("a", 1), _track("b", 2), _track("c", 3)]
+        desired = [
+            _track("c", 1),
+            _track("a", 2, title="Renamed"),
+            _track(None, 3),
+        ]
+
+        changes = TrackChangeSet.diff(current, desired)
+
+        assert [t.track_number for t in changes.inserts] == [3]
+        assert changes.deletes == ["b"]
+        assert changes.renumbers == {"c": 1, "a": 2}
+        assert changes.updates == {"a": {"title": "Renamed"}}
+        assert len(changes) == 4
+
+    def test_unknown_id_is_inserted(self):
+        """Test that a desired track with an unknown ID is inserted."""
+        changes = TrackChangeSet.diff([], [_track("new", 1)])
+
+        assert [t.id for t in changes.inserts] == ["new"]
+        assert not changes.deletes
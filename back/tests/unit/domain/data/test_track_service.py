@@ -20,6 +20,7 @@ class TestTrackService:
         repo = AsyncMock()
         repo.get_by_playlist.return_value = []
         repo.get_by_id.return_value = None
+        repo.get_next_track_number.return_value = 1
         repo.add_to_playlist.return_value = "track-id"
         repo.update.return_value = True
         repo.delete.return_value = True
@@ -82,7 +83,7 @@ class TestTrackService:
         }
 
         mock_playlist_repo.exists.return_value = True
-        mock_track_repo.get_by_playlist.return_value = []  # No existing tracks
+        mock_track_repo.get_next_track_number.return_value = 1  # No existing tracks
         mock_track_repo.add_to_playlist.return_value = 'track-id'
         mock_track_repo.get_by_id.return_value = created_track
 
@@ -104,21 +105,19 @@ class TestTrackService:
         """Test adding a track when playlist already has tracks."""
         playlist_id = 'playlist-1'
         track_data = {'title': 'New Track'}
-        existing_tracks = [
-            {'id': 'track-1', 'track_number': 1},
-            {'id': 'track-2', 'track_number': 2}
-        ]
 
         mock_playlist_repo.exists.return_value = True
-        mock_track_repo.get_by_playlist.return_value = existing_tracks
+        mock_track_repo.get_next_track_number.return_value = 3  # Tracks 1 and 2 exist
         mock_track_repo.add_to_playlist.return_value = 'track-id'
         mock_track_repo.get_by_id.return_value = {'id': 'track-id', 'title': 'New Track'}
 
         await service.add_track(playlist_id, track_data)
 
-        # Check that track_number is set correctly (should be 3)
+        # Check that track_number is set correctly (should be 3) without loading the tracks
         call_args = mock_track_repo.add_to_playlist.call_args[0]
         assert call_args[1]['track_number'] == 3
+        mock_track_repo.get_next_track_number.assert_awaited_once_with(playlist_id)
+        mock_track_repo.get_by_playlist.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_track_success(self, service, mock_track_repo, mock_playlist_repo):
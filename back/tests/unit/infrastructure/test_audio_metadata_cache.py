@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for the persistent audio metadata cache."""
+
+import os
+import threading
+import wave
+from types import SimpleNamespace
+
+import pytest
+
+from app.src.data.database_manager import DatabaseManager
+from app.src.infrastructure.adapters.audio.audio_metadata_cache import AudioMetadataCache
+from app.src.infrastructure.upload.adapters.metadata_extractor import MutagenMetadataExtractor
+from app.src.services.upload_service import UploadService
+
+
+@pytest.fixture
+def database_service(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "metadata.db"))
+    yield manager.database_service
+    manager.cleanup()
+
+
+def _write_wav(path, seconds):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(b"\0\0" * int(8000 * seconds))
+    return path
+
+
+class TestAudioMetadataCache:
+    """Test parsing once per file version across cache instances."""
+
+    def test_metadata_survives_a_new_cache(self, database_service, tmp_path):
+        track = _write_wav(tmp_path / "track.wav", 2)
+        cache = AudioMetadataCache(database_service)
+
+        assert cache.get_duration(track) == 2.0
+        assert cache.get_duration(track) == 2.0
+
+        restarted = AudioMetadataCache(database_service)
+        assert restarted.get(track).duration == 2.0
+
+        assert cache.get_statistics()["parses"] == 1
+        assert cache.get_statistics()["memory_hits"] == 1
+        assert restarted.get_statistics()["parses"] == 0
+        assert restarted.get_statistics()["database_hits"] == 1
+
+    def test_changed_file_is_parsed_again(self, database_service, tmp_path):
+        track = _write_wav(tmp_path / "track.wav", 2)
+        cache = AudioMetadataCache(database_service)
+        cache.get(track)
+
+        _write_wav(track, 3)
+        os.utime(track, (1_000_000_000, 1_000_000_000))
+
+        assert AudioMetadataCache(database_service).get_duration(track) == 3.0
+        assert cache.get_duration(track) == 3.0
+
+    def test_unreadable_and_missing_files(self, database_service, tmp_path):
+        garbage = tmp_path / "garbage.mp3"
+        garbage.write_bytes(b"not audio")
+        cache = AudioMetadataCache(database_service)
+
+        assert cache.get(garbage) is None
+        assert cache.get(garbage) is None
+        assert cache.get(tmp_path / "missing.mp3") is None
+        assert cache.get_statistics()["parses"] == 1
+        assert AudioMetadataCache(database_service).get(garbage) is None
+
+    def test_cover_art_and_binary_frames_are_not_kept(self, database_service, tmp_path):
+        from mutagen.id3 import APIC, PRIV, TIT2
+        from mutagen.wave import WAVE
+
+        track = _write_wav(tmp_path / "track.wav", 1)
+        tagged = WAVE(str(track))
+        tagged.add_tags()
+        tagged.tags.add(TIT2(encoding=3, text="Song"))
+        tagged.tags.add(APIC(encoding=3, mime="image/png", type=3, desc="cover", data=b"\x89PNG" * 4096))
+        tagged.tags.add(PRIV(owner="encoder", data=b"\0\1"))
+        tagged.save()
+
+        metadata = AudioMetadataCache(database_service).get(track)
+
+        assert metadata.title == "Song"
+        assert metadata.tags == {"TIT2": "Song"}
+        assert AudioMetadataCache(database_service).get(track).tags == {"TIT2": "Song"}
+
+
+class TestMetadataCallSites:
+    """Test upload and sync metadata extraction share one parse."""
+
+    @pytest.mark.asyncio
+    async def test_upload_service_and_extractor_share_the_cache(self, database_service, tmp_path):
+        track = _write_wav(tmp_path / "Song.wav", 2)
+        cache = AudioMetadataCache(database_service)
+        config = SimpleNamespace(
+            upload_folder=str(tmp_path), upload_allowed_extensions=["wav"], upload_max_size=1 << 20
+        )
+
+        metadata = UploadService(config, metadata_cache=cache).extract_metadata(track)
+        file_metadata = await MutagenMetadataExtractor(cache).extract_metadata(track)
+
+        assert metadata == {"title": "Song", "artist": "Unknown", "album": "Unknown", "duration": 2.0}
+        assert file_metadata.duration_seconds == 2.0
+        assert await MutagenMetadataExtractor(cache).validate_audio_file(track)
+        assert cache.get_statistics()["parses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_extractor_reads_metadata_off_the_event_loop(self, database_service, tmp_path):
+        track = _write_wav(tmp_path / "Song.wav", 2)
+        cache = AudioMetadataCache(database_service)
+        loop_thread = threading.get_ident()
+        threads = []
+        read = cache.get
+
+        def get(file_path):
+            threads.append(threading.get_ident())
+            return read(file_path)
+
+        cache.get = get
+        extractor = MutagenMetadataExtractor(cache)
+
+        assert (await extractor.extract_metadata(track)).duration_seconds == 2.0
+        assert await extractor.validate_audio_file(track)
+        assert threads and loop_thread not in threads
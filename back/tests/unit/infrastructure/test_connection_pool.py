@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for ConnectionPool validation, recycling and statistics."""
+
+import sqlite3
+import time
+
+import pytest
+
+from app.src.data.connection_pool import ConnectionPool
+
+
+def _make_pool(db_path, **kwargs):
+    options = {"pool_size": 1, "max_overflow": 1, "timeout": 0.2}
+    options.update(kwargs)
+    return ConnectionPool(db_path, **options)
+
+
+class TestConnectionPool:
+    """Test suite for borrow-side behaviour of the pool."""
+
+    def test_returned_connection_is_reused_without_validation(self, tmp_db_file):
+        pool = _make_pool(tmp_db_file)
+
+        first = pool.get_connection()
+        pool.return_connection(first)
+        second = pool.get_connection()
+
+        assert second is first
+        stats = pool.get_statistics()
+        assert stats["validations"] == 0
+        assert stats["borrow_wait_ms"]["count"] == 2
+        pool.close_all()
+
+    def test_idle_connection_is_validated_and_replaced_when_broken(self, tmp_db_file):
+        pool = _make_pool(tmp_db_file, validate_after_idle=0.005)
+        broken = pool.get_connection()
+        pool.return_connection(broken)
+        broken.close()
+        time.sleep(0.01)
+
+        replacement = pool.get_connection()
+
+        assert replacement is not broken
+        assert replacement.execute("SELECT 1").fetchone()[0] == 1
+        stats = pool.get_statistics()
+        assert stats["validation_failures"] == 1
+        assert stats["current_size"] == 1
+        pool.close_all()
+
+    def test_failed_overflow_connection_releases_only_its_slot(self, tmp_db_file, monkeypatch):
+        pool = _make_pool(tmp_db_file, timeout=0.01)
+        held = pool.get_connection()
+        monkeypatch.setattr(pool, "_create_connection", lambda: None)
+
+        for _ in range(3):
+            with pytest.raises(sqlite3.OperationalError):
+                pool.get_connection()
+
+        assert pool.get_statistics()["current_size"] == 1
+        pool.return_connection(held)
+        pool.close_all()
+
+    def test_connection_is_recycled_after_max_uses(self, tmp_db_file):
+        pool = _make_pool(tmp_db_file, max_connection_uses=2)
+
+        seen = []
+        for _ in range(3):
+            conn = pool.get_connection()
+            seen.append(conn)
+            pool.return_connection(conn)
+
+        assert seen[0] is seen[1]
+        assert seen[2] is not seen[0]
+        assert pool.get_statistics()["recycled_connections"] == 1
+        pool.close_all()
+
+    def test_overflow_is_recorded_and_exhaustion_raises(self, tmp_db_file):
+        pool = _make_pool(tmp_db_file)
+        first = pool.get_connection()
+        overflow = pool.get_connection()
+
+        with pytest.raises(sqlite3.OperationalError):
+            pool.get_connection()
+
+        pool.return_connection(first)
+        pool.return_connection(overflow)
+        stats = pool.get_statistics()
+        assert stats["overflow_events"] == 1
+        assert stats["exhausted_events"] == 1
+        # The overflow connection is closed once the base pool is refilled
+        assert stats["current_size"] == 1
+        pool.close_all()
+
+    def test_open_transaction_is_rolled_back_on_return(self, tmp_db_file):
+        pool = _make_pool(tmp_db_file)
+        conn = pool.get_connection()
+        conn.execute("CREATE TABLE items (id INTEGER)")
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO items VALUES (1)")
+
+        pool.return_connection(conn)
+
+        assert not conn.in_transaction
+        assert pool.get_connection().execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        pool.close_all()
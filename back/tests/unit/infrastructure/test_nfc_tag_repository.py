@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for the SQLite NFC tag repository."""
+
+import sqlite3
+
+import pytest
+
+from app.src.domain.nfc.entities.nfc_tag import NfcTag
+from app.src.domain.nfc.value_objects.tag_identifier import TagIdentifier
+from app.src.infrastructure.nfc.repositories.nfc_tag_repository import NfcTagRepository
+
+
+@pytest.fixture
+def database_service(migrated_db, tmp_db_file):
+    with sqlite3.connect(tmp_db_file) as conn:
+        conn.execute("INSERT INTO playlists (id, title, nfc_tag_id) VALUES ('pl-1', 'One', 'a1b2c3d4')")
+    return migrated_db.database_service
+
+
+def _tag(uid="a1b2c3d4", playlist_id="pl-1"):
+    return NfcTag(identifier=TagIdentifier(uid=uid), associated_playlist_id=playlist_id)
+
+
+def _row(db_path, uid="a1b2c3d4"):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT playlist_id, detection_count FROM nfc_tags WHERE uid = ?", (uid,)
+        ).fetchone()
+
+
+class TestNfcTagRepository:
+    """Test persistence, caching and write-behind of tag detections."""
+
+    @pytest.mark.asyncio
+    async def test_tags_survive_a_new_repository(self, database_service):
+        await NfcTagRepository(database_service).save_tag(_tag())
+
+        repository = NfcTagRepository(database_service)
+        tag = await repository.find_by_playlist_id("pl-1")
+
+        assert tag.identifier.uid == "a1b2c3d4"
+        assert (await repository.find_by_identifier(TagIdentifier(uid="a1b2c3d4"))).is_associated()
+        assert repository.get_statistics()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_detections_are_buffered_and_flushed_in_one_batch(self, database_service, tmp_db_file):
+        repository = NfcTagRepository(database_service, flush_interval=60)
+        await repository.save_tag(_tag())
+
+        for _ in range(5):
+            tag = await repository.find_by_identifier(TagIdentifier(uid="a1b2c3d4"))
+            tag.mark_detected()
+            await repository.save_tag(tag)
+
+        assert _row(tmp_db_file) == ("pl-1", 0)
+        assert (await repository.find_by_identifier(TagIdentifier(uid="a1b2c3d4"))).detection_count == 5
+
+        await repository.close()
+
+        assert _row(tmp_db_file) == ("pl-1", 5)
+        stats = repository.get_statistics()
+        assert (stats["writes"], stats["buffered_updates"], stats["pending_updates"]) == (2, 5, 0)
+
+    @pytest.mark.asyncio
+    async def test_association_changes_are_written_immediately(self, database_service, tmp_db_file):
+        repository = NfcTagRepository(database_service, flush_interval=60)
+        await repository.save_tag(_tag())
+
+        tag = await repository.find_by_identifier(TagIdentifier(uid="a1b2c3d4"))
+        tag.dissociate_from_playlist()
+        await repository.save_tag(tag)
+
+        assert _row(tmp_db_file) == (None, 0)
+        assert await repository.find_by_playlist_id("pl-1") is None
+
+    @pytest.mark.asyncio
+    async def test_association_not_backed_by_playlists_is_ignored(self, database_service, tmp_db_file):
+        await NfcTagRepository(database_service).save_tag(_tag())
+        with sqlite3.connect(tmp_db_file) as conn:
+            conn.execute("UPDATE playlists SET nfc_tag_id = NULL")
+
+        repository = NfcTagRepository(database_service)
+
+        assert await repository.find_by_playlist_id("pl-1") is None
+        tag = await repository.find_by_identifier(TagIdentifier(uid="a1b2c3d4"))
+        assert tag is not None and not tag.is_associated()
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_row_and_cache(self, database_service, tmp_db_file):
+        repository = NfcTagRepository(database_service)
+        await repository.save_tag(_tag())
+
+        assert await repository.delete_tag(TagIdentifier(uid="a1b2c3d4"))
+        assert await repository.find_by_identifier(TagIdentifier(uid="a1b2c3d4")) is None
+        assert _row(tmp_db_file) is None
+        assert not await repository.delete_tag(TagIdentifier(uid="a1b2c3d4"))
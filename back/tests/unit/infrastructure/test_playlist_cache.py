@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for the in-process playlist LRU cache."""
+
+from app.src.domain.data.models.playlist import Playlist
+from app.src.domain.data.models.track import Track
+from app.src.infrastructure.repositories.playlist_cache import (
+    PlaylistCache,
+    add_playlist_change_listener,
+    remove_playlist_change_listener,
+)
+
+
+def _playlist(playlist_id, nfc_tag_id=None, track_ids=()):
+    playlist = Playlist(title=f"Playlist {playlist_id}", id=playlist_id, nfc_tag_id=nfc_tag_id)
+    for number, track_id in enumerate(track_ids, start=1):
+        playlist.add_track(Track(track_number=number, title=track_id, filename=f"{track_id}.mp3",
+                                 file_path=f"/music/{track_id}.mp3", id=track_id))
+    return playlist
+
+
+class TestPlaylistCache:
+    """Test lookups, eviction, invalidation and counters."""
+
+    def test_get_returns_independent_copies(self):
+        cache = PlaylistCache()
+        cache.put(_playlist("p1"))
+
+        first = cache.get("p1")
+        first.title = "Mutated"
+
+        assert cache.get("p1").title == "Playlist p1"
+        assert cache.get("missing") is None
+        stats = cache.get_statistics()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PlaylistCache(max_entries=2)
+        cache.put(_playlist("p1", nfc_tag_id="tag-1"))
+        cache.put(_playlist("p2"))
+        cache.get("p1")
+        cache.put(_playlist("p3"))
+
+        assert cache.get("p2") is None
+        assert cache.get("p1") is not None
+        assert cache.lookup_nfc_tag("tag-1")[0] is True
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_nfc_lookup_and_negative_entries(self):
+        cache = PlaylistCache()
+        cache.put(_playlist("p1", nfc_tag_id="tag-1"))
+        cache.put_missing_tag("tag-2")
+
+        found, playlist = cache.lookup_nfc_tag("tag-1")
+        assert found and playlist.id == "p1"
+        assert cache.lookup_nfc_tag("tag-2") == (True, None)
+        assert cache.lookup_nfc_tag("tag-3") == (False, None)
+
+        cache.invalidate_tag("tag-2")
+        assert cache.lookup_nfc_tag("tag-2") == (False, None)
+
+    def test_invalidation_drops_playlist_tag_and_track_mappings(self):
+        cache = PlaylistCache()
+        cache.put(_playlist("p1", nfc_tag_id="tag-1", track_ids=["t1"]))
+        cache.put(_playlist("p2", track_ids=["t2"]))
+
+        cache.invalidate("p1")
+        cache.invalidate_track("t2")
+
+        assert cache.get("p1") is None
+        assert cache.get("p2") is None
+        assert cache.lookup_nfc_tag("tag-1") == (False, None)
+        assert cache.get_statistics()["invalidations"] == 2
+
+    def test_stale_load_is_not_cached_after_invalidation(self):
+        cache = PlaylistCache()
+        generation = cache.generation
+
+        cache.invalidate("p1")
+        cache.put(_playlist("p1"), generation)
+        cache.put_missing_tag("tag-1", generation)
+
+        assert cache.get("p1") is None
+        assert cache.lookup_nfc_tag("tag-1") == (False, None)
+
+    def test_change_listeners_are_notified(self):
+        cache = PlaylistCache()
+        changes = []
+
+        def listener(**change):
+            changes.append(change)
+
+        add_playlist_change_listener(listener)
+        try:
+            cache.invalidate("p1")
+            cache.invalidate_tag("tag-1")
+            cache.invalidate_track("t1")
+            cache.clear()
+        finally:
+            remove_playlist_change_listener(listener)
+        cache.invalidate("p2")
+
+        assert [{k: v for k, v in c.items() if v} for c in changes] == [
+            {"playlist_id": "p1"}, {"nfc_tag_id": "tag-1"}, {"track_id": "t1"}, {},
+        ]
@@ -0,0 +1,206 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for the PN532 reader thread and its event loop bridge."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.src.config.nfc_config import NFCConfig
+from app.src.infrastructure.adapters.nfc.nfc_adapter import NFCHandlerAdapter
+from app.src.infrastructure.hardware.nfc.pn532_nfc_hardware import (
+    POLL_MODE_IDLE,
+    POLL_MODE_PRESENCE_HOLD,
+    AdaptivePollScheduler,
+    PN532NFCHardware,
+    TagPresenceFilter,
+)
+
+
+class FakePN532:
+    """Blocking stand-in for the adafruit driver."""
+
+    def __init__(self, uid=None):
+        self.uid = uid
+        self.fail = False
+        self.threads = set()
+
+    def read_passive_target(self, timeout):
+        self.threads.add(threading.get_ident())
+        time.sleep(timeout)
+        if self.fail:
+            raise OSError("bus error")
+        return self.uid
+
+
+@pytest.fixture
+def config():
+    return NFCConfig(read_timeout=0.02, max_retries=1, debounce_time=0.01, retry_delay=0.01,
+                     tag_removal_threshold=0.05)
+
+
+@pytest.fixture
+def hardware(config):
+    hw = PN532NFCHardware(asyncio.Lock(), config)
+    hw._pn532 = FakePN532()
+    return hw
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestPN532ReaderThread:
+    """Test polling off the event loop and transition delivery."""
+
+    @pytest.mark.asyncio
+    async def test_transitions_are_delivered_on_the_loop(self, hardware):
+        events = []
+        loop_thread = threading.get_ident()
+        hardware.tag_subject.subscribe(lambda e: events.append((e, threading.get_ident())))
+
+        await hardware.start_nfc_reader()
+        try:
+            hardware._pn532.uid = bytes([0xDE, 0xAD])
+            await _wait_for(lambda: len(events) == 1)
+            hardware._pn532.uid = None
+            await _wait_for(lambda: len(events) == 2)
+        finally:
+            await hardware.stop_nfc_reader()
+
+        assert events[0][0]["uid"] == "dead"
+        assert events[1][0]["absence"] is True
+        assert all(thread == loop_thread for _, thread in events)
+        assert loop_thread not in hardware._pn532.threads
+        assert not hardware.get_status()["reader_thread_alive"]
+
+    @pytest.mark.asyncio
+    async def test_polling_does_not_block_the_loop(self, hardware, config):
+        config.read_timeout = 0.2
+
+        await hardware.start_nfc_reader()
+        try:
+            started = time.perf_counter()
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - started
+        finally:
+            await hardware.stop_nfc_reader()
+
+        # A blocking poll on the loop would stall for the full read timeout
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_status_reports_poll_timing_and_errors(self, hardware):
+        adapter = NFCHandlerAdapter(hardware)
+        hardware._pn532.fail = True
+        hardware._attempt_recovery = lambda: None
+
+        await hardware.start_nfc_reader()
+        try:
+            await _wait_for(lambda: hardware.get_status()["read_errors"] >= 2)
+            hardware._pn532.fail = False
+            await _wait_for(lambda: hardware.get_status()["consecutive_errors"] == 0)
+        finally:
+            await hardware.stop_nfc_reader()
+
+        reader = adapter.get_hardware_status()["reader"]
+        assert reader["polls"] >= 3
+        assert reader["poll_duration_ms"]["p50_ms"] >= 15
+        assert set(reader["loop_lag_ms"]) >= {"count", "p95_ms"}
+
+
+class TestAdaptivePollScheduler:
+    """Test poll interval selection and statistics."""
+
+    def _scheduler(self, **overrides):
+        options = dict(poll_interval_min=0.1, poll_interval_max=0.4, poll_backoff_factor=2.0,
+                       idle_backoff_delay=10.0, presence_hold_interval=0.3)
+        options.update(overrides)
+        return AdaptivePollScheduler(NFCConfig(**options))
+
+    def test_backs_off_when_idle_and_resets_on_activity(self):
+        scheduler = self._scheduler()
+        scheduler.record_activity(now=0.0)
+
+        assert scheduler.next_interval(False, now=5.0) == 0.1
+        assert [scheduler.next_interval(False, now=11.0) for _ in range(3)] == [0.2, 0.4, 0.4]
+        assert scheduler.get_statistics(now=11.0)["mode"] == POLL_MODE_IDLE
+
+        scheduler.record_activity(now=12.0)
+        assert scheduler.next_interval(False, now=12.5) == 0.1
+
+    def test_presence_hold_and_fixed_modes(self):
+        scheduler = self._scheduler()
+        assert scheduler.next_interval(True) == 0.3
+        assert scheduler.get_statistics()["mode"] == POLL_MODE_PRESENCE_HOLD
+
+        fixed = self._scheduler(adaptive_polling_enabled=False, debounce_time=0.2)
+        assert fixed.next_interval(False, now=1000.0) == 0.2
+
+    def test_detection_latency_is_bounded_by_last_empty_poll(self):
+        scheduler = self._scheduler()
+        scheduler.record_poll(False, now=1.0)
+        scheduler.record_detection(now=1.25)
+
+        stats = scheduler.get_statistics(now=1.25)
+        assert stats["detection_latency_ms"]["last_ms"] == 250.0
+        assert stats["polls_last_minute"] == 1
+
+    @pytest.mark.asyncio
+    async def test_held_tag_switches_to_presence_checks(self, hardware, config):
+        config.max_retries = 3
+        config.presence_hold_interval = 0.01
+        hardware._pn532.uid = bytes([0x01])
+
+        await hardware.start_nfc_reader()
+        try:
+            await _wait_for(lambda: hardware.get_status()["polling"]["presence_checks"] >= 3)
+        finally:
+            await hardware.stop_nfc_reader()
+
+        assert hardware.get_status()["polling"]["mode"] == POLL_MODE_PRESENCE_HOLD
+
+
+class TestTagPresenceFilter:
+    """Test debouncing of raw poll results."""
+
+    def test_edge_of_field_flapping_emits_one_presence(self):
+        presence = TagPresenceFilter(NFCConfig(tag_removal_threshold=1.0))
+        reads = ["aa", None, "aa", None, None, "aa", None]
+
+        transitions = [presence.update(uid, now=i * 0.2) for i, uid in enumerate(reads)]
+
+        assert transitions == ["present"] + [None] * 6
+        assert presence.get_statistics()["suppressed_absences"] == 2
+        assert presence.get_statistics()["absence_pending"] is True
+
+        assert presence.update(None, now=2.2) == "absent"
+        assert presence.present_uid is None
+
+    def test_presence_needs_n_of_m_reads(self):
+        presence = TagPresenceFilter(NFCConfig(presence_confirm_reads=2, presence_window_size=3,
+                                               tag_removal_threshold=0.0))
+
+        assert [presence.update(uid) for uid in ["bb", None, None, None]] == [None] * 4
+        assert presence.get_statistics()["suppressed_detections"] == 1
+
+        assert [presence.update(uid) for uid in ["bb", None, "bb"]] == [None, None, "present"]
+
+    def test_tag_swap_is_reported_without_absence(self):
+        presence = TagPresenceFilter(NFCConfig(tag_removal_threshold=5.0))
+
+        assert presence.update("aa", now=0.0) == "present"
+        assert presence.update("bb", now=0.1) == "present"
+        assert presence.present_uid == "bb"
+
+    def test_invalid_confirmation_is_rejected(self):
+        with pytest.raises(ValueError):
+            NFCConfig(presence_confirm_reads=4, presence_window_size=3).validate()
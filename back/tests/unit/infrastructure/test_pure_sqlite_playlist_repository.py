@@ -5,7 +5,7 @@
 """Unit tests for PureSQLitePlaylistRepository."""
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from app.src.infrastructure.repositories.pure_sqlite_playlist_repository import PureSQLitePlaylistRepository
 from app.src.domain.data.models.track import Track
 
@@ -17,8 +17,9 @@ class TestPureSQLitePlaylistRepository:
     def mock_db_service(self):
         """Mock database service."""
         db_service = Mock()
-        db_service.execute_query = Mock()
-        db_service.execute_command = Mock()
+        db_service.execute_query_async = AsyncMock()
+        db_service.execute_single_async = AsyncMock()
+        db_service.execute_command_async = AsyncMock()
         return db_service
 
     @pytest.fixture
@@ -61,7 +62,7 @@ class TestPureSQLitePlaylistRepository:
             }
         ]
 
-        mock_db_service.execute_query.return_value = track_rows
+        mock_db_service.execute_query_async.return_value = track_rows
 
         result = await repository.get_tracks_by_playlist(playlist_id)
 
@@ -79,8 +80,8 @@ class TestPureSQLitePlaylistRepository:
         assert result[1].track_number == 2
 
         # Verify database query
-        mock_db_service.execute_query.assert_called_once()
-        query_call = mock_db_service.execute_query.call_args
+        mock_db_service.execute_query_async.assert_called_once()
+        query_call = mock_db_service.execute_query_async.call_args
         assert 'SELECT * FROM tracks' in query_call[0][0]
         assert query_call[0][1] == (playlist_id,)
 
@@ -88,12 +89,12 @@ class TestPureSQLitePlaylistRepository:
     async def test_get_tracks_by_playlist_empty(self, repository, mock_db_service):
         """Test getting tracks when playlist has no tracks."""
         playlist_id = 'empty-playlist'
-        mock_db_service.execute_query.return_value = []
+        mock_db_service.execute_query_async.return_value = []
 
         result = await repository.get_tracks_by_playlist(playlist_id)
 
         assert result == []
-        mock_db_service.execute_query.assert_called_once()
+        mock_db_service.execute_query_async.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_tracks_by_playlist_handles_missing_fields(self, repository, mock_db_service):
@@ -113,7 +114,7 @@ class TestPureSQLitePlaylistRepository:
             }
         ]
 
-        mock_db_service.execute_query.return_value = track_rows
+        mock_db_service.execute_query_async.return_value = track_rows
 
         result = await repository.get_tracks_by_playlist(playlist_id)
 
@@ -127,15 +128,15 @@ class TestPureSQLitePlaylistRepository:
     async def test_delete_tracks_by_playlist_success(self, repository, mock_db_service):
         """Test deleting all tracks for a playlist."""
         playlist_id = 'playlist-1'
-        mock_db_service.execute_command.return_value = 5  # 5 tracks deleted
+        mock_db_service.execute_command_async.return_value = 5  # 5 tracks deleted
 
         result = await repository.delete_tracks_by_playlist(playlist_id)
 
         assert result is True
 
         # Verify database command
-        mock_db_service.execute_command.assert_called_once()
-        command_call = mock_db_service.execute_command.call_args
+        mock_db_service.execute_command_async.assert_called_once()
+        command_call = mock_db_service.execute_command_async.call_args
         assert 'DELETE FROM tracks WHERE playlist_id = ?' in command_call[0][0]
         assert command_call[0][1] == (playlist_id,)
 
@@ -143,12 +144,12 @@ class TestPureSQLitePlaylistRepository:
     async def test_delete_tracks_by_playlist_no_tracks(self, repository, mock_db_service):
         """Test deleting tracks when playlist has no tracks."""
         playlist_id = 'empty-playlist'
-        mock_db_service.execute_command.return_value = 0  # No tracks deleted
+        mock_db_service.execute_command_async.return_value = 0  # No tracks deleted
 
         result = await repository.delete_tracks_by_playlist(playlist_id)
 
         assert result is True  # Still returns True even if no tracks deleted
-        mock_db_service.execute_command.assert_called_once()
+        mock_db_service.execute_command_async.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_repository_methods_handle_database_errors(self, repository, mock_db_service):
@@ -156,13 +157,13 @@ class TestPureSQLitePlaylistRepository:
         playlist_id = 'playlist-1'
 
         # Test get_tracks_by_playlist with database error
-        mock_db_service.execute_query.side_effect = Exception("Database error")
+        mock_db_service.execute_query_async.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
             await repository.get_tracks_by_playlist(playlist_id)
 
         # Test delete_tracks_by_playlist with database error
-        mock_db_service.execute_command.side_effect = Exception("Database error")
+        mock_db_service.execute_command_async.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
             await repository.delete_tracks_by_playlist(playlist_id)
@@ -223,8 +224,8 @@ class TestPureSQLitePlaylistRepository:
         ]
 
         # Mock database calls
-        mock_db_service.execute_single.return_value = playlist_row
-        mock_db_service.execute_query.return_value = track_rows
+        mock_db_service.execute_single_async.return_value = playlist_row
+        mock_db_service.execute_query_async.return_value = track_rows
 
         result = await repository.find_by_nfc_tag(nfc_tag_id)
 
@@ -237,8 +238,8 @@ class TestPureSQLitePlaylistRepository:
         assert result.tracks[0].title == 'Track 1'
 
         # Verify database query
-        mock_db_service.execute_single.assert_called_once()
-        query_call = mock_db_service.execute_single.call_args
+        mock_db_service.execute_single_async.assert_called_once()
+        query_call = mock_db_service.execute_single_async.call_args
         assert 'SELECT * FROM playlists WHERE nfc_tag_id = ?' in query_call[0][0]
         assert query_call[0][1] == (nfc_tag_id,)
 
@@ -246,12 +247,12 @@ class TestPureSQLitePlaylistRepository:
     async def test_find_by_nfc_tag_not_found(self, repository, mock_db_service):
         """Test finding playlist by NFC tag when no playlist is associated."""
         nfc_tag_id = 'nonexistent-nfc'
-        mock_db_service.execute_single.return_value = None
+        mock_db_service.execute_single_async.return_value = None
 
         result = await repository.find_by_nfc_tag(nfc_tag_id)
 
         assert result is None
-        mock_db_service.execute_single.assert_called_once()
+        mock_db_service.execute_single_async.assert_called_once()
 
     def test_repository_has_interface_method(self, repository):
         """Test that repository implements the correct interface method name.
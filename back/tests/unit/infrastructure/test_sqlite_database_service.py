@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for the async execution layer of SQLiteDatabaseService."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.src.data.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_service(tmp_path):
+    """Database service on a migrated temporary database."""
+    manager = DatabaseManager(str(tmp_path / "service.db"))
+    yield manager.database_service
+    manager.cleanup()
+
+
+class TestSQLiteDatabaseServiceAsync:
+    """Test suite for the awaitable persistence API."""
+
+    @pytest.mark.asyncio
+    async def test_writes_run_on_single_writer_thread(self, db_service, monkeypatch):
+        """All async writes are executed by the dedicated writer thread."""
+        thread_names = set()
+        original = db_service.execute_command
+
+        def recording_execute_command(*args, **kwargs):
+            thread_names.add(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(db_service, "execute_command", recording_execute_command)
+
+        await asyncio.gather(*[
+            db_service.execute_command_async(
+                "INSERT INTO playlists (id, title) VALUES (?, ?)", (f"p{i}", f"Playlist {i}")
+            )
+            for i in range(10)
+        ])
+
+        assert len(thread_names) == 1
+        assert next(iter(thread_names)).startswith("sqlite-writer")
+        assert threading.current_thread().name not in thread_names
+
+    @pytest.mark.asyncio
+    async def test_reads_return_rows_from_reader_pool(self, db_service):
+        """Async reads see committed writes and return sqlite rows."""
+        await db_service.execute_command_async(
+            "INSERT INTO playlists (id, title) VALUES (?, ?)", ("p1", "Playlist")
+        )
+
+        rows = await db_service.execute_query_async("SELECT * FROM playlists")
+        row = await db_service.execute_single_async(
+            "SELECT title FROM playlists WHERE id = ?", ("p1",)
+        )
+
+        assert len(rows) == 1
+        assert row["title"] == "Playlist"
+
+    @pytest.mark.asyncio
+    async def test_batch_async_is_atomic(self, db_service):
+        """A failing batch leaves no partial writes behind."""
+        operations = [
+            {"query": "INSERT INTO playlists (id, title) VALUES (?, ?)", "params": ("p1", "A")},
+            {"query": "INSERT INTO playlists (id, title) VALUES (?, ?)", "params": ("p1", "B")},
+        ]
+
+        with pytest.raises(Exception):
+            await db_service.execute_batch_async(operations)
+
+        count = await db_service.execute_single_async("SELECT COUNT(*) FROM playlists")
+        assert count[0] == 0
+
+    @pytest.mark.asyncio
+    async def test_health_info_reports_lane_timings(self, db_service):
+        """Queue-wait and execution histograms are exposed in health info."""
+        await db_service.execute_command_async(
+            "INSERT INTO playlists (id, title) VALUES (?, ?)", ("p1", "Playlist")
+        )
+        await db_service.execute_query_async("SELECT * FROM playlists")
+
+        stats = db_service.get_health_info()["async_execution"]
+
+        assert stats["writer_threads"] == 1
+        assert stats["write"]["execution"]["count"] == 1
+        assert stats["read"]["queue_wait"]["count"] == 1
+        assert "p95_ms" in stats["read"]["execution"]
+
+    @pytest.mark.asyncio
+    async def test_batch_many_operation_uses_executemany(self, db_service):
+        """A "many" operation writes every parameter set in one statement."""
+        operations = [{
+            "query": "INSERT INTO playlists (id, title) VALUES (?, ?)",
+            "params": [(f"p{i}", f"Playlist {i}") for i in range(5)],
+            "type": "many",
+        }]
+
+        results = await db_service.execute_batch_async(operations)
+
+        count = await db_service.execute_single_async("SELECT COUNT(*) FROM playlists")
+        assert results == [5]
+        assert count[0] == 5
@@ -0,0 +1,261 @@
+"""
+Tests for the background transcoding cache.
+
+Tests cover:
+- Which files get a rendition, by format and bitrate
+- Conversions on the pool, with renditions stored next to the originals
+- Playback picking current renditions only
+- Disk quota eviction of the least recently played renditions
+- Evicted and failed sources not being converted again
+"""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.src.config.audio_config import AudioConfig
+from app.src.services.transcoding_service import (
+    TranscodingService,
+    is_rendition,
+    rendition_path,
+)
+
+
+def copy_transcoder(source, target):
+    """Stand-in for ffmpeg: the rendition is a copy of the source."""
+    target.write_bytes(source.read_bytes())
+    return True
+
+
+@pytest.fixture
+def metadata_cache():
+    """Metadata cache reporting 128 kbps for every file."""
+    cache = Mock()
+    cache.get.return_value = SimpleNamespace(bitrate=128000)
+    return cache
+
+
+@pytest.fixture
+def service(tmp_path, metadata_cache):
+    """Transcoding service over a temporary upload folder."""
+    service = TranscodingService(
+        upload_folder=str(tmp_path),
+        audio_config=AudioConfig(transcode_enabled=True),
+        metadata_cache=metadata_cache,
+        transcoder=Mock(side_effect=copy_transcoder),
+    )
+    yield service
+    service.shutdown()
+
+
+def write_file(path, size=1024):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\1" * size)
+    return path
+
+
+class TestRenditionSelection:
+    """Test which files deserve a rendition."""
+
+    def test_rendition_is_hidden_next_to_original(self, tmp_path):
+        rendition = rendition_path(tmp_path / "album" / "song.flac")
+
+        assert rendition == tmp_path / "album" / ".song.flac.playback.mp3"
+        assert is_rendition(rendition)
+        assert not is_rendition(tmp_path / "song.mp3")
+
+    def test_costly_formats_need_rendition(self, service, tmp_path):
+        assert service.needs_rendition(write_file(tmp_path / "song.flac"))
+        assert not service.needs_rendition(write_file(tmp_path / "song.wav"))
+
+    def test_mp3_needs_rendition_above_bitrate_limit(self, service, tmp_path, metadata_cache):
+        song = write_file(tmp_path / "song.mp3")
+        assert not service.needs_rendition(song)
+
+        metadata_cache.get.return_value = SimpleNamespace(bitrate=320000)
+        assert service.needs_rendition(song)
+
+
+class TestBackgroundConversion:
+    """Test conversions scheduled on the pool."""
+
+    def test_scheduled_file_gets_rendition(self, service, tmp_path):
+        song = write_file(tmp_path / "album" / "song.flac")
+
+        assert service.schedule([song]) == 1
+        assert service.wait(timeout=5)
+
+        assert rendition_path(song).read_bytes() == song.read_bytes()
+        assert service.get_statistics()["transcoded"] == 1
+
+    def test_folder_scan_skips_cheap_files(self, service, tmp_path):
+        flac = write_file(tmp_path / "album" / "one.flac")
+        mp3 = write_file(tmp_path / "album" / "two.mp3")
+
+        assert service.schedule_folder()
+        assert service.wait(timeout=5)
+
+        assert rendition_path(flac).exists()
+        assert not rendition_path(mp3).exists()
+        assert service._transcoder.call_count == 1
+
+    def test_existing_rendition_is_not_rebuilt(self, service, tmp_path):
+        song = write_file(tmp_path / "song.flac")
+        service.schedule([song])
+        service.wait(timeout=5)
+
+        service.schedule([song])
+        service.wait(timeout=5)
+
+        assert service._transcoder.call_count == 1
+        assert service.get_statistics()["skipped"] == 1
+
+    def test_failed_conversion_leaves_no_rendition(self, tmp_path, metadata_cache):
+        service = TranscodingService(
+            upload_folder=str(tmp_path),
+            audio_config=AudioConfig(transcode_enabled=True),
+            metadata_cache=metadata_cache,
+            transcoder=Mock(return_value=False),
+        )
+        song = write_file(tmp_path / "song.flac")
+
+        service.schedule([song])
+        service.wait(timeout=5)
+
+        assert not rendition_path(song).exists()
+        assert service.get_statistics()["failed"] == 1
+
+        service.schedule([song])
+        service.wait(timeout=5)
+        assert service._transcoder.call_count == 1
+
+        # A replaced original is tried again
+        write_file(song, size=2048)
+        service.schedule([song])
+        service.wait(timeout=5)
+        assert service._transcoder.call_count == 2
+        service.shutdown()
+
+    def test_transcoding_is_opt_in(self, tmp_path, metadata_cache):
+        service = TranscodingService(
+            upload_folder=str(tmp_path),
+            audio_config=AudioConfig(),
+            metadata_cache=metadata_cache,
+            transcoder=Mock(side_effect=copy_transcoder),
+        )
+
+        assert not service.enabled
+
+    def test_disabled_service_schedules_nothing(self, tmp_path, metadata_cache):
+        service = TranscodingService(
+            upload_folder=str(tmp_path),
+            audio_config=AudioConfig(transcode_enabled=False),
+            metadata_cache=metadata_cache,
+            transcoder=Mock(side_effect=copy_transcoder),
+        )
+
+        assert service.schedule([write_file(tmp_path / "song.flac")]) == 0
+        assert not service.schedule_folder()
+
+
+class TestPlaybackPath:
+    """Test the path handed to the audio backend."""
+
+    def test_current_rendition_is_preferred(self, service, tmp_path):
+        song = write_file(tmp_path / "song.flac")
+        service.schedule([song])
+        service.wait(timeout=5)
+
+        assert service.playback_path(str(song)) == str(rendition_path(song))
+        assert service.get_statistics()["playback_hits"] == 1
+
+    def test_original_is_used_without_rendition(self, service, tmp_path):
+        song = write_file(tmp_path / "song.flac")
+
+        assert service.playback_path(str(song)) == str(song)
+
+    def test_stale_rendition_is_ignored(self, service, tmp_path):
+        song = write_file(tmp_path / "song.flac")
+        rendition = write_file(rendition_path(song))
+        older = time.time() - 60
+        os.utime(rendition, (older, older))
+
+        assert service.playback_path(str(song)) == str(song)
+
+
+class TestQuota:
+    """Test disk quota and eviction."""
+
+    def test_least_recently_played_is_evicted(self, tmp_path, metadata_cache):
+        service = TranscodingService(
+            upload_folder=str(tmp_path),
+            audio_config=AudioConfig(transcode_quota_mb=1),
+            metadata_cache=metadata_cache,
+            transcoder=Mock(side_effect=copy_transcoder),
+        )
+        songs = [write_file(tmp_path / f"{name}.flac", size=400 * 1024) for name in ("a", "b", "c")]
+        for age, song in zip((300, 200, 100), songs):
+            rendition = write_file(rendition_path(song), size=400 * 1024)
+            os.utime(rendition, (time.time() - age + 50, time.time() - age + 50))
+            os.utime(song, (time.time() - age, time.time() - age))
+        # "a" was played last although its rendition is the oldest
+        service.playback_path(str(songs[0]))
+
+        assert service.enforce_quota() == 1
+
+        assert rendition_path(songs[0]).exists()
+        assert not rendition_path(songs[1]).exists()
+        assert rendition_path(songs[2]).exists()
+        statistics = service.get_statistics()
+        assert statistics["renditions"] == 2
+        assert statistics["disk_usage_mb"] <= 1
+
+    def test_evicted_rendition_is_not_rebuilt_by_rescan(self, tmp_path, metadata_cache):
+        service = TranscodingService(
+            upload_folder=str(tmp_path),
+            audio_config=AudioConfig(transcode_enabled=True, transcode_quota_mb=1),
+            metadata_cache=metadata_cache,
+            transcoder=Mock(side_effect=copy_transcoder),
+        )
+        for name in ("a", "b", "c"):
+            write_file(tmp_path / "album" / f"{name}.flac", size=400 * 1024)
+
+        service.schedule_folder()
+        assert service.wait(timeout=5)
+        assert service.get_statistics()["evicted"] == 1
+
+        service.schedule_folder()
+        assert service.wait(timeout=5)
+
+        statistics = service.get_statistics()
+        assert (statistics["transcoded"], statistics["evicted"]) == (3, 1)
+        assert statistics["renditions"] == 2
+        service.shutdown()
+
+    def test_quota_is_enforced_once_per_batch(self, service, tmp_path, monkeypatch):
+        enforce_quota = Mock(return_value=0)
+        monkeypatch.setattr(service, "enforce_quota", enforce_quota)
+        for name in ("a", "b", "c"):
+            write_file(tmp_path / "album" / f"{name}.flac")
+
+        service.schedule_folder()
+        assert service.wait(timeout=5)
+
+        assert service.get_statistics()["transcoded"] == 3
+        enforce_quota.assert_called_once_with()
+
+    def test_orphaned_renditions_are_removed(self, service, tmp_path):
+        rendition = write_file(tmp_path / ".gone.flac.playback.mp3")
+
+        assert service.enforce_quota() == 1
+        assert not rendition.exists()
+
+    def test_clear_removes_every_rendition(self, service, tmp_path):
+        song = write_file(tmp_path / "song.flac")
+        write_file(rendition_path(song))
+
+        assert service.clear() == 1
+        assert song.exists()
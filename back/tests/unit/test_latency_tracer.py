@@ -0,0 +1,74 @@
+# Copyright (c) 2025 Jonathan Piette
+# This file is part of TheOpenMusicBox and is licensed for non-commercial use only.
+# See the LICENSE file for details.
+
+"""Unit tests for the end-to-end latency tracer."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.src.monitoring.core.latency_tracer import LatencyTracer
+
+
+class TestLatencyTracer:
+    """Test trace propagation, stage statistics and reporting."""
+
+    @pytest.mark.asyncio
+    async def test_trace_follows_tasks_and_feeds_stage_histograms(self):
+        tracer = LatencyTracer(max_traces=5)
+
+        async def downstream():
+            with tracer.span("lookup"):
+                await asyncio.sleep(0.01)
+            tracer.mark("audio_output")
+            tracer.finish(end_mark="audio_output")
+
+        with tracer.trace("tag_to_audio", started_at=time.perf_counter() - 0.005, uid="abc") as trace:
+            tracer.record_span("detection", 5.0, offset_ms=0.0)
+            task = asyncio.create_task(downstream())
+        assert tracer.current() is None
+        await task
+
+        assert trace.status == "ok"
+        assert trace.total_ms == trace.marks["audio_output"] >= 15
+        stats = tracer.get_statistics()
+        assert stats["statuses"] == {"ok": 1}
+        assert set(stats["stages"]) == {"detection", "lookup"}
+        assert stats["stages"]["lookup"]["p50_ms"] >= 10
+        assert stats["recent"][0]["attributes"] == {"uid": "abc"}
+
+    def test_unsuccessful_traces_are_counted_but_not_in_percentiles(self):
+        tracer = LatencyTracer()
+
+        with tracer.trace("tag_to_audio"):
+            with tracer.span("lookup"):
+                pass
+            tracer.finish(status="no_playlist")
+            # Finished traces are no longer current
+            assert tracer.current() is None
+            assert tracer.finish() is None
+
+        stats = tracer.get_statistics()
+        assert stats["statuses"] == {"no_playlist": 1}
+        assert stats["total_ms"]["count"] == 0
+        assert stats["stages"] == {}
+
+    def test_ensure_trace_joins_current_trace(self):
+        tracer = LatencyTracer()
+
+        with tracer.trace("tag_to_audio") as outer:
+            with tracer.ensure_trace("tag_to_audio") as joined:
+                assert joined is outer
+        with tracer.ensure_trace("tag_to_audio") as fresh:
+            assert fresh is not outer
+
+    def test_spans_outside_a_trace_are_ignored(self):
+        tracer = LatencyTracer()
+
+        with tracer.span("play_file"):
+            pass
+        tracer.mark("audio_output")
+
+        assert tracer.get_statistics()["recent"] == []